@@ -0,0 +1,81 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_errors
+
+error_handler의 성공 경로와 실패 경로(응답 파싱, 예외 생성/전달) 비용 측정.
+
+    $ python benchmarks/bench_errors.py
+"""
+
+import argparse
+import json
+
+from common import measure
+from requests.models import Response
+
+from fsfupbit.errors import UpbitErrorMixin, error_handler
+
+REMAINING_REQ = "group=order; min=479; sec=7"
+
+
+def make_response(status: int, body: bytes) -> Response:
+    """전송 없이 만든 requests Response (녹화한 Upbit 응답과 같은 형식)"""
+    resp = Response()
+    resp.status_code = status
+    resp._content = body
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = "application/json; charset=utf-8"
+    resp.headers["Remaining-Req"] = REMAINING_REQ
+    return resp
+
+
+def _error(name: str, message: str) -> bytes:
+    return json.dumps({"error": {"name": name, "message": message}}).encode()
+
+
+CASES = {
+    "success_200": (200, b'[{"market": "KRW-BTC", "trade_price": 50000000.0}]'),
+    "known_400": (400, _error("insufficient_funds_bid", "주문가능한 금액(KRW)이 부족합니다.")),
+    "known_401": (401, _error("jwt_verification", "Failed to verify Authorization header.")),
+    "unknown_400": (400, _error("some_new_error", "새로 추가된 에러입니다.")),
+    "too_many_429": (429, b"Too many API requests."),
+    "non_json_502": (502, b"<html>Bad Gateway</html>"),
+}
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    repeat = 3 if quick else 5
+    for name, (status, body) in CASES.items():
+        call = error_handler(lambda resp=make_response(status, body): resp)
+
+        def once():
+            try:
+                call()
+            except UpbitErrorMixin:
+                pass
+        results[name] = measure(once, repeat=repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.quick), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_import
+
+새 인터프리터에서 fsfupbit을 import 하는 데 걸리는 시간 측정.
+
+    $ python benchmarks/bench_import.py --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import os
+import subprocess
+import sys
+
+from common import REPO_ROOT
+
+CASES = {
+    "import fsfupbit": "import fsfupbit",
+    "from fsfupbit import Upbit": "from fsfupbit import Upbit",
+    "from fsfupbit import get_ohlcv": "from fsfupbit import get_ohlcv\n"
+                                      "import fsfupbit.quotation_api as q\n"
+                                      "q._candles_to_frame([])",
+    "from fsfupbit import WebSocketManager": "from fsfupbit import WebSocketManager",
+}
+
+# 인터프리터 시작 비용을 빼기 위해 import 전후를 자식 프로세스 안에서 측정
+_TIMER = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, repeat: int) -> dict:
+    """code를 새 인터프리터에서 repeat번 실행한 import 시간 통계 (밀리초)"""
+    # 자식 프로세스도 작업 트리의 fsfupbit을 import 하도록 함
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _TIMER.format(code=code)],
+                             capture_output=True, text=True, check=True, env=env)
+        samples.append(float(out.stdout.strip().splitlines()[-1]) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def run(repeat: int = 10) -> dict:
+    return {name: measure(code, repeat) for name, code in CASES.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
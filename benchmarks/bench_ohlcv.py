@@ -0,0 +1,95 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_ohlcv
+
+get_ohlcv의 캔들 페이지 파싱(JSON → DataFrame)과 시뮬레이터 대상 전체 조회 시간 측정.
+
+    $ python benchmarks/bench_ohlcv.py
+"""
+
+import argparse
+import json
+import time
+
+from common import measure
+
+from fsfupbit import quotation_api
+from fsfupbit.simulator import UpbitSimulator
+from fsfupbit.transport import get_default_transport, set_default_transport
+
+SIZES = {"1k": 1000, "10k": 10000, "100k": 100000}
+E2E_SIZES = {"1k": 1000, "10k": 10000}
+PAGE = 200
+# 캔들이 결정적이도록 고정한 기준 시각 (2024-01-01T00:00:00 UTC)
+TO = 1704067200
+
+
+def make_pages(count: int, market: str = "KRW-BTC") -> list:
+    """분 캔들 API 응답 본문(bytes) 목록. 최신 페이지부터"""
+    sim = UpbitSimulator(websocket=False)
+    pages = []
+    to = TO
+    for start in range(0, count, PAGE):
+        params = {"market": market, "count": min(PAGE, count - start),
+                  "to": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(to))}
+        candles = sim._candles("/v1/candles/minutes/1", params)
+        pages.append(json.dumps(candles).encode())
+        to -= len(candles) * 60
+    return pages
+
+
+def parse(pages: list):
+    """get_ohlcv와 같은 순서로 페이지를 디코딩하여 DataFrame 생성"""
+    contents = []
+    for page in pages:
+        contents.extend(json.loads(page))
+    return quotation_api._candles_to_frame(contents)
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    sizes = E2E_SIZES if quick else SIZES
+    for name, count in sizes.items():
+        pages = make_pages(count)
+        results[f"parse_{name}"] = measure(lambda: parse(pages), items=count,
+                                           repeat=3 if quick else 5)
+
+    previous = get_default_transport()
+    with UpbitSimulator(websocket=False, rate_limit=False) as sim:
+        set_default_transport(sim.transport())
+        try:
+            for name, count in E2E_SIZES.items():
+                for workers in (None, 8):
+                    def fetch():
+                        quotation_api.get_ohlcv("KRW-BTC", interval="minute1",
+                                                count=count, period=0,
+                                                max_workers=workers)
+                    key = f"get_ohlcv_{name}" + (f"_workers{workers}" if workers else "")
+                    results[key] = measure(fetch, items=count, repeat=3,
+                                           min_time=0 if quick else 0.2)
+        finally:
+            set_default_transport(previous)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.quick), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
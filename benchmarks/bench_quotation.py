@@ -0,0 +1,87 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_quotation
+
+시뮬레이터를 대상으로 전체 마켓의 get_current_price와 get_tickers 시간 측정.
+
+    $ python benchmarks/bench_quotation.py
+"""
+
+import argparse
+import json
+
+from common import measure
+
+from fsfupbit import quotation_api
+from fsfupbit.market_registry import MarketRegistry, set_market_registry
+from fsfupbit.simulator import UpbitSimulator
+from fsfupbit.transport import get_default_transport, set_default_transport
+
+# 실제 Upbit와 비슷한 규모의 마켓 수
+MARKET_COUNTS = {"KRW": 230, "BTC": 180, "USDT": 90}
+
+
+def make_markets() -> list:
+    """(마켓, 한글명, 영문명, 기준 가격, 유의 종목 여부) 목록"""
+    markets = []
+    for quote, count in MARKET_COUNTS.items():
+        for i in range(count):
+            base = f"C{i:03d}"
+            markets.append((f"{quote}-{base}", base, base, 100.0 + i, i % 25 == 0))
+    return markets
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    repeat = 3 if quick else 5
+    previous = get_default_transport()
+    with UpbitSimulator(websocket=False, rate_limit=False,
+                        markets=make_markets()) as sim:
+        set_default_transport(sim.transport())
+        try:
+            tickers = quotation_api.get_tickers()
+            results["get_tickers"] = measure(quotation_api.get_tickers, repeat=repeat)
+            # 마켓 목록을 매번 받는 경우 (MarketRegistry 이전의 get_tickers와 같은 비용)
+            set_market_registry(MarketRegistry(ttl=0))
+            results["get_tickers_uncached"] = measure(quotation_api.get_tickers,
+                                                      repeat=repeat)
+            set_market_registry(None)
+            results["get_current_price_all"] = measure(
+                lambda: quotation_api.get_current_price(tickers),
+                items=len(tickers), repeat=repeat)
+            results["get_current_price_sequential"] = measure(
+                lambda: quotation_api.get_current_price(tickers, max_workers=None),
+                items=len(tickers), repeat=repeat)
+            results["get_current_price_quote_all"] = measure(
+                lambda: quotation_api.get_current_price(
+                    quote_currencies=["KRW", "BTC", "USDT"]),
+                items=len(tickers), repeat=repeat)
+            results["get_current_price_single"] = measure(
+                lambda: quotation_api.get_current_price("KRW-C000"), repeat=repeat)
+        finally:
+            set_market_registry(None)
+            set_default_transport(previous)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.quick), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
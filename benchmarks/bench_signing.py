@@ -0,0 +1,73 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_signing
+
+Upbit._request_headers의 인증 헤더 서명 처리량 측정 (PyJWT 직접 서명과 비교).
+
+    $ python benchmarks/bench_signing.py
+"""
+
+import argparse
+import hashlib
+import json
+import uuid
+from urllib.parse import urlencode
+
+from common import measure
+
+from fsfupbit.exchange_api import Upbit
+
+ACCESS = "benchmark_access_key_0123456789abcdef"
+SECRET = "benchmark_secret_key_0123456789abcdef"
+
+QUERIES = {
+    "no_query": None,
+    "order": {"market": "KRW-BTC", "side": "bid", "volume": "0.001",
+              "price": "50000000", "ord_type": "limit"},
+    "uuids_100": {"uuids[]": [str(uuid.UUID(int=i)) for i in range(100)]},
+}
+
+
+def pyjwt_headers(query=None) -> dict:
+    """서명기 도입 전 방식 (요청마다 jwt.encode)"""
+    import jwt
+    payload = {"access_key": ACCESS, "nonce": str(uuid.uuid4())}
+    if query is not None:
+        query_string = urlencode(query, doseq=True).replace("%5B%5D=", "[]=")
+        payload["query_hash"] = hashlib.sha512(query_string.encode()).hexdigest()
+        payload["query_hash_alg"] = "SHA512"
+    return {"Authorization": f"Bearer {jwt.encode(payload, SECRET)}"}
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    repeat = 3 if quick else 5
+    upbit = Upbit(ACCESS, SECRET)
+    for name, query in QUERIES.items():
+        results[f"request_headers_{name}"] = measure(
+            lambda: upbit._request_headers(query), repeat=repeat)
+        results[f"pyjwt_{name}"] = measure(lambda: pyjwt_headers(query), repeat=repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.quick), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
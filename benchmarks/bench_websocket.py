@@ -0,0 +1,125 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.bench_websocket
+
+WebSocket 메시지 디코딩과 프로세스 간 전달(mp.Queue, SharedRingBuffer) 처리량 측정.
+
+    $ python benchmarks/bench_websocket.py
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+
+from common import measure
+
+from fsfupbit.simulator import UpbitSimulator, _simple
+from fsfupbit.websocket_api import _message_decoder
+from fsfupbit.ws_codec import get_decoder
+
+BATCH = 1000
+
+
+def make_messages() -> dict:
+    """시뮬레이터가 보내는 것과 같은 타입별 수신 바이트 (DEFAULT, SIMPLE)"""
+    sim = UpbitSimulator(websocket=False)
+    market = sim.markets["KRW-BTC"]
+    messages = {}
+    for type in ("ticker", "trade", "orderbook"):
+        message = sim._ws_message(type, market, "REALTIME")
+        messages[type] = json.dumps(message).encode()
+        messages[f"{type}_simple"] = json.dumps(_simple(message, type)).encode()
+    return messages
+
+
+def _available_decoders() -> list:
+    names = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            get_decoder(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def bench_decode(messages: dict, repeat: int) -> dict:
+    results = {}
+    for decoder in _available_decoders():
+        for name, raw in messages.items():
+            simple = name.endswith("_simple")
+            decode = _message_decoder(decoder, "SIMPLE" if simple else "DEFAULT",
+                                      expand=simple)
+            batch = [raw] * BATCH
+
+            def run_batch():
+                for item in batch:
+                    decode(item)
+            key = f"decode_{decoder}_{name}" + ("_expand" if simple else "")
+            results[key] = measure(run_batch, items=BATCH, repeat=repeat)
+    return results
+
+
+def bench_queue(raw: bytes, repeat: int) -> dict:
+    """WebSocketManager의 두 출력 방식으로 BATCH개 메시지를 넣고 꺼내는 시간"""
+    from fsfupbit.ring_buffer import SharedRingBuffer
+
+    decode = get_decoder("auto")
+    queue = mp.Queue(BATCH)
+
+    def through_queue():
+        for _ in range(BATCH):
+            queue.put(decode(raw))
+        for _ in range(BATCH):
+            queue.get()
+
+    ring = SharedRingBuffer(slots=BATCH, slot_size=8192)
+    writer = SharedRingBuffer(ring.name, create=False)
+
+    def through_ring():
+        for _ in range(BATCH):
+            writer.write(raw)
+        for _ in range(BATCH):
+            decode(ring.read(block=False))
+
+    try:
+        return {
+            "mp_queue_decoded": measure(through_queue, items=BATCH, repeat=repeat),
+            "shm_ring_raw": measure(through_ring, items=BATCH, repeat=repeat),
+        }
+    finally:
+        queue.close()
+        writer.close()
+        ring.close()
+        ring.unlink()
+
+
+def run(quick: bool = False) -> dict:
+    repeat = 3 if quick else 5
+    messages = make_messages()
+    results = bench_decode(messages, repeat)
+    results.update(bench_queue(messages["trade"], repeat))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+    print(json.dumps(run(args.quick), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
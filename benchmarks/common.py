@@ -0,0 +1,102 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.common
+
+벤치마크 공통 측정 함수와 실행 환경 정보.
+
+import 하면 저장소 루트를 sys.path 맨 앞에 추가하므로, 체크아웃에서
+``python benchmarks/...`` 로 실행해도 설치된 fsfupbit이 아니라 작업 트리를 측정합니다.
+"""
+
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+# 설치된 배포판(site-packages)보다 작업 트리의 fsfupbit을 먼저 찾도록 함
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if sys.path[:1] != [REPO_ROOT]:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.2,
+            number: Optional[int] = None, items: int = 1) -> Dict[str, Any]:
+    """func 1회 실행 시간 통계
+
+    timeit처럼 한 번 측정에 min_time 이상 걸리도록 반복 횟수(number)를 늘린 뒤
+    repeat번 측정합니다.
+
+    Args:
+        func: 측정할 함수 (인자 없음)
+        repeat: 측정 횟수 (기본값: 5)
+        min_time: 측정 1회의 최소 시간 (초, 기본값: 0.2)
+        number: 측정 1회의 반복 횟수. None이면 자동 결정
+        items: func 1회가 처리하는 항목 수 (메시지, 캔들 등). items_per_sec 계산에 사용
+
+    Returns:
+        dict: median_us, min_us, ops_per_sec, items_per_sec, number, repeat
+    """
+    if number is None:
+        number = 1
+        while True:
+            elapsed = _timed(func, number)
+            if elapsed >= min_time or number >= 1 << 20:
+                break
+            number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    samples = [_timed(func, number) / number for _ in range(repeat)]
+    median = statistics.median(samples)
+    result = {
+        "median_us": round(median * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+        "ops_per_sec": round(1 / median, 1) if median else None,
+        "number": number,
+        "repeat": repeat,
+    }
+    if items != 1:
+        result["items_per_sec"] = round(items / median, 1) if median else None
+    return result
+
+
+def _timed(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    import fsfupbit
+    versions = {}
+    for name in ("numpy", "pandas", "requests", "orjson", "websockets"):
+        try:
+            versions[name] = __import__(name).__version__
+        except ImportError:
+            versions[name] = None
+    return {
+        "fsfupbit": getattr(fsfupbit, "__version__", None),
+        "fsfupbit_path": os.path.dirname(os.path.abspath(fsfupbit.__file__)),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "executable": sys.executable,
+        "packages": versions,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
@@ -0,0 +1,136 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks.run
+
+전체 벤치마크를 실행하여 JSON으로 저장하고, 이전 결과와 비교하여 성능 저하를 보고.
+
+    $ python benchmarks/run.py --output benchmarks/results/1.0.2.json
+    $ python benchmarks/run.py --only signing,errors --quick
+    $ python benchmarks/run.py --compare benchmarks/results/1.0.1.json --threshold 0.2
+
+저장소 루트를 sys.path 맨 앞에 두므로 설치된 fsfupbit이 있어도 작업 트리를 측정합니다.
+
+네트워크 없이 녹화 형식의 고정 응답과 로컬 UpbitSimulator만 사용합니다.
+--compare의 이전 결과보다 threshold 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))   # 저장소 루트 (작업 트리의 fsfupbit)
+
+import bench_errors  # noqa: E402
+import bench_import  # noqa: E402
+import bench_ohlcv  # noqa: E402
+import bench_quotation  # noqa: E402
+import bench_signing  # noqa: E402
+import bench_websocket  # noqa: E402
+from common import environment  # noqa: E402
+
+SUITES = {
+    "import": lambda quick: bench_import.run(3 if quick else 10),
+    "ohlcv": bench_ohlcv.run,
+    "quotation": bench_quotation.run,
+    "signing": bench_signing.run,
+    "errors": bench_errors.run,
+    "websocket": bench_websocket.run,
+}
+
+
+def run(names: List[str], quick: bool = False) -> Dict[str, Any]:
+    results = {}
+    for name in names:
+        print(f"running {name}...", file=sys.stderr)
+        results[name] = SUITES[name](quick)
+    return {"environment": environment(), "quick": quick, "results": results}
+
+
+def _elapsed(stats: Dict[str, Any]) -> float:
+    """항목의 대표 소요 시간 (작을수록 좋음)"""
+    return stats["median_ms"] * 1000 if "median_ms" in stats else stats["median_us"]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float) -> List[Dict[str, Any]]:
+    """두 결과에 모두 있는 항목의 소요 시간 비교
+
+    Returns:
+        list: 항목별 {"suite", "case", "baseline", "current", "change", "regression"}
+            change는 소요 시간 변화율 (0.25면 25% 느려짐)
+    """
+    rows = []
+    for suite, cases in current["results"].items():
+        previous = baseline.get("results", {}).get(suite, {})
+        for case, stats in cases.items():
+            if case not in previous:
+                continue
+            before, after = _elapsed(previous[case]), _elapsed(stats)
+            change = (after - before) / before if before else 0.0
+            rows.append({
+                "suite": suite,
+                "case": case,
+                "baseline": before,
+                "current": after,
+                "change": round(change, 4),
+                "regression": change > threshold,
+            })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--only", help=f"쉼표로 구분한 실행할 묶음 ({','.join(SUITES)})")
+    parser.add_argument("--quick", action="store_true", help="큰 입력과 반복을 줄여 빠르게 실행")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="성능 저하로 판단할 소요 시간 증가율 (기본값: 0.2)")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+
+    report = run(names, args.quick)
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["comparison"] = compare(report, baseline, args.threshold)
+        regressions = [row for row in report["comparison"] if row["regression"]]
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for row in regressions:
+        print(f"regression: {row['suite']}.{row['case']} "
+              f"{row['baseline']:.1f}us -> {row['current']:.1f}us "
+              f"(+{row['change']:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
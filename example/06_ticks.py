@@ -1,8 +1,14 @@
-import requests
-
-url = "https://api.upbit.com/v1/trades/ticks?market=KRW-BTC&count=300"
-resp = requests.get(url)
-ticks = resp.json()
+import fsfupbit
 
+# 최근 체결 300건 (최신순)
+ticks = fsfupbit.get_trades("KRW-BTC", count=300)
 for tick in ticks:
     print(tick)
+
+# 이전 체결은 마지막 sequential_id를 cursor로 넘겨 조회
+older = fsfupbit.get_trades("KRW-BTC", count=300, cursor=ticks[-1]["sequential_id"])
+print(older[0])
+
+# 최근 3일 체결 전체를 시간순 DataFrame으로
+df = fsfupbit.get_trades_history("KRW-BTC", days=3, max_workers=3)
+print(df)
@@ -19,31 +19,135 @@ pyupbit를 기반으로 하여 최신 API 기능을 추가하고 코드 품질
 __version__ = "1.0.0"
 __author__ = "풀스택패밀리 연구소"
 
-from .quotation_api import (
-    get_tickers,
-    get_ohlcv,
-    get_ohlcv_from,
-    get_current_price,
-    get_orderbook,
-    get_orderbook_supported_levels,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-from .exchange_api import Upbit
+# 공개 이름 → 정의된 모듈. 처음 접근할 때 해당 모듈만 import 하므로
+# Upbit만 사용하는 프로세스는 pandas, websockets 등을 로드하지 않습니다.
+_LAZY_ATTRS = {
+    "get_tickers": "quotation_api",
+    "get_ohlcv": "quotation_api",
+    "get_ohlcv_from": "quotation_api",
+    "iter_ohlcv_from": "quotation_api",
+    "get_ohlcv_many": "quotation_api",
+    "get_current_price": "quotation_api",
+    "get_orderbook": "quotation_api",
+    "get_orderbook_supported_levels": "quotation_api",
+    "get_trades": "quotation_api",
+    "iter_trades": "quotation_api",
+    "get_trades_history": "quotation_api",
+    "CandleStore": "candle_store",
+    "MarketRegistry": "market_registry",
+    "set_market_registry": "market_registry",
+    "OrderBook": "orderbook",
+    "CandleBuilder": "candle_builder",
+    "Upbit": "exchange_api",
+    "AsyncUpbit": "async_api",
+    "HTTPTransport": "transport",
+    "AsyncHTTPTransport": "transport",
+    "get_default_transport": "transport",
+    "set_default_transport": "transport",
+    "RateLimiter": "rate_limit",
+    "RetryPolicy": "retry",
+    "RequestCoalescer": "coalesce",
+    "set_request_coalescer": "coalesce",
+    "Endpoints": "endpoints",
+    "set_base_url": "endpoints",
+    "WebSocketManager": "websocket_api",
+    "WebSocketClient": "websocket_api",
+    "PrivateWebSocketManager": "websocket_api",
+    "WebSocketHub": "websocket_api",
+    "stream": "websocket_api",
+}
 
-from .websocket_api import WebSocketManager, WebSocketClient, PrivateWebSocketManager
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from .quotation_api import (
+        get_tickers,
+        get_ohlcv,
+        get_ohlcv_from,
+        iter_ohlcv_from,
+        get_ohlcv_many,
+        get_current_price,
+        get_orderbook,
+        get_orderbook_supported_levels,
+        get_trades,
+        iter_trades,
+        get_trades_history,
+    )
+    from .candle_store import CandleStore
+    from .market_registry import MarketRegistry, set_market_registry
+    from .orderbook import OrderBook
+    from .candle_builder import CandleBuilder
+    from .exchange_api import Upbit
+    from .transport import (
+        HTTPTransport,
+        AsyncHTTPTransport,
+        get_default_transport,
+        set_default_transport,
+    )
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+    from .coalesce import RequestCoalescer, set_request_coalescer
+    from .endpoints import Endpoints, set_base_url
+    from .async_api import AsyncUpbit
+    from .websocket_api import (
+        WebSocketManager,
+        WebSocketClient,
+        PrivateWebSocketManager,
+        WebSocketHub,
+        stream,
+    )
 
 __all__ = [
     # 시세 조회
     "get_tickers",
     "get_ohlcv",
     "get_ohlcv_from",
+    "iter_ohlcv_from",
+    "get_ohlcv_many",
     "get_current_price",
     "get_orderbook",
     "get_orderbook_supported_levels",
+    "get_trades",
+    "iter_trades",
+    "get_trades_history",
+    "CandleStore",
+    "MarketRegistry",
+    "set_market_registry",
+    "OrderBook",
+    "CandleBuilder",
     # 거래/자산 관리
     "Upbit",
+    "AsyncUpbit",
+    # HTTP 전송 계층
+    "HTTPTransport",
+    "AsyncHTTPTransport",
+    "get_default_transport",
+    "set_default_transport",
+    "RateLimiter",
+    "RetryPolicy",
+    "RequestCoalescer",
+    "set_request_coalescer",
+    "Endpoints",
+    "set_base_url",
     # WebSocket
     "WebSocketManager",
     "WebSocketClient",
     "PrivateWebSocketManager",
+    "WebSocketHub",
+    "stream",
 ]
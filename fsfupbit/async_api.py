@@ -0,0 +1,493 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.async_api
+
+asyncio 기반 시세 조회 함수와 AsyncUpbit 클래스를 제공합니다.
+동기 API와 같은 서명(JWT) 로직과 에러 매핑을 사용하며, 하나의 이벤트 루프에서
+aiohttp 커넥션 풀을 공유하여 많은 요청을 동시에 처리합니다.
+"""
+
+import asyncio
+import datetime
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fsfupbit.endpoints import Endpoints, get_endpoints
+from fsfupbit.errors import UpbitValidationError, check_response
+from fsfupbit.exchange_api import Upbit
+from fsfupbit.quotation_api import (
+    MAX_CALL_COUNT,
+    _chunk_markets,
+    _format_current_price,
+    _normalize_ohlcv_to,
+    _candles_to_frame,
+    _candle_pages,
+    _candle_width,
+    _merge_candle_pages,
+    _newest_candles_frame,
+    _next_candle_page,
+)
+from fsfupbit.request_api import _parse
+from fsfupbit.transport import AsyncHTTPTransport, get_default_async_transport
+
+
+def _endpoints() -> Endpoints:
+    """모듈 기본 비동기 transport로 보낼 요청의 URL 표"""
+    return get_endpoints(get_default_async_transport())
+
+
+async def _request(
+    method: str,
+    url: str,
+    transport: Optional[AsyncHTTPTransport] = None,
+    **kwargs: Any
+) -> Tuple[Any, Dict[str, Any]]:
+    """비동기 요청 후 에러 매핑과 Remaining-Req 파싱을 수행
+
+    Returns:
+        응답 본문, 파싱된 요청 수 제한 정보
+    """
+    transport = transport or get_default_async_transport()
+    resp = check_response(await transport.request(method, url, **kwargs))
+    data = resp.json()
+    remaining_req = resp.headers.get("Remaining-Req", "")
+    limit = _parse(remaining_req)
+    return data, limit
+
+
+async def _call_public_api(
+    url: str, transport: Optional[AsyncHTTPTransport] = None, **params: Any
+) -> Tuple[Any, Dict[str, Any]]:
+    """Upbit 공개 API 비동기 호출 (request_api._call_public_api 대응)"""
+    return await _request("GET", url, transport=transport, params=params)
+
+
+async def _send_request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[Dict[str, Any]] = None,
+    transport: Optional[AsyncHTTPTransport] = None
+) -> Tuple[Any, Dict[str, Any]]:
+    """인증이 필요한 비동기 요청 (request_api._send_*_request 대응)
+
+    POST/DELETE는 JSON 본문, GET은 form 본문으로 전송하여 동기 경로와
+    동일한 형식을 유지합니다.
+    """
+    idempotent = None
+    if method != "GET":
+        headers["Accept"] = "application/json"
+        headers["Content-Type"] = "application/json"
+        if isinstance(data, dict):
+            if method == "POST" and data.get("identifier"):
+                idempotent = True
+            data = json.dumps(data)
+    return await _request(method, url, transport=transport,
+                          headers=headers, data=data, idempotent=idempotent)
+
+
+async def _fetch_candles(url, ticker, count, to, converting_price_unit=None):
+    """to 시점 이전의 캔들 count개를 비동기로 요청하여 원본 응답 리스트 반환"""
+    query_params = {"market": ticker, "count": count,
+                    "to": to.strftime("%Y-%m-%d %H:%M:%S")}
+    if converting_price_unit is not None:
+        query_params["convertingPriceUnit"] = converting_price_unit
+    contents, _ = await _call_public_api(url, **query_params)
+    return contents
+
+
+async def _get_ohlcv_concurrent(url, ticker, count, to, width,
+                                converting_price_unit):
+    """quotation_api._get_ohlcv_concurrent의 비동기 버전 (페이지를 asyncio.gather로 동시 요청)"""
+    pages = _candle_pages(count, to, width)
+    results = await asyncio.gather(*[
+        _fetch_candles(url, ticker, query_count, page_to, converting_price_unit)
+        for page_to, query_count in pages
+    ])
+
+    candles = {}
+    exhausted = _merge_candle_pages(candles, results, pages)
+    while not exhausted and 0 < len(candles) < count:
+        oldest, query_count = _next_candle_page(candles, count)
+        contents = await _fetch_candles(url, ticker, query_count, oldest,
+                                        converting_price_unit)
+        exhausted = _merge_candle_pages(candles, [contents], [(oldest, query_count)])
+    return _newest_candles_frame(candles, count)
+
+
+async def get_ohlcv(
+    ticker: str = "KRW-BTC",
+    interval: str = "day",
+    count: int = 200,
+    to: Union[str, datetime.datetime] = None,
+    period: float = 0.1,
+    converting_price_unit: str = None
+):
+    """
+    캔들 데이터 비동기 조회
+
+    quotation_api.get_ohlcv와 같은 인자와 반환 형식을 사용합니다. 초/분/일/주
+    캔들은 페이지별 to 시점을 미리 계산하여 모든 페이지를 동시에 요청하고(요청
+    간격은 transport의 RateLimiter가 조절), 월/연 캔들은 period 간격으로 순차
+    요청합니다.
+
+    Returns:
+        DataFrame: OHLCV 데이터. 캔들이 없으면 None
+
+    Raises:
+        UpbitErrorMixin: Upbit가 에러 응답을 반환한 경우
+            (동기 get_ohlcv와 달리 None을 반환하지 않음)
+
+    Examples:
+        >>> dfs = await asyncio.gather(
+        ...     *[get_ohlcv(t, interval="minute1") for t in tickers])
+    """
+    url = _endpoints().candle_url(interval)
+    to = _normalize_ohlcv_to(to)
+    count = max(count, 1)
+    width = _candle_width(url)
+    if width is not None and count > MAX_CALL_COUNT:
+        return await _get_ohlcv_concurrent(url, ticker, count, to, width,
+                                           converting_price_unit)
+
+    candles = []
+    for pos in range(count, 0, -200):
+        query_count = min(MAX_CALL_COUNT, pos)
+        contents = await _fetch_candles(url, ticker, query_count, to,
+                                        converting_price_unit)
+        if len(contents) == 0:
+            break
+        candles += contents
+
+        to = datetime.datetime.strptime(
+            contents[-1]['candle_date_time_utc'], "%Y-%m-%dT%H:%M:%S")
+
+        if pos > 200:
+            await asyncio.sleep(period)
+
+    if len(candles) == 0:
+        return None
+    return _candles_to_frame(candles)
+
+
+async def get_current_price(ticker="KRW-BTC", limit_info=False, verbose=False,
+                            quote_currencies=None, output="dict"):
+    """현재가 정보 비동기 조회
+
+    quotation_api.get_current_price와 같은 인자와 반환 형식을 사용합니다.
+    URL 길이 제한 안에서 나눈 티커 묶음은 모두 동시에 요청합니다.
+    """
+    if output not in ("dict", "frame"):
+        raise UpbitValidationError(
+            "output은 'dict', 'frame'만 가능합니다", field="output")
+    url = _endpoints().url("ticker")
+
+    if quote_currencies is not None:
+        if not isinstance(quote_currencies, str):
+            quote_currencies = ",".join(quote_currencies)
+        price, req_limit_info = await _call_public_api(
+            _endpoints().url("ticker_all"), quote_currencies=quote_currencies)
+        single = False
+    elif isinstance(ticker, str) or (isinstance(ticker, list) and len(ticker) == 1):
+        price, req_limit_info = await _call_public_api(url, markets=ticker)
+        single = output == "dict"
+    else:
+        results = await asyncio.gather(*[
+            _call_public_api(url, markets=chunk)
+            for chunk in _chunk_markets(url, ticker)
+        ])
+        price = []
+        req_limit_info = {}
+        for price_sliced, req_limit_info in results:
+            price += price_sliced
+        single = False
+
+    price = _format_current_price(price, single, verbose, output)
+    if limit_info:
+        return price, req_limit_info
+    else:
+        return price
+
+
+async def get_orderbook(
+    ticker: Union[str, List[str]] = "KRW-BTC",
+    level: Optional[float] = None,
+    limit_info: bool = False
+):
+    """호가 정보 비동기 조회
+
+    quotation_api.get_orderbook과 같은 인자와 반환 형식을 사용합니다.
+    """
+    url = _endpoints().url("orderbook")
+
+    if level is not None:
+        orderbook, req_limit_info = await _call_public_api(
+            url, markets=ticker, level=str(level)
+        )
+    else:
+        orderbook, req_limit_info = await _call_public_api(url, markets=ticker)
+
+    if isinstance(ticker, str) or \
+            (isinstance(ticker, list) and len(ticker) == 1):
+        orderbook = orderbook[0]
+
+    if limit_info:
+        return orderbook, req_limit_info
+    else:
+        return orderbook
+
+
+class AsyncUpbit:
+    """asyncio 기반 Upbit 거래/자산 관리 클라이언트
+
+    Upbit 클래스의 주요 메서드를 코루틴으로 제공합니다. 같은 이벤트 루프의
+    다른 비동기 함수들과 커넥션 풀을 공유합니다. 에러 응답은 출력하거나 None을
+    반환하지 않고 동기 API와 같은 예외(UpbitErrorMixin 하위 클래스)로 발생합니다.
+
+    지원하는 메서드는 잔고 조회(get_balances, get_balance), 주문 가능 정보
+    (get_chance), 주문 조회(get_order, get_individual_order), 주문 취소
+    (cancel_order), 지정가/시장가 주문(buy_limit_order, sell_limit_order,
+    buy_market_order, sell_market_order)입니다. 입출금, 일괄 취소/취소 후 재주문,
+    트래블룰, API 키 조회 등 나머지 기능은 동기 Upbit 클래스를 사용하세요.
+
+    Args:
+        access: Upbit API Access Key
+        secret: Upbit API Secret Key
+        transport: 요청에 사용할 AsyncHTTPTransport (선택사항)
+            - None: 모듈 기본 비동기 transport를 공유
+        base_url: 이 클라이언트의 API 기본 주소 (선택사항)
+            - None: transport의 base_url, 없으면 set_base_url()로 지정한 프로세스 기본 주소 사용
+
+    Examples:
+        >>> async def main():
+        ...     upbit = AsyncUpbit(access, secret)
+        ...     balances = await upbit.get_balances()
+        ...     order = await upbit.buy_limit_order("KRW-BTC", 50000000, 0.001)
+    """
+
+    def __init__(self, access, secret,
+                 transport: Optional[AsyncHTTPTransport] = None,
+                 base_url: Optional[str] = None):
+        self.access = access
+        self.secret = secret
+        self.transport = transport
+        self._signer = None
+        self._endpoints = Endpoints(base_url) if base_url else None
+
+    # 동기 클라이언트와 동일한 JWT 서명 사용
+    _request_headers = Upbit._request_headers
+    set_base_url = Upbit.set_base_url
+
+    @property
+    def endpoints(self) -> Endpoints:
+        """요청 URL 표 (base_url > transport의 base_url > set_base_url() 순서)"""
+        return self._endpoints or get_endpoints(
+            self.transport or get_default_async_transport())
+
+    async def _send(self, method, url, data=None):
+        headers = self._request_headers(data)
+        return await _send_request(method, url, headers=headers, data=data,
+                                   transport=self.transport)
+
+    async def close(self):
+        """전용 transport를 사용하는 경우 커넥션 풀 종료"""
+        if self.transport is not None:
+            await self.transport.close()
+
+    #--------------------------------------------------------------------------
+    # 자산
+    #--------------------------------------------------------------------------
+    async def get_balances(self, contain_req=False):
+        """
+        전체 계좌 조회
+        :param contain_req: Remaining-Req 포함여부
+        :return: 내가 보유한 자산 리스트
+        """
+        url = self.endpoints.url("accounts")
+        result = await self._send("GET", url)
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def get_balance(self, ticker="KRW", verbose=False, contain_req=False):
+        """
+        특정 코인/원화의 잔고 조회
+        :param ticker: 화폐를 의미하는 영문 대문자 코드
+        :param verbose: False: only the balance, True: original dictionary
+        :param contain_req: Remaining-Req 포함여부
+        :return: 주문가능 금액/수량 (주문 중 묶여있는 금액/수량 제외)
+        """
+        fiat = "KRW"
+        if '-' in ticker:
+            fiat, ticker = ticker.split('-')
+
+        balances, req = await self.get_balances(contain_req=True)
+
+        balance = 0
+        for x in balances:
+            if x['currency'] == ticker and x['unit_currency'] == fiat:
+                if verbose is True:
+                    balance = x
+                else:
+                    balance = float(x['balance'])
+                break
+
+        if contain_req:
+            return balance, req
+        else:
+            return balance
+
+    #--------------------------------------------------------------------------
+    # 주문
+    #--------------------------------------------------------------------------
+    async def get_chance(self, ticker, contain_req=False):
+        """
+        마켓별 주문 가능 정보 조회
+        :param ticker: 마켓 티커
+        :param contain_req: Remaining-Req 포함여부
+        """
+        url = self.endpoints.url("orders_chance")
+        result = await self._send("GET", url, {"market": ticker})
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def get_order(self, ticker_or_uuid, state='wait', page=1, limit=100,
+                        contain_req=False):
+        """
+        주문 리스트 조회 (Upbit.get_order와 동일한 규칙으로 엔드포인트 선택)
+        :param ticker_or_uuid: 마켓 티커 또는 주문 UUID
+        :param state: 주문 상태 또는 상태 리스트
+        :param contain_req: Remaining-Req 포함여부
+        """
+        p = re.compile(r"^\w+-\w+-\w+-\w+-\w+$")
+        is_uuid = len(p.findall(ticker_or_uuid)) > 0
+        if is_uuid:
+            url = self.endpoints.url("orders_uuids")
+            data = {'uuid': ticker_or_uuid}
+        else:
+            states = state if isinstance(state, list) else [state]
+            has_closed_state = any(s in ['cancel', 'done'] for s in states)
+            if has_closed_state:
+                url = self.endpoints.url("orders_closed")
+            else:
+                url = self.endpoints.url("orders_open")
+
+            data = {
+                'market': ticker_or_uuid,
+                'page': page,
+                'limit': limit,
+                'order_by': 'desc'
+            }
+            data['states[]'] = states if len(states) > 1 else states[0]
+
+        result = await self._send("GET", url, data)
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def get_individual_order(self, uuid, contain_req=False):
+        """
+        개별 주문 조회
+        :param uuid: 주문 id
+        :param contain_req: Remaining-Req 포함여부
+        """
+        url = self.endpoints.url("orders_uuids")
+        result = await self._send("GET", url, {'uuid': uuid})
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def cancel_order(self, uuid, contain_req=False):
+        """
+        주문 취소
+        :param uuid: 주문 함수의 리턴 값중 uuid
+        :param contain_req: Remaining-Req 포함여부
+        """
+        url = self.endpoints.url("order")
+        result = await self._send("DELETE", url, {"uuid": uuid})
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def _create_order(self, data, contain_req, identifier=None):
+        if identifier is not None:
+            data["identifier"] = identifier
+        url = self.endpoints.url("orders")
+        result = await self._send("POST", url, data)
+        if contain_req:
+            return result
+        else:
+            return result[0]
+
+    async def buy_limit_order(self, ticker, price, volume, time_in_force=None,
+                              contain_req=False, identifier=None):
+        """
+        지정가 매수 (Upbit.buy_limit_order 대응)
+        """
+        data = {
+            "market": ticker,
+            "side": "bid",
+            "volume": str(volume),
+            "price": str(price),
+            "ord_type": "limit"
+        }
+        if time_in_force is not None:
+            data["time_in_force"] = time_in_force
+        return await self._create_order(data, contain_req, identifier)
+
+    async def sell_limit_order(self, ticker, price, volume, time_in_force=None,
+                               contain_req=False, identifier=None):
+        """
+        지정가 매도 (Upbit.sell_limit_order 대응)
+        """
+        data = {
+            "market": ticker,
+            "side": "ask",
+            "volume": str(volume),
+            "price": str(price),
+            "ord_type": "limit"
+        }
+        if time_in_force is not None:
+            data["time_in_force"] = time_in_force
+        return await self._create_order(data, contain_req, identifier)
+
+    async def buy_market_order(self, ticker, price, contain_req=False,
+                               identifier=None):
+        """
+        시장가 매수 (Upbit.buy_market_order 대응)
+        """
+        data = {"market": ticker,
+                "side": "bid",
+                "price": str(price),
+                "ord_type": "price"}
+        return await self._create_order(data, contain_req, identifier)
+
+    async def sell_market_order(self, ticker, volume, contain_req=False,
+                                identifier=None):
+        """
+        시장가 매도 (Upbit.sell_market_order 대응)
+        """
+        data = {"market": ticker,
+                "side": "ask",
+                "volume": str(volume),
+                "ord_type": "market"}
+        return await self._create_order(data, contain_req, identifier)
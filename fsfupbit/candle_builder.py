@@ -0,0 +1,271 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.candle_builder
+
+trade 스트림의 체결 메시지로 get_ohlcv와 같은 형식의 캔들을 실시간으로 만드는 집계기.
+"""
+
+import collections
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, Optional
+
+from fsfupbit.errors import UpbitValidationError
+from fsfupbit.quotation_api import OHLCV_RENAME, get_url_ohlcv, _candle_width
+
+FIELDS = list(OHLCV_RENAME.values())
+OPEN, HIGH, LOW, CLOSE, VOLUME, VALUE = range(6)
+
+_KST_OFFSET_MS = 9 * 60 * 60 * 1000
+# 1970-01-01은 목요일이므로 주 캔들(월요일 시작)은 4일 밀린 지점을 기준으로 나눔
+_WEEK_ORIGIN_MS = 4 * 24 * 60 * 60 * 1000
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _bucket_function(interval: str):
+    """체결 시각(UTC ms)을 캔들 시작 시각(UTC ms)으로 바꾸는 함수 반환
+
+    get_url_ohlcv가 받는 모든 interval을 지원하며, Upbit 캔들과 같이 UTC 기준으로
+    나눕니다 (일/주/월/연 캔들은 UTC 00:00, 즉 KST 09:00 시작).
+    """
+    url = get_url_ohlcv(interval)
+    width = _candle_width(url)
+    if width is not None:
+        width_ms = int(width.total_seconds() * 1000)
+        origin = _WEEK_ORIGIN_MS if url.endswith("/weeks") else 0
+        return lambda ts: (ts - origin) // width_ms * width_ms + origin
+
+    yearly = url.endswith("/years")
+
+    def calendar_bucket(ts):
+        t = _EPOCH + datetime.timedelta(milliseconds=ts)
+        start = datetime.datetime(t.year, 1 if yearly else t.month, 1)
+        return (start - _EPOCH) // datetime.timedelta(milliseconds=1)
+    return calendar_bucket
+
+
+class _Bars:
+    """한 마켓의 캔들 버퍼
+
+    capacity의 2배 크기 배열에 이어서 기록하고, 끝에 닿으면 최근 캔들을 앞으로
+    옮깁니다. 항상 연속된 구간이므로 복사 없이 배열 뷰를 돌려줄 수 있습니다.
+    keys의 열은 캔들 시작 시각, 시가 체결 시각, 종가 체결 시각(UTC ms)입니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.keys = np.zeros((capacity * 2, 3), dtype="int64")
+        self.values = np.zeros((capacity * 2, 6), dtype="float64")
+        self.start = 0
+        self.end = 0
+
+    def _compact(self, keep: int) -> None:
+        src = slice(self.end - keep, self.end)
+        self.keys[:keep] = self.keys[src]
+        self.values[:keep] = self.values[src]
+        self.start, self.end = 0, keep
+
+    def _new(self, i: int, bucket: int, ts: int, price: float) -> None:
+        self.keys[i] = (bucket, ts, ts)
+        self.values[i] = (price, price, price, price, 0.0, 0.0)
+
+    def add(self, bucket: int, ts: int, price: float, volume: float) -> bool:
+        """체결을 해당 캔들에 반영. 보관 중인 가장 오래된 캔들보다 이전이면 False"""
+        count = self.end - self.start
+        last = self.end - 1
+        if count and self.keys[last, 0] == bucket:
+            i = last
+        elif not count or self.keys[last, 0] < bucket:
+            if self.end == len(self.keys):
+                self._compact(min(count, self.capacity - 1))
+            elif count == self.capacity:
+                self.start += 1
+            i = self.end
+            self.end += 1
+            self._new(i, bucket, ts, price)
+        else:
+            # 늦게 도착한 체결: 이미 지난 캔들을 찾거나 사이에 끼워 넣음
+            buckets = self.keys[self.start:self.end, 0]
+            i = self.start + int(np.searchsorted(buckets, bucket))
+            if self.keys[i, 0] != bucket:
+                if i == self.start and count == self.capacity:
+                    return False
+                i = self._insert(i)
+                self._new(i, bucket, ts, price)
+
+        keys = self.keys[i]
+        row = self.values[i]
+        if ts < keys[1]:
+            keys[1] = ts
+            row[OPEN] = price
+        if ts >= keys[2]:
+            keys[2] = ts
+            row[CLOSE] = price
+        row[HIGH] = max(row[HIGH], price)
+        row[LOW] = min(row[LOW], price)
+        row[VOLUME] += volume
+        row[VALUE] += price * volume
+        return True
+
+    def _insert(self, pos: int) -> int:
+        """pos 위치에 빈 캔들 자리를 만들고 그 위치를 반환"""
+        if self.end - self.start == self.capacity:
+            # 가장 오래된 캔들을 버리고 앞쪽을 한 칸씩 당김
+            pos -= 1
+            self.keys[self.start:pos] = self.keys[self.start + 1:pos + 1]
+            self.values[self.start:pos] = self.values[self.start + 1:pos + 1]
+            return pos
+        if self.end == len(self.keys):
+            offset = self.start
+            self._compact(self.end - self.start)
+            pos -= offset
+        self.keys[pos + 1:self.end + 1] = self.keys[pos:self.end].copy()
+        self.values[pos + 1:self.end + 1] = self.values[pos:self.end].copy()
+        self.end += 1
+        return pos
+
+
+class CandleBuilder:
+    """trade 스트림으로 캔들을 만드는 실시간 집계기
+
+    체결 메시지를 받을 때마다 해당 캔들의 시가/고가/저가/종가/거래량/거래대금을
+    갱신합니다. 캔들은 마켓별로 미리 할당한 버퍼에 최근 size개까지 보관하며,
+    get_ohlcv와 같은 컬럼과 KST 시각 인덱스의 DataFrame이나 NumPy 배열 뷰로
+    조회할 수 있습니다.
+
+    Args:
+        interval: 캔들 간격 (get_ohlcv와 동일, 예: "seconds/1", "minute1", "day")
+        size: 마켓별로 보관할 최대 캔들 수 (기본값: 1000)
+        dedupe: 중복 확인을 위해 기억할 마켓별 최근 체결 번호 수 (기본값: 10000)
+
+    Examples:
+        >>> builder = CandleBuilder("minute1")
+        >>> wm = WebSocketManager("trade", ["KRW-BTC", "KRW-ETH"])
+        >>> while True:
+        ...     builder.update(wm.get())
+        ...     df = builder.to_frame("KRW-BTC")   # get_ohlcv와 같은 형식
+
+    Note:
+        - 캔들 구간은 Upbit와 같이 UTC 기준으로 나누며, 인덱스는 캔들 시작 시각(KST)입니다
+        - 체결이 없던 구간의 캔들은 만들지 않습니다 (get_ohlcv와 동일)
+        - 같은 sequential_id의 체결은 한 번만 반영합니다
+        - 마지막 캔들은 진행 중이므로 값이 계속 바뀝니다
+        - DEFAULT/SIMPLE 포맷의 trade 메시지를 모두 받습니다
+    """
+
+    def __init__(self, interval: str = "minute1", size: int = 1000,
+                 dedupe: int = 10000):
+        if size < 1:
+            raise UpbitValidationError("size는 1 이상이어야 합니다", field="size")
+        self.interval = interval
+        self.size = size
+        self._bucket = _bucket_function(interval)
+        self._bars: Dict[str, _Bars] = {}
+        self._dedupe = dedupe
+        self._seen: Dict[str, set] = {}
+        self._seen_order: Dict[str, collections.deque] = {}
+
+    @property
+    def markets(self):
+        """캔들을 만들고 있는 마켓 리스트"""
+        return list(self._bars)
+
+    def update(self, message: Any) -> Optional[str]:
+        """trade 메시지 하나를 반영
+
+        Args:
+            message: trade 스트림 메시지 (DEFAULT/SIMPLE). dict가 아니거나
+                trade 메시지가 아니면 무시
+
+        Returns:
+            str: 갱신한 마켓. 무시한 경우 None
+        """
+        if not isinstance(message, dict):
+            return None
+        if "ttms" in message:
+            if message.get("ty", "trade") != "trade":
+                return None
+            market, ts = message.get("cd"), message["ttms"]
+            price, volume = message["tp"], message["tv"]
+            sid = message.get("sid")
+        elif "trade_timestamp" in message:
+            if message.get("type", "trade") != "trade":
+                return None
+            market, ts = message.get("code"), message["trade_timestamp"]
+            price, volume = message["trade_price"], message["trade_volume"]
+            sid = message.get("sequential_id")
+        else:
+            return None
+
+        if sid is not None and self._dedupe:
+            seen = self._seen.get(market)
+            if seen is None:
+                seen = self._seen[market] = set()
+                self._seen_order[market] = collections.deque()
+            if sid in seen:
+                return None
+            seen.add(sid)
+            order = self._seen_order[market]
+            order.append(sid)
+            if len(order) > self._dedupe:
+                seen.discard(order.popleft())
+
+        bars = self._bars.get(market)
+        if bars is None:
+            bars = self._bars[market] = _Bars(self.size)
+        ts = int(ts)
+        if not bars.add(self._bucket(ts), ts, float(price), float(volume)):
+            return None
+        return market
+
+    def update_many(self, messages: Iterable[Any]) -> None:
+        """여러 trade 메시지를 순서대로 반영"""
+        for message in messages:
+            self.update(message)
+
+    def _get(self, market: str) -> _Bars:
+        try:
+            return self._bars[market]
+        except KeyError:
+            raise UpbitValidationError(
+                f"캔들 데이터가 없는 마켓입니다: {market}", field="market") from None
+
+    def values(self, market: str) -> np.ndarray:
+        """캔들 값 배열 뷰. shape: (캔들 수, 6), 열 순서는 FIELDS"""
+        bars = self._get(market)
+        return bars.values[bars.start:bars.end]
+
+    def times(self, market: str) -> np.ndarray:
+        """캔들 시작 시각(UTC, ms) 배열 뷰"""
+        bars = self._get(market)
+        return bars.keys[bars.start:bars.end, 0]
+
+    def to_frame(self, market: str, count: Optional[int] = None) -> pd.DataFrame:
+        """get_ohlcv와 같은 형식의 DataFrame 반환
+
+        Args:
+            market: 마켓 코드
+            count: 최근 캔들 수 (기본값: 보관 중인 전체)
+
+        Returns:
+            DataFrame: 캔들 시작 시각(KST) 인덱스의 open/high/low/close/volume/value
+        """
+        values = self.values(market)
+        times = self.times(market)
+        if count is not None:
+            values, times = values[-count:], times[-count:]
+        index = pd.DatetimeIndex((times + _KST_OFFSET_MS).astype("datetime64[ms]"))
+        return pd.DataFrame(values.copy(), index=index, columns=FIELDS)
@@ -0,0 +1,387 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.candle_store
+
+(티커, 캔들 간격)별 캔들 데이터를 디스크에 저장하고, 이후 호출에서는
+마지막으로 저장된 캔들 이후의 데이터만 받아 갱신하는 로컬 캔들 저장소입니다.
+"""
+
+import datetime
+import io
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from fsfupbit.quotation_api import (
+    get_ohlcv, get_ohlcv_from, get_url_ohlcv, _candle_width, _ohlcv_from_range,
+)
+
+KST_OFFSET = datetime.timedelta(hours=9)
+
+FIELDS = ["open", "high", "low", "close", "volume", "value"]
+# 컬럼별 파일의 dtype (time은 KST 캔들 시작 시각)
+COLUMN_DTYPES = {"time": np.dtype("datetime64[ns]"),
+                 **{name: np.dtype("float64") for name in FIELDS}}
+
+# 간격이 일정하지 않은 캔들의 갱신 개수 추정용 최소 간격
+_MIN_WIDTH = {
+    "months": datetime.timedelta(days=28),
+    "years": datetime.timedelta(days=365),
+}
+
+
+def _interval_key(interval: str) -> str:
+    """같은 캔들을 가리키는 interval 별칭("day"/"days" 등)을 하나의 키로 변환"""
+    return get_url_ohlcv(interval).split("/candles/", 1)[1]
+
+
+def _now_kst() -> datetime.datetime:
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return now + KST_OFFSET
+
+
+def _kst(value: datetime.datetime) -> datetime.datetime:
+    """tz 정보 있는 시각을 캔들 인덱스와 같은 tz 없는 KST 시각으로 변환"""
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None) + KST_OFFSET
+
+
+def _utc(kst: datetime.datetime) -> datetime.datetime:
+    """캔들 인덱스의 KST 시각을 tz 정보 있는 UTC 시각으로 변환"""
+    return (kst - KST_OFFSET).replace(tzinfo=datetime.timezone.utc)
+
+
+def _to_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    columns = {"time": df.index.values.astype(COLUMN_DTYPES["time"])}
+    for name in FIELDS:
+        columns[name] = df[name].to_numpy(dtype="float64")
+    return columns
+
+
+def _append_in_place(file: str, keep: int, new: np.ndarray) -> bool:
+    """.npy 파일의 앞쪽 keep개는 그대로 두고 뒤에 new를 씀
+
+    np.save는 헤더의 shape 뒤에 여유 공백을 두므로 헤더 길이를 바꾸지 않고
+    원소 수만 고칠 수 있습니다. 헤더 형식이 다르면 아무것도 쓰지 않고 False
+    반환 (호출한 쪽이 파일 전체를 다시 씀).
+    """
+    fmt = np.lib.format
+    with open(file, "r+b") as f:
+        version = fmt.read_magic(f)
+        if version == (1, 0):
+            read_header, write_header = fmt.read_array_header_1_0, fmt.write_array_header_1_0
+        elif version == (2, 0):
+            read_header, write_header = fmt.read_array_header_2_0, fmt.write_array_header_2_0
+        else:
+            return False
+        shape, fortran_order, dtype = read_header(f)
+        offset = f.tell()
+        if dtype != new.dtype or fortran_order or len(shape) != 1 or keep > shape[0]:
+            return False
+
+        header = io.BytesIO()
+        write_header(header, {"descr": fmt.dtype_to_descr(new.dtype),
+                              "fortran_order": False,
+                              "shape": (keep + len(new),)})
+        if header.tell() != offset:
+            return False
+
+        # 헤더의 갯수가 파일보다 많아지는 순간이 없도록, 늘어날 때는 데이터를
+        # 먼저 쓰고 줄어들 때는 헤더를 먼저 씀
+        shrink = keep + len(new) < shape[0]
+        if shrink:
+            f.seek(0)
+            f.write(header.getvalue())
+        f.seek(offset + keep * new.dtype.itemsize)
+        f.write(new.tobytes())
+        f.truncate()
+        if not shrink:
+            f.seek(0)
+            f.write(header.getvalue())
+    return True
+
+
+class CandleStore:
+    """증분 갱신을 지원하는 로컬 캔들 저장소
+
+    캔들은 (티커, 간격)별 디렉토리에 컬럼마다 하나의 NumPy 파일(time.npy,
+    open.npy, ..., value.npy)로 저장되는 컬럼 형식입니다. 읽을 때는 필요한
+    컬럼만 메모리 맵으로 열어 요청한 구간만 디스크에서 읽으므로, 종가만 필요하면
+    close.npy의 해당 부분만 읽습니다. 이미 저장된 구간은 다시 받지 않고, 마지막
+    캔들(진행 중일 수 있음)부터 현재까지의 캔들만 요청하여 파일 끝에 덧붙입니다.
+
+    Args:
+        path: 캔들 파일을 저장할 디렉토리
+
+    Examples:
+        >>> store = CandleStore("~/.fsfupbit/candles")
+        >>> df = store.get_ohlcv("KRW-BTC", interval="minute1", count=10000)
+        >>> # 두 번째 호출은 새로 생긴 캔들만 요청
+        >>> df = store.get_ohlcv("KRW-BTC", interval="minute1", count=10000)
+        >>> # 기간 조회도 저장된 구간은 다시 받지 않음
+        >>> df = store.get_ohlcv_from("KRW-BTC", "minute1", "2024-01-01 00:00:00")
+        >>> closes = store.load("KRW-BTC", "minute1", count=500, columns=["close"])
+
+    Note:
+        - 저장소 하나를 동시에 갱신하는 프로세스는 하나여야 합니다
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+
+    def _dir(self, ticker: str, interval: str) -> str:
+        key = _interval_key(interval).replace("/", "_")
+        return os.path.join(self.path, ticker, key)
+
+    def _open(self, ticker: str, interval: str,
+              columns: List[str]) -> Optional[Dict[str, np.ndarray]]:
+        """컬럼 파일을 메모리 맵으로 열기 (저장된 데이터가 없으면 None)
+
+        덧붙이는 중에는 time 파일을 마지막에 늘리므로, 모든 컬럼을 time의 길이로
+        잘라 같은 행을 가리키게 합니다.
+        """
+        directory = self._dir(ticker, interval)
+        try:
+            arrays = {name: np.load(os.path.join(directory, f"{name}.npy"),
+                                    mmap_mode="r")
+                      for name in dict.fromkeys(["time"] + columns)}
+        except (FileNotFoundError, ValueError):
+            return None
+        n = min(len(a) for a in arrays.values())
+        return {name: a[:n] for name, a in arrays.items()}
+
+    def _frame(self, arrays: Dict[str, np.ndarray], columns: List[str],
+               start: int, stop: int) -> Optional[pd.DataFrame]:
+        if stop <= start:
+            return None
+        return pd.DataFrame({name: np.array(arrays[name][start:stop]) for name in columns},
+                            index=pd.DatetimeIndex(np.array(arrays["time"][start:stop])))
+
+    def load(self, ticker: str, interval: str, count: Optional[int] = None,
+             columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """저장된 캔들 조회
+
+        Args:
+            ticker: 마켓 티커
+            interval: 캔들 간격 (get_ohlcv와 동일)
+            count: 최근 캔들 갯수 (기본값: None = 전체). 지정하면 파일에서 그만큼만 읽음
+            columns: 읽을 컬럼 (기본값: None = open, high, low, close, volume, value)
+
+        Returns:
+            DataFrame: get_ohlcv와 같은 형식의 캔들 데이터. 저장된 데이터가 없으면 None
+        """
+        columns = list(columns or FIELDS)
+        arrays = self._open(ticker, interval, columns)
+        if arrays is None:
+            return None
+        n = len(arrays["time"])
+        start = 0 if count is None else max(n - max(count, 1), 0)
+        return self._frame(arrays, columns, start, n)
+
+    def save(self, ticker: str, interval: str, df: pd.DataFrame) -> None:
+        """캔들 저장 (새 디렉토리에 모두 쓴 뒤 기존 디렉토리와 교체)"""
+        self._replace(self._dir(ticker, interval), _to_columns(df))
+
+    def append(self, ticker: str, interval: str, df: pd.DataFrame) -> int:
+        """캔들을 컬럼 파일 끝에 덧붙임
+
+        df의 첫 캔들 시각 이후로 저장된 캔들은 df로 교체하고, 그 이전 구간은
+        다시 쓰지 않습니다. 저장된 데이터가 없으면 save()와 같습니다.
+
+        Args:
+            ticker: 마켓 티커
+            interval: 캔들 간격 (get_ohlcv와 동일)
+            df: 저장된 캔들보다 새로운 캔들 (시간순)
+
+        Returns:
+            int: 덧붙인 뒤 저장된 캔들 갯수
+        """
+        new = _to_columns(df)
+        arrays = self._open(ticker, interval, [])
+        if arrays is None:
+            self.save(ticker, interval, df)
+            return len(df)
+        times = arrays["time"]
+        if len(df) == 0:
+            return len(times)
+        keep = int(np.searchsorted(times, new["time"][0], side="left"))
+        stored = len(times)
+        del arrays, times  # 메모리 맵을 닫은 뒤 파일 수정
+
+        directory = self._dir(ticker, interval)
+        # 늘어날 때는 time을 마지막에, 줄어들 때는 처음에 고쳐서 읽는 쪽이
+        # time 길이까지만 보면 항상 온전한 행을 보게 함
+        names = FIELDS + ["time"] if keep + len(df) >= stored else ["time"] + FIELDS
+        for name in names:
+            if not _append_in_place(os.path.join(directory, f"{name}.npy"),
+                                    keep, new[name]):
+                old = self._open(ticker, interval, FIELDS)
+                merged = {key: np.concatenate([np.array(old[key][:keep]), new[key]])
+                          for key in new}
+                del old
+                self._replace(directory, merged)
+                break
+        return keep + len(df)
+
+    def _replace(self, directory: str, columns: Dict[str, np.ndarray]) -> None:
+        parent = os.path.dirname(directory)
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+        try:
+            for name, values in columns.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), values)
+            old = None
+            if os.path.exists(directory):
+                old = tempfile.mkdtemp(dir=parent, suffix=".old")
+                os.rmdir(old)
+                os.replace(directory, old)
+            os.replace(tmp, directory)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        if old is not None:
+            shutil.rmtree(old, ignore_errors=True)
+
+    def clear(self, ticker: str, interval: str) -> None:
+        """저장된 캔들 삭제"""
+        shutil.rmtree(self._dir(ticker, interval), ignore_errors=True)
+
+    def _span(self, ticker: str, interval: str):
+        """저장된 첫/마지막 캔들 시각과 갯수 (없으면 None)"""
+        arrays = self._open(ticker, interval, [])
+        if arrays is None or len(arrays["time"]) == 0:
+            return None
+        times = arrays["time"]
+        return (pd.Timestamp(times[0]).to_pydatetime(),
+                pd.Timestamp(times[-1]).to_pydatetime(), len(times))
+
+    def get_ohlcv(
+        self,
+        ticker: str = "KRW-BTC",
+        interval: str = "day",
+        count: int = 200,
+        max_workers: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """저장소를 거쳐 최근 캔들 count개 조회
+
+        Args:
+            ticker: 마켓 티커 (기본값: "KRW-BTC")
+            interval: 캔들 간격 (get_ohlcv와 동일)
+            count: 조회 갯수 (기본값: 200)
+            max_workers: 새로 받는 캔들의 동시 요청 스레드 수 (get_ohlcv와 동일)
+
+        Returns:
+            DataFrame: get_ohlcv와 같은 형식의 OHLCV 데이터. 조회 실패 시 None
+
+        Note:
+            - 저장된 마지막 캔들은 진행 중이었을 수 있으므로 항상 다시 받습니다
+            - 저장된 캔들이 count보다 적으면 더 오래된 캔들을 받아 저장소를 확장합니다
+        """
+        count = max(count, 1)
+        span = self._span(ticker, interval)
+        if span is None:
+            df = get_ohlcv(ticker, interval, count=count, max_workers=max_workers)
+            if df is None:
+                return None
+            self.save(ticker, interval, df)
+            return df
+        last = span[1]
+
+        # 마지막 저장 캔들부터 현재까지의 캔들 개수를 넉넉하게 추정
+        url = get_url_ohlcv(interval)
+        width = _candle_width(url) or _MIN_WIDTH[_interval_key(interval)]
+        n_new = int((_now_kst() - last) / width) + 1
+
+        fresh = get_ohlcv(ticker, interval, count=max(n_new, 1),
+                          max_workers=max_workers)
+        if fresh is None:
+            return None
+        stored = self.append(ticker, interval, fresh)
+
+        if stored < count:
+            # 앞쪽 확장은 파일 전체를 다시 씀 (저장소를 처음 늘릴 때만 발생)
+            df = self.load(ticker, interval)
+            oldest_utc = df.index[0].to_pydatetime() - KST_OFFSET
+            older = get_ohlcv(ticker, interval, count=count - stored,
+                              to=oldest_utc, max_workers=max_workers)
+            if older is not None:
+                self.save(ticker, interval,
+                          pd.concat([older[older.index < df.index[0]], df]))
+
+        return self.load(ticker, interval, count)
+
+    def get_ohlcv_from(
+        self,
+        ticker: str = "KRW-BTC",
+        interval: str = "day",
+        fromDatetime=None,
+        to=None,
+        period: float = 0.1
+    ) -> Optional[pd.DataFrame]:
+        """저장소를 거쳐 fromDatetime부터 to까지의 캔들 조회
+
+        quotation_api.get_ohlcv_from과 같은 인자를 사용합니다. 저장된 구간은
+        다시 받지 않고, 요청 구간 중 저장된 첫 캔들보다 앞선 부분과 마지막 캔들
+        (진행 중일 수 있음) 이후 부분만 받아 저장소를 넓힌 뒤, 요청 구간을 컬럼
+        파일에서 잘라 반환합니다.
+
+        Args:
+            ticker: 마켓 티커 (기본값: "KRW-BTC")
+            interval: 캔들 간격 (get_ohlcv와 동일)
+            fromDatetime: 시작 시각 (기본값: 2000-01-01, tz 정보가 없으면 로컬 시각)
+            to: 끝 시각, 이 시각 이전의 캔들까지 (기본값: 현재)
+            period: 페이지 요청 간격 (초, 기본값: 0.1)
+
+        Returns:
+            DataFrame: get_ohlcv와 같은 형식의 OHLCV 데이터. 조회 실패 시 None
+
+        Note:
+            - 저장된 구간은 항상 이어져 있으므로, 저장된 구간과 떨어진 과거/미래
+              구간을 요청하면 그 사이의 캔들도 함께 받습니다
+        """
+        start_utc, end_utc = _ohlcv_from_range(fromDatetime, to)
+        start, end = _kst(start_utc), _kst(end_utc)
+
+        span = self._span(ticker, interval)
+        if span is None:
+            df = get_ohlcv_from(ticker, interval, fromDatetime=start_utc,
+                                to=end_utc, period=period)
+            if df is None:
+                return None
+            self.save(ticker, interval, df)
+        else:
+            first, last, _ = span
+            if end > last:
+                fresh = get_ohlcv_from(ticker, interval, fromDatetime=_utc(last),
+                                       to=end_utc, period=period)
+                if fresh is None:
+                    return None
+                self.append(ticker, interval, fresh[fresh.index >= last])
+            if start < first:
+                older = get_ohlcv_from(ticker, interval, fromDatetime=start_utc,
+                                       to=_utc(first), period=period)
+                if older is not None and len(older[older.index < first]):
+                    self.save(ticker, interval, pd.concat(
+                        [older[older.index < first], self.load(ticker, interval)]))
+
+        arrays = self._open(ticker, interval, FIELDS)
+        if arrays is None:
+            return None
+        times = arrays["time"]
+        lo = int(np.searchsorted(times, np.datetime64(start), side="left"))
+        hi = int(np.searchsorted(times, np.datetime64(end), side="left"))
+        return self._frame(arrays, FIELDS, lo, hi)
@@ -0,0 +1,187 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.coalesce
+
+동시에 들어온 같은 시세 조회 요청을 하나로 합치는 single-flight 계층.
+_call_public_api()가 이 계층을 거쳐 요청을 보냅니다.
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def request_key(url: str, params: Dict[str, Any],
+                scope: Any = None) -> Hashable:
+    """(url, params)로 요청 키 생성
+
+    Args:
+        url: 요청 URL
+        params: GET 파라미터 (리스트 값은 순서를 유지한 튜플로 변환)
+        scope: 키를 구분할 추가 값 (예: 요청을 보낼 transport 객체)
+    """
+    return (scope, url, _freeze(params))
+
+
+def _waiter_error(error: BaseException) -> BaseException:
+    """기다리던 호출에 던질 예외 (traceback이 섞이지 않도록 복사본 사용)"""
+    try:
+        fresh = copy.copy(error)
+    except Exception:
+        return error
+    return fresh.with_traceback(None)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """동시 요청 병합기 (single-flight)
+
+    같은 키의 요청이 이미 전송 중이면 새로 보내지 않고 그 응답을 기다려 함께
+    사용합니다. 20개 스레드가 동시에 get_current_price("KRW-BTC")를 호출해도
+    HTTP 요청과 요청 수 제한은 1건만 사용합니다. ttl을 지정하면 받은 응답을
+    ttl초 동안 보관하여 직후의 같은 요청도 전송 없이 돌려줍니다.
+
+    요청이 실패하면 기다리던 호출도 같은 종류의 예외를 받으며, 실패한 결과는
+    보관하지 않습니다. 기다리던 호출에는 예외의 복사본을 새로 발생시키고 원래
+    예외는 __cause__로 연결하므로 traceback이 호출마다 따로 남습니다.
+
+    Args:
+        ttl: 응답 보관 시간 (초, 기본값: 0). 0이면 전송 중인 요청만 병합
+        max_entries: 보관할 최대 응답 수 (기본값: 1024). 넘으면 오래된 것부터 삭제
+        enabled: False이면 병합하지 않고 매번 요청 (기본값: True)
+
+    Examples:
+        >>> set_request_coalescer(RequestCoalescer(ttl=0.2))
+        >>> # 200ms 안의 같은 현재가 조회는 한 번만 전송
+        >>> get_current_price("KRW-BTC")
+
+        >>> # 병합 끄기
+        >>> set_request_coalescer(RequestCoalescer(enabled=False))
+
+    Note:
+        - 여러 호출이 같은 결과 객체를 받으므로 결과는 수정하지 말고 읽기만 하세요
+          (_call_public_api는 응답 객체를 공유하고 JSON은 호출마다 따로 파싱합니다)
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 1024,
+                 enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._fresh: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def call(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """key가 같은 동시 호출을 합쳐 fn()을 한 번만 실행하고 결과 반환
+
+        Args:
+            key: 요청 키 (request_key()로 생성)
+            fn: 실제 요청을 보내는 함수
+
+        Returns:
+            fn()의 결과 (다른 호출과 공유될 수 있음)
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            if self.ttl > 0:
+                entry = self._fresh.get(key)
+                if entry is not None:
+                    if time.monotonic() < entry[0]:
+                        return entry[1]
+                    del self._fresh[key]
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                error = _waiter_error(call.error)
+                if error is call.error:
+                    raise error
+                raise error from call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if call.error is None and self.ttl > 0:
+                    self._store(key, call.result)
+            call.done.set()
+        return call.result
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        fresh = self._fresh
+        fresh.pop(key, None)
+        while len(fresh) >= self.max_entries > 0:
+            del fresh[next(iter(fresh))]
+        if self.max_entries > 0:
+            fresh[key] = (time.monotonic() + self.ttl, result)
+
+    def clear(self) -> None:
+        """보관 중인 응답 삭제 (전송 중인 요청에는 영향 없음)"""
+        with self._lock:
+            self._fresh.clear()
+
+    def __repr__(self) -> str:
+        return (f"RequestCoalescer(ttl={self.ttl!r}, "
+                f"max_entries={self.max_entries!r}, enabled={self.enabled!r})")
+
+
+_default_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """_call_public_api()가 사용하는 프로세스 기본 요청 병합기"""
+    return _default_coalescer
+
+
+def set_request_coalescer(coalescer: Optional[RequestCoalescer]) -> None:
+    """프로세스 기본 요청 병합기 교체
+
+    Args:
+        coalescer: 새 병합기. None이면 기본 설정(ttl 0, 전송 중인 요청만 병합)으로 다시 생성
+
+    Examples:
+        >>> set_request_coalescer(RequestCoalescer(ttl=0.5))
+    """
+    global _default_coalescer
+    _default_coalescer = coalescer if coalescer is not None else RequestCoalescer()
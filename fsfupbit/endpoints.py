@@ -0,0 +1,172 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.endpoints
+
+Upbit REST API 경로 목록과 기본 주소(base URL)별 전체 URL 표.
+
+REST 요청 주소는 모두 이 모듈의 Endpoints로 만들며, 다음 순서로 처음 지정된
+주소를 사용합니다. transport는 URL을 바꾸지 않고 받은 URL로 그대로 전송합니다.
+
+1. 클라이언트의 base_url (``Upbit(..., base_url=...)``, ``upbit.set_base_url()``)
+2. 요청을 보낼 transport의 base_url (``HTTPTransport(base_url=...)``,
+   ``UpbitSimulator.transport()``)
+3. 프로세스 기본 주소 (``set_base_url()``)
+4. UPBIT_API_URL (https://api.upbit.com)
+"""
+
+from typing import Any, Dict, Optional
+
+UPBIT_API_URL = "https://api.upbit.com"
+
+# 이름 → 경로
+ENDPOINTS: Dict[str, str] = {
+    # 시세
+    "market_all": "/v1/market/all",
+    "ticker": "/v1/ticker",
+    "ticker_all": "/v1/ticker/all",
+    "orderbook": "/v1/orderbook",
+    "orderbook_supported_levels": "/v1/orderbook/supported_levels",
+    "trades_ticks": "/v1/trades/ticks",
+    # 자산/주문
+    "accounts": "/v1/accounts",
+    "orders_chance": "/v1/orders/chance",
+    "order": "/v1/order",
+    "orders": "/v1/orders",
+    "orders_test": "/v1/orders/test",
+    "orders_uuids": "/v1/orders/uuids",
+    "orders_open": "/v1/orders/open",
+    "orders_closed": "/v1/orders/closed",
+    # 출금
+    "withdraws": "/v1/withdraws",
+    "withdraw": "/v1/withdraw",
+    "withdraws_coin": "/v1/withdraws/coin",
+    "withdraws_krw": "/v1/withdraws/krw",
+    "withdraws_whitelist_addresses": "/v1/withdraws/whitelist_addresses",
+    # 입금
+    "deposits": "/v1/deposits",
+    "deposit": "/v1/deposit",
+    "deposits_generate_coin_address": "/v1/deposits/generate_coin_address",
+    "deposits_coin_addresses": "/v1/deposits/coin_addresses",
+    "deposits_coin_address": "/v1/deposits/coin_address",
+    "deposits_krw": "/v1/deposits/krw",
+    # 서비스 정보
+    "status_wallet": "/v1/status/wallet",
+    "api_keys": "/v1/api_keys",
+    "travel_rule_vasps": "/v1/travel_rule/vasps",
+    "travel_rule_verify": "/v1/travel_rule/verify",
+}
+
+SECOND_CANDLE_UNITS = (1, 3, 5, 10, 15, 30, 60, 240)
+MINUTE_CANDLE_UNITS = (1, 3, 5, 10, 15, 30, 60, 240)
+DEFAULT_CANDLE_PATH = "/v1/candles/days"
+
+
+def _candle_paths() -> Dict[str, str]:
+    """get_ohlcv interval → 캔들 경로 (interval의 모든 별칭 포함)"""
+    paths = {}
+    for name in ("day", "week", "month", "year"):
+        paths[name] = paths[name + "s"] = f"/v1/candles/{name}s"
+    for unit in MINUTE_CANDLE_UNITS:
+        paths[f"minute{unit}"] = paths[f"minutes{unit}"] = f"/v1/candles/minutes/{unit}"
+    for unit in SECOND_CANDLE_UNITS:
+        paths[f"seconds/{unit}"] = f"/v1/candles/seconds/{unit}"
+    return paths
+
+
+# interval → 경로
+CANDLE_PATHS: Dict[str, str] = _candle_paths()
+
+
+class Endpoints:
+    """기본 주소(base URL)를 붙인 Upbit API 전체 URL 표
+
+    생성할 때 모든 경로의 전체 URL을 한 번 만들어 두므로, 조회는 문자열 연결 없이
+    딕셔너리 조회 한 번입니다. 지역 엣지, 로컬 프록시/캐시, 시뮬레이터처럼
+    api.upbit.com이 아닌 주소로 요청을 보낼 때 사용합니다.
+
+    Args:
+        base_url: API 기본 주소 (기본값: UPBIT_API_URL)
+
+    Examples:
+        >>> endpoints = Endpoints("http://127.0.0.1:8080")
+        >>> endpoints.url("ticker")
+        'http://127.0.0.1:8080/v1/ticker'
+        >>> endpoints.candle_url("minute1")
+        'http://127.0.0.1:8080/v1/candles/minutes/1'
+    """
+
+    __slots__ = ("base_url", "_urls", "_candle_urls", "_default_candle_url")
+
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = (base_url or UPBIT_API_URL).rstrip("/")
+        self._urls = {name: self.base_url + path for name, path in ENDPOINTS.items()}
+        self._candle_urls = {interval: self.base_url + path
+                             for interval, path in CANDLE_PATHS.items()}
+        self._default_candle_url = self.base_url + DEFAULT_CANDLE_PATH
+
+    def url(self, name: str) -> str:
+        """이름에 해당하는 전체 URL
+
+        Raises:
+            KeyError: ENDPOINTS에 없는 이름인 경우
+        """
+        return self._urls[name]
+
+    def candle_url(self, interval: str) -> str:
+        """get_ohlcv interval의 캔들 URL. 알 수 없는 interval은 일 캔들"""
+        url = self._candle_urls.get(interval)
+        if url is not None:
+            return url
+        if interval.startswith("seconds/"):
+            # 표에 없는 초 단위도 그대로 전달 (지원 여부는 서버가 판단)
+            return f"{self.base_url}/v1/candles/seconds/{interval.split('/')[1]}"
+        return self._default_candle_url
+
+    def __repr__(self) -> str:
+        return f"Endpoints({self.base_url!r})"
+
+
+_default_endpoints = Endpoints()
+
+
+def get_endpoints(transport: Any = None) -> Endpoints:
+    """transport로 보낼 요청의 URL 표 (transport의 base_url > set_base_url() > 기본 주소)
+
+    Args:
+        transport: 요청을 보낼 transport. None이면 모듈 기본 (동기) transport
+    """
+    if transport is None:
+        from .transport import get_default_transport
+        transport = get_default_transport()
+    return getattr(transport, "endpoints", None) or _default_endpoints
+
+
+def set_base_url(base_url: Optional[str]) -> None:
+    """프로세스 기본 API 주소 변경
+
+    base_url을 지정하지 않은 Upbit/AsyncUpbit와 시세 조회 함수(get_ohlcv,
+    get_current_price 등)가 이후 요청부터 이 주소를 사용합니다. 클라이언트나
+    transport에 base_url을 지정했으면 그 주소가 우선합니다 (모듈 설명 참조).
+
+    Args:
+        base_url: API 기본 주소. None이면 UPBIT_API_URL로 복원
+
+    Examples:
+        >>> set_base_url("http://cache.internal:8080")   # 공유 캐시 프록시
+        >>> get_current_price("KRW-BTC")                  # 프록시로 요청
+    """
+    global _default_endpoints
+    _default_endpoints = Endpoints(base_url)
+
@@ -10,7 +10,7 @@
 #
 
 from requests import Response
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple, Type
 
 __all__ = [
     # Base exceptions (fsfupbit additions)
@@ -35,7 +35,8 @@ __all__ = [
     "TooManyRequests",
     "RemainingReqParsingError",
     "InValidAccessKey",
-    "error_handler",  # raise_error must be in place of last in this list
+    "register_error",
+    "error_handler",
 ]
 
 
@@ -52,8 +53,19 @@ class UpbitErrorMixin(Exception):
 
 
 class UpbitError(UpbitErrorMixin):
-    """fsfupbit 기본 에러 클래스"""
-    pass
+    """fsfupbit 기본 에러 클래스
+
+    등록되지 않은 에러 이름의 응답에 사용합니다. 서버 메시지는 형식 문자열로
+    해석하지 않고 그대로 보여 줍니다.
+
+    Attributes:
+        name (str): Upbit 에러 이름
+        code (int): HTTP 상태 코드
+        message (str): 서버가 보낸 에러 메시지
+    """
+
+    def __str__(self) -> str:
+        return getattr(self, "message", "") or getattr(self, "name", "")
 
 
 class UpbitAPIError(Exception):
@@ -263,42 +275,117 @@ class InValidAccessKey(UpbitUnauthorizedError):
     msg = "잘못된 엑세스 키입니다."
 
 
-BAD_REQUESTS = [eval(err) for err in __all__[:-1]
-                 if hasattr(eval(err), 'code') and eval(err).code == 400]
-UNAUTHORIZED = [eval(err) for err in __all__[:-1]
-                if hasattr(eval(err), 'code') and eval(err).code == 401]
-TOO_MANY_REQ = [eval(err) for err in __all__[:-1]
-                if hasattr(eval(err), 'code') and eval(err).code == 429]
+# (HTTP 상태 코드, Upbit 에러 이름) → 예외 클래스
+_ERROR_REGISTRY: Dict[Tuple[int, str], Type[UpbitErrorMixin]] = {}
+
+# 이름이 등록되지 않은 응답에 쓸 상태 코드별 예외 클래스
+_STATUS_FALLBACK: Dict[int, Type[UpbitErrorMixin]] = {429: TooManyRequests}
+
+
+def register_error(
+    cls: Type[UpbitErrorMixin],
+    name: Optional[str] = None,
+    code: Optional[int] = None
+) -> Type[UpbitErrorMixin]:
+    """Upbit 에러 이름에 예외 클래스를 등록
+
+    새로운 Upbit 에러 이름을 실행 중에 추가하거나, 기존 이름을 다른 예외
+    클래스로 바꿀 때 사용합니다. 클래스 데코레이터로도 사용할 수 있습니다.
+
+    Args:
+        cls: UpbitErrorMixin을 상속한 예외 클래스
+        name: Upbit 에러 이름 (기본값: cls.name)
+        code: HTTP 상태 코드 (기본값: cls.code)
+
+    Returns:
+        등록한 클래스
+
+    Examples:
+        >>> @register_error
+        ... class MarketOffline(UpbitBadRequestError):
+        ...     name = "market_offline"
+        ...     code = 400
+        ...     msg = "거래 가능한 마켓이 아닙니다."
+    """
+    _ERROR_REGISTRY[(cls.code if code is None else code,
+                     cls.name if name is None else name)] = cls
+    return cls
+
+
+for _cls in (
+    CreateAskError, CreateBidError, InsufficientFundsAsk, InsufficientFundsBid,
+    UnderMinTotalAsk, UnderMinTotalBid, WidthdrawAddressNotRegisterd,
+    ValidationError, InvalidQueryPayload, JwtVerification, ExpiredAccessKey,
+    NonceUsed, NoAutorizationIP, OutOfScope, TooManyRequests,
+):
+    register_error(_cls)
+del _cls
+
+# 상태 코드별 등록 클래스 목록 (이전 버전 호환용). 조회할 때마다 레지스트리에서
+# 만들므로 register_error()로 추가한 클래스도 포함됩니다.
+_STATUS_VIEWS = {"BAD_REQUESTS": 400, "UNAUTHORIZED": 401, "TOO_MANY_REQ": 429}
+
+
+def __getattr__(name: str) -> List[Type[UpbitErrorMixin]]:
+    status = _STATUS_VIEWS.get(name)
+    if status is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return list(dict.fromkeys(
+        err for (code, _), err in _ERROR_REGISTRY.items() if code == status))
+
+
+def _remaining_req(resp: Response) -> Optional[Dict[str, Any]]:
+    headers = getattr(resp, "headers", None)
+    value = headers.get("Remaining-Req") if headers else None
+    if not value:
+        return None
+    from .rate_limit import _parse
+    try:
+        return _parse(value)
+    except RemainingReqParsingError:
+        return None
+
+
+def check_response(resp: Response) -> Response:
+    """실패한 응답을 해당하는 Upbit 예외로 변환
+
+    동기 error_handler와 비동기 클라이언트가 함께 사용합니다. 예외 클래스는
+    register_error()로 채운 레지스트리에서 (HTTP 상태 코드, 에러 이름)으로
+    찾고, 등록되지 않은 이름이면 UpbitError를 발생시킵니다. 429 응답은 본문이
+    일반 텍스트이므로 JSON으로 파싱하지 않습니다.
+
+    Args:
+        resp: 응답 객체 (ok, status_code, text, json()만 사용)
+
+    Returns:
+        Response: 성공한 응답이면 그대로 반환
+
+    Raises:
+        UpbitErrorMixin: 실패한 응답. message(서버 메시지), remaining_req
+            (파싱한 Remaining-Req 헤더) 속성 포함
+    """
+    if resp.ok:
+        return resp
+
+    code = resp.status_code
+    if code == 429:
+        message = name = resp.text
+    else:
+        try:
+            error = resp.json().get("error") or {}
+        except (ValueError, AttributeError):
+            error = {}
+        message = error.get("message") or ""
+        name = error.get("name") or ""
+
+    cls = _ERROR_REGISTRY.get((code, name)) or _STATUS_FALLBACK.get(code)
+    if cls is None:
+        raise UpbitError(name=name, code=code, message=message,
+                         remaining_req=_remaining_req(resp))
+    raise cls(message=message, remaining_req=_remaining_req(resp))
 
 
 def error_handler(func: Callable):
     def wrapper(*args: Any, **kwargs: Dict[str, Any]) -> Response:
-        message, name = "", ""
-
-        resp = func(*args, **kwargs)
-        if resp.ok:
-            return resp
-
-        error = resp.json().get("error", {})
-        if bool(error):
-            message = error.get("message")
-            name = error.get("name")
-
-        code = resp.status_code
-        if code == 400:
-            for err in BAD_REQUESTS:
-                if err.name == name:
-                    raise err
-        elif code == 401:
-            for err in UNAUTHORIZED:
-                if err.name == name:
-                    raise err
-        elif code == 429:
-            for err in TOO_MANY_REQ:
-                # too_many_request doesn't use json response but text
-                if err.name == resp.text:
-                    raise TooManyRequests
-        else:
-            raise UpbitError(name=name, code=code, msg=message)
-        return resp
+        return check_response(func(*args, **kwargs))
     return wrapper
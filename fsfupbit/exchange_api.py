@@ -18,13 +18,12 @@ This module provides exchange api of the Upbit API.
 """
 
 import math
-import jwt          # PyJWT
 import re
-import uuid
-import hashlib
 from typing import Optional, Union, List, Dict, Any
-from urllib.parse import urlencode
+from fsfupbit.endpoints import Endpoints, get_endpoints
 from fsfupbit.request_api import _send_get_request, _send_post_request, _send_delete_request
+from fsfupbit.signer import JWTSigner
+from fsfupbit.transport import HTTPTransport
 
 
 def get_tick_size(price, method="floor"):
@@ -80,29 +79,40 @@ def get_tick_size(price, method="floor"):
 
 
 class Upbit:
-    def __init__(self, access, secret):
+    def __init__(self, access, secret, transport: Optional[HTTPTransport] = None,
+                 base_url: Optional[str] = None):
+        """
+        Args:
+            access: Upbit API Access Key
+            secret: Upbit API Secret Key
+            transport: 요청에 사용할 HTTPTransport (선택사항)
+                - None: 모듈 기본 transport를 공유
+            base_url: 이 클라이언트의 API 기본 주소 (선택사항, 예: 로컬 프록시/캐시)
+                - None: transport의 base_url, 없으면 set_base_url()로 지정한 프로세스 기본 주소 사용
+        """
         self.access = access
         self.secret = secret
+        self.transport = transport
+        self._signer: Optional[JWTSigner] = None
+        self._endpoints: Optional[Endpoints] = Endpoints(base_url) if base_url else None
 
+    @property
+    def endpoints(self) -> Endpoints:
+        """요청 URL 표 (base_url > transport의 base_url > set_base_url() 순서)"""
+        return self._endpoints or get_endpoints(self.transport)
 
-    def _request_headers(self, query=None):
-        payload = {
-            "access_key": self.access,
-            "nonce": str(uuid.uuid4())
-        }
+    def set_base_url(self, base_url: Optional[str]) -> None:
+        """이 클라이언트의 API 기본 주소 변경 (None이면 프로세스 기본 주소를 따름)"""
+        self._endpoints = Endpoints(base_url) if base_url else None
 
-        if query is not None:
-            m = hashlib.sha512()
-            m.update(urlencode(query, doseq=True).replace("%5B%5D=", "[]=").encode())
-            query_hash = m.hexdigest()
-            payload['query_hash'] = query_hash
-            payload['query_hash_alg'] = "SHA512"
 
-        #jwt_token = jwt.encode(payload, self.secret, algorithm="HS256").decode('utf-8')
-        jwt_token = jwt.encode(payload, self.secret, algorithm="HS256")     # PyJWT >= 2.0
-        authorization_token = 'Bearer {}'.format(jwt_token)
-        headers = {"Authorization": authorization_token}
-        return headers
+    def _request_headers(self, query=None):
+        signer = self._signer
+        if signer is None or signer.access_key != self.access \
+                or signer.secret_key != self.secret:
+            # 키가 바뀐 경우에만 HMAC 객체를 다시 만듦
+            signer = self._signer = JWTSigner(self.access, self.secret)
+        return signer.headers(query)
 
 
     #--------------------------------------------------------------------------
@@ -116,9 +126,10 @@ class Upbit:
         :return: 내가 보유한 자산 리스트
         [contain_req == True 일 경우 Remaining-Req가 포함]
         """
-        url = "https://api.upbit.com/v1/accounts"
+        url = self.endpoints.url("accounts")
         headers = self._request_headers()
-        result = _send_get_request(url, headers=headers)
+        result = _send_get_request(url, headers=headers,
+                                   transport=self.transport)
         if contain_req:
             return result
         else:
@@ -274,10 +285,11 @@ class Upbit:
         [contain_req == True 일 경우 Remaining-Req가 포함]
         """
         try:
-            url = "https://api.upbit.com/v1/orders/chance"
+            url = self.endpoints.url("orders_chance")
             data = {"market": ticker}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -305,10 +317,11 @@ class Upbit:
             is_uuid = len(p.findall(ticker_or_uuid)) > 0
             if is_uuid:
                 # PR #129: /v1/order → /v1/orders/uuids (deprecated API fix)
-                url = "https://api.upbit.com/v1/orders/uuids"
+                url = self.endpoints.url("orders_uuids")
                 data = {'uuid': ticker_or_uuid}
                 headers = self._request_headers(data)
-                result = _send_get_request(url, headers=headers, data=data)
+                result = _send_get_request(url, headers=headers, data=data,
+                                           transport=self.transport)
             else:
                 # PR #129: /v1/orders → /v1/orders/open or /v1/orders/closed (deprecated API fix)
                 # PR #114: Support multiple states with 'states[]' parameter
@@ -322,11 +335,11 @@ class Upbit:
                 if has_closed_state and has_open_state:
                     # 열림/닫힘 상태가 혼합된 경우, 개별 API 호출 후 병합 필요
                     # 현재는 간단히 /v1/orders/closed를 사용 (두 상태 모두 포함)
-                    url = "https://api.upbit.com/v1/orders/closed"
+                    url = self.endpoints.url("orders_closed")
                 elif has_closed_state:
-                    url = "https://api.upbit.com/v1/orders/closed"
+                    url = self.endpoints.url("orders_closed")
                 else:
-                    url = "https://api.upbit.com/v1/orders/open"
+                    url = self.endpoints.url("orders_open")
 
                 data = {
                     'market': ticker_or_uuid,
@@ -340,7 +353,8 @@ class Upbit:
                 data['states[]'] = states if len(states) > 1 else states[0]
 
                 headers = self._request_headers(data)
-                result = _send_get_request(url, headers=headers, data=data)
+                result = _send_get_request(url, headers=headers, data=data,
+                                           transport=self.transport)
 
             if contain_req:
                 return result
@@ -361,10 +375,11 @@ class Upbit:
         # TODO : states, uuids, identifiers 관련 기능 추가 필요
         try:
             # PR #129: /v1/order → /v1/orders/uuids (deprecated API fix)
-            url = "https://api.upbit.com/v1/orders/uuids"
+            url = self.endpoints.url("orders_uuids")
             data = {'uuid': uuid}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -382,10 +397,11 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/order"
+            url = self.endpoints.url("order")
             data = {"uuid": uuid}
             headers = self._request_headers(data)
-            result = _send_delete_request(url, headers=headers, data=data)
+            result = _send_delete_request(url, headers=headers, data=data,
+                                          transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -402,7 +418,8 @@ class Upbit:
         price: Union[float, str],
         volume: Union[float, str],
         time_in_force: str = None,
-        contain_req: bool = False
+        contain_req: bool = False,
+        identifier: str = None
     ):
         """
         지정가 매수
@@ -417,6 +434,8 @@ class Upbit:
                 - "IOC": Immediate Or Cancel - 즉시 체결, 불완분분 취소
                 - "MARKET": 시장가 주문 (지정가와 시장가 혼합)
             contain_req: Remaining-Req 포함여부
+            identifier: 조회/재시도용 사용자 지정 주문 ID (선택사항, 계정 내 유일해야 함)
+                transport의 RetryPolicy(retry_orders=True)가 이 값이 있는 주문만 재시도
 
         Returns:
             dict 또는 tuple: 주문 정보
@@ -430,7 +449,7 @@ class Upbit:
             >>> order = upbit.buy_limit_order("KRW-BTC", 50000000, 0.001, time_in_force="FOK")
         """
         try:
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {
                 "market": ticker,
                 "side": "bid",
@@ -441,9 +460,12 @@ class Upbit:
 
             if time_in_force is not None:
                 data["time_in_force"] = time_in_force
+            if identifier is not None:
+                data["identifier"] = identifier
 
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -452,22 +474,26 @@ class Upbit:
             print(x.__class__.__name__)
             return None
 
-    def buy_market_order(self, ticker, price, contain_req=False):
+    def buy_market_order(self, ticker, price, contain_req=False, identifier=None):
         """
         시장가 매수
         :param ticker: ticker for cryptocurrency
         :param price: KRW
         :param contain_req: Remaining-Req 포함여부
+        :param identifier: 조회/재시도용 사용자 지정 주문 ID (선택사항)
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {"market": ticker,  # market ID
                     "side": "bid",  # buy
                     "price": str(price),
                     "ord_type": "price"}
+            if identifier is not None:
+                data["identifier"] = identifier
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -476,22 +502,26 @@ class Upbit:
             print(x.__class__.__name__)
             return None
 
-    def sell_market_order(self, ticker, volume, contain_req=False):
+    def sell_market_order(self, ticker, volume, contain_req=False, identifier=None):
         """
         시장가 매도 메서드
         :param ticker: 가상화폐 티커
         :param volume: 수량
         :param contain_req: Remaining-Req 포함여부
+        :param identifier: 조회/재시도용 사용자 지정 주문 ID (선택사항)
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {"market": ticker,  # ticker
                     "side": "ask",  # sell
                     "volume": str(volume),
                     "ord_type": "market"}
+            if identifier is not None:
+                data["identifier"] = identifier
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -506,7 +536,8 @@ class Upbit:
         price: Union[float, str],
         volume: Union[float, str],
         time_in_force: str = None,
-        contain_req: bool = False
+        contain_req: bool = False,
+        identifier: str = None
     ):
         """
         지정가 매도
@@ -521,6 +552,8 @@ class Upbit:
                 - "IOC": Immediate Or Cancel - 즉시 체결, 불완분분 취소
                 - "MARKET": 시장가 주문 (지정가와 시장가 혼합)
             contain_req: Remaining-Req 포함여부
+            identifier: 조회/재시도용 사용자 지정 주문 ID (선택사항, 계정 내 유일해야 함)
+                transport의 RetryPolicy(retry_orders=True)가 이 값이 있는 주문만 재시도
 
         Returns:
             dict 또는 tuple: 주문 정보
@@ -534,7 +567,7 @@ class Upbit:
             >>> order = upbit.sell_limit_order("KRW-BTC", 50000000, 0.001, time_in_force="FOK")
         """
         try:
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {
                 "market": ticker,
                 "side": "ask",
@@ -545,9 +578,12 @@ class Upbit:
 
             if time_in_force is not None:
                 data["time_in_force"] = time_in_force
+            if identifier is not None:
+                data["identifier"] = identifier
 
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -597,7 +633,7 @@ class Upbit:
             - 주문 가능 여부만 확인합니다
         """
         try:
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {
                 "market": market,
                 "side": side,
@@ -612,7 +648,8 @@ class Upbit:
                 data["time_in_force"] = time_in_force
 
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
 
             if contain_req:
                 return result
@@ -652,10 +689,11 @@ class Upbit:
         """
         try:
             # 먼저 미체결 주문 조회
-            url = "https://api.upbit.com/v1/orders"
+            url = self.endpoints.url("orders")
             data = {"market": market, "state": "wait"}
             headers = self._request_headers(data)
-            orders = _send_get_request(url, headers=headers, data=data)
+            orders = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
 
             if not orders:
                 return [] if not contain_req else ([], {})
@@ -721,10 +759,11 @@ class Upbit:
         """
         try:
             # 1. 기존 주문 조회
-            url = "https://api.upbit.com/v1/order"
+            url = self.endpoints.url("order")
             data = {"uuid": uuid}
             headers = self._request_headers(data)
-            order_info = _send_get_request(url, headers=headers, data=data)
+            order_info = _send_get_request(url, headers=headers, data=data,
+                                           transport=self.transport)
 
             if not order_info or not order_info[0]:
                 raise ValueError(f"주문을 찾을 수 없습니다: {uuid}")
@@ -776,11 +815,12 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/withdraws"
+            url = self.endpoints.url("withdraws")
             data = {"currency": currency}
             headers = self._request_headers(data)
 
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -799,10 +839,11 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/withdraw"
+            url = self.endpoints.url("withdraw")
             data = {"uuid": uuid, "currency": currency}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -852,7 +893,7 @@ class Upbit:
             출금하려는 코인이 지원하는 네트워크 타입을 확인해야 합니다.
         """
         try:
-            url = "https://api.upbit.com/v1/withdraws/coin"
+            url = self.endpoints.url("withdraws_coin")
             data = {
                 "currency": currency,
                 "amount": str(amount),
@@ -864,7 +905,8 @@ class Upbit:
                 data["secondary_address"] = secondary_address
 
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -883,10 +925,11 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/withdraws/krw"
+            url = self.endpoints.url("withdraws_krw")
             data = {"amount": amount}
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -925,10 +968,11 @@ class Upbit:
             - 출금 가능 여부, 수수료, 최소/최대 출금 금액 등을 확인할 수 있습니다
         """
         try:
-            url = "https://api.upbit.com/v1/orders/chance"
+            url = self.endpoints.url("orders_chance")
             data = {"market": f"KRW-{currency}", "amount": str(amount)}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -972,13 +1016,14 @@ class Upbit:
             - 출금 허용 주소로만 출금이 가능합니다
         """
         try:
-            url = "https://api.upbit.com/v1/withdraws/whitelist_addresses"
+            url = self.endpoints.url("withdraws_whitelist_addresses")
             data = {}
             if currency is not None:
                 data["currency"] = currency
 
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1001,11 +1046,12 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/deposits"
+            url = self.endpoints.url("deposits")
             data = {"currency": currency}
             headers = self._request_headers(data)
 
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -1024,10 +1070,11 @@ class Upbit:
         :return:
         """
         try:
-            url = "https://api.upbit.com/v1/deposit"
+            url = self.endpoints.url("deposit")
             data = {"uuid": uuid, "currency": currency}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
             if contain_req:
                 return result
             else:
@@ -1064,14 +1111,15 @@ class Upbit:
             >>> upbit.get_deposit_chance("BTC", 0.01)
         """
         try:
-            url = "https://api.upbit.com/v1/orders/chance"
+            url = self.endpoints.url("orders_chance")
             data = {"market": f"KRW-{currency}"}
 
             if amount is not None:
                 data["amount"] = str(amount)
 
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1112,10 +1160,11 @@ class Upbit:
             - 2차 보안 비밀번호가 설정된 경우 필요할 수 있습니다
         """
         try:
-            url = "https://api.upbit.com/v1/deposits/generate_coin_address"
+            url = self.endpoints.url("deposits_generate_coin_address")
             data = {"currency": currency}
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
 
             if contain_req:
                 return result
@@ -1151,9 +1200,10 @@ class Upbit:
             - 입금 주소가 없는 코인은 포함되지 않을 수 있습니다
         """
         try:
-            url = "https://api.upbit.com/v1/deposits/coin_addresses"
+            url = self.endpoints.url("deposits_coin_addresses")
             headers = self._request_headers()
-            result = _send_get_request(url, headers=headers)
+            result = _send_get_request(url, headers=headers,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1193,10 +1243,11 @@ class Upbit:
             - 일부 코인(XRP 등)은 2차 주소(secondary_address)가 필요할 수 있습니다
         """
         try:
-            url = "https://api.upbit.com/v1/deposits/coin_address"
+            url = self.endpoints.url("deposits_coin_address")
             data = {"currency": currency}
             headers = self._request_headers(data)
-            result = _send_get_request(url, headers=headers, data=data)
+            result = _send_get_request(url, headers=headers, data=data,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1235,9 +1286,10 @@ class Upbit:
             - 입금자명과 일치해야 입금이 처리됩니다
         """
         try:
-            url = "https://api.upbit.com/v1/deposits/krw"
+            url = self.endpoints.url("deposits_krw")
             headers = self._request_headers()
-            result = _send_get_request(url, headers=headers)
+            result = _send_get_request(url, headers=headers,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1257,9 +1309,10 @@ class Upbit:
     #--------------------------------------------------------------------------
     #     입출금 현황 
     def get_deposit_withdraw_status(self, contain_req=False):
-        url = "https://api.upbit.com/v1/status/wallet"
+        url = self.endpoints.url("status_wallet")
         headers = self._request_headers()
-        result = _send_get_request(url, headers=headers)
+        result = _send_get_request(url, headers=headers,
+                                   transport=self.transport)
         if contain_req:
             return result
         else:
@@ -1268,9 +1321,10 @@ class Upbit:
 
     #     API키 리스트 조회
     def get_api_key_list(self, contain_req=False):
-        url = "https://api.upbit.com/v1/api_keys"
+        url = self.endpoints.url("api_keys")
         headers = self._request_headers()
-        result = _send_get_request(url, headers=headers)
+        result = _send_get_request(url, headers=headers,
+                                   transport=self.transport)
         if contain_req:
             return result
         else:
@@ -1308,9 +1362,10 @@ class Upbit:
             - 입금 시 거래소 정보가 필요할 수 있습니다
         """
         try:
-            url = "https://api.upbit.com/v1/travel_rule/vasps"
+            url = self.endpoints.url("travel_rule_vasps")
             headers = self._request_headers()
-            result = _send_get_request(url, headers=headers)
+            result = _send_get_request(url, headers=headers,
+                                       transport=self.transport)
 
             if contain_req:
                 return result
@@ -1356,14 +1411,15 @@ class Upbit:
             - VASP 정보는 정확해야 합니다
         """
         try:
-            url = "https://api.upbit.com/v1/travel_rule/verify"
+            url = self.endpoints.url("travel_rule_verify")
             data = {
                 "deposit_uuid": deposit_uuid,
                 "vasp_name": vasp_name,
                 "vasp_address": vasp_address
             }
             headers = self._request_headers(data)
-            result = _send_post_request(url, headers=headers, data=data)
+            result = _send_post_request(url, headers=headers, data=data,
+                                        transport=self.transport)
 
             if contain_req:
                 return result
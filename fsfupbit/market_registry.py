@@ -0,0 +1,287 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.market_registry
+
+/v1/market/all 응답을 TTL 동안 보관하고 마켓, 호가 통화, 유의/주의 종목별
+색인을 제공하는 마켓 정보 저장소입니다. get_tickers()가 이 저장소를 사용합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from fsfupbit.endpoints import get_endpoints
+from fsfupbit.request_api import _call_public_api
+
+DEFAULT_TTL = 60.0
+
+_BASIC_FIELDS = ("market", "korean_name", "english_name")
+
+
+def _origin() -> str:
+    """요청이 실제로 향하는 API 주소"""
+    return get_endpoints().base_url
+
+
+def _is_warning(item: Dict[str, Any]) -> bool:
+    event = item.get("market_event") or {}
+    return bool(event.get("warning")) or item.get("market_warning") == "CAUTION"
+
+
+def _quote(market: str) -> str:
+    return market.split("-", 1)[0]
+
+
+class MarketRegistry:
+    """마켓 정보 저장소
+
+    /v1/market/all?isDetails=true를 한 번 받아 ttl초 동안 재사용하며, 받을 때마다
+    마켓 코드, 호가 통화(KRW/BTC/USDT), 유의 종목, 주의 항목별 색인을 만들어 두어
+    조회는 딕셔너리 조회 한 번입니다. path를 지정하면 받은 목록을 파일에 저장하고,
+    프로세스를 다시 시작해도 ttl이 지나지 않았으면 요청 없이 파일에서 읽습니다.
+
+    요청 주소(set_base_url, transport의 base_url)가 바뀌면 ttl과 관계없이 다시 받습니다.
+
+    Args:
+        ttl: 목록 재사용 시간 (초, 기본값: 60). 0이면 조회할 때마다 새로 받음
+        path: 목록을 저장할 JSON 파일 경로 (선택사항)
+
+    Examples:
+        >>> registry = MarketRegistry(ttl=300, path="~/.fsfupbit/markets.json")
+        >>> registry.tickers("KRW")
+        ['KRW-BTC', 'KRW-ETH', ...]
+        >>> registry.get("KRW-BTC")["korean_name"]
+        '비트코인'
+        >>> registry.warning_markets()
+        ['KRW-XXX']
+        >>> registry.caution_markets("TRADING_VOLUME_SOARING")
+        ['KRW-YYY']
+
+    Note:
+        - get(), markets()는 마켓 정보 딕셔너리의 얕은 복사본을 반환하므로 최상위
+          키를 바꿔도 저장소에는 영향이 없습니다. 안쪽의 market_event 딕셔너리는
+          저장소와 공유되므로 수정하지 마세요
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, path: Optional[str] = None):
+        self.ttl = ttl
+        self.path = os.path.expanduser(path) if path else None
+        self.limit_info: Dict[str, Any] = {}
+        self.fetched_at = 0.0
+        self._origin: Optional[str] = None
+        self._lock = threading.Lock()
+        self._by_market: Dict[str, Dict[str, Any]] = {}
+        self._tickers: Dict[str, List[str]] = {}
+        self._basic: Dict[str, List[Dict[str, Any]]] = {}
+        self._details: Dict[str, List[Dict[str, Any]]] = {}
+        self._warning: List[str] = []
+        self._caution: Dict[str, List[str]] = {}
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def _fresh(self, origin: str) -> bool:
+        return (self._origin == origin
+                and time.time() - self.fetched_at < self.ttl)
+
+    def _ensure(self) -> None:
+        origin = _origin()
+        if self._fresh(origin):
+            return
+        with self._lock:
+            # 기다리는 동안 다른 스레드가 갱신했으면 다시 받지 않음
+            if self._fresh(origin):
+                return
+            if not (self._origin is None and self._load(origin)):
+                self._fetch(origin)
+
+    def refresh(self) -> None:
+        """ttl과 관계없이 목록을 지금 다시 받음
+
+        Raises:
+            UpbitAPIError: 요청이 실패한 경우
+        """
+        with self._lock:
+            self._fetch(_origin())
+
+    def invalidate(self) -> None:
+        """보관 중인 목록을 만료시켜 다음 조회 때 다시 받도록 함"""
+        self.fetched_at = 0.0
+
+    def _fetch(self, origin: str) -> None:
+        markets, limit_info = _call_public_api(
+            get_endpoints().url("market_all"), isDetails="true")
+        self._build(markets, origin, time.time())
+        self.limit_info = limit_info
+        if self.path:
+            self._save()
+
+    def _build(self, markets: List[Dict[str, Any]], origin: str,
+               fetched_at: float) -> None:
+        """색인을 새로 만든 뒤 한 번에 교체 (조회 중인 스레드는 이전 색인을 계속 사용)"""
+        by_market = {}
+        tickers: Dict[str, List[str]] = {"": []}
+        basic: Dict[str, List[Dict[str, Any]]] = {"": []}
+        details: Dict[str, List[Dict[str, Any]]] = {"": []}
+        warning = []
+        caution: Dict[str, List[str]] = {"": []}
+        for item in markets:
+            market = item["market"]
+            quote = _quote(market)
+            view = {key: item[key] for key in _BASIC_FIELDS if key in item}
+            by_market[market] = item
+            for key in ("", quote):
+                tickers.setdefault(key, []).append(market)
+                basic.setdefault(key, []).append(view)
+                details.setdefault(key, []).append(item)
+            if _is_warning(item):
+                warning.append(market)
+            flags = [flag for flag, on in
+                     ((item.get("market_event") or {}).get("caution") or {}).items() if on]
+            if flags:
+                caution[""].append(market)
+            for flag in flags:
+                caution.setdefault(flag, []).append(market)
+
+        self._by_market, self._tickers, self._basic, self._details = \
+            by_market, tickers, basic, details
+        self._warning, self._caution = warning, caution
+        self._origin, self.fetched_at = origin, fetched_at
+
+    def _save(self) -> None:
+        """목록을 파일에 원자적으로 저장"""
+        data = {"origin": self._origin, "fetched_at": self.fetched_at,
+                "markets": self._details[""]}
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _load(self, origin: str) -> bool:
+        """저장된 목록이 같은 주소에서 ttl 안에 받은 것이면 읽고 True 반환"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("origin") != origin \
+                or time.time() - data.get("fetched_at", 0) >= self.ttl:
+            return False
+        self._build(data["markets"], origin, data["fetched_at"])
+        return True
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _select(self, name: str, fiat: str) -> list:
+        self._ensure()
+        index = getattr(self, name)
+        if fiat in index:
+            selected = index[fiat]
+        else:
+            # 호가 통화가 아닌 접두사("KRW-B" 등)는 기존 get_tickers처럼 startswith로 필터
+            selected = [x for x in index[""]
+                        if (x if name == "_tickers" else x["market"]).startswith(fiat)]
+        if name == "_tickers":
+            return list(selected)
+        # 호출한 쪽이 수정해도 색인이 바뀌지 않도록 복사본 반환
+        return [dict(x) for x in selected]
+
+    def tickers(self, fiat: str = "") -> List[str]:
+        """마켓 코드 목록
+
+        Args:
+            fiat: 호가 통화 또는 마켓 코드 접두사 (기본값: "" = 전체)
+        """
+        return self._select("_tickers", fiat)
+
+    def markets(self, fiat: str = "", details: bool = False) -> List[Dict[str, Any]]:
+        """마켓 정보 목록
+
+        Args:
+            fiat: 호가 통화 또는 마켓 코드 접두사 (기본값: "" = 전체)
+            details: True면 market_warning, market_event 포함 (기본값: False)
+        """
+        return self._select("_details" if details else "_basic", fiat)
+
+    def get(self, market: str) -> Optional[Dict[str, Any]]:
+        """마켓 정보 (isDetails=true 형식)의 복사본. 없는 마켓이면 None"""
+        self._ensure()
+        item = self._by_market.get(market)
+        return dict(item) if item is not None else None
+
+    def quotes(self) -> List[str]:
+        """호가 통화 목록"""
+        self._ensure()
+        return [key for key in self._tickers if key]
+
+    def warning_markets(self) -> List[str]:
+        """투자 유의 종목 마켓 코드 목록"""
+        self._ensure()
+        return list(self._warning)
+
+    def caution_markets(self, flag: Optional[str] = None) -> List[str]:
+        """투자 주의 항목에 해당하는 마켓 코드 목록
+
+        Args:
+            flag: 주의 항목 (PRICE_FLUCTUATIONS, TRADING_VOLUME_SOARING,
+                DEPOSIT_AMOUNT_SOARING, GLOBAL_PRICE_DIFFERENCES,
+                CONCENTRATION_OF_SMALL_ACCOUNTS). None이면 하나라도 해당하는 마켓
+        """
+        self._ensure()
+        return list(self._caution.get(flag or "", ()))
+
+    def __contains__(self, market: str) -> bool:
+        self._ensure()
+        return market in self._by_market
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self._by_market)
+
+    def __repr__(self) -> str:
+        return f"MarketRegistry(ttl={self.ttl!r}, path={self.path!r})"
+
+
+_default_registry = MarketRegistry()
+
+
+def get_market_registry() -> MarketRegistry:
+    """get_tickers()가 사용하는 프로세스 기본 마켓 정보 저장소"""
+    return _default_registry
+
+
+def set_market_registry(registry: Optional[MarketRegistry]) -> None:
+    """프로세스 기본 마켓 정보 저장소 교체
+
+    Args:
+        registry: 새 저장소. None이면 기본 설정(ttl 60초, 파일 저장 없음)으로 다시 생성
+
+    Examples:
+        >>> set_market_registry(MarketRegistry(ttl=600, path="~/.fsfupbit/markets.json"))
+    """
+    global _default_registry
+    _default_registry = registry if registry is not None else MarketRegistry()
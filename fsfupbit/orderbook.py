@@ -0,0 +1,203 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.orderbook
+
+orderbook 스트림 메시지와 get_orderbook 스냅샷으로 유지하는 로컬 호가창.
+"""
+
+import operator
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from fsfupbit.errors import UpbitValidationError
+
+# 마켓별 배열의 행 번호
+BID_PRICE, BID_SIZE, ASK_PRICE, ASK_SIZE, BID_DEPTH, ASK_DEPTH = range(6)
+
+_DEFAULT_UNIT = operator.itemgetter("bid_price", "bid_size", "ask_price", "ask_size")
+_SIMPLE_UNIT = operator.itemgetter("bp", "bs", "ap", "as")
+
+
+class OrderBook:
+    """마켓별 호가를 NumPy 배열로 유지하는 로컬 호가창
+
+    마켓마다 (6, levels) 크기의 연속된 float64 배열 하나를 미리 할당하고,
+    메시지를 받을 때마다 그 배열을 제자리에서 갱신합니다. 행은 매수 호가,
+    매수 잔량, 매도 호가, 매도 잔량, 누적 매수 잔량, 누적 매도 잔량 순이며
+    0번 열이 최우선 호가입니다. 누적 잔량은 갱신 시 미리 계산하므로 최우선
+    호가, 스프레드, n단계 누적 잔량 조회는 모두 O(1)입니다.
+
+    Args:
+        markets: 미리 배열을 할당할 마켓 리스트 (None이면 메시지를 받을 때 할당)
+        levels: 마켓별 최대 호가 단계 수 (기본값: 30)
+
+    Examples:
+        >>> book = OrderBook(["KRW-BTC"])
+        >>> book.seed(get_orderbook("KRW-BTC"))
+        >>> async for msg in stream("orderbook", ["KRW-BTC"]):
+        ...     book.update(msg)
+        ...     print(book.best_bid("KRW-BTC"), book.spread("KRW-BTC"))
+        >>> book.depth("KRW-BTC", "bid", levels=5)   # 매수 5단계 누적 잔량
+        >>> book.bids("KRW-BTC")                      # (가격, 잔량) 배열 뷰
+
+    Note:
+        - DEFAULT/SIMPLE 포맷 스트림 메시지와 get_orderbook 응답을 모두 받습니다
+        - 저장된 것보다 오래된 timestamp의 메시지는 무시합니다
+        - 한 스레드에서 갱신하는 것을 전제로 합니다
+        - 조회 메서드가 반환하는 배열은 내부 배열의 뷰이므로 다음 갱신 때 값이 바뀝니다
+    """
+
+    def __init__(self, markets: Optional[Iterable[str]] = None, levels: int = 30):
+        if levels < 1:
+            raise UpbitValidationError("levels는 1 이상이어야 합니다", field="levels")
+        self.levels = levels
+        self._books: Dict[str, np.ndarray] = {}
+        self._levels: Dict[str, int] = {}
+        self._timestamps: Dict[str, int] = {}
+        for market in markets or []:
+            self._book(market)
+
+    def _book(self, market: str) -> np.ndarray:
+        book = self._books.get(market)
+        if book is None:
+            book = self._books[market] = np.full((6, self.levels), np.nan)
+            self._levels[market] = 0
+            self._timestamps[market] = 0
+        return book
+
+    @property
+    def markets(self) -> List[str]:
+        """호가를 유지하고 있는 마켓 리스트"""
+        return list(self._books)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def update(self, message: Dict[str, Any]) -> Optional[str]:
+        """호가 메시지로 해당 마켓의 배열을 제자리에서 갱신
+
+        Args:
+            message: orderbook 스트림 메시지(DEFAULT/SIMPLE) 또는 get_orderbook 응답 항목
+
+        Returns:
+            str: 갱신한 마켓. 오래된 메시지라 무시한 경우 None
+        """
+        if "obu" in message:
+            market = message["cd"]
+            units = message["obu"]
+            timestamp = message.get("tms", 0)
+            getter = _SIMPLE_UNIT
+        else:
+            market = message.get("code") or message["market"]
+            units = message["orderbook_units"]
+            timestamp = message.get("timestamp", 0)
+            getter = _DEFAULT_UNIT
+
+        book = self._book(market)
+        if timestamp < self._timestamps[market]:
+            return None
+
+        n = min(len(units), self.levels)
+        if n:
+            values = np.array([getter(u) for u in units[:n]], dtype="float64")
+            book[:4, :n] = values.T
+            np.cumsum(book[BID_SIZE, :n], out=book[BID_DEPTH, :n])
+            np.cumsum(book[ASK_SIZE, :n], out=book[ASK_DEPTH, :n])
+        if n < self._levels[market]:
+            book[:, n:self._levels[market]] = np.nan
+        self._levels[market] = n
+        self._timestamps[market] = timestamp
+        return market
+
+    def seed(self, snapshot: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        """get_orderbook 응답으로 초기 호가 설정
+
+        Args:
+            snapshot: get_orderbook 응답 (단일 마켓 dict 또는 여러 마켓 리스트)
+        """
+        if isinstance(snapshot, dict):
+            snapshot = [snapshot]
+        for item in snapshot:
+            self.update(item)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _get(self, market: str) -> np.ndarray:
+        try:
+            return self._books[market]
+        except KeyError:
+            raise UpbitValidationError(
+                f"호가 데이터가 없는 마켓입니다: {market}", field="market") from None
+
+    def best_bid(self, market: str) -> float:
+        """최우선 매수 호가 (호가가 없으면 NaN)"""
+        return float(self._get(market)[BID_PRICE, 0])
+
+    def best_ask(self, market: str) -> float:
+        """최우선 매도 호가 (호가가 없으면 NaN)"""
+        return float(self._get(market)[ASK_PRICE, 0])
+
+    def spread(self, market: str) -> float:
+        """최우선 매도 호가 - 최우선 매수 호가"""
+        book = self._get(market)
+        return float(book[ASK_PRICE, 0] - book[BID_PRICE, 0])
+
+    def mid(self, market: str) -> float:
+        """최우선 매수/매도 호가의 중간값"""
+        book = self._get(market)
+        return float((book[ASK_PRICE, 0] + book[BID_PRICE, 0]) / 2)
+
+    def depth(self, market: str, side: str, levels: Optional[int] = None) -> float:
+        """최우선 호가부터 levels 단계까지의 누적 잔량
+
+        Args:
+            market: 마켓 코드
+            side: "bid" 또는 "ask"
+            levels: 누적할 호가 단계 수 (기본값: 수신한 전체 단계)
+        """
+        row = self._depth_row(side)
+        book = self._get(market)
+        n = self._levels[market]
+        if n == 0:
+            return 0.0
+        levels = n if levels is None else max(1, min(levels, n))
+        return float(book[row, levels - 1])
+
+    def bids(self, market: str) -> np.ndarray:
+        """매수 호가 (가격, 잔량) 배열 뷰. shape: (2, 단계 수)"""
+        return self._get(market)[BID_PRICE:BID_SIZE + 1, :self._levels[market]]
+
+    def asks(self, market: str) -> np.ndarray:
+        """매도 호가 (가격, 잔량) 배열 뷰. shape: (2, 단계 수)"""
+        return self._get(market)[ASK_PRICE:ASK_SIZE + 1, :self._levels[market]]
+
+    def cumulative(self, market: str, side: str) -> np.ndarray:
+        """단계별 누적 잔량 배열 뷰"""
+        row = self._depth_row(side)
+        return self._get(market)[row, :self._levels[market]]
+
+    def timestamp(self, market: str) -> int:
+        """마지막으로 반영한 메시지의 timestamp (ms)"""
+        self._get(market)
+        return self._timestamps[market]
+
+    @staticmethod
+    def _depth_row(side: str) -> int:
+        if side == "bid":
+            return BID_DEPTH
+        if side == "ask":
+            return ASK_DEPTH
+        raise UpbitValidationError("side는 'bid' 또는 'ask'만 가능합니다", field="side")
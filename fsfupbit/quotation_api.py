@@ -18,36 +18,42 @@ This module provides quatation api of the Upbit API.
 """
 
 import datetime
-import pandas as pd
+import math
+import operator
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Union
+from urllib.parse import quote
+from fsfupbit.endpoints import get_endpoints
+from fsfupbit.errors import UpbitAPIError, UpbitValidationError
+from fsfupbit.market_registry import get_market_registry
 from fsfupbit.request_api import _call_public_api
 
 
 def get_tickers(fiat="", is_details=False, limit_info=False, verbose=False):
     """업비트 티커 조회
 
+    마켓 목록은 프로세스 기본 MarketRegistry가 TTL(기본 60초) 동안 보관하므로,
+    반복 호출해도 /v1/market/all은 TTL마다 한 번만 요청합니다.
+
     Args:
         fiat (str, optional): Fiat (KRW, BTC, USDT). Defaults to empty string.
         limit_info (bool, optional): True: 요청 수 제한 정보 리턴, False: 요청 수 제한 정보 리턴 받지 않음. Defaults to False.
 
     Returns:
         tuple/list: limit_info가 True이면 튜플, False이면 리스트 객체
+            (요청 수 제한 정보는 마켓 목록을 마지막으로 받은 요청의 값)
     """  # pylint: disable=line-too-long # noqa: E501
 
-    url = "https://api.upbit.com/v1/market/all"
-    detail = "true" if is_details else "false"
-    markets, req_limit_info = _call_public_api(url, isDetails=detail)
-
+    registry = get_market_registry()
     if verbose or is_details:
-        tickers = [x for x in markets if x['market'].startswith(fiat)]
+        tickers = registry.markets(fiat, details=is_details)
     else:
-        tickers = [
-            x['market'] for x in markets if x['market'].startswith(fiat)
-        ]
+        tickers = registry.tickers(fiat)
 
     if limit_info:
-        return tickers, req_limit_info
+        return tickers, registry.limit_info
     else:
         return tickers
 
@@ -65,41 +71,160 @@ def get_url_ohlcv(interval):
             - 년: "year", "years"
 
     Returns:
-        str: upbit api url
+        str: upbit api url (set_base_url()로 지정한 주소 기준)
     """
+    return get_endpoints().candle_url(interval)
 
-    if interval in ["day", "days"]:
-        url = "https://api.upbit.com/v1/candles/days"
-    elif interval in ["minute1", "minutes1"]:
-        url = "https://api.upbit.com/v1/candles/minutes/1"
-    elif interval in ["minute3", "minutes3"]:
-        url = "https://api.upbit.com/v1/candles/minutes/3"
-    elif interval in ["minute5", "minutes5"]:
-        url = "https://api.upbit.com/v1/candles/minutes/5"
-    elif interval in ["minute10", "minutes10"]:
-        url = "https://api.upbit.com/v1/candles/minutes/10"
-    elif interval in ["minute15", "minutes15"]:
-        url = "https://api.upbit.com/v1/candles/minutes/15"
-    elif interval in ["minute30", "minutes30"]:
-        url = "https://api.upbit.com/v1/candles/minutes/30"
-    elif interval in ["minute60", "minutes60"]:
-        url = "https://api.upbit.com/v1/candles/minutes/60"
-    elif interval in ["minute240", "minutes240"]:
-        url = "https://api.upbit.com/v1/candles/minutes/240"
-    elif interval in ["week",  "weeks"]:
-        url = "https://api.upbit.com/v1/candles/weeks"
-    elif interval in ["month", "months"]:
-        url = "https://api.upbit.com/v1/candles/months"
-    elif interval in ["year", "years"]:
-        url = "https://api.upbit.com/v1/candles/years"
-    elif interval.startswith("seconds/"):
-        # 초 캔들 (예: "seconds/1", "seconds/3", etc.)
-        unit = interval.split("/")[1]
-        url = f"https://api.upbit.com/v1/candles/seconds/{unit}"
-    else:
-        url = "https://api.upbit.com/v1/candles/days"
 
-    return url
+MAX_CALL_COUNT = 200
+
+OHLCV_COLUMNS = [
+    'opening_price',
+    'high_price',
+    'low_price',
+    'trade_price',
+    'candle_acc_trade_volume',
+    'candle_acc_trade_price',
+]
+
+OHLCV_RENAME = {
+    "opening_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "trade_price": "close",
+    "candle_acc_trade_volume": "volume",
+    "candle_acc_trade_price": "value",
+}
+
+
+def _to_datetime(value):
+    """문자열/pandas Timestamp를 datetime으로 변환 (pandas는 문자열 파싱 시에만 로드)"""
+    if isinstance(value, str):
+        import pandas as pd
+        return pd.to_datetime(value).to_pydatetime()
+    if hasattr(value, "to_pydatetime"):
+        return value.to_pydatetime()
+    return value
+
+
+def _normalize_ohlcv_to(to):
+    """get_ohlcv의 to 파라미터를 tz 정보 없는 UTC datetime으로 변환"""
+    if to is None:
+        to = datetime.datetime.now(datetime.timezone.utc)
+        to = to.replace(tzinfo=None)
+    return _to_datetime(to)
+
+
+_OHLCV_VALUES = operator.itemgetter(*OHLCV_COLUMNS)
+
+
+def _candles_to_frame(contents):
+    """캔들 API 응답 리스트를 KST 시각 인덱스의 OHLCV DataFrame으로 변환
+
+    여러 페이지의 응답을 이어 붙인 리스트를 한 번에 변환합니다. 시각 문자열은
+    pandas가 한 번의 벡터화 호출로 파싱하고, 가격/거래량은 하나의 2차원
+    float64 배열로 만들어 복사 없이 DataFrame을 구성한 뒤 한 번만 정렬합니다.
+    """
+    import numpy as np
+    import pandas as pd
+
+    index = pd.to_datetime([x['candle_date_time_kst'] for x in contents],
+                           format="%Y-%m-%dT%H:%M:%S")
+    values = np.array([_OHLCV_VALUES(x) for x in contents], dtype="float64")
+    values = values.reshape(len(contents), len(OHLCV_COLUMNS))
+    df = pd.DataFrame(values, index=index,
+                      columns=[OHLCV_RENAME[c] for c in OHLCV_COLUMNS],
+                      copy=False)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
+_FIXED_CANDLE_PATH = re.compile(r"/candles/(seconds|minutes|days|weeks)(?:/(\d+))?$")
+_FIXED_CANDLE_UNIT = {
+    "seconds": datetime.timedelta(seconds=1),
+    "minutes": datetime.timedelta(minutes=1),
+    "days": datetime.timedelta(days=1),
+    "weeks": datetime.timedelta(weeks=1),
+}
+
+
+def _candle_width(url):
+    """캔들 URL의 고정 간격(timedelta) 반환. 월/연 캔들처럼 간격이 일정하지 않으면 None"""
+    matched = _FIXED_CANDLE_PATH.search(url)
+    if matched is None:
+        return None
+    unit, size = matched.groups()
+    return _FIXED_CANDLE_UNIT[unit] * int(size or 1)
+
+
+def _fetch_candles(url, ticker, count, to, converting_price_unit=None):
+    """to 시점 이전의 캔들 count개를 요청하여 원본 응답 리스트 반환"""
+    query_params = {"market": ticker, "count": count,
+                    "to": to.strftime("%Y-%m-%d %H:%M:%S")}
+    if converting_price_unit is not None:
+        query_params["convertingPriceUnit"] = converting_price_unit
+    contents, _ = _call_public_api(url, **query_params)
+    return contents
+
+
+def _get_ohlcv_concurrent(url, ticker, count, to, width, converting_price_unit,
+                          max_workers):
+    """고정 간격 캔들의 페이지별 to 시점을 미리 계산하여 동시에 요청
+
+    거래가 없어 캔들이 비어 있는 구간이 있으면 페이지가 서로 겹치므로 중복을
+    제거하고, 부족한 개수만 가장 오래된 캔들부터 순차적으로 추가 요청합니다.
+    """
+    pages = _candle_pages(count, to, width)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda page: _fetch_candles(url, ticker, page[1], page[0],
+                                        converting_price_unit),
+            pages))
+
+    candles = {}
+    exhausted = _merge_candle_pages(candles, results, pages)
+    while not exhausted and 0 < len(candles) < count:
+        oldest, query_count = _next_candle_page(candles, count)
+        contents = _fetch_candles(url, ticker, query_count, oldest,
+                                  converting_price_unit)
+        exhausted = _merge_candle_pages(candles, [contents], [(oldest, query_count)])
+    return _newest_candles_frame(candles, count)
+
+
+def _candle_pages(count, to, width):
+    """고정 간격 캔들 count개를 받을 페이지별 (to 시점, 요청 개수) 목록"""
+    return [
+        (to - width * (MAX_CALL_COUNT * i),
+         min(MAX_CALL_COUNT, count - MAX_CALL_COUNT * i))
+        for i in range(math.ceil(count / MAX_CALL_COUNT))
+    ]
+
+
+def _merge_candle_pages(candles, results, pages):
+    """페이지 응답을 시각별로 중복 제거하여 candles에 합치고, 상장 시점까지 받았는지 반환
+
+    요청보다 적게 받은 페이지가 있으면 상장 시점까지 모두 받은 것입니다.
+    """
+    for contents in results:
+        for x in contents:
+            candles.setdefault(x['candle_date_time_utc'], x)
+    return any(len(contents) < query_count
+               for contents, (_, query_count) in zip(results, pages))
+
+
+def _next_candle_page(candles, count):
+    """빈 구간으로 부족한 캔들을 받을 다음 페이지 (가장 오래된 캔들 이전)"""
+    oldest = datetime.datetime.strptime(min(candles), "%Y-%m-%dT%H:%M:%S")
+    return oldest, min(MAX_CALL_COUNT, count - len(candles))
+
+
+def _newest_candles_frame(candles, count):
+    """합친 캔들 중 최신 count개의 DataFrame. 캔들이 없으면 None"""
+    if not candles:
+        return None
+    newest = sorted(candles)[-count:]
+    return _candles_to_frame([candles[key] for key in newest])
 
 
 def get_ohlcv(
@@ -108,7 +233,8 @@ def get_ohlcv(
     count: int = 200,
     to: Union[str, datetime.datetime] = None,
     period: float = 0.1,
-    converting_price_unit: str = None
+    converting_price_unit: str = None,
+    max_workers: Optional[int] = None
 ):
     """
     캔들 데이터 조회
@@ -128,6 +254,9 @@ def get_ohlcv(
         converting_price_unit: 파라미터 (선택사항, 일봉만 지원)
             - KRW 마켓이 아닌 마켓의 일봉을 원화로 환산하여 조회
             - 예: "KRW", "BTC"
+        max_workers: 동시 요청 스레드 수 (선택사항)
+            - None: 페이지를 순차적으로 조회 (기존 동작)
+            - 2 이상: 초/분/일/주 캔들의 페이지를 동시에 조회 (요청 수 제한은 RateLimiter가 조절)
 
     Returns:
         DataFrame: OHLCV 데이터
@@ -151,74 +280,153 @@ def get_ohlcv(
         >>> # BTC-ETH 일봉을 BTC 기준으로 환산 조회
         >>> df = get_ohlcv("BTC-ETH", interval="day", converting_price_unit="BTC")
 
+        >>> # 1분봉 10만 개를 8개 스레드로 동시에 조회
+        >>> df = get_ohlcv("KRW-BTC", interval="minute1", count=100000, max_workers=8)
+
     Note:
         - converting_price_unit은 일봉에서만 사용 가능합니다
         - 조회 데이터가 200개 이상인 경우 자동으로 여러 번 호출됩니다
+        - 월/연 캔들은 간격이 일정하지 않아 max_workers와 관계없이 순차적으로 조회합니다
     """
-    MAX_CALL_COUNT = 200
     try:
-        url = get_url_ohlcv(interval=interval)
+        return _get_ohlcv(ticker, interval, count, to, period,
+                          converting_price_unit, max_workers)
+    except Exception:
+        return None
 
-        if to is None:
-            to = datetime.datetime.now(datetime.timezone.utc)
-            to = to.replace(tzinfo=None)
-        elif isinstance(to, str):
-            to = pd.to_datetime(to).to_pydatetime()
-        elif isinstance(to, pd._libs.tslibs.timestamps.Timestamp):
-            to = to.to_pydatetime()
 
-        #to = to.astimezone(datetime.timezone.utc)
+def _get_ohlcv(ticker, interval, count, to, period, converting_price_unit,
+               max_workers):
+    """get_ohlcv 구현. 요청 실패 시 None 대신 예외를 그대로 전달"""
+    url = get_url_ohlcv(interval=interval)
+    to = _normalize_ohlcv_to(to)
 
-        dfs = []
-        count = max(count, 1)
-        for pos in range(count, 0, -200):
-            query_count = min(MAX_CALL_COUNT, pos)
+    #to = to.astimezone(datetime.timezone.utc)
 
-            to = to.strftime("%Y-%m-%d %H:%M:%S")
+    count = max(count, 1)
+    width = _candle_width(url)
+    if max_workers is not None and max_workers > 1 \
+            and width is not None and count > MAX_CALL_COUNT:
+        return _get_ohlcv_concurrent(url, ticker, count, to, width,
+                                     converting_price_unit, max_workers)
 
-            query_params = {"market": ticker, "count": query_count, "to": to}
-            if converting_price_unit is not None:
-                query_params["convertingPriceUnit"] = converting_price_unit
-
-            contents, _ = _call_public_api(url, **query_params)
-
-            dt_list = []
-            for x in contents:
-                dt = datetime.datetime.strptime(
-                    x['candle_date_time_kst'], "%Y-%m-%dT%H:%M:%S")
-                #dt_list.append(dt.astimezone())
-                dt_list.append(dt)
-
-            df = pd.DataFrame(contents,
-                              columns=[
-                                  'opening_price',
-                                  'high_price',
-                                  'low_price',
-                                  'trade_price',
-                                  'candle_acc_trade_volume',
-                                  'candle_acc_trade_price'],
-                              index=dt_list)
-            df = df.sort_index()
-            if df.shape[0] == 0:
-                break
-            dfs += [df]
+    candles = []
+    for pos in range(count, 0, -200):
+        query_count = min(MAX_CALL_COUNT, pos)
 
-            to = datetime.datetime.strptime(
-                contents[-1]['candle_date_time_utc'], "%Y-%m-%dT%H:%M:%S")
+        to = to.strftime("%Y-%m-%d %H:%M:%S")
 
-            if pos > 200:
-                time.sleep(period)
+        query_params = {"market": ticker, "count": query_count, "to": to}
+        if converting_price_unit is not None:
+            query_params["convertingPriceUnit"] = converting_price_unit
 
-        df = pd.concat(dfs).sort_index()
-        df = df.rename(columns={"opening_price": "open",
-                                "high_price": "high",
-                                "low_price": "low",
-                                "trade_price": "close",
-                                "candle_acc_trade_volume": "volume",
-                                "candle_acc_trade_price": "value"})
-        return df
-    except Exception:
+        contents, _ = _call_public_api(url, **query_params)
+        if len(contents) == 0:
+            break
+        candles += contents
+
+        to = datetime.datetime.strptime(
+            contents[-1]['candle_date_time_utc'], "%Y-%m-%dT%H:%M:%S")
+
+        if pos > 200:
+            time.sleep(period)
+
+    if len(candles) == 0:
         return None
+    return _candles_to_frame(candles)
+
+
+def get_ohlcv_many(
+    tickers: List[str],
+    interval: str = "day",
+    count: int = 200,
+    to: Union[str, datetime.datetime] = None,
+    period: float = 0.1,
+    max_workers: int = 8,
+    as_dict: bool = False,
+    errors: str = "raise"
+):
+    """
+    여러 마켓의 캔들 데이터를 동시에 조회
+
+    마켓별 get_ohlcv 호출을 스레드 풀에서 동시에 실행합니다. 요청 간격은
+    transport의 RateLimiter가 candle 그룹 한도에 맞춰 조절합니다.
+
+    Args:
+        tickers: 마켓 티커 리스트 (예: get_tickers("KRW"))
+        interval: 캔들 간격 (get_ohlcv와 동일)
+        count: 마켓별 조회 갯수 (기본값: 200)
+        to: 조회 마지막 시점 (datetime 또는 str)
+        period: 마켓별 페이지 조회 시간 간격 (초 단위, 기본값: 0.1)
+        max_workers: 동시에 조회할 마켓 수 (기본값: 8)
+        as_dict: 반환 형식 (기본값: False)
+            - False: 컬럼이 (ticker, field) MultiIndex인 DataFrame
+            - True: {ticker: DataFrame} 딕셔너리 (모든 DataFrame이 같은 인덱스)
+        errors: 일부 마켓 조회 실패 시 처리 방식 (기본값: "raise")
+            - "raise": 실패한 마켓 목록과 원인을 담은 UpbitAPIError 발생
+            - "collect": (데이터, {ticker: 예외}) 튜플 반환
+
+    Returns:
+        DataFrame 또는 dict: 모든 마켓의 시각을 합친 인덱스로 정렬된 OHLCV 데이터.
+        해당 시각에 캔들이 없는 마켓의 값은 NaN입니다.
+        errors="collect"이면 (데이터, 실패 마켓별 예외) 튜플
+
+    Raises:
+        UpbitAPIError: errors="raise"이고 하나 이상의 마켓 조회가 실패한 경우
+            (response에 {ticker: 에러 내용} 포함)
+        UpbitValidationError: errors 값이 올바르지 않은 경우
+
+    Examples:
+        >>> df = get_ohlcv_many(get_tickers("KRW"), interval="minute1", count=400)
+        >>> df["KRW-BTC"]["close"]
+        >>> df.xs("close", axis=1, level=1)   # 마켓별 종가
+
+        >>> data, failed = get_ohlcv_many(tickers, errors="collect")
+        >>> for ticker, exc in failed.items():
+        ...     print(ticker, exc)
+
+    Note:
+        - 캔들이 하나도 없는 마켓도 실패로 보고합니다
+    """
+    if errors not in ("raise", "collect"):
+        raise UpbitValidationError(
+            "errors는 'raise' 또는 'collect'만 가능합니다", field="errors")
+
+    tickers = list(dict.fromkeys(tickers))
+
+    def fetch(ticker):
+        df = _get_ohlcv(ticker, interval, count, to, period, None, None)
+        if df is None:
+            raise UpbitAPIError(f"{ticker} 캔들 데이터가 없습니다")
+        return df
+
+    frames = {}
+    failed = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {ticker: executor.submit(fetch, ticker) for ticker in tickers}
+        for ticker, future in futures.items():
+            try:
+                frames[ticker] = future.result()
+            except Exception as exc:
+                failed[ticker] = exc
+
+    if failed and errors == "raise":
+        raise UpbitAPIError(
+            f"{len(failed)}개 마켓 캔들 조회 실패: {', '.join(failed)}",
+            response={ticker: repr(exc) for ticker, exc in failed.items()})
+
+    import pandas as pd
+    if frames:
+        data = pd.concat(frames, axis=1).sort_index()
+    else:
+        data = pd.DataFrame(
+            columns=pd.MultiIndex.from_product([[], list(OHLCV_RENAME.values())]))
+    if as_dict:
+        data = {ticker: data[ticker] for ticker in frames}
+
+    if errors == "collect":
+        return data, failed
+    return data
 
 
 def get_ohlcv_from(ticker="KRW-BTC", interval="day", fromDatetime=None,
@@ -226,24 +434,9 @@ def get_ohlcv_from(ticker="KRW-BTC", interval="day", fromDatetime=None,
     MAX_CALL_COUNT = 200
     try:
         url = get_url_ohlcv(interval=interval)
+        fromDatetime, to = _ohlcv_from_range(fromDatetime, to)
 
-        if fromDatetime is None:
-            fromDatetime = datetime.datetime(2000, 1, 1, 0, 0, 0)
-        elif isinstance(fromDatetime, str):
-            fromDatetime = pd.to_datetime(fromDatetime).to_pydatetime()
-        elif isinstance(fromDatetime, pd._libs.tslibs.timestamps.Timestamp):
-            fromDatetime = fromDatetime.to_pydatetime()
-        fromDatetime = fromDatetime.astimezone(datetime.timezone.utc)
-
-        if to is None:
-            to = datetime.datetime.now()
-        elif isinstance(to, str):
-            to = pd.to_datetime(to).to_pydatetime()
-        elif isinstance(to, pd._libs.tslibs.timestamps.Timestamp):
-            to = to.to_pydatetime()
-        to = to.astimezone(datetime.timezone.utc)
-
-        dfs = []
+        candles = []
         while to > fromDatetime:
             query_count = MAX_CALL_COUNT
 
@@ -251,54 +444,156 @@ def get_ohlcv_from(ticker="KRW-BTC", interval="day", fromDatetime=None,
 
             contents, _ = _call_public_api(
                 url, market=ticker, count=query_count, to=to)
-
-            dt_list = []
-            for x in contents:
-                dt = datetime.datetime.strptime(
-                    x['candle_date_time_kst'], "%Y-%m-%dT%H:%M:%S")
-                dt_list.append(dt.astimezone())
-            # set timezone for time comparison
-            # timezone will be removed before DataFrame returned
-
-            df = pd.DataFrame(contents,
-                              columns=[
-                                  'opening_price',
-                                  'high_price',
-                                  'low_price',
-                                  'trade_price',
-                                  'candle_acc_trade_volume',
-                                  'candle_acc_trade_price'],
-                              index=dt_list)
-            df = df.sort_index()
-            if df.shape[0] == 0:
+            if len(contents) == 0:
                 break
-            dfs += [df]
+            candles += contents
 
             to = datetime.datetime.strptime(
                 contents[-1]['candle_date_time_utc'], "%Y-%m-%dT%H:%M:%S")
             to = to.replace(tzinfo=datetime.timezone.utc)
             # to compare fromTs and to, set tzinfo
-            # timezone will be removed before DataFrame returned
 
             if to > fromDatetime:
                 time.sleep(period)
 
-        df = pd.concat(dfs).sort_index()
-        df = df[df.index >= fromDatetime]
-        df.index = df.index.tz_localize(None)
-        # remove timezone, return DataFrame whose index has no timezone
-        #   like get_ohlcv method
-        df = df.rename(columns={"opening_price": "open",
-                                "high_price": "high",
-                                "low_price": "low",
-                                "trade_price": "close",
-                                "candle_acc_trade_volume": "volume",
-                                "candle_acc_trade_price": "value"})
-        return df
+        if len(candles) == 0:
+            return None
+        df = _candles_to_frame(candles)
+        # the KST wall-clock index is compared as local time,
+        #   like get_ohlcv method the returned index has no timezone
+        from_local = fromDatetime.astimezone().replace(tzinfo=None)
+        return df[df.index >= from_local]
     except Exception:
         return None
 
 
+def _ohlcv_from_range(fromDatetime, to):
+    """get_ohlcv_from의 조회 구간을 UTC datetime으로 변환 (tz 정보 없는 값은 로컬 시각)"""
+    if fromDatetime is None:
+        fromDatetime = datetime.datetime(2000, 1, 1, 0, 0, 0)
+    if to is None:
+        to = datetime.datetime.now()
+    return (_to_datetime(fromDatetime).astimezone(datetime.timezone.utc),
+            _to_datetime(to).astimezone(datetime.timezone.utc))
+
+
+_UTC_KEY_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _first_candle_before(url, ticker, lo, hi, precision):
+    """lo 이전에는 캔들이 없을 때, 첫 캔들을 포함하는 precision 폭의 구간 시작 탐색
+
+    count=1 요청으로 "hi 이전에 캔들이 있는가"를 이분 탐색하므로, 상장 전의
+    긴 빈 구간을 페이지마다 요청하지 않고 약 log2((hi - lo) / precision)번에 건너뜁니다.
+
+    Returns:
+        datetime: 이 시각 이전에는 캔들이 없는 구간 시작. hi 이전에 캔들이 없으면 None
+    """
+    if not _fetch_candles(url, ticker, 1, hi):
+        return None
+    while hi - lo > precision:
+        mid = lo + (hi - lo) / 2
+        if _fetch_candles(url, ticker, 1, mid):
+            hi = mid
+        else:
+            lo = mid
+    return lo
+
+
+def iter_ohlcv_from(ticker="KRW-BTC", interval="day", fromDatetime=None,
+                    to=None, period=0.1, chunk_size=None):
+    """fromDatetime부터 to까지의 캔들을 시간순 DataFrame 조각으로 반환하는 제너레이터
+
+    get_ohlcv_from은 전체 구간을 받은 뒤 한 번에 DataFrame을 만들지만, 이 함수는
+    오래된 구간부터 앞으로 나아가며 받은 캔들을 요청마다(또는 chunk_size개씩) 바로
+    내보냅니다.
+    각 조각은 get_ohlcv와 같은 형식(KST 인덱스, open/high/low/close/volume/value)이며
+    조각끼리 겹치지 않고 이어지므로, 디스크에 이어 쓰거나 누적 집계하는 동안
+    메모리 사용량이 조회 구간 길이와 관계없이 일정합니다.
+
+    Args:
+        ticker: 마켓 티커 (기본값: "KRW-BTC")
+        interval: 캔들 간격 (get_ohlcv와 동일, 기본값: "day")
+        fromDatetime: 조회 시작 시각 (기본값: 2000-01-01). tz 정보가 없으면 로컬 시각
+        to: 조회 종료 시각 (기본값: 현재). tz 정보가 없으면 로컬 시각
+        period: 요청 간 대기 시간 (초, 기본값: 0.1)
+        chunk_size: 조각당 최소 캔들 수 (선택사항)
+            - None: 요청 1회에 받은 캔들마다 조각 반환 (최대 200개)
+            - 정수: 캔들이 chunk_size개 이상 모이면 반환. 마지막 조각은 더 작을 수 있음
+
+    Yields:
+        DataFrame: 시간순으로 정렬된 캔들 조각
+
+    Raises:
+        UpbitAPIError: 요청이 실패한 경우 (get_ohlcv_from과 달리 None을 반환하지 않음)
+
+    Examples:
+        >>> for chunk in iter_ohlcv_from("KRW-BTC", "minute1", "2024-01-01"):
+        ...     chunk.to_csv("btc_minute1.csv", mode="a", header=False)
+
+    Note:
+        - 시작 구간에 캔들이 없으면(상장 전) 이분 탐색으로 첫 캔들 위치를 찾아 건너뜁니다
+        - 월/연 캔들은 간격이 일정하지 않아 전체를 받은 뒤 나누어 반환합니다
+          (2000년 이후 전체도 수백 개 이하)
+    """
+    url = get_url_ohlcv(interval=interval)
+    start, to = _ohlcv_from_range(fromDatetime, to)
+    width = _candle_width(url)
+    if width is None:
+        yield from _iter_ohlcv_backward(url, ticker, start, to, period,
+                                        max(chunk_size or MAX_CALL_COUNT, 1))
+        return
+    chunk_size = max(chunk_size or 1, 1)
+
+    # 서버의 to 경계 포함 여부와 관계없이 한 번의 요청(200개)이 구간 전체를 덮도록
+    # 구간 폭을 캔들 199개로 둡니다.
+    span = width * (MAX_CALL_COUNT - 1)
+    pending = []
+    while start < to:
+        end = min(start + span, to)
+        contents = _fetch_candles(url, ticker, MAX_CALL_COUNT, end)
+        if not contents:
+            # end 이전에 캔들이 하나도 없음: 첫 캔들이 있는 구간으로 이동
+            start = _first_candle_before(url, ticker, end, to, span)
+            if start is None:
+                break
+            continue
+
+        lo, hi = start.strftime(_UTC_KEY_FORMAT), end.strftime(_UTC_KEY_FORMAT)
+        pending += [x for x in reversed(contents)
+                    if lo <= x['candle_date_time_utc'] < hi]
+        if len(pending) >= chunk_size:
+            yield _candles_to_frame(pending)
+            pending = []
+
+        start = end
+        if start < to:
+            time.sleep(period)
+
+    if pending:
+        yield _candles_to_frame(pending)
+
+
+def _iter_ohlcv_backward(url, ticker, start, to, period, chunk_size):
+    """간격이 일정하지 않은 캔들(월/연)을 최신순으로 모두 받은 뒤 시간순 조각으로 반환"""
+    lo = start.strftime(_UTC_KEY_FORMAT)
+    candles = []
+    while to > start:
+        contents = _fetch_candles(url, ticker, MAX_CALL_COUNT, to)
+        if not contents:
+            break
+        candles += contents
+        to = datetime.datetime.strptime(
+            contents[-1]['candle_date_time_utc'], _UTC_KEY_FORMAT)
+        to = to.replace(tzinfo=datetime.timezone.utc)
+        if to > start:
+            time.sleep(period)
+
+    candles = [x for x in reversed(candles) if x['candle_date_time_utc'] >= lo]
+    for i in range(0, len(candles), chunk_size):
+        yield _candles_to_frame(candles[i:i + chunk_size])
+
+
 def get_daily_ohlcv_from_base(ticker="KRW-BTC", base=0):
     try:
         df = get_ohlcv(ticker, interval="minute60")
@@ -314,41 +609,125 @@ def get_daily_ohlcv_from_base(ticker="KRW-BTC", base=0):
         return None
 
 
-def _get_current_price(ticker="KRW-BTC", limit_info=False, verbose=False):    
-    url = "https://api.upbit.com/v1/ticker"
-    return _call_public_api(url, markets=ticker)    
-    
-def get_current_price(ticker="KRW-BTC", limit_info=False, verbose=False):
+MAX_TICKER_MARKETS = 200
+MAX_URL_LENGTH = 4096
+
+
+def _chunk_markets(url, tickers, max_url_length=MAX_URL_LENGTH,
+                   max_markets=MAX_TICKER_MARKETS):
+    """쿼리 문자열을 포함한 URL이 max_url_length를 넘지 않도록 티커를 묶음으로 나눔
+
+    markets 파라미터는 requests가 "markets=KRW-BTC&markets=KRW-ETH" 형식으로
+    인코딩하므로 티커마다 인코딩된 길이를 더해 가며 나눕니다.
+    """
+    budget = max_url_length - len(url) - 1     # "?"
+    chunks = []
+    chunk, size = [], 0
+    for ticker in tickers:
+        item = len("markets=") + len(quote(ticker, safe="")) + 1   # "&"
+        if chunk and (size + item > budget or len(chunk) >= max_markets):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(ticker)
+        size += item
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _get_current_price(ticker="KRW-BTC", limit_info=False, verbose=False):
+    url = get_endpoints().url("ticker")
+    return _call_public_api(url, markets=ticker)
+
+
+def _get_current_price_many(tickers, max_workers):
+    """티커 묶음을 동시에 요청하여 (응답 리스트, 마지막 묶음의 요청 수 제한 정보) 반환"""
+    url = get_endpoints().url("ticker")
+    chunks = _chunk_markets(url, tickers)
+    if max_workers is not None and max_workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = list(executor.map(
+                lambda chunk: _call_public_api(url, markets=chunk), chunks))
+    else:
+        results = [_call_public_api(url, markets=chunk) for chunk in chunks]
+
+    price = []
+    req_limit_info = {}
+    for price_sliced, req_limit_info in results:
+        price += price_sliced
+    return price, req_limit_info
+
+
+def _format_current_price(price, single, verbose, output):
+    """현재가 응답 리스트를 get_current_price의 반환 형식으로 변환"""
+    if output == "frame":
+        import pandas as pd
+        frame = pd.DataFrame(price)
+        return frame.set_index("market") if "market" in frame else frame
+    if verbose:
+        return price
+    if single:
+        return price[0]['trade_price']
+    return {x['market']: x['trade_price'] for x in price}
+
+
+def get_current_price(ticker="KRW-BTC", limit_info=False, verbose=False,
+                      quote_currencies=None, output="dict", max_workers=4):
     """현재가 정보 조회
 
+    티커 리스트는 URL 길이 제한(MAX_URL_LENGTH)과 요청당 최대 마켓 수
+    (MAX_TICKER_MARKETS) 안에서 묶음으로 나누어 max_workers개까지 동시에
+    요청합니다. 요청 간격은 transport의 RateLimiter가 ticker 그룹 한도에 맞춰
+    조절합니다. quote_currencies를 지정하면 /v1/ticker/all로 호가 통화의 전체
+    마켓을 한 번에 조회합니다.
+
     Args:
         ticker (str/list, optional): 단일 티커 또는 티커 리스트 Defaults to "KRW-BTC".
         limit_info (bool, optional): True: 요청 제한 정보 리턴. Defaults to False.
         verbose (bool, optional): True: 원본 API 파라미터 리턴. Defaults to False.
+        quote_currencies (str/list, optional): 호가 통화 (예: "KRW", ["KRW", "BTC"]).
+            지정하면 ticker는 무시하고 해당 호가 통화의 전체 마켓을 1회 요청으로 조회
+        output (str, optional): 복수 마켓 조회 결과 형식. Defaults to "dict".
+            - "dict": {티커: 현재가} 딕셔너리 (verbose=True이면 원본 응답 리스트)
+            - "frame": 마켓 코드 인덱스의 DataFrame (응답의 모든 필드, verbose 무시)
+        max_workers (int, optional): 동시에 요청할 티커 묶음 수. Defaults to 4.
+            None 또는 1이면 순차적으로 요청
 
     Returns:
-        [type]: [description]
+        단일 티커: 현재가 (float), 복수 티커/quote_currencies: output 형식의 결과.
+        limit_info가 True이면 (결과, 요청 수 제한 정보) 튜플
+        (묶음으로 나눈 경우 마지막 묶음의 요청 수 제한 정보)
+
+    Raises:
+        UpbitValidationError: output 값이 올바르지 않은 경우
+
+    Examples:
+        >>> prices = get_current_price(get_tickers())          # 전체 마켓, 묶음 동시 요청
+        >>> df = get_current_price(quote_currencies=["KRW", "BTC"], output="frame")
+        >>> df.loc["KRW-BTC", "trade_price"]
     """
-    if isinstance(ticker, str) or (isinstance(ticker, list) and len(ticker) == 1):
-        price, req_limit_info = _get_current_price(ticker, limit_info, verbose)        
-        if verbose is False:
-            price = price[0]['trade_price']
-        
+    if output not in ("dict", "frame"):
+        raise UpbitValidationError(
+            "output은 'dict', 'frame'만 가능합니다", field="output")
+
+    if quote_currencies is not None:
+        if not isinstance(quote_currencies, str):
+            quote_currencies = ",".join(quote_currencies)
+        price, req_limit_info = _call_public_api(
+            get_endpoints().url("ticker_all"), quote_currencies=quote_currencies)
+        single = False
+    elif isinstance(ticker, str) or (isinstance(ticker, list) and len(ticker) == 1):
+        price, req_limit_info = _get_current_price(ticker, limit_info, verbose)
+        single = output == "dict"
     else:
-        slice_size = 200
-        price = []
-        for idx in range(0, len(ticker), slice_size):
-            ticker_sliced = ticker[idx: idx+slice_size]
-            price_sliced, req_limit_info = _get_current_price(ticker_sliced, limit_info, verbose)        
-            price += price_sliced
-
-        if verbose is False:
-            price = {x['market']: x['trade_price'] for x in price}
-    
+        price, req_limit_info = _get_current_price_many(ticker, max_workers)
+        single = False
+
+    price = _format_current_price(price, single, verbose, output)
     if limit_info:
         return price, req_limit_info
     else:
-        return price  
+        return price
 
 
 def get_orderbook_supported_levels(markets: List[str]) -> List[Dict]:
@@ -385,7 +764,7 @@ def get_orderbook_supported_levels(markets: List[str]) -> List[Dict]:
         raise ValueError("markets 파라미터는 비어있지 않은 리스트여야 합니다")
 
     # API 호출
-    url = "https://api.upbit.com/v1/orderbook/supported_levels"
+    url = get_endpoints().url("orderbook_supported_levels")
 
     # markets 파라미터를 쿼리 스트링으로 변환
     # Upbit API는 여러 마켓을 쿼리 파라미터로 전달
@@ -449,7 +828,7 @@ def get_orderbook(
         - 호가 모아보기 단위는 get_orderbook_supported_levels()로 먼저 확인을 권장합니다
     """  # pylint: disable=line-too-long # noqa: E501
 
-    url = "https://api.upbit.com/v1/orderbook"
+    url = get_endpoints().url("orderbook")
 
     # level 파라미터가 있는 경우 쿼리 파라미터에 추가
     if level is not None:
@@ -469,6 +848,213 @@ def get_orderbook(
         return orderbook
 
 
+MAX_TRADE_COUNT = 500
+MAX_TRADE_DAYS_AGO = 7
+
+# 체결 내역 컬럼 (응답 필드, dtype)
+TRADE_COLUMNS = (
+    ("timestamp", "int64"),
+    ("trade_price", "float64"),
+    ("trade_volume", "float64"),
+    ("prev_closing_price", "float64"),
+    ("change_price", "float64"),
+    ("sequential_id", "int64"),
+)
+_TRADE_VALUES = operator.itemgetter(*(name for name, _ in TRADE_COLUMNS))
+
+
+def get_trades(
+    ticker: str = "KRW-BTC",
+    count: int = MAX_TRADE_COUNT,
+    days_ago: Optional[int] = None,
+    cursor: Optional[Union[int, str]] = None,
+    to: Optional[str] = None,
+    limit_info: bool = False
+):
+    """최근 체결 내역 조회 (요청 1회)
+
+    Args:
+        ticker: 마켓 티커 (기본값: "KRW-BTC")
+        count: 조회 갯수 (최대 500, 기본값: 500)
+        days_ago: 며칠 전의 체결 내역인지 (1~7, 기본값: None = 가장 최근 체결 날짜)
+        cursor: 페이지네이션 커서. 이전 응답의 마지막 sequential_id를 넣으면 그보다
+            이전 체결을 조회
+        to: 해당 시각 이전의 체결 조회 (UTC, "HHmmss" 또는 "HH:mm:ss")
+        limit_info: 요청 수 제한 정보 포함 여부 (기본값: False)
+
+    Returns:
+        list: 최신순 체결 내역. limit_info가 True이면 (체결 내역, 요청 제한 정보) 튜플
+
+    Raises:
+        UpbitValidationError: count 또는 days_ago가 범위를 벗어난 경우
+
+    Examples:
+        >>> ticks = get_trades("KRW-BTC", count=300)
+        >>> older = get_trades("KRW-BTC", cursor=ticks[-1]["sequential_id"])
+        >>> ticks = get_trades("KRW-BTC", days_ago=3)
+    """
+    if not 1 <= count <= MAX_TRADE_COUNT:
+        raise UpbitValidationError(
+            f"count는 1~{MAX_TRADE_COUNT} 범위여야 합니다", field="count")
+    if days_ago is not None and not 1 <= days_ago <= MAX_TRADE_DAYS_AGO:
+        raise UpbitValidationError(
+            f"days_ago는 1~{MAX_TRADE_DAYS_AGO} 범위여야 합니다", field="days_ago")
+
+    params = {"market": ticker, "count": count}
+    if days_ago:
+        params["days_ago"] = days_ago
+    if cursor is not None:
+        params["cursor"] = cursor
+    if to is not None:
+        params["to"] = to
+    trades, req_limit_info = _call_public_api(
+        get_endpoints().url("trades_ticks"), **params)
+
+    if limit_info:
+        return trades, req_limit_info
+    return trades
+
+
+def iter_trades(
+    ticker: str = "KRW-BTC",
+    days: int = 1,
+    cursor: Optional[Union[int, str]] = None,
+    to: Optional[str] = None
+):
+    """체결 내역을 최신순으로 페이지 단위로 반환하는 제너레이터
+
+    가장 최근 체결 날짜부터 하루씩 이전 날짜로 이동하며, 날짜마다 sequential_id
+    커서로 더 이상 체결이 없을 때까지 거슬러 올라갑니다. 필요한 만큼만 읽고
+    반복을 멈추면 이후 페이지는 요청하지 않습니다.
+
+    Args:
+        ticker: 마켓 티커 (기본값: "KRW-BTC")
+        days: 조회할 날짜 수 (1~8, 기본값: 1). 1이면 가장 최근 체결 날짜만,
+            8이면 days_ago=7까지 조회
+        cursor: 첫 날짜의 시작 커서 (선택사항)
+        to: 첫 날짜의 시작 시각 (UTC, "HHmmss" 또는 "HH:mm:ss", 선택사항)
+
+    Yields:
+        list: 최신순 체결 내역 페이지 (최대 500개)
+
+    Examples:
+        >>> for page in iter_trades("KRW-BTC", days=2):
+        ...     save(page)
+    """
+    _check_trade_days(days)
+    for days_ago in range(days):
+        yield from _iter_day_trades(ticker, days_ago, cursor, to)
+        cursor = to = None
+
+
+def _check_trade_days(days):
+    if not 1 <= days <= MAX_TRADE_DAYS_AGO + 1:
+        raise UpbitValidationError(
+            f"days는 1~{MAX_TRADE_DAYS_AGO + 1} 범위여야 합니다", field="days")
+
+
+def _iter_day_trades(ticker, days_ago, cursor=None, to=None):
+    """하루치 체결 내역을 sequential_id 커서로 거슬러 올라가며 페이지 단위로 반환"""
+    while True:
+        page = get_trades(ticker, MAX_TRADE_COUNT, days_ago or None, cursor, to)
+        if page:
+            yield page
+        if len(page) < MAX_TRADE_COUNT:
+            return
+        cursor = page[-1]["sequential_id"]
+
+
+def _trades_to_columns(pages):
+    """체결 내역 페이지들을 중복 제거, 시간순 정렬한 컬럼별 NumPy 배열로 변환"""
+    import numpy as np
+
+    rows = [row for page in pages for row in page]
+    values = [_TRADE_VALUES(row) for row in rows]
+    columns = {}
+    for i, (name, dtype) in enumerate(TRADE_COLUMNS):
+        columns[name] = np.fromiter((v[i] for v in values), dtype=dtype,
+                                    count=len(values))
+    columns["ask_bid"] = np.array([row["ask_bid"] for row in rows], dtype="U3")
+
+    # 페이지가 겹쳐 같은 체결이 두 번 올 수 있으므로 sequential_id로 중복 제거
+    # (np.unique는 정렬된 위치를 돌려주므로 정렬도 함께 처리됨)
+    _, order = np.unique(columns["sequential_id"], return_index=True)
+    order = order[np.argsort(columns["timestamp"][order], kind="stable")]
+    return {name: column[order] for name, column in columns.items()}
+
+
+def get_trades_history(
+    ticker: str = "KRW-BTC",
+    days: int = 1,
+    max_workers: Optional[int] = None,
+    output: str = "frame"
+):
+    """최근 여러 날짜의 체결 내역 전체를 컬럼 형식으로 조회
+
+    날짜(days_ago)마다 iter_trades와 같은 방식으로 커서를 따라 모든 페이지를
+    받으며, max_workers를 지정하면 날짜별 조회를 동시에 실행합니다. 요청 간격은
+    transport의 RateLimiter가 trade 그룹 한도에 맞춰 조절합니다. 응답은 행 단위
+    딕셔너리를 만들지 않고 필드별 NumPy 배열로 바로 변환합니다.
+
+    Args:
+        ticker: 마켓 티커 (기본값: "KRW-BTC")
+        days: 조회할 날짜 수 (1~8, 기본값: 1)
+        max_workers: 동시에 조회할 날짜 수 (선택사항)
+            - None: 날짜를 순차적으로 조회
+            - 2 이상: 날짜별 조회를 스레드 풀에서 동시에 실행
+        output: 반환 형식 (기본값: "frame")
+            - "frame": KST 체결 시각 인덱스의 DataFrame
+            - "numpy": {컬럼명: NumPy 배열} 딕셔너리
+            - "list": 원본 응답 딕셔너리 리스트 (최신순)
+
+    Returns:
+        시간순으로 정렬하고 sequential_id로 중복을 제거한 체결 내역
+        - timestamp: 체결 시각 (밀리초)
+        - trade_price: 체결 가격
+        - trade_volume: 체결량
+        - prev_closing_price: 전일 종가
+        - change_price: 변화량
+        - sequential_id: 체결 번호
+        - ask_bid: 매도/매수 ("ASK", "BID")
+
+    Raises:
+        UpbitValidationError: days 또는 output 값이 올바르지 않은 경우
+
+    Examples:
+        >>> df = get_trades_history("KRW-BTC", days=7, max_workers=7)
+        >>> df.groupby("ask_bid")["trade_volume"].resample("1min").sum()
+
+        >>> cols = get_trades_history("KRW-BTC", output="numpy")
+        >>> vwap = (cols["trade_price"] * cols["trade_volume"]).sum() / cols["trade_volume"].sum()
+    """
+    _check_trade_days(days)
+    if output not in ("frame", "numpy", "list"):
+        raise UpbitValidationError(
+            "output은 'frame', 'numpy', 'list'만 가능합니다", field="output")
+
+    def fetch(days_ago):
+        return list(_iter_day_trades(ticker, days_ago))
+
+    if max_workers is not None and max_workers > 1 and days > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, days)) as executor:
+            per_day = list(executor.map(fetch, range(days)))
+    else:
+        per_day = [fetch(days_ago) for days_ago in range(days)]
+    pages = [page for day in per_day for page in day]
+
+    if output == "list":
+        return [row for page in pages for row in page]
+
+    columns = _trades_to_columns(pages)
+    if output == "numpy":
+        return columns
+
+    import pandas as pd
+    index = pd.to_datetime(columns["timestamp"], unit="ms") + pd.Timedelta(hours=9)
+    index.name = "timestamp_kst"
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
 if __name__ == "__main__":
     # 모든 티커 목록 조회
     # all_tickers = get_tickers()
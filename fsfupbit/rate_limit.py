@@ -0,0 +1,241 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+"""
+fsfupbit.rate_limit
+
+Remaining-Req 헤더로 학습하는 클라이언트 측 요청 수 제한 스케줄러.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from .errors import RemainingReqParsingError
+
+_REMAINING_REQ_PATTERN = re.compile(
+    r"group=([a-z\-]+); min=([0-9]+); sec=([0-9]+)")
+
+# 그룹별 초당 요청 수 (Upbit 문서 기준 기본값, 응답 헤더로 보정됨)
+DEFAULT_GROUP_RATES = {
+    "market": 10,
+    "candle": 10,
+    "trade": 10,
+    "ticker": 10,
+    "orderbook": 10,
+    "default": 30,
+    "order": 8,
+    "order-test": 8,
+    "order-cancel-all": 0.5,
+}
+
+# (HTTP 메서드, 경로 접두사) → 그룹. 먼저 일치하는 항목 사용, 메서드가 None이면 모든 메서드
+DEFAULT_ROUTE_GROUPS = (
+    (None, "/v1/market/", "market"),
+    (None, "/v1/candles/", "candle"),
+    (None, "/v1/trades/", "trade"),
+    (None, "/v1/ticker", "ticker"),
+    (None, "/v1/orderbook", "orderbook"),
+    ("POST", "/v1/orders/test", "order-test"),
+    ("POST", "/v1/orders", "order"),
+    ("DELETE", "/v1/orders/open", "order-cancel-all"),
+)
+
+
+def _parse(remaining_req: str) -> Dict[str, Any]:
+    """Parse the number of remaining requests info for Upbit API
+
+    Args:
+        remaining_req (str): String of the number of remaining requests info
+         like "group=market; min=573; sec=9"
+    Returns:
+        Parsed dictionary of the number of remaining requests info
+         like {'group': 'market', 'min': 573, 'sec': 2}
+    Raises:
+        RemainingReqParsingError: If the input can not be parsed.
+    """
+    try:
+        matched = _REMAINING_REQ_PATTERN.search(remaining_req)
+        if matched is None:
+            raise RemainingReqParsingError
+
+        ret = {
+            "group": matched.group(1),
+            "min": int(matched.group(2)),
+            "sec": int(matched.group(3)),
+        }
+        return ret
+    except (AttributeError, ValueError):
+        raise RemainingReqParsingError
+
+
+class TokenBucket:
+    """초당 요청 수를 제한하는 토큰 버킷
+
+    토큰이 부족하면 음수로 예약하여 호출 순서대로 대기 시간을 배정합니다.
+
+    Args:
+        rate: 초당 충전되는 토큰 수
+        capacity: 최대 토큰 수 (기본값: rate, 최소 1)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개를 예약하고 전송 전 대기해야 할 시간(초)을 반환"""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def observe(self, remaining: int, now: float) -> None:
+        """서버가 알려준 남은 요청 수로 토큰 수와 용량을 보정"""
+        self._refill(now)
+        if remaining + 1 > self.capacity:
+            # sec 값은 이번 요청을 뺀 값이므로 실제 한도는 remaining + 1 이상
+            self.capacity = float(remaining + 1)
+            self.rate = self.capacity
+        self.tokens = min(self.tokens, float(remaining))
+
+    def drain(self, now: float) -> None:
+        """429 응답을 받은 경우 남은 토큰을 비움"""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    """Remaining-Req 헤더로 학습하는 그룹별 요청 수 제한 스케줄러
+
+    요청 전에 경로로 추정한 그룹의 토큰을 예약하고, 응답의 Remaining-Req 헤더로
+    (메서드, 경로) → 그룹 매핑과 남은 요청 수를 학습합니다. 동기/비동기
+    transport가 같은 인스턴스를 공유할 수 있으며 스레드 간에 안전합니다.
+
+    Args:
+        rates: 그룹별 초당 요청 수 (기본값: DEFAULT_GROUP_RATES)
+        default_group: 경로로 그룹을 알 수 없을 때 사용할 그룹 (기본값: "default")
+
+    Examples:
+        >>> limiter = RateLimiter()
+        >>> limiter.acquire("GET", "https://api.upbit.com/v1/candles/minutes/1")
+        >>> # 요청 전송 후
+        >>> limiter.observe("GET", url, resp.headers.get("Remaining-Req"))
+
+    Note:
+        - Remaining-Req의 min 값은 초 단위 제한보다 항상 느슨하므로 sec 값만 사용합니다
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        default_group: str = "default"
+    ):
+        self.rates = dict(DEFAULT_GROUP_RATES if rates is None else rates)
+        self.default_group = default_group
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._routes: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def group_for(self, method: str, url: str) -> str:
+        """요청이 속한 요청 수 제한 그룹 반환"""
+        path = urlsplit(url).path
+        group = self._routes.get((method, path))
+        if group is not None:
+            return group
+        for route_method, prefix, group in DEFAULT_ROUTE_GROUPS:
+            if (route_method is None or route_method == method) \
+                    and path.startswith(prefix):
+                return group
+        return self.default_group
+
+    def _bucket(self, group: str) -> TokenBucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            rate = self.rates.get(group, self.rates.get(self.default_group, 10))
+            bucket = self._buckets[group] = TokenBucket(rate)
+        return bucket
+
+    def reserve(self, method: str, url: str) -> float:
+        """토큰을 예약하고 대기 시간(초)을 반환"""
+        group = self.group_for(method, url)
+        with self._lock:
+            return self._bucket(group).reserve(time.monotonic())
+
+    def acquire(self, method: str, url: str) -> None:
+        """전송 가능해질 때까지 현재 스레드를 대기"""
+        wait = self.reserve(method, url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, method: str, url: str) -> None:
+        """전송 가능해질 때까지 이벤트 루프를 막지 않고 대기"""
+        wait = self.reserve(method, url)
+        if wait > 0:
+            import asyncio
+            await asyncio.sleep(wait)
+
+    def observe(
+        self,
+        method: str,
+        url: str,
+        remaining_req: Optional[str],
+        status_code: Optional[int] = None
+    ) -> None:
+        """응답의 Remaining-Req 헤더와 상태 코드로 스케줄러를 보정
+
+        Args:
+            method: 요청 HTTP 메서드
+            url: 요청 URL
+            remaining_req: Remaining-Req 헤더 값 (없으면 None)
+            status_code: 응답 상태 코드
+        """
+        limit = None
+        if isinstance(remaining_req, str):
+            try:
+                limit = _parse(remaining_req)
+            except RemainingReqParsingError:
+                pass
+
+        now = time.monotonic()
+        with self._lock:
+            if limit is not None:
+                group = limit["group"]
+                self._routes[(method, urlsplit(url).path)] = group
+                self._bucket(group).observe(limit["sec"], now)
+            else:
+                group = self.group_for(method, url)
+            if status_code == 429:
+                self._bucket(group).drain(now)
+
+
+_default_rate_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    """동기/비동기 기본 transport가 공유하는 RateLimiter 반환"""
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        with _default_lock:
+            if _default_rate_limiter is None:
+                _default_rate_limiter = RateLimiter()
+    return _default_rate_limiter
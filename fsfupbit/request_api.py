@@ -9,70 +9,57 @@
 # See LICENSE file for the full text of the license.
 #
 
-import re
-import requests
 from requests import Response
 from typing import Any, Tuple, Dict, Optional
-from .errors import error_handler, RemainingReqParsingError
+from .coalesce import get_request_coalescer, request_key
+from .errors import error_handler
+from .rate_limit import _parse
+from .transport import HTTPTransport, get_default_transport
 import json
 
 HTTP_RESP_CODE_START = 200
 HTTP_RESP_CODE_END = 400
 
 
-def _parse(remaining_req: str) -> Dict[str, Any]:
-    """Parse the number of remaining requests info for Upbit API
-
-    Args:
-        remaining_req (str): String of the number of remaining requests info
-         like "group=market; min=573; sec=9"
-    Returns:
-        Parsed dictionary of the number of remaining requests info
-         like {'group': 'market', 'min': 573, 'sec': 2}
-    Raises:
-        RemainingReqParsingError: If the input can not be parsed.
-    """
-    try:
-        pattern = re.compile(r"group=([a-z\-]+); min=([0-9]+); sec=([0-9]+)")
-        matched = pattern.search(remaining_req)
-        if matched is None:
-            raise RemainingReqParsingError
-
-        ret = {
-            "group": matched.group(1),
-            "min": int(matched.group(2)),
-            "sec": int(matched.group(3)),
-        }
-        return ret
-    except (AttributeError, ValueError):
-        raise RemainingReqParsingError
-
-
 @error_handler
-def _call_get(url: str, **kwargs: Any) -> Response:
-    return requests.get(url, **kwargs)
+def _call_get(url: str, transport: Optional[HTTPTransport] = None,
+              **kwargs: Any) -> Response:
+    return (transport or get_default_transport()).get(url, **kwargs)
 
 
 @error_handler
-def _call_post(url: str, **kwargs: Any) -> Response:
-    return requests.post(url, **kwargs)
+def _call_post(url: str, transport: Optional[HTTPTransport] = None,
+               **kwargs: Any) -> Response:
+    return (transport or get_default_transport()).post(url, **kwargs)
 
 
 @error_handler
-def _call_delete(url: str, **kwargs: Any) -> Response:
-    return requests.delete(url, **kwargs)
+def _call_delete(url: str, transport: Optional[HTTPTransport] = None,
+                 **kwargs: Any) -> Response:
+    return (transport or get_default_transport()).delete(url, **kwargs)
 
 
-def _call_public_api(url: str, **params: Any) -> Tuple[Any, Dict[str, Any]]:
+def _call_public_api(
+    url: str, transport: Optional[HTTPTransport] = None, **params: Any
+) -> Tuple[Any, Dict[str, Any]]:
     """Call Upbit public api
 
+    동시에 들어온 같은 (transport, url, params) 요청은 기본 요청 병합기
+    (get_request_coalescer())가 하나로 합쳐 한 번만 전송합니다.
+
     Args:
         url (str): REST API url
+        transport (HTTPTransport, optional): HTTP transport.
+         Defaults to the module-level default transport.
         params (any): GET method parameters
     Returns:
         The contents of requested url, parsed remaining requests count info
     """
-    resp = _call_get(url, params=params)
+    transport = transport or get_default_transport()
+    resp = get_request_coalescer().call(
+        request_key(url, params, transport),
+        lambda: _call_get(url, transport=transport, params=params))
+    # 응답 본문은 공유하되 JSON은 호출마다 파싱하여 결과 객체를 공유하지 않음
     data = resp.json()
     remaining_req = resp.headers.get("Remaining-Req", "")
     limit = _parse(remaining_req)
@@ -80,7 +67,8 @@ def _call_public_api(url: str, **params: Any) -> Tuple[Any, Dict[str, Any]]:
 
 
 def _send_post_request(
-    url: str, headers: Dict[str, str], data: Dict[str, Any]
+    url: str, headers: Dict[str, str], data: Dict[str, Any],
+    transport: Optional[HTTPTransport] = None
 ) -> Tuple[Any, Dict[str, Any]]:
     """Call POST method request for Upbit
 
@@ -88,6 +76,7 @@ def _send_post_request(
         url (str): REST API url
         headers (dict[str, str]): HTTP headers
         data (dict[str, any]): Data
+        transport (HTTPTransport, optional): HTTP transport
     Returns:
         The contents of requested url, parsed remaining requests count info
     """
@@ -95,27 +84,31 @@ def _send_post_request(
         headers["Accept"] = "application/json"
         headers["Content-Type"] = "application/json"
 
+    # identifier를 지정한 주문은 중복 생성되지 않으므로 재시도 정책에 멱등으로 알림
+    idempotent = True if isinstance(data, dict) and data.get("identifier") else None
     if isinstance(data, dict):
         data = json.dumps(data)
 
-    resp = _call_post(url, headers=headers, data=data)
+    resp = _call_post(url, transport=transport, headers=headers, data=data,
+                      idempotent=idempotent)
     data = resp.json()
     remaining_req = resp.headers.get("Remaining-Req", "")
     limit = _parse(remaining_req)
     return data, limit
 
 
-def _send_get_request(url, headers, data=None):
+def _send_get_request(url, headers, data=None, transport=None):
     """Call GET method request for Upbit
 
     Args:
         url (str): REST API url
         headers (dict[str, str]): HTTP headers
         data (dict[str, any]): Data
+        transport (HTTPTransport, optional): HTTP transport
     Returns:
         The contents of requested url, parsed remaining requests count info
     """
-    resp = _call_get(url, headers=headers, data=data)
+    resp = _call_get(url, transport=transport, headers=headers, data=data)
     data = resp.json()
     remaining_req = resp.headers.get("Remaining-Req", "")
     limit = _parse(remaining_req)
@@ -123,7 +116,8 @@ def _send_get_request(url, headers, data=None):
 
 
 def _send_delete_request(
-    url: str, headers: Dict[str, str], data: Dict[str, Any]
+    url: str, headers: Dict[str, str], data: Dict[str, Any],
+    transport: Optional[HTTPTransport] = None
 ) -> Optional[Tuple[Any, Dict[str, Any]]]:
     """Call DELETE method request for Upbit
 
@@ -131,6 +125,7 @@ def _send_delete_request(
         url (str): REST API url
         headers (dict[str, str]): HTTP headers
         data (dict[str, any]): Data
+        transport (HTTPTransport, optional): HTTP transport
     Returns:
         The contents of requested url, parsed remaining requests count info
     """
@@ -141,7 +136,7 @@ def _send_delete_request(
     if isinstance(data, dict):
         data = json.dumps(data)
 
-    resp = _call_delete(url, headers=headers, data=data)
+    resp = _call_delete(url, transport=transport, headers=headers, data=data)
     data = resp.json()
     remaining_req = resp.headers.get("Remaining-Req", "")
     limit = _parse(remaining_req)
@@ -0,0 +1,201 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.retry
+
+transport가 429/5xx 응답과 네트워크 오류를 재시도할 때 사용하는 재시도 정책.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from .errors import RemainingReqParsingError
+from .rate_limit import _parse
+
+DEFAULT_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class RetryBudget:
+    """재시도 예산
+
+    요청마다 ratio만큼, 시간에 따라 초당 min_per_sec만큼 재시도 토큰을 쌓고
+    재시도할 때마다 1개를 사용합니다. 장애가 길어져도 재시도가 전체 요청의
+    일정 비율을 넘지 않아 서버 부하와 429를 키우지 않습니다.
+
+    Args:
+        ratio: 요청 1건당 쌓이는 재시도 토큰 (기본값: 0.2, 요청의 20%까지 재시도)
+        min_per_sec: 요청이 적을 때도 허용할 초당 재시도 수 (기본값: 1.0)
+        burst: 최대로 쌓아 둘 토큰 수 (기본값: 10)
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_sec: float = 1.0,
+                 burst: float = 10):
+        self.ratio = ratio
+        self.min_per_sec = min_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst,
+                               self._tokens + elapsed * self.min_per_sec)
+            self._updated = now
+
+    def deposit(self) -> None:
+        """요청 1건을 기록"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """재시도 토큰 1개 사용. 예산이 없으면 False"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """429/5xx 응답과 네트워크 오류의 재시도 정책
+
+    지수적으로 늘어나는 상한 안에서 무작위로 대기 시간을 고르는 full jitter
+    백오프를 사용하며, 응답의 Retry-After 헤더와 Remaining-Req 헤더(남은
+    요청 수 0)가 있으면 그보다 먼저 재시도하지 않습니다.
+
+    기본적으로 멱등인 GET 요청만 재시도합니다. 주문 생성(POST)은
+    retry_orders=True로 켜야 하며, 그때도 identifier가 지정된 주문만
+    재시도하여 같은 주문이 두 번 생성되지 않도록 합니다.
+
+    Args:
+        max_retries: 요청당 최대 재시도 횟수 (기본값: 3)
+        backoff_base: 첫 재시도 대기 시간의 상한 (초, 기본값: 0.1)
+        backoff_max: 재시도 대기 시간의 최대 상한 (초, 기본값: 5.0)
+        max_retry_after: 따를 최대 Retry-After (초, 기본값: 30.0). 더 길면 재시도하지 않음
+        status_codes: 재시도할 응답 상태 코드 (기본값: 429, 500, 502, 503, 504)
+        methods: 재시도할 HTTP 메서드 (기본값: ("GET",))
+        retry_orders: identifier가 지정된 주문 생성 요청 재시도 여부 (기본값: False)
+        budget: 재시도 예산 (기본값: RetryBudget()). None이면 제한 없음
+
+    Examples:
+        >>> transport = HTTPTransport(retry=RetryPolicy(max_retries=5))
+        >>> upbit = Upbit(access, secret,
+        ...               transport=HTTPTransport(retry=RetryPolicy(retry_orders=True)))
+        >>> upbit.buy_limit_order("KRW-BTC", 50000000, 0.001, identifier="my-order-1")
+
+    Note:
+        - 인증 헤더는 재시도할 때마다 새 nonce로 다시 서명합니다
+        - identifier 주문을 재시도했는데 첫 요청이 이미 처리된 경우 Upbit가
+          중복 identifier 에러를 반환하므로, identifier로 주문을 조회하여 확인하세요
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        max_retry_after: float = 30.0,
+        status_codes: Iterable[int] = DEFAULT_RETRY_STATUS,
+        methods: Iterable[str] = ("GET",),
+        retry_orders: bool = False,
+        budget: Optional[RetryBudget] = None
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.retry_orders = retry_orders
+        self.budget = RetryBudget() if budget is None else budget
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """요청의 재시도 가능 여부
+
+        Args:
+            method: HTTP 메서드
+            idempotent: 요청이 멱등인지 여부. None이면 메서드로 판단하고,
+                True인 POST(identifier 주문)는 retry_orders가 켜진 경우만 허용
+        """
+        if idempotent is False or self.max_retries < 1:
+            return False
+        if method == "POST" and idempotent:
+            return self.retry_orders
+        return method in self.methods
+
+    def start(self) -> None:
+        """새 요청을 재시도 예산에 기록"""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def delay(self, attempt: int, status_code: Optional[int] = None,
+              headers: Optional[Any] = None) -> Optional[float]:
+        """attempt번째 재시도 전 대기 시간(초). 재시도하지 않아야 하면 None
+
+        Args:
+            attempt: 이미 재시도한 횟수 (0부터)
+            status_code: 실패한 응답의 상태 코드 (네트워크 오류면 None)
+            headers: 실패한 응답의 헤더
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status_code is not None and status_code not in self.status_codes:
+            return None
+
+        wait = random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if headers is not None:
+            retry_after = _retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                wait = max(wait, retry_after)
+            elif _exhausted(headers.get("Remaining-Req")):
+                # 초 단위 요청 수를 모두 쓴 경우 다음 1초 구간까지 대기
+                wait = max(wait, min(1.0, self.backoff_max))
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return wait
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _exhausted(remaining_req: Optional[str]) -> bool:
+    if not remaining_req:
+        return False
+    try:
+        return _parse(remaining_req)["sec"] == 0
+    except RemainingReqParsingError:
+        return False
@@ -0,0 +1,219 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.ring_buffer
+
+프로세스 간에 메시지를 직렬화 없이 전달하는 공유 메모리 링 버퍼입니다.
+생산자 1개, 소비자 1개(SPSC)를 기준으로 동작합니다.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+# 헤더: magic, 슬롯 수, 슬롯 크기, 마지막으로 쓴 순번, 크기 초과로 버린 메시지 수
+_HEADER = struct.Struct("<8sIIQQ")
+_HEADER_SIZE = 64
+_MAGIC = b"FSFRING1"
+_WRITE_SEQ_OFFSET = 16
+_OVERSIZED_OFFSET = 24
+
+# 슬롯 헤더: 순번(쓰는 중에는 0), 데이터 길이
+_SLOT = struct.Struct("<QI4x")
+_U64 = struct.Struct("<Q")
+
+
+class SharedRingBuffer:
+    """고정 크기 슬롯으로 나뉜 공유 메모리 링 버퍼
+
+    생산자는 write()로 메시지 바이트를 다음 슬롯에 복사하고, 소비자는 read()로
+    슬롯을 가리키는 memoryview를 복사 없이 받습니다. 소비자가 slots개 이상 뒤처지면
+    덮어쓰인 메시지를 건너뛰고 그 수를 overruns에 기록합니다.
+
+    read()가 반환한 memoryview는 읽는 도중에도 생산자가 덮어쓸 수 있으므로,
+    복사나 파싱을 마친 뒤 still_valid()로 슬롯 순번을 다시 확인합니다 (seqlock).
+    덮어쓰였으면 overruns가 1 증가하고 False를 반환하므로 결과를 버리면 됩니다.
+
+    Args:
+        name: 공유 메모리 이름 (None이면 자동 생성)
+        slots: 슬롯 수 (기본값: 1024)
+        slot_size: 슬롯당 최대 메시지 크기 (바이트, 기본값: 8192)
+        create: True면 새로 만들고, False면 name의 기존 버퍼에 연결 (기본값: True)
+
+    Examples:
+        >>> ring = SharedRingBuffer(slots=1024, slot_size=8192)
+        >>> # 다른 프로세스에서
+        >>> writer = SharedRingBuffer(ring.name, create=False)
+        >>> writer.write(b'{"type": "trade"}')
+        >>> view = ring.read()
+        >>> message = orjson.loads(view)  # memoryview를 그대로 파싱
+        >>> if not ring.still_valid():    # 파싱 중 덮어쓰였으면 버림
+        ...     message = None
+        >>> json.loads(bytes(view))       # 표준 json은 bytes로 복사 필요
+        >>> ring.overruns
+
+    Note:
+        - read()가 반환한 memoryview는 생산자가 버퍼를 한 바퀴 돌아 같은 슬롯을
+          덮어쓰기 전까지만 유효합니다. 오래 보관하려면 bytes(view)로 복사한 뒤
+          still_valid()로 복사본이 온전한지 확인하세요
+        - slot_size보다 큰 메시지는 쓰지 않고 oversized 수만 증가시킵니다
+        - 생성한 쪽에서 사용이 끝나면 close()와 unlink()를 호출해야 합니다
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        slots: int = 1024,
+        slot_size: int = 8192,
+        create: bool = True
+    ):
+        if create:
+            if slots < 1 or slot_size < 1:
+                raise ValueError("slots and slot_size must be positive")
+            stride = _SLOT.size + (slot_size + 7) // 8 * 8
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_HEADER_SIZE + stride * slots)
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, slots, slot_size, 0, 0)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            magic, slots, slot_size, _, _ = _HEADER.unpack_from(self._shm.buf, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"{name} is not a SharedRingBuffer")
+        self.slots = slots
+        self.slot_size = slot_size
+        self._stride = _SLOT.size + (slot_size + 7) // 8 * 8
+        self._buf = self._shm.buf
+        # 생산자/소비자 각자의 프로세스 로컬 상태
+        self._write_seq = self.write_seq
+        self._read_seq = self._write_seq
+        self._view_seq = 0  # 마지막으로 read()한 메시지의 순번 (확인 후 0)
+        self.overruns = 0
+
+    @property
+    def name(self) -> str:
+        """다른 프로세스에서 연결할 때 사용할 공유 메모리 이름"""
+        return self._shm.name
+
+    @property
+    def write_seq(self) -> int:
+        """지금까지 쓴 메시지 수"""
+        return _U64.unpack_from(self._buf, _WRITE_SEQ_OFFSET)[0]
+
+    @property
+    def oversized(self) -> int:
+        """slot_size를 넘어 버린 메시지 수"""
+        return _U64.unpack_from(self._buf, _OVERSIZED_OFFSET)[0]
+
+    def _slot_offset(self, seq: int) -> int:
+        return _HEADER_SIZE + ((seq - 1) % self.slots) * self._stride
+
+    def write(self, data: bytes) -> bool:
+        """메시지를 다음 슬롯에 기록 (생산자 전용)
+
+        Returns:
+            bool: 기록 여부 (slot_size를 넘으면 False)
+        """
+        size = len(data)
+        if size > self.slot_size:
+            _U64.pack_into(self._buf, _OVERSIZED_OFFSET, self.oversized + 1)
+            return False
+
+        seq = self._write_seq + 1
+        offset = self._slot_offset(seq)
+        # 순번을 0으로 두고 데이터를 쓴 뒤 순번을 기록하여, 쓰는 중인 슬롯을 구분
+        _SLOT.pack_into(self._buf, offset, 0, size)
+        start = offset + _SLOT.size
+        self._buf[start:start + size] = data
+        _SLOT.pack_into(self._buf, offset, seq, size)
+        _U64.pack_into(self._buf, _WRITE_SEQ_OFFSET, seq)
+        self._write_seq = seq
+        return True
+
+    def read(
+        self,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.0005
+    ) -> Optional[memoryview]:
+        """다음 메시지를 복사 없이 읽기 (소비자 전용)
+
+        Args:
+            block: 메시지가 없을 때 대기 여부 (기본값: True)
+            timeout: 최대 대기 시간 (초, 기본값: None)
+            poll_interval: 대기 중 확인 간격 (초, 기본값: 0.0005)
+
+        Returns:
+            memoryview: 메시지 바이트. 메시지가 없으면 None
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            head = self.write_seq
+            if head > self._read_seq:
+                if head - self._read_seq > self.slots:
+                    # 생산자가 한 바퀴 이상 앞서 있으면 덮어쓰인 메시지를 건너뜀
+                    self.overruns += head - self._read_seq - self.slots
+                    self._read_seq = head - self.slots
+
+                seq = self._read_seq + 1
+                offset = self._slot_offset(seq)
+                slot_seq, size = _SLOT.unpack_from(self._buf, offset)
+                if slot_seq == seq:
+                    self._read_seq = self._view_seq = seq
+                    start = offset + _SLOT.size
+                    return self._buf[start:start + size]
+                # 읽는 사이 덮어쓰였으면 다시 위치를 계산
+                if slot_seq > seq or slot_seq == 0:
+                    continue
+
+            if not block:
+                return None
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def still_valid(self) -> bool:
+        """마지막으로 read()한 메시지가 아직 덮어쓰이지 않았는지 확인 (소비자 전용)
+
+        read()가 반환한 memoryview를 복사하거나 파싱한 뒤 호출합니다. 그 사이
+        생산자가 슬롯을 덮어쓰기 시작했으면 overruns를 1 늘리고 False를 반환합니다
+        (같은 메시지에 대해 한 번만 셉니다).
+
+        Returns:
+            bool: 마지막 메시지가 온전하면 True
+        """
+        seq = self._view_seq
+        if seq == 0:
+            return True
+        slot_seq, _ = _SLOT.unpack_from(self._buf, self._slot_offset(seq))
+        if slot_seq == seq:
+            return True
+        self._view_seq = 0
+        self.overruns += 1
+        return False
+
+    def __getstate__(self):
+        return {"name": self.name}
+
+    def __setstate__(self, state):
+        self.__init__(state["name"], create=False)
+
+    def close(self) -> None:
+        """현재 프로세스의 공유 메모리 연결 해제"""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """공유 메모리 삭제 (생성한 프로세스에서 한 번 호출)"""
+        self._shm.unlink()
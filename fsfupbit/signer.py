@@ -0,0 +1,161 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.signer
+
+Upbit 인증 헤더(JWT, HS256) 서명기.
+"""
+
+import base64
+import functools
+import hashlib
+import hmac
+import json
+import uuid
+from typing import Any, Dict, Optional
+from urllib.parse import quote_plus
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# PyJWT와 같은 형식 ({"alg":"HS256","typ":"JWT"})의 헤더는 항상 같으므로 미리 인코딩
+_JWT_HEADER_SEGMENT = _b64url(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+
+@functools.lru_cache(maxsize=256)
+def _quote_key(key: str) -> str:
+    """쿼리 키 인코딩. 배열 파라미터의 "[]"는 Upbit 규칙대로 인코딩하지 않음"""
+    quoted = quote_plus(key)
+    if quoted.endswith("%5B%5D"):
+        quoted = quoted[:-6] + "[]"
+    return quoted
+
+
+def _quote_value(value: Any) -> str:
+    if isinstance(value, (str, bytes)):
+        return quote_plus(value)
+    return quote_plus(str(value))
+
+
+def canonical_query(query: Any) -> str:
+    """query_hash 계산용 쿼리 문자열
+
+    urlencode(query, doseq=True).replace("%5B%5D=", "[]=")와 같은 문자열을 만듭니다.
+    리스트/튜플 값은 같은 키를 반복하여 나열합니다.
+
+    Args:
+        query: dict 또는 (키, 값) 쌍의 시퀀스
+
+    Returns:
+        str: 인코딩된 쿼리 문자열 (예: "market=KRW-BTC&states[]=done&states[]=cancel")
+    """
+    items = query.items() if hasattr(query, "items") else query
+    parts = []
+    for key, value in items:
+        key = _quote_key(key if isinstance(key, (str, bytes)) else str(key))
+        if isinstance(value, (str, bytes)):
+            parts.append(f"{key}={quote_plus(value)}")
+            continue
+        try:
+            len(value)
+        except TypeError:
+            parts.append(f"{key}={quote_plus(str(value))}")
+            continue
+        for element in value:
+            parts.append(f"{key}={_quote_value(element)}")
+    return "&".join(parts)
+
+
+def query_hash(query: Any) -> str:
+    """쿼리의 SHA512 해시 (16진수)"""
+    return hashlib.sha512(canonical_query(query).encode()).hexdigest()
+
+
+class SignedHeaders(dict):
+    """서명한 쿼리를 기억하는 Authorization 헤더
+
+    요청을 재시도할 때 같은 nonce를 다시 보내면 Upbit가 거부하므로, transport는
+    resign()으로 새 nonce의 토큰을 받아 다시 전송합니다. 서명 후 추가한 다른
+    헤더는 그대로 유지됩니다.
+    """
+
+    __slots__ = ("_signer", "_query")
+
+    def __init__(self, signer: "JWTSigner", query: Optional[Any] = None):
+        super().__init__(Authorization="Bearer " + signer.token(query))
+        self._signer = signer
+        self._query = query
+
+    def resign(self) -> "SignedHeaders":
+        """새 nonce로 서명한 헤더 복사본 반환"""
+        headers = SignedHeaders.__new__(SignedHeaders)
+        dict.update(headers, self)
+        headers["Authorization"] = "Bearer " + self._signer.token(self._query)
+        headers._signer = self._signer
+        headers._query = self._query
+        return headers
+
+
+class JWTSigner:
+    """Upbit API 인증 토큰 서명기
+
+    상수인 JWT 헤더 부분을 미리 인코딩하고, 비밀 키를 넣은 HMAC-SHA256 객체를
+    한 번만 만들어 요청마다 copy()로 재사용합니다. 만들어지는 토큰은
+    jwt.encode(payload, secret, algorithm="HS256")와 같은 형식입니다.
+
+    Args:
+        access_key: Upbit API Access Key
+        secret_key: Upbit API Secret Key
+
+    Examples:
+        >>> signer = JWTSigner(access, secret)
+        >>> headers = signer.headers({"market": "KRW-BTC", "side": "bid"})
+        >>> headers["Authorization"]
+        'Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...'
+    """
+
+    def __init__(self, access_key: str, secret_key: str):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self._mac = hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+        # 페이로드 JSON의 access_key 부분도 요청마다 같으므로 미리 만들어 둠
+        self._payload_prefix = '{"access_key":%s,"nonce":"' % json.dumps(access_key)
+
+    def token(self, query: Optional[Any] = None) -> str:
+        """JWT 토큰 생성
+
+        Args:
+            query: 요청 파라미터 (있으면 query_hash, query_hash_alg 포함)
+
+        Returns:
+            str: JWT 토큰
+        """
+        payload = self._payload_prefix + str(uuid.uuid4())
+        if query is not None:
+            payload += '","query_hash":"%s","query_hash_alg":"SHA512"}' % \
+                query_hash(query)
+        else:
+            payload += '"}'
+
+        signing_input = _JWT_HEADER_SEGMENT + b"." + _b64url(payload.encode())
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode()
+
+    def headers(self, query: Optional[Any] = None) -> Dict[str, str]:
+        """Authorization 헤더 생성 (재시도 시 resign()으로 다시 서명 가능)"""
+        return SignedHeaders(self, query)
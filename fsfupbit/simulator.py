@@ -0,0 +1,1274 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.simulator
+
+네트워크 없이 테스트와 벤치마크에 사용하는 로컬 Upbit API 시뮬레이터.
+
+    $ python -m fsfupbit.simulator --port 8080 --ws-port 8081
+"""
+
+import base64
+import calendar
+import datetime
+import hashlib
+import hmac
+import json
+import math
+import threading
+import time
+import uuid as uuid_lib
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from fsfupbit.rate_limit import DEFAULT_GROUP_RATES, DEFAULT_ROUTE_GROUPS
+from fsfupbit.signer import canonical_query
+from fsfupbit.ws_codec import SIMPLE_FIELDS
+
+# (마켓, 한글명, 영문명, 기준 가격, 유의 종목 여부)
+DEFAULT_MARKETS = (
+    ("KRW-BTC", "비트코인", "Bitcoin", 50000000.0, False),
+    ("KRW-ETH", "이더리움", "Ethereum", 3000000.0, False),
+    ("KRW-XRP", "리플", "Ripple", 700.0, False),
+    ("KRW-SOL", "솔라나", "Solana", 150000.0, False),
+    ("KRW-DOGE", "도지코인", "Dogecoin", 150.0, False),
+    ("KRW-ADA", "에이다", "Ada", 600.0, False),
+    ("KRW-WARN", "유의종목", "Warning", 10.0, True),
+    ("BTC-ETH", "이더리움", "Ethereum", 0.06, False),
+    ("BTC-XRP", "리플", "Ripple", 0.000014, False),
+    ("USDT-BTC", "비트코인", "Bitcoin", 40000.0, False),
+    ("USDT-ETH", "이더리움", "Ethereum", 2400.0, False),
+)
+
+DEFAULT_BALANCES = {"KRW": 10000000.0}
+
+TOO_MANY_REQUESTS = "Too many API requests."
+ORDERBOOK_DEPTH = 30
+MIN_ORDER_TOTAL = {"KRW": 5000.0, "BTC": 0.00005, "USDT": 0.5}
+FEE_RATE = 0.0005
+# nonce 재사용 검사에 기억할 최근 nonce 수 (넘으면 오래된 것부터 잊음)
+NONCE_HISTORY = 100000
+
+_KST = datetime.timezone(datetime.timedelta(hours=9))
+_CANDLE_SECONDS = {"seconds": 1, "minutes": 60, "days": 86400, "weeks": 604800}
+# 1970-01-01은 목요일이므로 주 캔들(월요일 시작)은 4일 밀린 지점을 기준으로 나눔
+_WEEK_ORIGIN = 4 * 86400
+_SIMPLE_ABBR = {
+    type: {full: abbr for abbr, full in fields.items()}
+    for type, fields in SIMPLE_FIELDS.items()
+}
+
+
+class SimulatorError(Exception):
+    """시뮬레이터가 Upbit 형식의 에러 응답으로 변환하는 예외"""
+
+    def __init__(self, status: int, name: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.name = name
+        self.message = message
+
+
+# ----------------------------------------------------------------------
+# 가격 모델
+# ----------------------------------------------------------------------
+def _seed(market: str) -> int:
+    return zlib.crc32(market.encode())
+
+
+def _round_price(market: str, price: float) -> float:
+    if not market.startswith("KRW-"):
+        return round(price, 8)
+    for limit, tick in ((2000000, 1000), (1000000, 500), (500000, 100),
+                        (100000, 50), (10000, 10), (1000, 1), (100, 0.1),
+                        (10, 0.01), (1, 0.001)):
+        if price >= limit:
+            return round(round(price / tick) * tick, 4)
+    return round(price, 4)
+
+
+def _noise(seed: int, step: int) -> float:
+    """(seed, step)마다 고정된 [0, 1) 값"""
+    return (zlib.crc32(b"%d:%d" % (seed, step)) & 0xFFFFFF) / 0x1000000
+
+
+class _Market:
+    """마켓 정보와 시각의 결정적 함수인 가격"""
+
+    def __init__(self, market: str, korean_name: str, english_name: str,
+                 base_price: float, warning: bool):
+        self.market = market
+        self.quote, self.base = market.split("-", 1)
+        self.korean_name = korean_name
+        self.english_name = english_name
+        self.base_price = base_price
+        self.warning = warning
+        self.seed = _seed(market)
+        self.fixed_price: Optional[float] = None
+
+    def price(self, ts: float) -> float:
+        """시각 ts(초)의 가격"""
+        if self.fixed_price is not None:
+            return self.fixed_price
+        phase = self.seed % 1000
+        wave = (0.04 * math.sin(ts / 86400 * 2 * math.pi + phase)
+                + 0.015 * math.sin(ts / 3600 * 2 * math.pi + phase / 7)
+                + 0.004 * math.sin(ts / 97 + phase / 3)
+                + 0.001 * (_noise(self.seed, int(ts)) - 0.5))
+        return _round_price(self.market, self.base_price * (1 + wave))
+
+    def volume(self, start: float, seconds: float) -> float:
+        rate = 1000000.0 / self.base_price  # 초당 거래 대금 약 100만 (호가 통화 기준)
+        return round(rate * seconds * (0.5 + _noise(self.seed, int(start))), 8)
+
+
+# ----------------------------------------------------------------------
+# 요청 수 제한
+# ----------------------------------------------------------------------
+class _Limiter:
+    """그룹별 1초/1분 구간 요청 수 제한 (Upbit Remaining-Req와 같은 형식)"""
+
+    def __init__(self, rates: Dict[str, float]):
+        self.rates = rates
+        self._windows: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def group_for(method: str, path: str) -> str:
+        for route_method, prefix, group in DEFAULT_ROUTE_GROUPS:
+            if (route_method is None or route_method == method) \
+                    and path.startswith(prefix):
+                return group
+        return "default"
+
+    def hit(self, group: str, count: bool = True) -> Tuple[bool, str]:
+        """요청 1건을 기록하고 (허용 여부, Remaining-Req 헤더) 반환
+
+        count가 False면 기록하지 않고 항상 허용합니다.
+        """
+        per_sec = max(1, int(self.rates.get(group, self.rates.get("default", 30))))
+        per_min = per_sec * 60
+        now = time.time()
+        sec, minute = int(now), int(now // 60)
+        with self._lock:
+            window = self._windows.setdefault(group, [sec, 0, minute, 0])
+            if window[0] != sec:
+                window[0], window[1] = sec, 0
+            if window[2] != minute:
+                window[2], window[3] = minute, 0
+            allowed = not count or (window[1] < per_sec and window[3] < per_min)
+            if count and allowed:
+                window[1] += 1
+                window[3] += 1
+            remaining = (f"group={group}; min={max(0, per_min - window[3])}; "
+                         f"sec={max(0, per_sec - window[1])}")
+        return allowed, remaining
+
+
+# ----------------------------------------------------------------------
+# 시각 처리
+# ----------------------------------------------------------------------
+def _parse_to(value: Optional[str]) -> float:
+    """캔들 to 파라미터를 UTC 초로 변환 (없으면 현재 시각)"""
+    if not value:
+        return time.time()
+    value = value.strip().replace(" ", "T").replace("Z", "+00:00")
+    try:
+        dt = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise SimulatorError(400, "validation_error", f"잘못된 to 형식입니다: {value}")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.timestamp()
+
+
+def _utc(ts: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc)
+
+
+def _isoformat(ts: float, tz=datetime.timezone.utc) -> str:
+    return datetime.datetime.fromtimestamp(ts, tz).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _candle_starts(kind: str, unit: int, to: float, count: int) -> List[float]:
+    """to 이전에 시작한 캔들 count개의 시작 시각(UTC 초), 최신순"""
+    last = math.ceil(to) - 1
+    if kind in _CANDLE_SECONDS:
+        width = _CANDLE_SECONDS[kind] * (unit if kind in ("seconds", "minutes") else 1)
+        origin = _WEEK_ORIGIN if kind == "weeks" else 0
+        start = (last - origin) // width * width + origin
+        return [start - i * width for i in range(count)]
+
+    t = _utc(last)
+    year, month = t.year, (t.month if kind == "months" else 1)
+    starts = []
+    for _ in range(count):
+        starts.append(calendar.timegm((year, month, 1, 0, 0, 0)))
+        if kind == "months":
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        else:
+            year -= 1
+    return starts
+
+
+def _candle_end(kind: str, unit: int, start: float) -> float:
+    if kind in _CANDLE_SECONDS:
+        return start + _CANDLE_SECONDS[kind] * (
+            unit if kind in ("seconds", "minutes") else 1)
+    t = _utc(start)
+    if kind == "months":
+        year, month = (t.year, t.month + 1) if t.month < 12 else (t.year + 1, 1)
+    else:
+        year, month = t.year + 1, 1
+    return calendar.timegm((year, month, 1, 0, 0, 0))
+
+
+def _simple(message: Dict[str, Any], type: str) -> Dict[str, Any]:
+    """DEFAULT 포맷 메시지를 SIMPLE 포맷(축약 필드명)으로 변환"""
+    abbr = _SIMPLE_ABBR.get(type, {})
+
+    def rename(obj):
+        if isinstance(obj, dict):
+            return {abbr.get(k, k): rename(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [rename(v) for v in obj]
+        return obj
+    return rename(message)
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class UpbitSimulator:
+    """로컬 Upbit REST/WebSocket API 시뮬레이터
+
+    캔들, 현재가, 호가, 마켓 목록 같은 시세 API와 계좌/주문 API, 공개/개인
+    WebSocket을 127.0.0.1에서 제공합니다. 가격은 시각에 대한 결정적 함수라
+    같은 요청에는 항상 같은 캔들이 오며, Upbit와 같은 형식의 Remaining-Req 헤더,
+    그룹별 요청 수 제한과 429 응답, JWT 서명/nonce/query_hash 검증을 재현합니다.
+
+    HTTPTransport(base_url=...)와 WebSocket 클래스의 uri 인자로 라이브러리 전체가
+    시뮬레이터를 향하게 할 수 있습니다.
+
+    Args:
+        host: 바인딩할 주소 (기본값: "127.0.0.1")
+        port: REST API 포트 (기본값: 0, 빈 포트 자동 선택)
+        ws_port: WebSocket 포트 (기본값: 0, 빈 포트 자동 선택)
+        markets: (마켓, 한글명, 영문명, 기준 가격, 유의 종목 여부) 목록 (기본값: DEFAULT_MARKETS)
+        keys: {access_key: secret_key}. 지정하면 JWT 서명을 검증하고, None이면 서명만 해석
+        balances: 초기 잔고 {통화: 수량} (기본값: KRW 1천만)
+        rate_limit: 그룹별 요청 수 제한 적용 여부 (기본값: True). False여도 Remaining-Req 헤더는 전송
+        rates: 그룹별 초당 요청 수 (기본값: DEFAULT_GROUP_RATES)
+        websocket: WebSocket 서버 실행 여부 (기본값: True, websockets 필요)
+        ws_interval: WebSocket 시세 메시지 전송 간격 (초, 기본값: 0.1)
+        trade_interval: 체결 내역(/v1/trades/ticks)의 체결 간격 (초, 기본값: 1.0)
+
+    Examples:
+        >>> with UpbitSimulator(keys={"access": "secret"}) as sim:
+        ...     set_default_transport(sim.transport())
+        ...     df = get_ohlcv("KRW-BTC", interval="minute1", count=1000)
+        ...     upbit = Upbit("access", "secret", transport=sim.transport())
+        ...     upbit.buy_limit_order("KRW-BTC", 50000000, 0.001)
+        ...     wm = WebSocketManager("ticker", ["KRW-BTC"], uri=sim.websocket_uri)
+
+    Note:
+        - 지정가 주문은 주문 시점 가격보다 유리하면 즉시 체결되고, 아니면 대기합니다
+        - set_price()로 마켓 가격을 고정하여 체결 여부를 제어할 수 있습니다
+        - inject_error()로 5xx/429 응답을 주입하여 재시도 동작을 시험할 수 있습니다
+        - nonce 재사용 검사는 최근 NONCE_HISTORY개의 nonce만 기억합니다
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        ws_port: int = 0,
+        markets: Optional[Iterable[Tuple[str, str, str, float, bool]]] = None,
+        keys: Optional[Dict[str, str]] = None,
+        balances: Optional[Dict[str, float]] = None,
+        rate_limit: bool = True,
+        rates: Optional[Dict[str, float]] = None,
+        websocket: bool = True,
+        ws_interval: float = 0.1,
+        trade_interval: float = 1.0
+    ):
+        self.host = host
+        self.port = port
+        self.ws_port = ws_port
+        self.markets: Dict[str, _Market] = {
+            m[0]: _Market(*m) for m in (DEFAULT_MARKETS if markets is None else markets)}
+        self.keys = keys
+        self.rate_limit = rate_limit
+        self.websocket = websocket
+        self.ws_interval = ws_interval
+        self.trade_interval = trade_interval
+        self.request_count = 0
+
+        self._limiter = _Limiter(dict(DEFAULT_GROUP_RATES if rates is None else rates))
+        self._balances = {currency: [float(amount), 0.0, 0.0]  # 잔고, 주문 중, 평균 매수가
+                          for currency, amount in (DEFAULT_BALANCES if balances is None
+                                                   else balances).items()}
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._identifiers: Dict[str, str] = {}
+        self._nonces: Dict[Any, None] = {}  # 삽입 순서로 오래된 nonce를 잊음
+        self._errors: List[List[Any]] = []
+        self._lock = threading.RLock()
+
+        self._http: Optional[ThreadingHTTPServer] = None
+        self._http_thread: Optional[threading.Thread] = None
+        self._ws_loop = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_stop = None
+        self._private_queues: set = set()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        """REST API 기본 주소 (예: "http://127.0.0.1:54321")"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def websocket_uri(self) -> str:
+        """공개 WebSocket 주소"""
+        return f"ws://{self.host}:{self.ws_port}/websocket/v1"
+
+    @property
+    def private_websocket_uri(self) -> str:
+        """개인 WebSocket 주소"""
+        return f"ws://{self.host}:{self.ws_port}/websocket/v1/private"
+
+    def start(self) -> "UpbitSimulator":
+        """REST/WebSocket 서버를 백그라운드 스레드에서 시작"""
+        simulator = self
+
+        class Handler(_Handler):
+            sim = simulator
+
+        self._http = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._http.daemon_threads = True
+        self.port = self._http.server_address[1]
+        self._http_thread = threading.Thread(
+            target=self._http.serve_forever, name="upbit-simulator-http", daemon=True)
+        self._http_thread.start()
+
+        if self.websocket:
+            ready = threading.Event()
+            self._ws_thread = threading.Thread(
+                target=self._run_websocket, args=(ready,),
+                name="upbit-simulator-ws", daemon=True)
+            self._ws_thread.start()
+            ready.wait()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+        if self._ws_loop is not None:
+            self._ws_loop.call_soon_threadsafe(self._ws_stop.set)
+            self._ws_thread.join(5)
+            self._ws_loop = None
+
+    def __enter__(self) -> "UpbitSimulator":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def transport(self, **kwargs: Any):
+        """시뮬레이터를 향하는 HTTPTransport 생성 (kwargs는 HTTPTransport 인자)"""
+        from fsfupbit.transport import HTTPTransport
+        kwargs.setdefault("rate_limiter", None)
+        return HTTPTransport(base_url=self.base_url, **kwargs)
+
+    def async_transport(self, **kwargs: Any):
+        """시뮬레이터를 향하는 AsyncHTTPTransport 생성"""
+        from fsfupbit.transport import AsyncHTTPTransport
+        kwargs.setdefault("rate_limiter", None)
+        return AsyncHTTPTransport(base_url=self.base_url, **kwargs)
+
+    # ------------------------------------------------------------------
+    # 시나리오 제어
+    # ------------------------------------------------------------------
+    def set_price(self, market: str, price: Optional[float]) -> None:
+        """마켓 가격 고정 (None이면 시각에 따른 가격으로 복원)"""
+        self.markets[market].fixed_price = price
+        if price is not None:
+            self._match_orders(market)
+
+    def inject_error(self, status: int, path: str = "/", times: int = 1) -> None:
+        """path로 시작하는 다음 times개 요청에 status 응답 주입 (429 또는 5xx)"""
+        with self._lock:
+            self._errors.append([path, status, times])
+
+    def balance(self, currency: str) -> float:
+        """주문 중인 수량을 제외한 잔고"""
+        with self._lock:
+            return self._balances.get(currency, [0.0, 0.0, 0.0])[0]
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    def _take_error(self, path: str) -> Optional[int]:
+        with self._lock:
+            for item in self._errors:
+                if path.startswith(item[0]):
+                    item[2] -= 1
+                    if item[2] <= 0:
+                        self._errors.remove(item)
+                    return item[1]
+        return None
+
+    def handle(self, method: str, target: str, headers: Mapping[str, str],
+               body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """HTTP 요청 하나를 처리하여 (상태 코드, 헤더, 본문) 반환
+
+        headers는 HTTP 서버의 헤더 객체처럼 이름을 대소문자 구분 없이 찾을 수
+        있어야 합니다.
+        """
+        with self._lock:
+            self.request_count += 1
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        group = self._limiter.group_for(method, path)
+
+        # 제한을 끈 경우에도 클라이언트가 파싱하는 Remaining-Req 헤더는 보냄
+        allowed, remaining = self._limiter.hit(group, count=self.rate_limit)
+        response_headers = {"Remaining-Req": remaining}
+        if not allowed:
+            return 429, response_headers, TOO_MANY_REQUESTS.encode()
+
+        injected = self._take_error(path)
+        if injected == 429:
+            return 429, response_headers, TOO_MANY_REQUESTS.encode()
+        if injected is not None:
+            return injected, response_headers, _error_body(
+                "server_error", "시뮬레이터가 주입한 에러입니다")
+
+        params, raw_query = self._params(parts.query, headers, body)
+        try:
+            handler = _ROUTES.get((method, path))
+            if handler is None and path.startswith("/v1/candles/"):
+                handler = UpbitSimulator._candles
+            if handler is None:
+                raise SimulatorError(404, "not_found", f"지원하지 않는 API입니다: {method} {path}")
+            if handler.__name__ in _PRIVATE:
+                self._authenticate(headers, raw_query)
+            if handler is UpbitSimulator._candles:
+                result = handler(self, path, params)
+            else:
+                result = handler(self, params)
+        except SimulatorError as e:
+            return e.status, response_headers, _error_body(e.name, e.message)
+
+        status = 201 if method == "POST" else 200
+        response_headers["Content-Type"] = "application/json; charset=utf-8"
+        return status, response_headers, json.dumps(result).encode()
+
+    @staticmethod
+    def _params(query: str, headers: Mapping[str, str], body: bytes):
+        """쿼리 스트링과 본문(form/JSON)을 합친 파라미터와 query_hash 원문"""
+        pairs = parse_qsl(query, keep_blank_values=True)
+        raw = query
+        if body:
+            content_type = headers.get("Content-Type", "")
+            text = body.decode("utf-8")
+            if "json" in content_type or text.lstrip().startswith("{"):
+                data = json.loads(text)
+                raw = canonical_query(data)
+                for key, value in data.items():
+                    values = value if isinstance(value, list) else [value]
+                    pairs.extend((key, str(v)) for v in values)
+            else:
+                pairs.extend(parse_qsl(text, keep_blank_values=True))
+                raw = text
+        params: Dict[str, Any] = {}
+        for key, value in pairs:
+            if key.endswith("[]"):
+                params.setdefault(key[:-2], []).append(value)
+            elif key in params:
+                existing = params[key]
+                params[key] = (existing if isinstance(existing, list)
+                               else [existing]) + [value]
+            else:
+                params[key] = value
+        return params, raw.replace("%5B%5D=", "[]=")
+
+    def _authenticate(self, headers: Mapping[str, str], raw_query: str) -> str:
+        """Authorization 헤더의 JWT 검증 후 access_key 반환"""
+        auth = headers.get("Authorization", "")
+        if not auth.startswith("Bearer "):
+            raise SimulatorError(401, "jwt_verification", "인증 헤더가 없습니다")
+        try:
+            header_segment, payload_segment, signature = auth[7:].split(".")
+            payload = json.loads(_b64decode(payload_segment))
+        except ValueError:
+            raise SimulatorError(401, "jwt_verification", "JWT 형식이 올바르지 않습니다")
+
+        access_key = payload.get("access_key")
+        if self.keys is not None:
+            secret = self.keys.get(access_key)
+            if secret is None:
+                raise SimulatorError(401, "invalid_access_key", "잘못된 엑세스 키입니다")
+            expected = hmac.new(secret.encode(),
+                                f"{header_segment}.{payload_segment}".encode(),
+                                hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                raise SimulatorError(401, "jwt_verification", "JWT 서명 검증에 실패했습니다")
+
+        nonce = payload.get("nonce")
+        with self._lock:
+            if nonce in self._nonces:
+                raise SimulatorError(401, "nonce_used", "이미 요청한 nonce값입니다")
+            self._nonces[nonce] = None
+            if len(self._nonces) > NONCE_HISTORY:
+                del self._nonces[next(iter(self._nonces))]
+
+        if raw_query:
+            expected_hash = hashlib.sha512(raw_query.encode()).hexdigest()
+            if payload.get("query_hash") != expected_hash:
+                raise SimulatorError(401, "invalid_query_payload",
+                                     "query_hash가 요청 파라미터와 다릅니다")
+        return access_key
+
+    # ------------------------------------------------------------------
+    # 시세 API
+    # ------------------------------------------------------------------
+    def _market(self, market: str) -> _Market:
+        info = self.markets.get(market)
+        if info is None:
+            raise SimulatorError(404, "Code not found", "마켓을 찾지 못하였습니다.")
+        return info
+
+    def _market_list(self, params: Dict[str, Any], key: str) -> List[_Market]:
+        value = params.get(key, "")
+        names = value if isinstance(value, list) else value.split(",")
+        names = [n.strip() for n in names if n.strip()]
+        if not names:
+            raise SimulatorError(400, "validation_error", f"{key}는 필수입니다")
+        return [self._market(n) for n in names]
+
+    def _market_all(self, params):
+        details = params.get("isDetails") == "true"
+        result = []
+        for m in self.markets.values():
+            item = {"market": m.market, "korean_name": m.korean_name,
+                    "english_name": m.english_name}
+            if details:
+                item["market_warning"] = "CAUTION" if m.warning else "NONE"
+                item["market_event"] = {
+                    "warning": m.warning,
+                    "caution": {
+                        "PRICE_FLUCTUATIONS": False,
+                        "TRADING_VOLUME_SOARING": m.warning,
+                        "DEPOSIT_AMOUNT_SOARING": False,
+                        "GLOBAL_PRICE_DIFFERENCES": False,
+                        "CONCENTRATION_OF_SMALL_ACCOUNTS": False,
+                    },
+                }
+            result.append(item)
+        return result
+
+    def _candles(self, path, params):
+        segments = path.split("/")[3:]
+        kind = segments[0]
+        unit = int(segments[1]) if len(segments) > 1 else 1
+        if kind not in ("seconds", "minutes", "days", "weeks", "months", "years"):
+            raise SimulatorError(404, "not_found", f"지원하지 않는 캔들입니다: {path}")
+        market = self._market(params.get("market", ""))
+        count = min(200, max(1, int(params.get("count", 1))))
+        to = _parse_to(params.get("to"))
+        now = time.time()
+
+        result = []
+        for start in _candle_starts(kind, unit, min(to, now), count):
+            end = min(_candle_end(kind, unit, start), now)
+            samples = [market.price(start + (end - start) * i / 4) for i in range(5)]
+            candle = {
+                "market": market.market,
+                "candle_date_time_utc": _isoformat(start),
+                "candle_date_time_kst": _isoformat(start, _KST),
+                "opening_price": samples[0],
+                "high_price": max(samples),
+                "low_price": min(samples),
+                "trade_price": samples[-1],
+                "timestamp": int(end * 1000) - 1,
+                "candle_acc_trade_price": 0.0,
+                "candle_acc_trade_volume": market.volume(start, end - start),
+            }
+            candle["candle_acc_trade_price"] = round(
+                candle["candle_acc_trade_volume"] * (samples[0] + samples[-1]) / 2, 8)
+            if kind in ("seconds", "minutes"):
+                candle["unit"] = unit
+            if kind in ("weeks", "months", "years"):
+                candle["first_day_of_period"] = _isoformat(start)[:10]
+            if kind == "days":
+                prev = market.price(start - 1)
+                candle["prev_closing_price"] = prev
+                candle["change_price"] = samples[-1] - prev
+                candle["change_rate"] = (samples[-1] - prev) / prev
+            result.append(candle)
+        return result
+
+    def _ticker_item(self, market: _Market) -> Dict[str, Any]:
+        now = time.time()
+        day_start = now // 86400 * 86400
+        price = market.price(now)
+        opening = market.price(day_start)
+        prev = market.price(day_start - 1)
+        samples = [market.price(day_start + (now - day_start) * i / 8) for i in range(9)]
+        change = price - prev
+        volume = market.volume(day_start, now - day_start)
+        trade_time = _utc(now)
+        return {
+            "market": market.market,
+            "trade_date": trade_time.strftime("%Y%m%d"),
+            "trade_time": trade_time.strftime("%H%M%S"),
+            "trade_date_kst": trade_time.astimezone(_KST).strftime("%Y%m%d"),
+            "trade_time_kst": trade_time.astimezone(_KST).strftime("%H%M%S"),
+            "trade_timestamp": int(now * 1000),
+            "opening_price": opening,
+            "high_price": max(samples),
+            "low_price": min(samples),
+            "trade_price": price,
+            "prev_closing_price": prev,
+            "change": "RISE" if change > 0 else "FALL" if change < 0 else "EVEN",
+            "change_price": abs(change),
+            "change_rate": abs(change) / prev,
+            "signed_change_price": change,
+            "signed_change_rate": change / prev,
+            "trade_volume": round(market.volume(now, 1) / 10, 8),
+            "acc_trade_price": round(volume * price, 8),
+            "acc_trade_price_24h": round(market.volume(now - 86400, 86400) * price, 8),
+            "acc_trade_volume": volume,
+            "acc_trade_volume_24h": market.volume(now - 86400, 86400),
+            "highest_52_week_price": round(market.base_price * 1.05, 8),
+            "highest_52_week_date": "2024-03-14",
+            "lowest_52_week_price": round(market.base_price * 0.95, 8),
+            "lowest_52_week_date": "2023-09-11",
+            "timestamp": int(now * 1000),
+        }
+
+    def _ticker(self, params):
+        return [self._ticker_item(m) for m in self._market_list(params, "markets")]
+
+    def _ticker_all(self, params):
+        value = params.get("quote_currencies", "")
+        quotes = set(value if isinstance(value, list) else value.split(","))
+        quotes.discard("")
+        if not quotes:
+            raise SimulatorError(400, "validation_error", "quote_currencies는 필수입니다")
+        return [self._ticker_item(m) for m in self.markets.values()
+                if m.quote in quotes]
+
+    def _orderbook_item(self, market: _Market, level: float = 0) -> Dict[str, Any]:
+        now = time.time()
+        price = market.price(now)
+        tick = max(level, _round_price(market.market, price * 1.0005) - price,
+                   price * 1e-6)
+        units = []
+        for i in range(ORDERBOOK_DEPTH):
+            units.append({
+                "ask_price": _round_price(market.market, price + tick * (i + 1)),
+                "bid_price": _round_price(market.market, price - tick * i),
+                "ask_size": round(0.1 + _noise(market.seed, int(now) * 64 + i), 8),
+                "bid_size": round(0.1 + _noise(market.seed, int(now) * 64 + 32 + i), 8),
+            })
+        return {
+            "market": market.market,
+            "timestamp": int(now * 1000),
+            "total_ask_size": round(sum(u["ask_size"] for u in units), 8),
+            "total_bid_size": round(sum(u["bid_size"] for u in units), 8),
+            "orderbook_units": units,
+            "level": level,
+        }
+
+    def _orderbook(self, params):
+        level = float(params.get("level", 0) or 0)
+        return [self._orderbook_item(m, level)
+                for m in self._market_list(params, "markets")]
+
+    def _supported_levels(self, params):
+        return [{"market": m.market,
+                 "supported_levels": [0, 10, 100, 1000, 10000, 100000]
+                 if m.quote == "KRW" else [0]}
+                for m in self._market_list(params, "market")]
+
+    def _trades_ticks(self, params):
+        """체결 내역. 시각 k * trade_interval마다 체결 1건, 최신순
+
+        days_ago는 오늘(UTC)에서 며칠 전 날짜인지, to는 그 날짜의 UTC 시각
+        ("HHmmss" 또는 "HH:mm:ss"), cursor는 이전 응답의 마지막 sequential_id입니다.
+        sequential_id는 체결 시각(밀리초) * 1000입니다.
+        """
+        market = self._market(params.get("market", ""))
+        count = min(500, max(1, int(params.get("count", 1))))
+        days_ago = int(params.get("days_ago") or 0)
+        if not 0 <= days_ago <= 7:
+            raise SimulatorError(400, "validation_error", "days_ago는 1~7 범위여야 합니다")
+
+        now = time.time()
+        day_start = (now // 86400 - days_ago) * 86400
+        upper = min(day_start + 86400, now)
+        to = params.get("to")
+        if to:
+            digits = to.replace(":", "")
+            if len(digits) != 6 or not digits.isdigit():
+                raise SimulatorError(400, "validation_error", f"잘못된 to 형식입니다: {to}")
+            upper = min(upper, day_start + int(digits[:2]) * 3600
+                        + int(digits[2:4]) * 60 + int(digits[4:]))
+        cursor = params.get("cursor")
+        if cursor:
+            upper = min(upper, int(cursor) / 1000000)
+
+        interval = self.trade_interval
+        first = math.ceil(day_start / interval)
+        last = math.ceil(upper / interval) - 1
+        prev = market.price(day_start - 1)
+        result = []
+        for k in range(last, max(first, last - count + 1) - 1, -1):
+            ts = k * interval
+            ms = int(round(ts * 1000))
+            price = market.price(ts)
+            trade_time = _utc(ts)
+            result.append({
+                "market": market.market,
+                "trade_date_utc": trade_time.strftime("%Y-%m-%d"),
+                "trade_time_utc": trade_time.strftime("%H:%M:%S"),
+                "timestamp": ms,
+                "trade_price": price,
+                "trade_volume": round(market.volume(ts, interval) / 10, 8),
+                "prev_closing_price": prev,
+                "change_price": price - prev,
+                "ask_bid": "BID" if _noise(market.seed, k) > 0.5 else "ASK",
+                "sequential_id": ms * 1000,
+            })
+        return result
+
+    # ------------------------------------------------------------------
+    # 계좌/주문 API
+    # ------------------------------------------------------------------
+    def _accounts(self, params):
+        with self._lock:
+            return [{
+                "currency": currency,
+                "balance": f"{balance:.8f}".rstrip("0").rstrip(".") or "0",
+                "locked": f"{locked:.8f}".rstrip("0").rstrip(".") or "0",
+                "avg_buy_price": f"{avg:.8f}".rstrip("0").rstrip(".") or "0",
+                "avg_buy_price_modified": False,
+                "unit_currency": "KRW",
+            } for currency, (balance, locked, avg) in self._balances.items()
+                if balance or locked]
+
+    def _account(self, currency: str) -> Dict[str, Any]:
+        balance, locked, avg = self._balances.get(currency, [0.0, 0.0, 0.0])
+        return {"currency": currency, "balance": str(balance), "locked": str(locked),
+                "avg_buy_price": str(avg), "avg_buy_price_modified": False,
+                "unit_currency": "KRW"}
+
+    def _chance(self, params):
+        market = self._market(params.get("market", ""))
+        with self._lock:
+            return {
+                "bid_fee": str(FEE_RATE),
+                "ask_fee": str(FEE_RATE),
+                "maker_bid_fee": str(FEE_RATE),
+                "maker_ask_fee": str(FEE_RATE),
+                "market": {
+                    "id": market.market,
+                    "name": f"{market.base}/{market.quote}",
+                    "order_types": ["limit"],
+                    "order_sides": ["ask", "bid"],
+                    "bid_types": ["best_fok", "best_ioc", "limit", "limit_fok",
+                                  "limit_ioc", "price"],
+                    "ask_types": ["best_fok", "best_ioc", "limit", "limit_fok",
+                                  "limit_ioc", "market"],
+                    "bid": {"currency": market.quote,
+                            "min_total": str(MIN_ORDER_TOTAL.get(market.quote, 0))},
+                    "ask": {"currency": market.quote,
+                            "min_total": str(MIN_ORDER_TOTAL.get(market.quote, 0))},
+                    "max_total": "1000000000",
+                    "state": "active",
+                },
+                "bid_account": self._account(market.quote),
+                "ask_account": self._account(market.base),
+            }
+
+    def _validate_order(self, params) -> Dict[str, Any]:
+        market = self._market(params.get("market", ""))
+        side, ord_type = params.get("side"), params.get("ord_type")
+        if side not in ("bid", "ask"):
+            raise SimulatorError(400, "validation_error", "side는 bid 또는 ask입니다")
+        if ord_type not in ("limit", "price", "market", "best"):
+            raise SimulatorError(400, "validation_error", "지원하지 않는 ord_type입니다")
+        try:
+            price = float(params["price"]) if params.get("price") else None
+            volume = float(params["volume"]) if params.get("volume") else None
+        except ValueError:
+            raise SimulatorError(400, "validation_error", "price/volume이 숫자가 아닙니다")
+        if ord_type == "limit" and (price is None or volume is None):
+            raise SimulatorError(400, "validation_error", "지정가 주문은 price와 volume이 필요합니다")
+        if ord_type == "price" and (side != "bid" or price is None):
+            raise SimulatorError(400, "validation_error", "시장가 매수는 price가 필요합니다")
+        if ord_type == "market" and (side != "ask" or volume is None):
+            raise SimulatorError(400, "validation_error", "시장가 매도는 volume이 필요합니다")
+
+        current = market.price(time.time())
+        total = price if ord_type == "price" else (price or current) * (volume or 0)
+        if total < MIN_ORDER_TOTAL.get(market.quote, 0):
+            raise SimulatorError(400, f"under_min_total_{side}",
+                                 "최소주문금액 이상으로 주문해주세요")
+        return {"market": market, "side": side, "ord_type": ord_type,
+                "price": price, "volume": volume, "total": total,
+                "time_in_force": params.get("time_in_force"),
+                "identifier": params.get("identifier")}
+
+    def _order_view(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in order.items() if not k.startswith("_")}
+
+    def _create_order(self, params):
+        spec = self._validate_order(params)
+        market, side = spec["market"], spec["side"]
+        currency = market.quote if side == "bid" else market.base
+        # 매수는 주문 총액+수수료, 매도는 수량을 주문 중으로 묶어 둠
+        lock_amount = spec["total"] * (1 + FEE_RATE) if side == "bid" else spec["volume"]
+
+        with self._lock:
+            identifier = spec["identifier"]
+            if identifier and identifier in self._identifiers:
+                raise SimulatorError(400, "validation_error", "이미 사용한 identifier입니다")
+            account = self._balances.setdefault(currency, [0.0, 0.0, 0.0])
+            if account[0] + 1e-12 < lock_amount:
+                raise SimulatorError(400, f"insufficient_funds_{side}",
+                                     f"주문가능한 금액({currency})이 부족합니다.")
+            account[0] -= lock_amount
+            account[1] += lock_amount
+
+            now = _utc(time.time()).astimezone(_KST)
+            order = {
+                "uuid": str(uuid_lib.uuid4()),
+                "side": side,
+                "ord_type": spec["ord_type"],
+                "price": None if spec["price"] is None else str(spec["price"]),
+                "state": "wait",
+                "market": market.market,
+                "created_at": now.isoformat(timespec="seconds"),
+                "volume": None if spec["volume"] is None else str(spec["volume"]),
+                "remaining_volume": None if spec["volume"] is None else str(spec["volume"]),
+                "reserved_fee": str(spec["total"] * FEE_RATE),
+                "remaining_fee": str(spec["total"] * FEE_RATE),
+                "paid_fee": "0",
+                "locked": str(lock_amount),
+                "executed_volume": "0",
+                "trades_count": 0,
+                "_lock_currency": currency,
+                "_lock_amount": lock_amount,
+            }
+            if spec["time_in_force"]:
+                order["time_in_force"] = spec["time_in_force"]
+            if identifier:
+                order["identifier"] = identifier
+                self._identifiers[identifier] = order["uuid"]
+            self._orders[order["uuid"]] = order
+            self._publish_order(order)
+            self._try_fill(order, market.price(time.time()))
+            if order["state"] == "wait" and spec["time_in_force"] in ("ioc", "fok"):
+                self._cancel(order)
+            return self._order_view(order)
+
+    def _test_order(self, params):
+        spec = self._validate_order(params)
+        return {"uuid": str(uuid_lib.uuid4()), "side": spec["side"],
+                "ord_type": spec["ord_type"], "price": params.get("price"),
+                "volume": params.get("volume"), "state": "wait",
+                "market": spec["market"].market, "created_at": _isoformat(time.time()),
+                "trades_count": 0}
+
+    def _try_fill(self, order: Dict[str, Any], price: float) -> None:
+        """가격 조건을 만족하면 주문 전체를 price에 체결"""
+        side, ord_type = order["side"], order["ord_type"]
+        if ord_type == "limit":
+            limit = float(order["price"])
+            if (side == "bid" and price > limit) or (side == "ask" and price < limit):
+                return
+            price = limit
+
+        market = self.markets[order["market"]]
+        if ord_type == "price":
+            volume = float(order["price"]) / price
+        else:
+            volume = float(order["volume"])
+        funds = price * volume
+        fee = funds * FEE_RATE
+
+        quote = self._balances.setdefault(market.quote, [0.0, 0.0, 0.0])
+        base = self._balances.setdefault(market.base, [0.0, 0.0, 0.0])
+        if side == "bid":
+            quote[1] -= order["_lock_amount"]
+            quote[0] += order["_lock_amount"] - funds - fee
+            held = base[0] + base[1]
+            base[2] = (base[2] * held + funds) / (held + volume) if held + volume else 0
+            base[0] += volume
+        else:
+            base[1] -= order["_lock_amount"]
+            quote[0] += funds - fee
+        order.update({
+            "state": "done",
+            "executed_volume": str(volume),
+            "remaining_volume": "0",
+            "paid_fee": str(fee),
+            "remaining_fee": "0",
+            "locked": "0",
+            "trades_count": 1,
+            "_lock_amount": 0.0,
+        })
+        self._publish_order(order, trade_price=price, trade_volume=volume)
+        self._publish_asset([market.quote, market.base])
+
+    def _match_orders(self, market: str) -> None:
+        price = self.markets[market].price(time.time())
+        with self._lock:
+            for order in list(self._orders.values()):
+                if order["market"] == market and order["state"] == "wait":
+                    self._try_fill(order, price)
+
+    def _cancel(self, order: Dict[str, Any]) -> None:
+        account = self._balances[order["_lock_currency"]]
+        account[1] -= order["_lock_amount"]
+        account[0] += order["_lock_amount"]
+        order.update({"state": "cancel", "locked": "0", "_lock_amount": 0.0})
+        self._publish_order(order)
+
+    def _find_order(self, params) -> Dict[str, Any]:
+        order = None
+        if params.get("uuid"):
+            order = self._orders.get(params["uuid"])
+        elif params.get("identifier"):
+            order = self._orders.get(self._identifiers.get(params["identifier"], ""))
+        if order is None:
+            raise SimulatorError(404, "order_not_found", "주문을 찾지 못했습니다.")
+        return order
+
+    def _get_order(self, params):
+        with self._lock:
+            self._match_orders_locked()
+            return self._order_view(self._find_order(params))
+
+    def _match_orders_locked(self) -> None:
+        now = time.time()
+        for order in list(self._orders.values()):
+            if order["state"] == "wait":
+                self._try_fill(order, self.markets[order["market"]].price(now))
+
+    def _orders_uuids(self, params):
+        with self._lock:
+            self._match_orders_locked()
+            uuids = params.get("uuids") or params.get("uuid") or []
+            uuids = uuids if isinstance(uuids, list) else [uuids]
+            identifiers = params.get("identifiers") or []
+            identifiers = identifiers if isinstance(identifiers, list) else [identifiers]
+            uuids += [self._identifiers[i] for i in identifiers if i in self._identifiers]
+            return [self._order_view(self._orders[u]) for u in uuids if u in self._orders]
+
+    def _list_orders(self, params, states: Tuple[str, ...]):
+        requested = params.get("states") or params.get("state") or list(states)
+        requested = requested if isinstance(requested, list) else [requested]
+        market = params.get("market")
+        limit = int(params.get("limit", 100))
+        page = int(params.get("page", 1))
+        with self._lock:
+            self._match_orders_locked()
+            orders = [o for o in self._orders.values()
+                      if o["state"] in requested and o["state"] in states
+                      and (market is None or o["market"] == market)]
+        if params.get("order_by", "desc") == "desc":
+            orders.reverse()
+        orders = orders[(page - 1) * limit:page * limit]
+        return [self._order_view(o) for o in orders]
+
+    def _orders_open(self, params):
+        return self._list_orders(params, ("wait", "watch"))
+
+    def _orders_closed(self, params):
+        return self._list_orders(params, ("done", "cancel"))
+
+    def _cancel_order(self, params):
+        with self._lock:
+            order = self._find_order(params)
+            if order["state"] != "wait":
+                raise SimulatorError(400, "validation_error", "취소할 수 없는 주문입니다")
+            self._cancel(order)
+            self._publish_asset([order["_lock_currency"]])
+            return self._order_view(order)
+
+    # ------------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------------
+    def _run_websocket(self, ready: threading.Event) -> None:
+        import asyncio
+        import websockets
+
+        async def main():
+            self._ws_stop = asyncio.Event()
+            async with websockets.serve(self._ws_handler, self.host, self.ws_port) as server:
+                self.ws_port = next(iter(server.sockets)).getsockname()[1]
+                ready.set()
+                await self._ws_stop.wait()
+
+        loop = asyncio.new_event_loop()
+        self._ws_loop = loop
+        try:
+            loop.run_until_complete(main())
+        finally:
+            ready.set()
+            loop.close()
+
+    def _publish(self, message: Dict[str, Any]) -> None:
+        loop = self._ws_loop
+        if loop is None:
+            return
+        for queue in list(self._private_queues):
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    def _publish_order(self, order: Dict[str, Any], trade_price: Optional[float] = None,
+                       trade_volume: Optional[float] = None) -> None:
+        if not self._private_queues:
+            return
+        now = int(time.time() * 1000)
+        self._publish({
+            "type": "myOrder",
+            "code": order["market"],
+            "uuid": order["uuid"],
+            "ask_bid": order["side"].upper(),
+            "order_type": order["ord_type"],
+            "state": "trade" if trade_price is not None else order["state"],
+            "trade_uuid": str(uuid_lib.uuid4()) if trade_price is not None else None,
+            "price": trade_price if trade_price is not None else
+            float(order["price"] or 0),
+            "volume": trade_volume if trade_volume is not None else
+            float(order["volume"] or 0),
+            "remaining_volume": float(order["remaining_volume"] or 0),
+            "executed_volume": float(order["executed_volume"]),
+            "trades_count": order["trades_count"],
+            "paid_fee": float(order["paid_fee"]),
+            "locked": float(order["locked"]),
+            "identifier": order.get("identifier"),
+            "order_timestamp": now,
+            "timestamp": now,
+            "stream_type": "REALTIME",
+        })
+
+    def _publish_asset(self, currencies: List[str]) -> None:
+        if not self._private_queues:
+            return
+        now = int(time.time() * 1000)
+        self._publish({
+            "type": "myAsset",
+            "asset_uuid": str(uuid_lib.uuid4()),
+            "assets": [{"currency": c, "balance": self._balances[c][0],
+                        "locked": self._balances[c][1]} for c in currencies],
+            "asset_timestamp": now,
+            "timestamp": now,
+            "stream_type": "REALTIME",
+        })
+
+    def _ws_message(self, type: str, market: _Market, stream_type: str) -> Dict[str, Any]:
+        if type == "ticker":
+            message = self._ticker_item(market)
+            message.pop("market")
+        elif type == "orderbook":
+            message = self._orderbook_item(market)
+            message.pop("market")
+        else:
+            now = time.time()
+            price = market.price(now)
+            message = {
+                "trade_price": price,
+                "trade_volume": round(market.volume(now, 1) / 10, 8),
+                "ask_bid": "BID" if _noise(market.seed, int(now * 10)) > 0.5 else "ASK",
+                "prev_closing_price": market.price(now // 86400 * 86400 - 1),
+                "change": "EVEN",
+                "change_price": 0.0,
+                "trade_date": _utc(now).strftime("%Y-%m-%d"),
+                "trade_time": _utc(now).strftime("%H:%M:%S"),
+                "trade_timestamp": int(now * 1000),
+                "timestamp": int(now * 1000),
+                "sequential_id": int(now * 1000000),
+            }
+        message["type"] = type
+        message["code"] = market.market
+        message["stream_type"] = stream_type
+        return message
+
+    async def _ws_handler(self, websocket, path: Optional[str] = None) -> None:
+        import asyncio
+        import websockets
+
+        request = getattr(websocket, "request", None)
+        path = request.path if request is not None else (path or websocket.path)
+        headers = request.headers if request is not None else websocket.request_headers
+        private = path.rstrip("/").endswith("/private")
+        if private:
+            try:
+                self._authenticate({"Authorization": headers.get("Authorization", "")}, "")
+            except SimulatorError as e:
+                await websocket.send(json.dumps(
+                    {"error": {"name": e.name, "message": e.message}}))
+                await websocket.close()
+                return
+
+        subscriptions: List[Tuple[str, List[str], bool]] = []
+        state = {"format": "DEFAULT"}
+        private_queue: "asyncio.Queue" = asyncio.Queue()
+        if private:
+            self._private_queues.add(private_queue)
+
+        def encode(message):
+            if state["format"] == "SIMPLE":
+                message = _simple(message, message["type"])
+            return json.dumps(message).encode()
+
+        async def receive():
+            async for raw in websocket:
+                try:
+                    request = json.loads(raw)
+                except ValueError:
+                    continue
+                new = []
+                for item in request if isinstance(request, list) else []:
+                    if "type" in item:
+                        new.append((item["type"], list(item.get("codes") or []),
+                                    bool(item.get("isOnlyRealtime"))))
+                    if "format" in item:
+                        state["format"] = str(item["format"]).upper()
+                subscriptions[:] = new
+                for type, codes, only_realtime in new:
+                    if only_realtime or type not in ("ticker", "trade", "orderbook"):
+                        continue
+                    for code in codes:
+                        if code in self.markets:
+                            await websocket.send(encode(self._ws_message(
+                                type, self.markets[code], "SNAPSHOT")))
+
+        async def push_private():
+            while True:
+                message = await private_queue.get()
+                for type, codes, _ in subscriptions:
+                    if type.lower() == message["type"].lower() and \
+                            (not codes or message.get("code") in codes):
+                        await websocket.send(encode(dict(message)))
+                        break
+
+        receiver = asyncio.ensure_future(receive())
+        pusher = asyncio.ensure_future(push_private()) if private else None
+        try:
+            while not receiver.done():
+                for type, codes, _ in list(subscriptions):
+                    if type not in ("ticker", "trade", "orderbook"):
+                        continue
+                    for code in codes:
+                        if code in self.markets:
+                            await websocket.send(encode(self._ws_message(
+                                type, self.markets[code], "REALTIME")))
+                await asyncio.sleep(self.ws_interval)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            receiver.cancel()
+            if pusher is not None:
+                pusher.cancel()
+            self._private_queues.discard(private_queue)
+
+
+_PRIVATE = {
+    "_accounts", "_chance", "_create_order", "_test_order", "_get_order",
+    "_orders_uuids", "_orders_open", "_orders_closed", "_cancel_order",
+}
+
+_ROUTES = {
+    ("GET", "/v1/market/all"): UpbitSimulator._market_all,
+    ("GET", "/v1/ticker"): UpbitSimulator._ticker,
+    ("GET", "/v1/ticker/all"): UpbitSimulator._ticker_all,
+    ("GET", "/v1/orderbook"): UpbitSimulator._orderbook,
+    ("GET", "/v1/orderbook/supported_levels"): UpbitSimulator._supported_levels,
+    ("GET", "/v1/trades/ticks"): UpbitSimulator._trades_ticks,
+    ("GET", "/v1/accounts"): UpbitSimulator._accounts,
+    ("GET", "/v1/orders/chance"): UpbitSimulator._chance,
+    ("POST", "/v1/orders"): UpbitSimulator._create_order,
+    ("POST", "/v1/orders/test"): UpbitSimulator._test_order,
+    ("GET", "/v1/order"): UpbitSimulator._get_order,
+    ("GET", "/v1/orders/uuids"): UpbitSimulator._orders_uuids,
+    ("GET", "/v1/orders/open"): UpbitSimulator._orders_open,
+    ("GET", "/v1/orders/closed"): UpbitSimulator._orders_closed,
+    ("DELETE", "/v1/order"): UpbitSimulator._cancel_order,
+}
+
+
+def _error_body(name: str, message: str) -> bytes:
+    return json.dumps({"error": {"name": name, "message": message}}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    sim: UpbitSimulator
+    protocol_version = "HTTP/1.1"
+    # keep-alive 연결에서 헤더와 본문을 따로 쓸 때 생기는 지연(Nagle + delayed ACK) 방지
+    disable_nagle_algorithm = True
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, content = self.sim.handle(
+            self.command, self.path, self.headers, body)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="로컬 Upbit API 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--ws-port", type=int, default=8081)
+    parser.add_argument("--no-rate-limit", action="store_true")
+    args = parser.parse_args(argv)
+
+    sim = UpbitSimulator(args.host, args.port, args.ws_port,
+                         rate_limit=not args.no_rate_limit).start()
+    print(f"REST: {sim.base_url}\nWebSocket: {sim.websocket_uri}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()
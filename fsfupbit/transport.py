@@ -0,0 +1,493 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+"""
+fsfupbit.transport
+
+HTTP 전송 계층. 모든 REST 호출은 이 모듈의 transport 객체를 거쳐 전송됩니다.
+"""
+
+import json
+import threading
+import time
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+from .endpoints import Endpoints
+from .rate_limit import RateLimiter, get_default_rate_limiter
+from .retry import RetryPolicy
+from .signer import SignedHeaders
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_TIMEOUT = (3.05, 10.0)
+DEFAULT_ASYNC_POOL_MAXSIZE = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+
+Timeout = Union[None, float, Tuple[float, float]]
+RateLimiterOption = Union[bool, None, RateLimiter]
+RetryOption = Union[bool, None, RetryPolicy]
+
+
+def _resolve_rate_limiter(rate_limiter: RateLimiterOption) -> Optional[RateLimiter]:
+    if rate_limiter is True:
+        return get_default_rate_limiter()
+    if rate_limiter is False or rate_limiter is None:
+        return None
+    return rate_limiter
+
+
+def _resolve_retry(retry: RetryOption) -> Optional[RetryPolicy]:
+    if retry is True:
+        return RetryPolicy()
+    if retry is False or retry is None:
+        return None
+    return retry
+
+
+def _resign(kwargs: Dict[str, Any]) -> None:
+    """재시도 전에 인증 헤더를 새 nonce로 다시 서명"""
+    headers = kwargs.get("headers")
+    if isinstance(headers, SignedHeaders):
+        kwargs["headers"] = headers.resign()
+
+
+class HTTPTransport:
+    """커넥션 풀을 사용하는 keep-alive HTTP 전송 객체
+
+    하나의 ``requests.Session`` 을 소유하여 api.upbit.com 과의 TCP/TLS 연결을
+    재사용합니다. 스레드 간에 공유해도 안전하며, ``Upbit`` 인스턴스나
+    시세 조회 함수에 주입하여 사용할 수 있습니다.
+
+    Args:
+        pool_connections: 호스트별로 캐시할 커넥션 풀의 개수 (기본값: 10)
+        pool_maxsize: 하나의 풀에 유지할 최대 커넥션 수 (기본값: 32)
+        timeout: 요청 타임아웃 (초 또는 (connect, read) 튜플, 기본값: (3.05, 10.0))
+        keep_alive: False이면 매 요청 후 연결을 닫음 (기본값: True)
+        session: 직접 구성한 ``requests.Session`` (선택사항)
+            - 세션에 mount한 어댑터(urllib3 Retry, mTLS, 프록시 등)는 그대로 사용.
+              pool_connections/pool_maxsize를 지정한 경우에만 풀 어댑터로 교체
+        rate_limiter: 요청 수 제한 스케줄러
+            - True: 프로세스 공용 RateLimiter 사용 (기본값)
+            - None/False: 사용하지 않음
+            - RateLimiter 인스턴스: 지정한 스케줄러 사용
+        retry: 429/5xx 응답과 네트워크 오류 재시도 정책
+            - True: 기본 RetryPolicy 사용, GET 요청만 재시도 (기본값)
+            - None/False: 재시도하지 않음
+            - RetryPolicy 인스턴스: 지정한 정책 사용
+        base_url: 이 transport로 보내는 요청의 API 기본 주소 (선택사항)
+            - 예: 로컬 시뮬레이터, 캐시 프록시 ("http://127.0.0.1:8080")
+            - set_base_url()보다 우선하고 클라이언트의 base_url보다는 나중
+              (fsfupbit.endpoints 참조). transport는 받은 URL을 바꾸지 않음
+
+    Examples:
+        >>> transport = HTTPTransport(pool_maxsize=64, timeout=5)
+        >>> upbit = Upbit(access, secret, transport=transport)
+
+        >>> # 시세 조회 함수가 사용할 기본 transport 교체
+        >>> set_default_transport(HTTPTransport(timeout=(1, 3)))
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        session: Optional[requests.Session] = None,
+        rate_limiter: RateLimiterOption = True,
+        retry: RetryOption = True,
+        base_url: Optional[str] = None
+    ):
+        pool_given = pool_connections is not None or pool_maxsize is not None
+        self.pool_connections = (DEFAULT_POOL_CONNECTIONS if pool_connections is None
+                                 else pool_connections)
+        self.pool_maxsize = DEFAULT_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.rate_limiter = _resolve_rate_limiter(rate_limiter)
+        self.retry = _resolve_retry(retry)
+        self.endpoints: Optional[Endpoints] = Endpoints(base_url) if base_url else None
+
+        self.session = session if session is not None else requests.Session()
+        # 주입한 세션의 어댑터는 풀 크기를 명시했을 때만 교체
+        if session is None or pool_given:
+            adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                  pool_maxsize=self.pool_maxsize)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None,
+                **kwargs: Any) -> Response:
+        """HTTP 요청 전송
+
+        rate_limiter가 설정된 경우 요청 수 제한에 걸리지 않도록 전송 전에 대기하고,
+        응답의 Remaining-Req 헤더로 스케줄러를 보정합니다. retry 정책이 허용하는
+        요청은 429/5xx 응답과 네트워크 오류를 재시도합니다.
+
+        Args:
+            method: HTTP 메서드 ("GET", "POST", "DELETE")
+            url: 요청 URL
+            idempotent: 재시도해도 안전한 요청인지 여부 (None이면 메서드로 판단,
+                identifier를 지정한 주문 생성은 True)
+            kwargs: ``requests.Session.request`` 로 전달할 인자
+
+        Returns:
+            Response: 응답 객체 (재시도한 경우 마지막 응답)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        policy = self.retry
+        if policy is None:
+            return self._send(method, url, kwargs)
+        policy.start()
+        if not policy.allows(method, idempotent):
+            return self._send(method, url, kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                resp = self._send(method, url, kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                wait = policy.delay(attempt)
+                if wait is None:
+                    raise
+            else:
+                if resp.status_code not in policy.status_codes:
+                    return resp
+                wait = policy.delay(attempt, resp.status_code, resp.headers)
+                if wait is None:
+                    return resp
+                resp.close()
+            attempt += 1
+            time.sleep(wait)
+            _resign(kwargs)
+
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> Response:
+        limiter = self.rate_limiter
+        if limiter is not None:
+            limiter.acquire(method, url)
+        resp = self.session.request(method, url, **kwargs)
+        if limiter is not None:
+            limiter.observe(method, url, resp.headers.get("Remaining-Req"),
+                            resp.status_code)
+        return resp
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """지정한 API 기본 주소 (없으면 None)"""
+        return self.endpoints.base_url if self.endpoints is not None else None
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """풀링된 연결 종료"""
+        self.session.close()
+
+    def __enter__(self) -> "HTTPTransport":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """모듈 수준 시세 조회 함수가 사용하는 기본 transport 반환
+
+    최초 호출 시 기본 설정으로 생성되며, 이후에는 같은 객체를 재사용합니다.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[HTTPTransport]) -> None:
+    """기본 transport 교체
+
+    Args:
+        transport: 새 기본 transport. None이면 다음 호출 시 기본 설정으로 다시 생성
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
+
+
+class AsyncResponse:
+    """본문을 모두 읽어 둔 비동기 응답 객체
+
+    ``requests.Response`` 와 같은 이름의 속성(``ok``, ``status_code``,
+    ``headers``, ``text``, ``json()``)을 제공하므로 동기 경로의 에러 매핑과
+    Remaining-Req 파싱을 그대로 사용할 수 있습니다.
+    """
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code: int, headers: Any, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def _to_pairs(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """리스트 값을 반복 키로 펼친 (key, value) 목록 생성 (requests와 동일한 인코딩)"""
+    pairs = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            pairs.extend((key, str(v)) for v in value)
+        else:
+            pairs.append((key, str(value)))
+    return pairs
+
+
+class AsyncHTTPTransport:
+    """aiohttp 기반 비동기 HTTP 전송 객체
+
+    하나의 ``aiohttp.ClientSession`` 커넥션 풀을 공유하여 같은 이벤트 루프에서
+    수백 개의 요청을 동시에 처리합니다. 세션은 첫 요청 시 실행 중인 이벤트
+    루프에 생성되며, 루프가 바뀌면 새로 만들어집니다.
+
+    Args:
+        pool_maxsize: 동시에 열 수 있는 최대 커넥션 수 (기본값: 100)
+        pool_maxsize_per_host: 호스트별 최대 커넥션 수 (0이면 제한 없음)
+        timeout: 요청 타임아웃 (초 또는 (connect, read) 튜플, 기본값: (3.05, 10.0))
+        keep_alive: False이면 매 요청 후 연결을 닫음 (기본값: True)
+        keepalive_timeout: 유휴 커넥션 유지 시간 (초, 기본값: 15.0)
+        rate_limiter: 요청 수 제한 스케줄러 (HTTPTransport와 같은 규칙, 기본값: True)
+        retry: 재시도 정책 (HTTPTransport와 같은 규칙, 기본값: True)
+        base_url: 이 transport로 보내는 요청의 API 기본 주소 (HTTPTransport와 같은 규칙)
+
+    Note:
+        - aiohttp가 필요합니다: ``pip install fsfupbit[async]``
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_ASYNC_POOL_MAXSIZE,
+        pool_maxsize_per_host: int = 0,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        rate_limiter: RateLimiterOption = True,
+        retry: RetryOption = True,
+        base_url: Optional[str] = None
+    ):
+        self.pool_maxsize = pool_maxsize
+        self.pool_maxsize_per_host = pool_maxsize_per_host
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = _resolve_rate_limiter(rate_limiter)
+        self.retry = _resolve_retry(retry)
+        self.endpoints: Optional[Endpoints] = Endpoints(base_url) if base_url else None
+        self._session = None
+        self._loop = None
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """지정한 API 기본 주소 (없으면 None)"""
+        return self.endpoints.base_url if self.endpoints is not None else None
+
+    def _get_session(self):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed \
+                and self._loop is loop:
+            return self._session
+
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncHTTPTransport를 사용하려면 aiohttp가 필요합니다: "
+                "pip install fsfupbit[async]")
+
+        if isinstance(self.timeout, tuple):
+            timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0],
+                                            sock_read=self.timeout[1])
+        else:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        if self.keep_alive:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                keepalive_timeout=self.keepalive_timeout)
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                force_close=True)
+
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=timeout)
+        self._loop = loop
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Union[None, str, Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None
+    ) -> AsyncResponse:
+        """HTTP 요청 전송
+
+        Args:
+            method: HTTP 메서드 ("GET", "POST", "DELETE")
+            url: 요청 URL
+            params: 쿼리 파라미터 (리스트 값은 반복 키로 인코딩)
+            data: 요청 본문. dict는 form 인코딩, str은 그대로 전송
+            headers: HTTP 헤더
+            idempotent: 재시도해도 안전한 요청인지 여부 (HTTPTransport.request와 동일)
+
+        Returns:
+            AsyncResponse: 본문을 읽어 둔 응답 객체 (재시도한 경우 마지막 응답)
+        """
+        kwargs = {"params": params, "data": data, "headers": headers}
+        policy = self.retry
+        if policy is None:
+            return await self._send(method, url, **kwargs)
+        policy.start()
+        if not policy.allows(method, idempotent):
+            return await self._send(method, url, **kwargs)
+
+        self._get_session()
+        import asyncio
+        import aiohttp
+        attempt = 0
+        while True:
+            try:
+                resp = await self._send(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                wait = policy.delay(attempt)
+                if wait is None:
+                    raise
+            else:
+                if resp.status_code not in policy.status_codes:
+                    return resp
+                wait = policy.delay(attempt, resp.status_code, resp.headers)
+                if wait is None:
+                    return resp
+            attempt += 1
+            await asyncio.sleep(wait)
+            _resign(kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Union[None, str, Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> AsyncResponse:
+        session = self._get_session()
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire_async(method, url)
+
+        if isinstance(data, dict):
+            headers = dict(headers or {})
+            headers.setdefault("Content-Type",
+                               "application/x-www-form-urlencoded")
+            data = urlencode(_to_pairs(data))
+
+        async with session.request(
+            method, url,
+            params=_to_pairs(params) if params else None,
+            data=data,
+            headers=headers
+        ) as resp:
+            content = await resp.read()
+            status, headers = resp.status, resp.headers
+
+        if limiter is not None:
+            limiter.observe(method, url, headers.get("Remaining-Req"), status)
+        return AsyncResponse(status, headers, content)
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """커넥션 풀 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    async def __aenter__(self) -> "AsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+
+_default_async_transport: Optional[AsyncHTTPTransport] = None
+
+
+def get_default_async_transport() -> AsyncHTTPTransport:
+    """비동기 시세 조회 함수와 ``AsyncUpbit`` 이 공유하는 기본 transport 반환"""
+    global _default_async_transport
+    if _default_async_transport is None:
+        with _default_lock:
+            if _default_async_transport is None:
+                _default_async_transport = AsyncHTTPTransport()
+    return _default_async_transport
+
+
+def set_default_async_transport(
+    transport: Optional[AsyncHTTPTransport]
+) -> None:
+    """기본 비동기 transport 교체
+
+    Args:
+        transport: 새 기본 transport. None이면 다음 호출 시 기본 설정으로 다시 생성
+    """
+    global _default_async_transport
+    with _default_lock:
+        _default_async_transport = transport
@@ -11,22 +11,35 @@
 
 import websockets
 import asyncio
+import inspect
 import json
+import logging
+import queue
+import threading
 import uuid
 import multiprocessing as mp
-import jwt
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
+from fsfupbit.errors import UpbitValidationError
+from fsfupbit.signer import JWTSigner
+from fsfupbit.ws_codec import check_format, expand_simple, get_decoder
+
+logger = logging.getLogger(__name__)
 
 class WebSocketClient:
-    def __init__(self, type: str, codes: list, queue: mp.Queue):
+    def __init__(self, type: str, codes: list, queue: mp.Queue,
+                 format: str = "DEFAULT", decoder="auto", expand: bool = False,
+                 uri: Optional[str] = None):
+        self.uri = uri or PUBLIC_WEBSOCKET_URI
         self.type = type
         self.codes = codes
         self.queue = queue
+        self.format = check_format(format)
+        self.decoder = decoder
+        self.expand = expand
         self.run()
 
     async def connect_socket(self):
-        uri = "wss://api.upbit.com/websocket/v1"
-        async for websocket in websockets.connect(uri, ping_interval=60):
+        async for websocket in websockets.connect(self.uri, ping_interval=60):
             try:
                 data = [{
                     "ticket": str(uuid.uuid4())[:6]
@@ -34,13 +47,15 @@ class WebSocketClient:
                     "type": self.type,
                     "codes": self.codes,
                     "isOnlyRealtime": True
+                }, {
+                    "format": self.format
                 }]
                 await websocket.send(json.dumps(data))
 
+                decode = _message_decoder(self.decoder, self.format, self.expand)
                 while True:
                     recv_data = await websocket.recv()
-                    recv_data = recv_data.decode('utf8')
-                    self.queue.put(json.loads(recv_data))
+                    self.queue.put(decode(recv_data))
             except websockets.ConnectionClosed:
                 self.queue.put('ConnectionClosedError')
                 continue
@@ -60,21 +75,61 @@ class WebSocketManager(mp.Process):
                 print(data)
             >> wm.terminate()
 
+            >> # 공유 메모리 링 버퍼로 전달 (pickle 없음)
+            >> wm = WebSocketManager("orderbook", ["KRW-BTC"], output="shm")
+            >> raw = wm.get_raw()      # 복사 없는 memoryview
+            >> data = bytes(raw)
+            >> wm.still_valid()        # 복사하는 동안 덮어쓰이지 않았는지 확인
+            >> wm.overruns             # 소비가 늦어 건너뛰거나 버린 메시지 수
+            >> wm.oversized            # slot_size를 넘어 버린 메시지 수
+
+            >> # 축약 필드명(SIMPLE) 수신, orjson이 설치되어 있으면 orjson으로 디코딩
+            >> wm = WebSocketManager("trade", ["KRW-BTC"], format="SIMPLE")
+
         주의 :
 
            재귀적인 호출을 위해 다음의 guard를 반드시 추가해야 한다.
            >> if __name__ == "__main__"
 
     """
-    def __init__(self, type: str, codes: list, qsize: int = 1000):
+    def __init__(self, type: str, codes: list, qsize: int = 1000,
+                 output: str = "queue", slots: int = 1024,
+                 slot_size: int = 8192, format: str = "DEFAULT",
+                 decoder="auto", expand: bool = False,
+                 uri: Optional[str] = None):
         """웹소켓을 컨트롤하는 클래스의 생성자
 
         Args:
             type   (str           ): 구독 메시지 종류 (ticker/trade/orderbook)
             codes  (list          ): 구독할 암호 화폐의 리스트 [BTC_KRW, ETH_KRW, …]
             qsize  (int , optional): 메시지를 저장할 Queue의 크기
+            output (str , optional): 메시지 전달 방식
+                - "queue": mp.Queue로 dict 전달 (기본값)
+                - "shm": 수신한 원본 바이트를 공유 메모리 링 버퍼로 전달
+            slots     (int, optional): "shm" 링 버퍼 슬롯 수
+            slot_size (int, optional): "shm" 링 버퍼 슬롯당 최대 메시지 크기 (바이트)
+            format (str , optional): 수신 포맷 ("DEFAULT" 또는 축약 필드명의 "SIMPLE")
+            decoder         (optional): 메시지 디코더 ("auto", "orjson", "msgspec", "json" 또는 함수)
+                - "auto": orjson, msgspec, json 순서로 설치된 라이브러리 사용
+            expand (bool, optional): SIMPLE 포맷의 축약 필드명을 DEFAULT 필드명으로 변환
+            uri    (str , optional): WebSocket 주소 (기본값: PUBLIC_WEBSOCKET_URI)
         """
-        self.__q = mp.Queue(qsize)
+        if output not in ("queue", "shm"):
+            raise UpbitValidationError(
+                "output은 'queue' 또는 'shm'만 가능합니다", field="output")
+        self.output = output
+        self.uri = uri or PUBLIC_WEBSOCKET_URI
+        self.format = check_format(format)
+        self.decoder = decoder
+        self.expand = expand
+        self.__decode = None
+        if output == "shm":
+            self.__q = None
+            from fsfupbit.ring_buffer import SharedRingBuffer
+            self.__ring = SharedRingBuffer(slots=slots, slot_size=slot_size)
+        else:
+            self.__q = mp.Queue(qsize)
+            self.__ring = None
         self.alive = False
 
         self.type = type
@@ -82,9 +137,19 @@ class WebSocketManager(mp.Process):
 
         super().__init__()
 
+    def __put(self, recv_data):
+        if self.__ring is not None:
+            self.__ring.write(recv_data)
+        else:
+            self.__q.put(self.__decoder()(recv_data))
+
+    def __decoder(self):
+        if self.__decode is None:
+            self.__decode = _message_decoder(self.decoder, self.format, self.expand)
+        return self.__decode
+
     async def __connect_socket(self):
-        uri = "wss://api.upbit.com/websocket/v1"
-        async for websocket in websockets.connect(uri, ping_interval=60):
+        async for websocket in websockets.connect(self.uri, ping_interval=60):
             try:
                 data = [{
                     "ticket": str(uuid.uuid4())[:6]
@@ -92,15 +157,16 @@ class WebSocketManager(mp.Process):
                     "type": self.type,
                     "codes": self.codes,
                     "isOnlyRealtime": True
+                }, {
+                    "format": self.format
                 }]
                 await websocket.send(json.dumps(data))
 
                 while self.alive:
                     recv_data = await websocket.recv()
-                    recv_data = recv_data.decode('utf8')
-                    self.__q.put(json.loads(recv_data))
+                    self.__put(recv_data)
             except websockets.ConnectionClosed:
-                self.__q.put('ConnectionClosedError')
+                self.__put(b'"ConnectionClosedError"')
                 continue
 
     def run(self):
@@ -112,11 +178,65 @@ class WebSocketManager(mp.Process):
         if self.alive is False:
             self.alive = True
             self.start()
+        if self.__ring is not None:
+            decode = self.__decoder()
+            while True:
+                message = decode(self.__ring.read())
+                # 디코딩하는 동안 덮어쓰인 메시지는 overruns에 세고 다음 메시지를 읽음
+                if self.__ring.still_valid():
+                    return message
         return self.__q.get()
 
+    def get_raw(self, timeout: Optional[float] = None) -> Optional[memoryview]:
+        """수신한 메시지 원본 바이트를 복사 없이 반환 (output="shm" 전용)
+
+        Args:
+            timeout: 최대 대기 시간 (초, 기본값: None)
+
+        Returns:
+            memoryview: 메시지 바이트 (JSON). timeout 동안 메시지가 없으면 None
+
+        Note:
+            - 반환된 memoryview는 링 버퍼가 한 바퀴 돌아 덮어쓰기 전까지만 유효합니다.
+              복사하거나 파싱한 뒤 still_valid()가 False이면 결과를 버리세요
+        """
+        if self.__ring is None:
+            raise UpbitValidationError(
+                "get_raw는 output='shm'에서만 사용할 수 있습니다", field="output")
+        if self.alive is False:
+            self.alive = True
+            self.start()
+        return self.__ring.read(timeout=timeout)
+
+    def still_valid(self) -> bool:
+        """마지막으로 get_raw()한 메시지가 아직 덮어쓰이지 않았는지 확인 (output="shm")
+
+        덮어쓰였으면 overruns를 1 늘리고 False를 반환합니다.
+        """
+        return self.__ring.still_valid() if self.__ring is not None else True
+
+    @property
+    def overruns(self) -> int:
+        """소비가 늦어 링 버퍼에서 덮어쓰인 메시지 수 (output="shm")"""
+        return self.__ring.overruns if self.__ring is not None else 0
+
+    @property
+    def oversized(self) -> int:
+        """slot_size를 넘어 링 버퍼에 쓰지 못하고 버린 메시지 수 (output="shm")"""
+        return self.__ring.oversized if self.__ring is not None else 0
+
     def terminate(self):
         self.alive = False
         super().terminate()
+        if self.__ring is not None:
+            self.join()
+            try:
+                self.__ring.close()
+            except BufferError:
+                # get_raw()로 받은 memoryview가 남아 있으면 프로세스 종료 시 해제
+                pass
+            self.__ring.unlink()
+            self.__ring = None
 
 
 if __name__ == "__main__":
@@ -188,7 +308,11 @@ class PrivateWebSocketManager(mp.Process):
         secret_key: str,
         type: str,
         codes: Optional[List[str]] = None,
-        qsize: int = 1000
+        qsize: int = 1000,
+        format: str = "DEFAULT",
+        decoder="auto",
+        expand: bool = False,
+        uri: Optional[str] = None
     ):
         """개인용 WebSocket 관리자 생성자
 
@@ -198,10 +322,18 @@ class PrivateWebSocketManager(mp.Process):
             type: 구독 메시지 종류 ("MyOrder", "MyAsset")
             codes: 구독할 암호화폐 코드 리스트 (선택사항)
             qsize: 메시지를 저장할 Queue의 크기
+            format: 수신 포맷 ("DEFAULT" 또는 축약 필드명의 "SIMPLE")
+            decoder: 메시지 디코더 ("auto", "orjson", "msgspec", "json" 또는 함수)
+            expand: SIMPLE 포맷의 축약 필드명을 DEFAULT 필드명으로 변환
+            uri: 개인 WebSocket 주소 (기본값: PRIVATE_WEBSOCKET_URI)
         """
         self.__q = mp.Queue(qsize)
+        self.uri = uri or PRIVATE_WEBSOCKET_URI
         self.alive = False
 
+        self.format = check_format(format)
+        self.decoder = decoder
+        self.expand = expand
         self.access_key = access_key
         self.secret_key = secret_key
         self.type = type
@@ -215,16 +347,12 @@ class PrivateWebSocketManager(mp.Process):
         Returns:
             str: JWT 토큰
         """
-        payload = {
-            "access_key": self.access_key,
-            "nonce": str(uuid.uuid4())
-        }
-        jwt_token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        jwt_token = JWTSigner(self.access_key, self.secret_key).token()
         return f'Bearer {jwt_token}'
 
     async def __connect_socket(self):
         """WebSocket 연결 및 메시지 수신"""
-        uri = "wss://api.upbit.com/websocket/v1/private"
+        uri = self.uri
 
         headers = {
             "Authorization": self._generate_jwt_token()
@@ -233,7 +361,7 @@ class PrivateWebSocketManager(mp.Process):
         async for websocket in websockets.connect(
             uri,
             ping_interval=60,
-            extra_headers=headers
+            **_connect_kwargs(headers)
         ):
             try:
                 # 구독 요청 데이터 생성
@@ -242,14 +370,16 @@ class PrivateWebSocketManager(mp.Process):
                 }, {
                     "type": self.type,
                     "codes": self.codes
+                }, {
+                    "format": self.format
                 }]
 
                 await websocket.send(json.dumps(data))
 
+                decode = _message_decoder(self.decoder, self.format, self.expand)
                 while self.alive:
                     recv_data = await websocket.recv()
-                    recv_data = recv_data.decode('utf8')
-                    self.__q.put(json.loads(recv_data))
+                    self.__q.put(decode(recv_data))
             except websockets.ConnectionClosed:
                 self.__q.put('ConnectionClosedError')
                 continue
@@ -276,3 +406,604 @@ class PrivateWebSocketManager(mp.Process):
         """WebSocket 연결 종료"""
         self.alive = False
         super().terminate()
+
+
+PUBLIC_WEBSOCKET_URI = "wss://api.upbit.com/websocket/v1"
+PRIVATE_WEBSOCKET_URI = "wss://api.upbit.com/websocket/v1/private"
+
+# 구독 타입 → Upbit 요청/응답에 사용되는 타입 이름 (대소문자 구분 없이 입력 가능)
+_PUBLIC_TYPES = {"ticker": "ticker", "trade": "trade", "orderbook": "orderbook"}
+_PRIVATE_TYPES = {"myorder": "myOrder", "myasset": "myAsset"}
+
+
+def _connect_kwargs(headers: Dict[str, str]) -> Dict[str, Any]:
+    """websockets 버전에 맞는 헤더 인자 이름으로 connect 인자 생성
+
+    websockets 14 이상은 additional_headers, 이전 버전은 extra_headers를 사용합니다.
+    """
+    if not headers:
+        return {}
+    params = inspect.signature(websockets.connect).parameters
+    if "additional_headers" in params:
+        return {"additional_headers": headers}
+    return {"extra_headers": headers}
+
+
+def _message_decoder(decoder, format: str, expand: bool):
+    """수신 바이트를 메시지로 바꾸는 함수 (SIMPLE + expand이면 필드명 변환 포함)"""
+    decode = get_decoder(decoder)
+    if format != "SIMPLE" or not expand:
+        return decode
+
+    def decode_expanded(raw):
+        message = decode(raw)
+        return expand_simple(message) if isinstance(message, dict) else message
+    return decode_expanded
+
+
+def _auth_headers(access_key: str, secret_key: str) -> Dict[str, str]:
+    """개인 WebSocket 연결용 JWT 인증 헤더"""
+    return JWTSigner(access_key, secret_key).headers()
+
+
+def _reconnect_wait(delay: float, max_delay: float, failures: int) -> float:
+    """재연결 전 대기 시간 (메시지 없이 연달아 실패할수록 두 배씩, max_delay까지)"""
+    return min(delay * 2 ** max(failures - 1, 0), max_delay)
+
+
+# 구독 해지 시 큐에 넣어 대기 중인 소비자를 깨우는 표지
+_CLOSED = object()
+
+
+class Subscription:
+    """WebSocketHub 구독 핸들
+
+    허브가 받은 메시지 중 구독한 타입/코드의 메시지만 전달받는 소비자용 큐입니다.
+    WebSocketHub.subscribe()로 생성합니다.
+
+    Attributes:
+        type: 구독 타입 ("ticker", "trade", "orderbook", "myOrder", "myAsset")
+        codes: 구독 중인 코드 집합 (비어 있으면 해당 타입의 모든 메시지)
+        dropped: 큐가 가득 차서 버린 메시지 수
+    """
+
+    def __init__(self, hub: "WebSocketHub", type: str, codes: List[str],
+                 qsize: int):
+        self.hub = hub
+        self.type = type
+        self.codes = set(codes)
+        self.dropped = 0
+        self.closed = False
+        self._q = queue.Queue(qsize)
+
+    def _put(self, message: Dict[str, Any]) -> None:
+        # 소비가 늦으면 가장 오래된 메시지를 버려 최신 메시지를 유지
+        while True:
+            try:
+                self._q.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    self._q.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """메시지 수신
+
+        Args:
+            block: 메시지가 없을 때 대기 여부 (기본값: True)
+            timeout: 최대 대기 시간 (초, 기본값: None)
+
+        Raises:
+            queue.Empty: block=False이거나 timeout 동안 메시지가 없는 경우,
+                또는 구독이 해지된 경우
+        """
+        message = self._q.get(block, timeout)
+        if message is _CLOSED:
+            # 다른 소비자도 깨어나도록 표지를 되돌려 둠
+            self._put(_CLOSED)
+            raise queue.Empty
+        return message
+
+    def __iter__(self):
+        """구독이 해지될 때까지 메시지를 반환 (해지되면 대기 중이어도 종료)"""
+        while True:
+            message = self._q.get()
+            if message is _CLOSED:
+                self._put(_CLOSED)
+                return
+            yield message
+
+    def _close(self) -> None:
+        """해지 표시 후 대기 중인 소비자를 깨움 (허브 lock 보유 상태)"""
+        if not self.closed:
+            self.closed = True
+            self._put(_CLOSED)
+
+    def add_codes(self, codes: List[str]) -> None:
+        """구독 코드 추가 (연결을 유지한 채 구독 메시지를 갱신)"""
+        self.hub._update(self, self.codes | set(codes))
+
+    def remove_codes(self, codes: List[str]) -> None:
+        """구독 코드 제거 (연결을 유지한 채 구독 메시지를 갱신)"""
+        self.hub._update(self, self.codes - set(codes))
+
+    def close(self) -> None:
+        """구독 해지"""
+        self.hub.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _HubConnection:
+    """WebSocketHub가 관리하는 하나의 WebSocket 연결 상태"""
+
+    def __init__(self, uri: str, private: bool):
+        self.uri = uri
+        self.private = private
+        self.websocket = None
+        self.wanted: Optional[asyncio.Event] = None
+        self.message: Optional[str] = None
+
+
+class WebSocketHub:
+    """여러 구독을 소수의 WebSocket 연결로 다중화하는 허브
+
+    프로세스를 구독마다 띄우는 대신, 하나의 백그라운드 스레드에서 공개 연결과
+    개인 연결(JWT 인증)을 각각 최대 1개씩 유지합니다. 연결별로 모든 구독을 합친
+    하나의 구독 메시지를 보내고, 받은 메시지는 타입과 코드에 따라 각 구독의
+    큐로 나누어 전달합니다. 구독을 추가/변경/해지하면 연결을 끊지 않고 구독
+    메시지를 다시 보냅니다.
+
+    Args:
+        access_key: Upbit API Access Key (myOrder/myAsset 구독 시 필요)
+        secret_key: Upbit API Secret Key (myOrder/myAsset 구독 시 필요)
+        uri: 공개 WebSocket 주소 (기본값: PUBLIC_WEBSOCKET_URI)
+        private_uri: 개인 WebSocket 주소 (기본값: PRIVATE_WEBSOCKET_URI)
+        reconnect_delay: 연결이 끊겼을 때 재연결 전 대기 시간 (초, 기본값: 1.0).
+            메시지를 받지 못하고 연달아 끊기면 두 배씩 늘림
+        reconnect_max_delay: 재연결 대기 시간의 상한 (초, 기본값: 30.0)
+        format: 수신 포맷 ("DEFAULT" 또는 축약 필드명의 "SIMPLE", 기본값: "DEFAULT")
+        decoder: 메시지 디코더 ("auto", "orjson", "msgspec", "json" 또는 함수)
+        expand: SIMPLE 포맷의 축약 필드명을 DEFAULT 필드명으로 변환 (기본값: False)
+
+    Examples:
+        >>> hub = WebSocketHub(access, secret)
+        >>> tickers = hub.subscribe("ticker", ["KRW-BTC", "KRW-ETH"])
+        >>> trades = hub.subscribe("trade", ["KRW-BTC"])
+        >>> orders = hub.subscribe("myOrder")
+        >>> data = tickers.get()
+        >>> tickers.add_codes(["KRW-XRP"])   # 실행 중 구독 코드 변경
+        >>> hub.close()
+
+    Note:
+        - 같은 타입을 여러 구독이 요청하면 코드를 합쳐 한 번만 구독합니다
+        - Upbit는 같은 연결에서 새 구독 메시지를 받으면 이전 구독을 대체합니다
+        - myAsset 메시지는 코드가 없으므로 모든 myAsset 구독에 전달됩니다
+        - 연결이 끊기면 자동으로 재연결하고 현재 구독을 다시 요청합니다
+        - 연결 실패(인증 거부, 잘못된 주소, TLS 오류 등)와 서버의 에러 메시지는
+          fsfupbit.websocket_api 로거에 경고로 남기고, last_error 속성에 보관하며,
+          해당 연결의 구독 큐에 {"error": {"name": ..., "message": ...}} 형식으로
+          전달합니다
+        - 구독을 해지하거나 허브를 닫으면 대기 중인 get()은 queue.Empty를 발생시키고
+          ``for msg in sub`` 반복은 종료됩니다
+    """
+
+    def __init__(
+        self,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        uri: str = PUBLIC_WEBSOCKET_URI,
+        private_uri: str = PRIVATE_WEBSOCKET_URI,
+        reconnect_delay: float = 1.0,
+        format: str = "DEFAULT",
+        decoder="auto",
+        expand: bool = False,
+        reconnect_max_delay: float = 30.0
+    ):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.format = check_format(format)
+        self._decode = _message_decoder(decoder, self.format, expand)
+        if self.format == "SIMPLE" and not expand:
+            self._type_key, self._code_key = "ty", "cd"
+        else:
+            self._type_key, self._code_key = "type", "code"
+        self._public = _HubConnection(uri, private=False)
+        self._private = _HubConnection(private_uri, private=True)
+        self._subscriptions: List[Subscription] = []
+        self._routes: Dict[str, Dict[Optional[str], List[Subscription]]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.last_error: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # 구독 관리
+    # ------------------------------------------------------------------
+    def subscribe(
+        self,
+        type: str,
+        codes: Optional[List[str]] = None,
+        qsize: int = 1000
+    ) -> Subscription:
+        """구독 추가
+
+        Args:
+            type: 구독 타입 ("ticker", "trade", "orderbook", "myOrder", "myAsset")
+            codes: 구독할 코드 리스트 (예: ["KRW-BTC"]).
+                myOrder는 생략하면 모든 마켓, myAsset은 코드를 사용하지 않음
+            qsize: 구독 큐 크기. 가득 차면 가장 오래된 메시지를 버림 (기본값: 1000)
+
+        Returns:
+            Subscription: 메시지를 받을 구독 핸들
+
+        Raises:
+            UpbitValidationError: 지원하지 않는 타입이거나, 공개 타입에 코드가 없거나,
+                개인 타입에 인증 키가 없는 경우
+        """
+        if self._closed:
+            raise RuntimeError("WebSocketHub is closed")
+        key = type.lower()
+        if key in _PUBLIC_TYPES:
+            type = _PUBLIC_TYPES[key]
+            if not codes:
+                raise UpbitValidationError(
+                    f"{type} 구독에는 코드가 필요합니다", field="codes")
+        elif key in _PRIVATE_TYPES:
+            type = _PRIVATE_TYPES[key]
+            if not (self.access_key and self.secret_key):
+                raise UpbitValidationError(
+                    f"{type} 구독에는 access_key와 secret_key가 필요합니다",
+                    field="type")
+        else:
+            raise UpbitValidationError(
+                f"지원하지 않는 구독 타입입니다: {type}", field="type")
+
+        subscription = Subscription(self, type, codes or [], qsize)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._rebuild()
+        self._start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독 해지. 연결에 남은 구독이 없으면 해당 연결을 닫음"""
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.remove(subscription)
+            subscription._close()
+            self._rebuild()
+
+    def _update(self, subscription: Subscription, codes: set) -> None:
+        if subscription.type in _PUBLIC_TYPES.values() and not codes:
+            raise UpbitValidationError(
+                f"{subscription.type} 구독에는 코드가 필요합니다", field="codes")
+        with self._lock:
+            subscription.codes = set(codes)
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """구독 목록으로 라우팅 표와 연결별 구독 메시지를 다시 만들고 반영 (lock 보유 상태)"""
+        routes: Dict[str, Dict[Optional[str], List[Subscription]]] = {}
+        wanted: Dict[str, set] = {}
+        for sub in self._subscriptions:
+            by_code = routes.setdefault(sub.type, {})
+            all_codes = wanted.setdefault(sub.type, set())
+            if sub.codes:
+                for code in sub.codes:
+                    # "KRW-BTC"와 "KRW-BTC.5"는 같은 경로이므로 한 번만 등록
+                    subs = by_code.setdefault(code.split(".")[0], [])
+                    if sub not in subs:
+                        subs.append(sub)
+                    if all_codes is not None:
+                        all_codes.add(code)
+            else:
+                by_code.setdefault(None, []).append(sub)
+                wanted[sub.type] = None   # 코드 제한 없음
+        # 디스패치 스레드는 잠금 없이 읽으므로 통째로 교체
+        self._routes = routes
+
+        for conn in (self._public, self._private):
+            types = _PRIVATE_TYPES if conn.private else _PUBLIC_TYPES
+            request = [{"ticket": str(uuid.uuid4())[:8]}]
+            for type in types.values():
+                if type not in wanted:
+                    continue
+                item: Dict[str, Any] = {"type": type}
+                if wanted[type]:
+                    item["codes"] = sorted(wanted[type])
+                if not conn.private:
+                    item["isOnlyRealtime"] = True
+                request.append(item)
+            if len(request) > 1:
+                request.append({"format": self.format})
+            message = json.dumps(request) if len(request) > 1 else None
+            if message is None and conn.message is None:
+                continue
+            if message is not None and conn.message is not None and \
+                    json.loads(message)[1:] == json.loads(conn.message)[1:]:
+                continue
+            conn.message = message
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._apply, conn)
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프 (백그라운드 스레드)
+    # ------------------------------------------------------------------
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(ready,), name="WebSocketHub", daemon=True)
+            self._thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._stop = asyncio.Event()
+        for conn in (self._public, self._private):
+            conn.wanted = asyncio.Event()
+        with self._lock:
+            self._loop = loop
+            for conn in (self._public, self._private):
+                self._apply(conn)
+        ready.set()
+        tasks = [loop.create_task(self._connection(conn))
+                 for conn in (self._public, self._private)]
+        try:
+            loop.run_until_complete(self._wait_closed(tasks))
+        finally:
+            loop.close()
+
+    async def _wait_closed(self, tasks) -> None:
+        await self._stop.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _apply(self, conn: _HubConnection) -> None:
+        """루프 스레드에서 바뀐 구독 메시지를 연결에 반영"""
+        if conn.message is None:
+            conn.wanted.clear()
+            if conn.websocket is not None:
+                asyncio.ensure_future(conn.websocket.close())
+            return
+        conn.wanted.set()
+        if conn.websocket is not None:
+            asyncio.ensure_future(self._send(conn, conn.message))
+
+    @staticmethod
+    async def _send(conn: _HubConnection, message: str) -> None:
+        try:
+            await conn.websocket.send(message)
+        except (AttributeError, websockets.ConnectionClosed):
+            # 재연결 시 최신 구독 메시지를 다시 보냄
+            pass
+
+    def _headers(self, conn: _HubConnection) -> Dict[str, str]:
+        if not conn.private:
+            return {}
+        return _auth_headers(self.access_key, self.secret_key)
+
+    async def _connection(self, conn: _HubConnection) -> None:
+        failures = 0
+        while True:
+            await conn.wanted.wait()
+            received = False
+            try:
+                async with websockets.connect(
+                    conn.uri, ping_interval=60,
+                    **_connect_kwargs(self._headers(conn))
+                ) as websocket:
+                    conn.websocket = websocket
+                    try:
+                        await websocket.send(conn.message)
+                    except websockets.ConnectionClosed:
+                        # 서버가 먼저 닫았어도 그 전에 보낸 에러 메시지는 읽어서 전달
+                        pass
+                    async for raw in websocket:
+                        # 에러 메시지만 받고 끊기는 연결은 실패로 보고 대기 시간을 늘림
+                        if self._dispatch(raw, conn):
+                            received = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._fail(conn, {"name": type(e).__name__, "message": str(e)})
+            finally:
+                conn.websocket = None
+            # 정상 종료(인증 실패, 잘못된 구독 등)도 끊김으로 보고 대기 후 재연결.
+            # 메시지를 받지 못한 채 끊기면 대기 시간을 두 배씩 늘림
+            if not conn.wanted.is_set():
+                failures = 0
+                continue
+            failures = 0 if received else failures + 1
+            await asyncio.sleep(_reconnect_wait(
+                self.reconnect_delay, self.reconnect_max_delay, failures))
+
+    def _fail(self, conn: _HubConnection, error: Dict[str, Any]) -> None:
+        """연결 실패/서버 에러를 기록하고 그 연결을 쓰는 구독에 에러 메시지 전달"""
+        logger.warning("WebSocketHub %s connection error: %s: %s",
+                       "private" if conn.private else "public",
+                       error.get("name"), error.get("message"))
+        message = {"error": error}
+        self.last_error = message
+        types = _PRIVATE_TYPES if conn.private else _PUBLIC_TYPES
+        with self._lock:
+            targets = [sub for sub in self._subscriptions
+                       if sub.type in types.values()]
+        for sub in targets:
+            sub._put(message)
+
+    def _dispatch(self, raw, conn: Optional[_HubConnection] = None) -> bool:
+        """받은 메시지를 타입/코드가 일치하는 구독 큐로 전달
+
+        Returns:
+            bool: 에러 메시지가 아니면 True
+        """
+        try:
+            message = self._decode(raw)
+        except Exception:
+            return True
+        if not isinstance(message, dict):
+            return True
+        if "error" in message and conn is not None:
+            # 에러 메시지에는 type이 없으므로 연결의 모든 구독에 전달
+            error = message["error"]
+            self._fail(conn, error if isinstance(error, dict)
+                       else {"name": "error", "message": str(error)})
+            return False
+        type = message.get(self._type_key)
+        by_code = self._routes.get(type)
+        if not by_code:
+            return True
+        if type == "myAsset":
+            # 코드를 지정한 구독은 여러 경로에 있으므로 한 번씩만 전달
+            targets = dict.fromkeys(sub for subs in by_code.values() for sub in subs)
+        else:
+            targets = by_code.get(message.get(self._code_key), []) + \
+                by_code.get(None, [])
+        for sub in targets:
+            sub._put(message)
+        return True
+
+    def close(self) -> None:
+        """모든 연결과 백그라운드 스레드 종료"""
+        self._closed = True
+        with self._lock:
+            for sub in self._subscriptions:
+                sub._close()
+            self._subscriptions = []
+            self._routes = {}
+            thread, loop = self._thread, self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._stop.set)
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+async def stream(
+    type: str,
+    codes: Optional[List[str]] = None,
+    access_key: Optional[str] = None,
+    secret_key: Optional[str] = None,
+    uri: Optional[str] = None,
+    is_only_realtime: bool = True,
+    reconnect_delay: Optional[float] = 1.0,
+    format: str = "DEFAULT",
+    decoder="auto",
+    expand: bool = False,
+    reconnect_max_delay: float = 30.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """현재 이벤트 루프에서 WebSocket 메시지를 받는 비동기 이터레이터
+
+    별도 프로세스나 큐 없이 호출한 코루틴의 이벤트 루프에서 직접 연결하고,
+    받은 메시지를 dict로 변환하여 바로 돌려줍니다.
+
+    Args:
+        type: 구독 타입 ("ticker", "trade", "orderbook", "myOrder", "myAsset")
+        codes: 구독할 코드 리스트 (예: ["KRW-BTC"]). myOrder/myAsset은 생략 가능
+        access_key: Upbit API Access Key (myOrder/myAsset 구독 시 필요)
+        secret_key: Upbit API Secret Key (myOrder/myAsset 구독 시 필요)
+        uri: WebSocket 주소 (기본값: 타입에 따라 공개/개인 주소)
+        is_only_realtime: 실시간 시세만 수신 (공개 타입, 기본값: True)
+        reconnect_delay: 연결이 끊겼을 때 재연결 전 대기 시간 (초, 기본값: 1.0).
+            메시지를 받지 못하고 연달아 끊기거나 연결에 실패하면 두 배씩 늘림
+            - None: 재연결하지 않음 (정상 종료 시 반복 종료, 연결 오류는 예외 전달)
+        format: 수신 포맷 ("DEFAULT" 또는 축약 필드명의 "SIMPLE", 기본값: "DEFAULT")
+        decoder: 메시지 디코더 ("auto", "orjson", "msgspec", "json" 또는 함수)
+        expand: SIMPLE 포맷의 축약 필드명을 DEFAULT 필드명으로 변환 (기본값: False)
+        reconnect_max_delay: 재연결 대기 시간의 상한 (초, 기본값: 30.0)
+
+    Yields:
+        dict: 수신된 메시지 데이터
+
+    Raises:
+        UpbitValidationError: 지원하지 않는 타입이거나, 공개 타입에 코드가 없거나,
+            개인 타입에 인증 키가 없는 경우
+
+    Examples:
+        >>> async def main():
+        ...     async for msg in stream("ticker", ["KRW-BTC", "KRW-ETH"]):
+        ...         print(msg["code"], msg["trade_price"])
+
+        >>> # 내 주문 이벤트
+        >>> async for msg in stream("myOrder", access_key=access, secret_key=secret):
+        ...     print(msg)
+
+    Note:
+        - 반복을 중단(break)하거나 태스크를 취소하면 연결이 닫힙니다
+    """
+    key = type.lower()
+    if key in _PUBLIC_TYPES:
+        private = False
+        request_item: Dict[str, Any] = {"type": _PUBLIC_TYPES[key],
+                                        "isOnlyRealtime": is_only_realtime}
+        if not codes:
+            raise UpbitValidationError(
+                f"{type} 구독에는 코드가 필요합니다", field="codes")
+    elif key in _PRIVATE_TYPES:
+        private = True
+        request_item = {"type": _PRIVATE_TYPES[key]}
+        if not (access_key and secret_key):
+            raise UpbitValidationError(
+                f"{type} 구독에는 access_key와 secret_key가 필요합니다",
+                field="type")
+    else:
+        raise UpbitValidationError(
+            f"지원하지 않는 구독 타입입니다: {type}", field="type")
+    if codes:
+        request_item["codes"] = list(codes)
+    if uri is None:
+        uri = PRIVATE_WEBSOCKET_URI if private else PUBLIC_WEBSOCKET_URI
+    format = check_format(format)
+    decode = _message_decoder(decoder, format, expand)
+
+    failures = 0
+    while True:
+        headers = _auth_headers(access_key, secret_key) if private else {}
+        received = False
+        try:
+            async with websockets.connect(
+                uri, ping_interval=60, **_connect_kwargs(headers)
+            ) as websocket:
+                request = [{"ticket": str(uuid.uuid4())[:8]}, request_item,
+                           {"format": format}]
+                try:
+                    await websocket.send(json.dumps(request))
+                except websockets.ConnectionClosed:
+                    # 서버가 먼저 닫았어도 그 전에 보낸 에러 메시지는 전달
+                    pass
+                async for raw in websocket:
+                    message = decode(raw)
+                    # 에러 메시지만 받고 끊기는 연결(인증 거부 등)은 실패로 보고 대기 시간을 늘림
+                    if not (isinstance(message, dict) and "error" in message):
+                        received = True
+                    yield message
+        except (websockets.WebSocketException, OSError):
+            # 끊김과 핸드셰이크 거부(InvalidStatus 등) 모두 재연결 대상
+            if reconnect_delay is None:
+                raise
+        if reconnect_delay is None:
+            return
+        failures = 0 if received else failures + 1
+        await asyncio.sleep(_reconnect_wait(reconnect_delay, reconnect_max_delay,
+                                            failures))
@@ -0,0 +1,223 @@
+#
+# fsfupbit - Enhanced Python wrapper for Upbit API
+#
+# Based on pyupbit (https://github.com/sharebook-kr/pyupbit)
+# Original Copyright (c) 2021 sharebook-kr
+# Modifications Copyright (c) 2025 풀스택패밀리 연구소
+#
+# Licensed under the Apache License, Version 2.0
+# See LICENSE file for the full text of the license.
+#
+
+# -*- coding: utf-8 -*-
+
+"""
+fsfupbit.ws_codec
+
+WebSocket 수신 메시지 디코더와 Upbit SIMPLE 포맷(축약 필드명) 변환 표.
+"""
+
+import json
+from typing import Any, Callable, Dict, Union
+
+from fsfupbit.errors import UpbitValidationError
+
+Decoder = Callable[[Union[bytes, memoryview, str]], Any]
+
+WEBSOCKET_FORMATS = ("DEFAULT", "SIMPLE")
+
+# SIMPLE 포맷 축약 필드명 → DEFAULT 포맷 필드명 (타입마다 같은 약어의 의미가 다를 수 있음)
+_COMMON_FIELDS = {
+    "ty": "type",
+    "cd": "code",
+    "tms": "timestamp",
+    "st": "stream_type",
+}
+
+SIMPLE_FIELDS: Dict[str, Dict[str, str]] = {
+    "ticker": {
+        **_COMMON_FIELDS,
+        "op": "opening_price",
+        "hp": "high_price",
+        "lp": "low_price",
+        "tp": "trade_price",
+        "pcp": "prev_closing_price",
+        "c": "change",
+        "cp": "change_price",
+        "scp": "signed_change_price",
+        "cr": "change_rate",
+        "scr": "signed_change_rate",
+        "tv": "trade_volume",
+        "atv": "acc_trade_volume",
+        "atv24h": "acc_trade_volume_24h",
+        "atp": "acc_trade_price",
+        "atp24h": "acc_trade_price_24h",
+        "tdt": "trade_date",
+        "ttm": "trade_time",
+        "ttms": "trade_timestamp",
+        "ab": "ask_bid",
+        "aav": "acc_ask_volume",
+        "abv": "acc_bid_volume",
+        "h52wp": "highest_52_week_price",
+        "h52wdt": "highest_52_week_date",
+        "l52wp": "lowest_52_week_price",
+        "l52wdt": "lowest_52_week_date",
+        "ts": "trade_status",
+        "ms": "market_state",
+        "msfi": "market_state_for_ios",
+        "its": "is_trading_suspended",
+        "dd": "delisting_date",
+        "mw": "market_warning",
+    },
+    "trade": {
+        **_COMMON_FIELDS,
+        "tp": "trade_price",
+        "tv": "trade_volume",
+        "ab": "ask_bid",
+        "pcp": "prev_closing_price",
+        "c": "change",
+        "cp": "change_price",
+        "td": "trade_date",
+        "ttm": "trade_time",
+        "ttms": "trade_timestamp",
+        "sid": "sequential_id",
+        "bap": "best_ask_price",
+        "bas": "best_ask_size",
+        "bbp": "best_bid_price",
+        "bbs": "best_bid_size",
+    },
+    "orderbook": {
+        **_COMMON_FIELDS,
+        "tas": "total_ask_size",
+        "tbs": "total_bid_size",
+        "obu": "orderbook_units",
+        "ap": "ask_price",
+        "bp": "bid_price",
+        "as": "ask_size",
+        "bs": "bid_size",
+        "lv": "level",
+    },
+    "myOrder": {
+        **_COMMON_FIELDS,
+        "uid": "uuid",
+        "ab": "ask_bid",
+        "ot": "order_type",
+        "s": "state",
+        "tuid": "trade_uuid",
+        "p": "price",
+        "ap": "avg_price",
+        "v": "volume",
+        "rv": "remaining_volume",
+        "ev": "executed_volume",
+        "tc": "trades_count",
+        "rsf": "reserved_fee",
+        "rmf": "remaining_fee",
+        "pf": "paid_fee",
+        "l": "locked",
+        "ef": "executed_funds",
+        "tif": "time_in_force",
+        "ttms": "trade_timestamp",
+        "otms": "order_timestamp",
+    },
+    "myAsset": {
+        **_COMMON_FIELDS,
+        "astuid": "asset_uuid",
+        "ast": "assets",
+        "cu": "currency",
+        "b": "balance",
+        "l": "locked",
+        "asttms": "asset_timestamp",
+    },
+}
+
+
+def expand_simple(message: Dict[str, Any]) -> Dict[str, Any]:
+    """SIMPLE 포맷 메시지의 축약 필드명을 DEFAULT 포맷 필드명으로 변환
+
+    orderbook_units, assets 같은 중첩 리스트도 함께 변환하며, 표에 없는 필드는
+    그대로 둡니다.
+
+    Args:
+        message: SIMPLE 포맷으로 받은 메시지 (예: {"ty": "ticker", "cd": "KRW-BTC", "tp": 1.0})
+
+    Returns:
+        dict: DEFAULT 포맷 필드명의 메시지 (예: {"type": "ticker", "code": "KRW-BTC", "trade_price": 1.0})
+    """
+    fields = SIMPLE_FIELDS.get(message.get("ty"), _COMMON_FIELDS)
+    return _rename(message, fields)
+
+
+def _rename(obj: Any, fields: Dict[str, str]) -> Any:
+    if isinstance(obj, dict):
+        return {fields.get(k, k): _rename(v, fields) if isinstance(v, list) else v
+                for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rename(item, fields) for item in obj]
+    return obj
+
+
+def _json_loads(data: Union[bytes, memoryview, str]) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def _orjson_decoder() -> Decoder:
+    import orjson
+    return orjson.loads
+
+
+def _msgspec_decoder() -> Decoder:
+    import msgspec
+    return msgspec.json.Decoder().decode
+
+
+_DECODERS: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": lambda: _json_loads,
+}
+
+
+def get_decoder(decoder: Union[str, Decoder] = "auto") -> Decoder:
+    """WebSocket 메시지 디코더 반환
+
+    Args:
+        decoder: 디코더 이름 또는 bytes를 받아 객체를 반환하는 함수 (기본값: "auto")
+            - "auto": orjson, msgspec, json 순서로 설치된 라이브러리 사용
+            - "orjson", "msgspec", "json": 지정한 라이브러리 사용
+
+    Returns:
+        bytes/memoryview/str을 받아 디코딩하는 함수
+
+    Raises:
+        UpbitValidationError: 지원하지 않는 디코더 이름인 경우
+        ImportError: 지정한 라이브러리가 설치되어 있지 않은 경우
+
+    Examples:
+        >>> decode = get_decoder()
+        >>> decode(b'{"type": "ticker"}')
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _DECODERS[name]()
+            except ImportError:
+                continue
+        return _json_loads
+    if decoder not in _DECODERS:
+        raise UpbitValidationError(
+            f"지원하지 않는 디코더입니다: {decoder}", field="decoder")
+    return _DECODERS[decoder]()
+
+
+def check_format(format: str) -> str:
+    """WebSocket 포맷 값 검증 후 대문자로 반환"""
+    format = format.upper()
+    if format not in WEBSOCKET_FORMATS:
+        raise UpbitValidationError(
+            f"format은 {', '.join(WEBSOCKET_FORMATS)} 중 하나여야 합니다",
+            field="format")
+    return format
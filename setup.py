@@ -17,6 +17,11 @@ install_requires = [
    'websockets>=10.0'
 ]
 
+extras_require = {
+   'async': ['aiohttp>=3.8.0'],
+   'fast': ['orjson>=3.6.0'],
+}
+
 with open("README.md", "r", encoding='UTF-8') as fh:
     long_description = fh.read()
 
@@ -31,6 +36,7 @@ setuptools.setup(
     url='https://github.com/urstory/fsfupbit',
     packages=setuptools.find_packages(),
     install_requires=install_requires,
+    extras_require=extras_require,
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.8",
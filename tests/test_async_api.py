@@ -0,0 +1,242 @@
+import asyncio
+import datetime
+import json
+import pytest
+
+from fsfupbit.async_api import (
+    AsyncUpbit,
+    get_ohlcv,
+    get_current_price,
+    get_orderbook,
+)
+from fsfupbit.errors import InsufficientFundsBid, ValidationError
+from fsfupbit.transport import (
+    AsyncHTTPTransport,
+    AsyncResponse,
+    set_default_async_transport,
+)
+
+REMAINING_REQ = {"Remaining-Req": "group=default; min=1800; sec=29"}
+
+
+class FakeAsyncTransport:
+    """요청을 기록하고 미리 정한 응답을 돌려주는 비동기 transport"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    async def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        status, body = self.handler(method, url, kwargs)
+        return AsyncResponse(status, REMAINING_REQ, json.dumps(body).encode())
+
+
+@pytest.fixture
+def fake_transport():
+    def install(handler):
+        transport = FakeAsyncTransport(handler)
+        set_default_async_transport(transport)
+        return transport
+    yield install
+    set_default_async_transport(None)
+
+
+# =============================================================================
+# Async Quotation Tests
+# =============================================================================
+
+class TestAsyncQuotation:
+    """비동기 시세 조회 함수 테스트"""
+
+    def test_get_current_price_single(self, fake_transport):
+        """단일 티커 현재가 조회"""
+        fake_transport(lambda m, u, kw: (200, [
+            {"market": "KRW-BTC", "trade_price": 50000000.0}]))
+
+        price = asyncio.run(get_current_price("KRW-BTC"))
+
+        assert price == 50000000.0
+
+    def test_get_current_price_slices_concurrently(self, fake_transport):
+        """200개 초과 티커는 묶음 단위로 나누어 요청"""
+        def handler(method, url, kwargs):
+            markets = kwargs["params"]["markets"]
+            return 200, [{"market": m, "trade_price": 1.0} for m in markets]
+
+        transport = fake_transport(handler)
+        tickers = [f"KRW-C{i}" for i in range(450)]
+
+        prices = asyncio.run(get_current_price(tickers))
+
+        assert len(prices) == 450
+        assert len(transport.calls) == 3
+
+    def test_get_orderbook_with_level(self, fake_transport):
+        """level 파라미터 전달 및 단일 티커 dict 반환"""
+        transport = fake_transport(lambda m, u, kw: (200, [
+            {"market": "KRW-BTC", "orderbook_units": []}]))
+
+        ob, limit = asyncio.run(
+            get_orderbook("KRW-BTC", level=10000, limit_info=True))
+
+        assert ob["market"] == "KRW-BTC"
+        assert limit["group"] == "default"
+        assert transport.calls[0][2]["params"]["level"] == "10000"
+
+    def test_get_ohlcv(self, fake_transport):
+        """캔들 조회 결과가 동기 API와 같은 컬럼으로 반환"""
+        fake_transport(lambda m, u, kw: (200, [
+            {
+                "candle_date_time_utc": "2024-01-01T15:00:00",
+                "candle_date_time_kst": "2024-01-02T00:00:00",
+                "opening_price": 100.0,
+                "high_price": 110.0,
+                "low_price": 90.0,
+                "trade_price": 105.0,
+                "candle_acc_trade_volume": 1.5,
+                "candle_acc_trade_price": 150.0
+            }
+        ]))
+
+        df = asyncio.run(get_ohlcv("KRW-BTC", interval="minute1", count=1))
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "value"]
+        assert df["close"].iloc[0] == 105.0
+
+    def test_get_ohlcv_pages_fetched_concurrently(self, fake_transport):
+        """분 캔들 200개 초과는 모든 페이지를 동시에 요청"""
+        in_flight = []
+        peak = []
+
+        class GatedTransport(FakeAsyncTransport):
+            async def request(self, method, url, **kwargs):
+                in_flight.append(1)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.pop()
+                return await super().request(method, url, **kwargs)
+
+        def handler(method, url, kwargs):
+            to = datetime.datetime.strptime(kwargs["params"]["to"], "%Y-%m-%d %H:%M:%S")
+            rows = []
+            for i in range(1, kwargs["params"]["count"] + 1):
+                t = to - datetime.timedelta(minutes=i)
+                rows.append({
+                    "candle_date_time_utc": t.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "candle_date_time_kst": (t + datetime.timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+                    "opening_price": 1.0, "high_price": 1.0, "low_price": 1.0,
+                    "trade_price": 1.0, "candle_acc_trade_volume": 1.0,
+                    "candle_acc_trade_price": 1.0,
+                })
+            return 200, rows
+
+        transport = GatedTransport(handler)
+        set_default_async_transport(transport)
+
+        df = asyncio.run(get_ohlcv("KRW-BTC", interval="minute1", count=450,
+                                   to="2024-01-02 00:00:00"))
+
+        assert len(df) == 450
+        assert df.index.is_unique and df.index.is_monotonic_increasing
+        assert len(transport.calls) == 3
+        assert max(peak) == 3
+
+    def test_get_ohlcv_error_propagates(self, fake_transport):
+        """에러 응답은 None 대신 예외로 전달"""
+        fake_transport(lambda m, u, kw: (400, {
+            "error": {"name": "validation_error", "message": "잘못된 마켓"}}))
+
+        with pytest.raises(ValidationError):
+            asyncio.run(get_ohlcv("KRW-NONE", interval="minute1", count=1))
+
+
+# =============================================================================
+# AsyncUpbit Tests
+# =============================================================================
+
+class TestAsyncUpbit:
+    """AsyncUpbit 테스트"""
+
+    def test_get_balances_signed(self, fake_transport):
+        """요청에 JWT Authorization 헤더가 포함되는지 확인"""
+        transport = fake_transport(lambda m, u, kw: (200, [
+            {"currency": "KRW", "balance": "1000", "unit_currency": "KRW"}]))
+        upbit = AsyncUpbit("test_access_key", "test_secret_key")
+
+        balance = asyncio.run(upbit.get_balance("KRW"))
+
+        assert balance == 1000.0
+        _, _, kwargs = transport.calls[0]
+        assert kwargs["headers"]["Authorization"].startswith("Bearer ")
+
+    def test_buy_limit_order_posts_json(self, fake_transport):
+        """주문은 JSON 본문으로 전송"""
+        transport = fake_transport(lambda m, u, kw: (201, {"uuid": "abc"}))
+        upbit = AsyncUpbit("test_access_key", "test_secret_key")
+
+        order = asyncio.run(upbit.buy_limit_order("KRW-BTC", 50000000, 0.001))
+
+        assert order == {"uuid": "abc"}
+        method, url, kwargs = transport.calls[0]
+        assert method == "POST"
+        assert json.loads(kwargs["data"])["ord_type"] == "limit"
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    def test_error_mapping_shared_with_sync(self, fake_transport):
+        """동기 API와 같은 예외 클래스로 매핑"""
+        fake_transport(lambda m, u, kw: (400, {
+            "error": {"name": "insufficient_funds_bid", "message": "부족"}}))
+        upbit = AsyncUpbit("test_access_key", "test_secret_key")
+
+        with pytest.raises(InsufficientFundsBid):
+            asyncio.run(upbit.get_balances())
+
+    def test_order_error_propagates(self, fake_transport, capsys):
+        """주문/취소 실패는 출력 후 None 반환이 아니라 예외로 전달"""
+        fake_transport(lambda m, u, kw: (400, {
+            "error": {"name": "insufficient_funds_bid", "message": "부족"}}))
+        upbit = AsyncUpbit("test_access_key", "test_secret_key")
+
+        with pytest.raises(InsufficientFundsBid):
+            asyncio.run(upbit.buy_limit_order("KRW-BTC", 50000000, 0.001))
+        with pytest.raises(InsufficientFundsBid):
+            asyncio.run(upbit.cancel_order("abc"))
+        assert capsys.readouterr().out == ""
+
+
+class TestAsyncHTTPTransport:
+    """aiohttp 기반 transport 테스트"""
+
+    def test_list_params_encoded_as_repeated_keys(self):
+        """리스트 파라미터가 requests와 같이 반복 키로 인코딩"""
+        web = pytest.importorskip("aiohttp.web")
+
+        async def handler(request):
+            return web.json_response(
+                {"markets": request.query.getall("markets")},
+                headers=REMAINING_REQ)
+
+        async def main():
+            app = web.Application()
+            app.router.add_get("/v1/ticker", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            transport = AsyncHTTPTransport()
+            try:
+                resp = await transport.get(
+                    f"http://127.0.0.1:{port}/v1/ticker",
+                    params={"markets": ["KRW-BTC", "KRW-ETH"]})
+            finally:
+                await transport.close()
+                await runner.cleanup()
+            return resp
+
+        resp = asyncio.run(main())
+
+        assert resp.ok
+        assert resp.json() == {"markets": ["KRW-BTC", "KRW-ETH"]}
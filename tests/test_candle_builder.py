@@ -0,0 +1,142 @@
+import datetime
+import random
+import numpy as np
+import pandas as pd
+import pytest
+
+from fsfupbit.candle_builder import CandleBuilder
+from fsfupbit.errors import UpbitValidationError
+
+
+def _ms(dt):
+    return int(dt.replace(tzinfo=datetime.timezone.utc).timestamp() * 1000)
+
+
+def _trade(dt, price, volume=1.0, sid=None, code="KRW-BTC"):
+    ts = _ms(dt)
+    return {"type": "trade", "code": code, "trade_timestamp": ts,
+            "trade_price": price, "trade_volume": volume,
+            "sequential_id": ts if sid is None else sid}
+
+
+# =============================================================================
+# CandleBuilder Tests
+# =============================================================================
+
+class TestCandleBuilder:
+    """CandleBuilder 테스트"""
+
+    START = datetime.datetime(2024, 1, 1, 0, 0)  # UTC
+
+    def test_minute_bars(self):
+        """1분 구간별 OHLCV와 KST 인덱스"""
+        builder = CandleBuilder("minute1")
+        s = self.START
+        builder.update_many([
+            _trade(s + datetime.timedelta(seconds=1), 100.0, 1.0),
+            _trade(s + datetime.timedelta(seconds=20), 105.0, 2.0),
+            _trade(s + datetime.timedelta(seconds=59), 99.0, 1.0),
+            _trade(s + datetime.timedelta(minutes=1, seconds=5), 101.0, 0.5),
+        ])
+
+        df = builder.to_frame("KRW-BTC")
+        expected_index = pd.to_datetime(["2024-01-01T09:00:00", "2024-01-01T09:01:00"],
+                                        format="%Y-%m-%dT%H:%M:%S")
+        assert df.index.equals(expected_index)
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "value"]
+        assert df.iloc[0].tolist() == [100.0, 105.0, 99.0, 99.0, 4.0, 409.0]
+        assert df.iloc[1].tolist() == [101.0, 101.0, 101.0, 101.0, 0.5, 50.5]
+
+    def test_matches_resampled_trades(self):
+        """무작위 체결로 만든 캔들이 pandas로 집계한 결과와 동일"""
+        rng = random.Random(0)
+        trades = []
+        for i in range(2000):
+            dt = self.START + datetime.timedelta(seconds=rng.randrange(0, 3 * 3600))
+            trades.append(_trade(dt, float(rng.randrange(90, 110)),
+                                 float(rng.randrange(1, 5)), sid=i))
+        trades.sort(key=lambda t: (t["trade_timestamp"], t["sequential_id"]))
+
+        builder = CandleBuilder("minute15")
+        builder.update_many(trades)
+
+        raw = pd.DataFrame(trades)
+        raw["time"] = pd.to_datetime(raw["trade_timestamp"], unit="ms") + \
+            pd.Timedelta(hours=9)
+        raw["value"] = raw["trade_price"] * raw["trade_volume"]
+        grouped = raw.groupby(raw["time"].dt.floor("15min"))
+        expected = pd.DataFrame({
+            "open": grouped["trade_price"].first(),
+            "high": grouped["trade_price"].max(),
+            "low": grouped["trade_price"].min(),
+            "close": grouped["trade_price"].last(),
+            "volume": grouped["trade_volume"].sum(),
+            "value": grouped["value"].sum(),
+        })
+
+        df = builder.to_frame("KRW-BTC")
+        np.testing.assert_allclose(df.values, expected.values)
+        assert (df.index.values.astype("datetime64[ms]") ==
+                expected.index.values.astype("datetime64[ms]")).all()
+
+    @pytest.mark.parametrize("interval,trade_time,bar_kst", [
+        ("seconds/5", datetime.datetime(2024, 1, 1, 0, 0, 7), "2024-01-01 09:00:05"),
+        ("minute240", datetime.datetime(2024, 1, 1, 5, 30), "2024-01-01 13:00:00"),
+        ("day", datetime.datetime(2024, 1, 1, 23, 0), "2024-01-01 09:00:00"),
+        ("week", datetime.datetime(2024, 1, 3, 12, 0), "2024-01-01 09:00:00"),
+        ("month", datetime.datetime(2024, 2, 20, 1, 0), "2024-02-01 09:00:00"),
+        ("year", datetime.datetime(2024, 7, 1), "2024-01-01 09:00:00"),
+    ])
+    def test_bucket_alignment(self, interval, trade_time, bar_kst):
+        """Upbit 캔들과 같은 UTC 기준 구간 시작 시각"""
+        builder = CandleBuilder(interval)
+        builder.update(_trade(trade_time, 1.0))
+        assert builder.to_frame("KRW-BTC").index[0] == pd.Timestamp(bar_kst)
+
+    def test_duplicate_and_late_trades(self):
+        """중복 체결은 무시하고, 늦게 도착한 체결은 지난 캔들에 반영"""
+        builder = CandleBuilder("minute1")
+        s = self.START
+        builder.update(_trade(s + datetime.timedelta(seconds=30), 100.0, sid=1))
+        builder.update(_trade(s + datetime.timedelta(minutes=2), 102.0, sid=3))
+        assert builder.update(_trade(s + datetime.timedelta(seconds=30), 100.0, sid=1)) is None
+        # 먼저 체결되었지만 늦게 도착: 시가를 바꿈
+        builder.update(_trade(s + datetime.timedelta(seconds=10), 98.0, sid=0))
+        # 비어 있던 1분 구간 사이에 끼워 넣음
+        builder.update(_trade(s + datetime.timedelta(minutes=1), 101.0, sid=2))
+
+        df = builder.to_frame("KRW-BTC")
+        assert len(df) == 3
+        assert df.iloc[0]["open"] == 98.0
+        assert df.iloc[0]["close"] == 100.0
+        assert df.iloc[0]["volume"] == 2.0
+        assert df["close"].tolist() == [100.0, 101.0, 102.0]
+
+    def test_ring_buffer_keeps_recent(self):
+        """size보다 많은 캔들은 오래된 것부터 버리고 배열 뷰는 연속"""
+        builder = CandleBuilder("seconds/1", size=10)
+        for i in range(35):
+            builder.update(_trade(self.START + datetime.timedelta(seconds=i), float(i)))
+
+        values = builder.values("KRW-BTC")
+        assert values.shape == (10, 6)
+        assert values[:, 3].tolist() == [float(i) for i in range(25, 35)]
+        assert np.shares_memory(values, builder._bars["KRW-BTC"].values)
+        # 버퍼보다 오래된 체결은 무시
+        assert builder.update(_trade(self.START, 0.0, sid=-1)) is None
+
+    def test_simple_format_and_other_messages(self):
+        """SIMPLE 포맷 체결 반영, 체결이 아닌 메시지는 무시"""
+        builder = CandleBuilder("minute1")
+        builder.update({"ty": "trade", "cd": "KRW-ETH", "ttms": _ms(self.START),
+                        "tp": 10.0, "tv": 2.0, "sid": 1})
+        assert builder.update({"type": "ticker", "code": "KRW-ETH",
+                               "trade_timestamp": _ms(self.START),
+                               "trade_price": 1.0, "trade_volume": 1.0}) is None
+        assert builder.update("ConnectionClosedError") is None
+        assert builder.to_frame("KRW-ETH")["value"].iloc[0] == 20.0
+
+    def test_unknown_market(self):
+        """체결이 없는 마켓 조회 검증"""
+        with pytest.raises(UpbitValidationError):
+            CandleBuilder().to_frame("KRW-BTC")
@@ -0,0 +1,237 @@
+import datetime
+import os
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from fsfupbit.candle_store import FIELDS, CandleStore
+
+
+def _frame(start, n, width=datetime.timedelta(minutes=1), base=0.0):
+    """get_ohlcv 형식의 캔들 DataFrame 생성 (KST 인덱스)"""
+    index = [start + width * i for i in range(n)]
+    prices = [base + i for i in range(n)]
+    return pd.DataFrame({
+        "open": prices,
+        "high": prices,
+        "low": prices,
+        "close": prices,
+        "volume": [1.0] * n,
+        "value": prices,
+    }, index=index)
+
+
+KST_NOW = datetime.datetime(2024, 1, 1, 12, 0, 30)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(str(tmp_path))
+
+
+# =============================================================================
+# CandleStore Tests
+# =============================================================================
+
+class TestCandleStore:
+    """CandleStore 테스트"""
+
+    def test_save_and_load_roundtrip(self, store):
+        """저장한 캔들을 그대로 읽어옴"""
+        df = _frame(datetime.datetime(2024, 1, 1, 9), 10)
+        store.save("KRW-BTC", "minute1", df)
+
+        loaded = store.load("KRW-BTC", "minute1")
+
+        assert list(loaded.columns) == ["open", "high", "low", "close", "volume", "value"]
+        assert (loaded.index == df.index).all()
+        assert (loaded["close"].values == df["close"].values).all()
+
+    def test_load_count_reads_tail(self, store):
+        """count를 지정하면 최근 캔들만 읽음"""
+        df = _frame(datetime.datetime(2024, 1, 1, 9), 10)
+        store.save("KRW-BTC", "minute1", df)
+
+        loaded = store.load("KRW-BTC", "minute1", count=3)
+
+        assert len(loaded) == 3
+        assert (loaded.index == df.index[-3:]).all()
+
+    def test_columnar_layout(self, store):
+        """컬럼마다 별도 파일로 저장하고 필요한 컬럼만 읽음"""
+        df = _frame(datetime.datetime(2024, 1, 1, 9), 10)
+        store.save("KRW-BTC", "minute1", df)
+        directory = store._dir("KRW-BTC", "minute1")
+
+        assert sorted(os.listdir(directory)) == sorted(
+            f"{name}.npy" for name in ["time"] + FIELDS)
+        # 종가만 읽으면 다른 컬럼 파일은 열지 않음
+        os.remove(os.path.join(directory, "open.npy"))
+        closes = store.load("KRW-BTC", "minute1", count=4, columns=["close"])
+        assert list(closes.columns) == ["close"]
+        assert list(closes["close"]) == [6.0, 7.0, 8.0, 9.0]
+
+    def test_append_rewrites_only_tail(self, store):
+        """덧붙일 때 겹치는 캔들만 교체하고 앞쪽 데이터와 파일은 유지"""
+        start = datetime.datetime(2024, 1, 1, 9)
+        store.save("KRW-BTC", "minute1", _frame(start, 10))
+        file = os.path.join(store._dir("KRW-BTC", "minute1"), "close.npy")
+        inode = os.stat(file).st_ino
+        with open(file, "rb") as f:
+            head = f.read(os.path.getsize(file) - 2 * 8)
+
+        stored = store.append("KRW-BTC", "minute1",
+                              _frame(start + datetime.timedelta(minutes=9), 5, base=100.0))
+
+        assert stored == 14
+        assert os.stat(file).st_ino == inode
+        with open(file, "rb") as f:
+            after = f.read()
+        # 헤더 이후 앞쪽 8개 값은 바이트 단위로 그대로
+        header_len = len(head) - 8 * 8
+        assert after[header_len:len(head)] == head[header_len:]
+        loaded = store.load("KRW-BTC", "minute1")
+        assert len(loaded) == 14
+        assert loaded["close"].iloc[9] == 100.0
+        assert loaded.index.is_unique
+
+        # 줄어드는 경우에도 파일이 일관됨
+        assert store.append("KRW-BTC", "minute1",
+                            _frame(start + datetime.timedelta(minutes=2), 1)) == 3
+        assert len(store.load("KRW-BTC", "minute1")) == 3
+
+    def test_interval_aliases_share_file(self, store):
+        """day와 days는 같은 파일을 사용"""
+        df = _frame(datetime.datetime(2024, 1, 1, 9), 3,
+                    width=datetime.timedelta(days=1))
+        store.save("KRW-BTC", "day", df)
+        assert store.load("KRW-BTC", "days") is not None
+
+    def test_load_missing(self, store):
+        """저장된 데이터가 없으면 None"""
+        assert store.load("KRW-BTC", "minute1") is None
+
+    @patch('fsfupbit.candle_store.get_ohlcv')
+    def test_first_call_fetches_full_range(self, mock_get_ohlcv, store):
+        """처음 조회할 때는 전체 구간을 받아 저장"""
+        df = _frame(datetime.datetime(2024, 1, 1, 8, 21), 200)
+        mock_get_ohlcv.return_value = df
+
+        result = store.get_ohlcv("KRW-BTC", "minute1", count=200)
+
+        assert len(result) == 200
+        assert mock_get_ohlcv.call_args.kwargs["count"] == 200
+        assert store.load("KRW-BTC", "minute1") is not None
+
+    @patch('fsfupbit.candle_store._now_kst', return_value=KST_NOW)
+    @patch('fsfupbit.candle_store.get_ohlcv')
+    def test_incremental_refresh(self, mock_get_ohlcv, _, store):
+        """두 번째 조회는 마지막 캔들 이후만 받고, 마지막 캔들은 갱신"""
+        cached = _frame(datetime.datetime(2024, 1, 1, 11, 0), 58)  # 11:00 ~ 11:57
+        store.save("KRW-BTC", "minute1", cached)
+
+        fresh = _frame(datetime.datetime(2024, 1, 1, 11, 57), 4, base=1000.0)
+        mock_get_ohlcv.return_value = fresh
+
+        result = store.get_ohlcv("KRW-BTC", "minute1", count=50)
+
+        # 11:57 ~ 12:00 → 4개
+        assert mock_get_ohlcv.call_args.kwargs["count"] == 4
+        assert len(result) == 50
+        assert result.index[-1] == datetime.datetime(2024, 1, 1, 12, 0)
+        # 진행 중이던 11:57 캔들은 새로 받은 값으로 교체
+        assert result.loc[datetime.datetime(2024, 1, 1, 11, 57), "close"] == 1000.0
+        assert result.index.is_unique
+
+        stored = store.load("KRW-BTC", "minute1")
+        assert len(stored) == 61
+
+    @patch('fsfupbit.candle_store._now_kst', return_value=KST_NOW)
+    @patch('fsfupbit.candle_store.get_ohlcv')
+    def test_backfill_when_cache_is_short(self, mock_get_ohlcv, _, store):
+        """저장된 캔들이 요청 개수보다 적으면 더 오래된 캔들을 받음"""
+        cached = _frame(datetime.datetime(2024, 1, 1, 11, 50), 11)  # 11:50 ~ 12:00
+        store.save("KRW-BTC", "minute1", cached)
+
+        fresh = _frame(datetime.datetime(2024, 1, 1, 12, 0), 1)
+        older = _frame(datetime.datetime(2024, 1, 1, 11, 30), 20)   # 11:30 ~ 11:49
+        mock_get_ohlcv.side_effect = [fresh, older]
+
+        result = store.get_ohlcv("KRW-BTC", "minute1", count=31)
+
+        assert len(result) == 31
+        assert result.index[0] == datetime.datetime(2024, 1, 1, 11, 30)
+        # 백필 요청의 to는 가장 오래된 캔들의 UTC 시각
+        backfill = mock_get_ohlcv.call_args_list[1].kwargs
+        assert backfill["to"] == datetime.datetime(2024, 1, 1, 2, 50)
+        assert backfill["count"] == 20
+
+    @patch('fsfupbit.candle_store.get_ohlcv', return_value=None)
+    def test_fetch_failure_returns_none(self, _, store):
+        """조회에 실패하면 None"""
+        assert store.get_ohlcv("KRW-BTC", "minute1") is None
+
+
+# =============================================================================
+# CandleStore.get_ohlcv_from Tests
+# =============================================================================
+
+def _utc(kst):
+    return (kst - datetime.timedelta(hours=9)).replace(tzinfo=datetime.timezone.utc)
+
+
+class TestCandleStoreRange:
+    """기간 조회 테스트 (시각은 모두 KST)"""
+
+    @patch('fsfupbit.candle_store.get_ohlcv_from')
+    def test_first_call_fetches_range(self, mock_from, store):
+        """처음에는 요청 구간 전체를 받아 저장"""
+        mock_from.return_value = _frame(datetime.datetime(2024, 1, 1, 9, 0), 60)
+
+        result = store.get_ohlcv_from("KRW-BTC", "minute1",
+                                      _utc(datetime.datetime(2024, 1, 1, 9, 0)),
+                                      _utc(datetime.datetime(2024, 1, 1, 10, 0)))
+
+        assert len(result) == 60
+        assert mock_from.call_count == 1
+        assert len(store.load("KRW-BTC", "minute1")) == 60
+
+    @patch('fsfupbit.candle_store.get_ohlcv_from')
+    def test_cached_range_not_refetched(self, mock_from, store):
+        """저장된 구간 안의 조회는 요청하지 않고 파일에서 잘라 반환"""
+        store.save("KRW-BTC", "minute1", _frame(datetime.datetime(2024, 1, 1, 9, 0), 60))
+
+        result = store.get_ohlcv_from("KRW-BTC", "minute1",
+                                      _utc(datetime.datetime(2024, 1, 1, 9, 10)),
+                                      _utc(datetime.datetime(2024, 1, 1, 9, 20)))
+
+        mock_from.assert_not_called()
+        assert len(result) == 10
+        assert result.index[0] == datetime.datetime(2024, 1, 1, 9, 10)
+        assert result.index[-1] == datetime.datetime(2024, 1, 1, 9, 19)
+
+    @patch('fsfupbit.candle_store.get_ohlcv_from')
+    def test_fetches_only_missing_edges(self, mock_from, store):
+        """저장된 구간 앞/뒤의 빠진 부분만 요청"""
+        store.save("KRW-BTC", "minute1", _frame(datetime.datetime(2024, 1, 1, 9, 30), 30))
+        newer = _frame(datetime.datetime(2024, 1, 1, 9, 59), 11, base=1000.0)   # 9:59 ~ 10:09
+        older = _frame(datetime.datetime(2024, 1, 1, 9, 0), 30, base=-100.0)    # 9:00 ~ 9:29
+        mock_from.side_effect = [newer, older]
+
+        result = store.get_ohlcv_from("KRW-BTC", "minute1",
+                                      _utc(datetime.datetime(2024, 1, 1, 9, 0)),
+                                      _utc(datetime.datetime(2024, 1, 1, 10, 10)))
+
+        tail, head = (c.kwargs for c in mock_from.call_args_list)
+        assert tail["fromDatetime"] == _utc(datetime.datetime(2024, 1, 1, 9, 59))
+        assert head["to"] == _utc(datetime.datetime(2024, 1, 1, 9, 30))
+        assert len(result) == 70
+        assert result.index.is_unique and result.index.is_monotonic_increasing
+        # 진행 중이던 9:59 캔들은 새로 받은 값으로 교체
+        assert result.loc[datetime.datetime(2024, 1, 1, 9, 59), "close"] == 1000.0
+        assert len(store.load("KRW-BTC", "minute1")) == 70
+
+    @patch('fsfupbit.candle_store.get_ohlcv_from', return_value=None)
+    def test_fetch_failure_returns_none(self, _, store):
+        """조회에 실패하면 None"""
+        assert store.get_ohlcv_from("KRW-BTC", "minute1") is None
@@ -0,0 +1,206 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fsfupbit.coalesce import (
+    RequestCoalescer, get_request_coalescer, request_key, set_request_coalescer,
+)
+from fsfupbit.errors import InsufficientFundsBid
+from fsfupbit.request_api import _call_public_api
+from fsfupbit.transport import HTTPTransport
+
+
+def _gated(result=None, error=None):
+    """gate가 열릴 때까지 블록하는 요청 함수와 호출 횟수"""
+    gate = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        gate.wait(5)
+        if error is not None:
+            raise error
+        return result
+
+    return fn, gate, calls
+
+
+def _run(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+# =============================================================================
+# RequestCoalescer Tests
+# =============================================================================
+
+class TestRequestCoalescer:
+    """동시 요청 병합과 micro-TTL 테스트"""
+
+    def test_request_key(self):
+        """리스트 파라미터와 키워드 순서"""
+        a = request_key("u", {"markets": ["KRW-BTC", "KRW-ETH"], "level": "0"})
+        b = request_key("u", {"level": "0", "markets": ["KRW-BTC", "KRW-ETH"]})
+        c = request_key("u", {"markets": ["KRW-ETH", "KRW-BTC"], "level": "0"})
+        assert a == b
+        assert a != c
+        assert request_key("u", {}, "t1") != request_key("u", {}, "t2")
+        hash(a)
+
+    def test_concurrent_calls_share_one_request(self):
+        """같은 키의 동시 호출은 한 번만 실행"""
+        coalescer = RequestCoalescer()
+        fn, gate, calls = _gated(result={"price": 1})
+        threads, results, _ = _run(20, lambda: coalescer.call("k", fn))
+        time.sleep(0.05)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r == {"price": 1} for r in results)
+
+        # 끝난 뒤의 호출은 다시 전송
+        coalescer.call("k", fn)
+        assert len(calls) == 2
+
+    def test_different_keys_not_merged(self):
+        coalescer = RequestCoalescer()
+        assert coalescer.call("a", lambda: 1) == 1
+        assert coalescer.call("b", lambda: 2) == 2
+
+    def test_error_shared_and_not_stored(self):
+        """실패는 기다리던 호출에도 전달되고 보관되지 않음"""
+        coalescer = RequestCoalescer(ttl=60)
+        fn, gate, calls = _gated(error=ValueError("boom"))
+        threads, _, errors = _run(5, lambda: coalescer.call("k", fn))
+        time.sleep(0.05)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert coalescer.call("k", lambda: "ok") == "ok"
+
+    def test_waiters_get_fresh_exceptions(self):
+        """기다리던 호출은 각자 새 예외 객체를 받고 원래 예외는 __cause__로 연결"""
+        coalescer = RequestCoalescer()
+        original = InsufficientFundsBid(message="부족")
+        fn, gate, calls = _gated(error=original)
+        threads, _, errors = _run(5, lambda: coalescer.call("k", fn))
+        time.sleep(0.05)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len({id(e) for e in errors}) == 5
+        waiters = [e for e in errors if e is not original]
+        assert len(waiters) == 4
+        for e in waiters:
+            assert type(e) is InsufficientFundsBid
+            assert str(e) == str(original)
+            assert e.__cause__ is original
+
+    def test_ttl(self):
+        """ttl 동안 결과 재사용, 지나면 다시 전송"""
+        coalescer = RequestCoalescer(ttl=0.05)
+        fn = MagicMock(side_effect=[1, 2])
+        assert coalescer.call("k", fn) == 1
+        assert coalescer.call("k", fn) == 1
+        time.sleep(0.06)
+        assert coalescer.call("k", fn) == 2
+        assert fn.call_count == 2
+
+        coalescer.clear()
+        fn.side_effect = [3]
+        assert coalescer.call("k", fn) == 3
+
+    def test_max_entries(self):
+        coalescer = RequestCoalescer(ttl=60, max_entries=2)
+        for key in ("a", "b", "c"):
+            coalescer.call(key, lambda: key)
+        assert list(coalescer._fresh) == ["b", "c"]
+
+    def test_disabled(self):
+        coalescer = RequestCoalescer(ttl=60, enabled=False)
+        fn = MagicMock(return_value=1)
+        coalescer.call("k", fn)
+        coalescer.call("k", fn)
+        assert fn.call_count == 2
+
+    def test_set_request_coalescer(self):
+        custom = RequestCoalescer(ttl=1)
+        set_request_coalescer(custom)
+        try:
+            assert get_request_coalescer() is custom
+        finally:
+            set_request_coalescer(None)
+        assert get_request_coalescer() is not custom
+        assert get_request_coalescer().ttl == 0
+
+
+# =============================================================================
+# _call_public_api Tests
+# =============================================================================
+
+def _response(body):
+    resp = MagicMock()
+    resp.json.side_effect = lambda: [dict(x) for x in body]
+    resp.headers = {"Remaining-Req": "group=ticker; min=1800; sec=29"}
+    return resp
+
+
+class TestCallPublicApiCoalescing:
+    """_call_public_api 동시 요청 병합"""
+
+    def test_concurrent_identical_calls(self):
+        transport = HTTPTransport(rate_limiter=None, retry=None)
+        gate = threading.Event()
+        body = [{"market": "KRW-BTC", "trade_price": 1.0}]
+
+        def send(*args, **kwargs):
+            gate.wait(5)
+            return _response(body)
+
+        url = "https://api.upbit.com/v1/ticker"
+        with patch.object(transport.session, "request", side_effect=send) as mock:
+            threads, results, _ = _run(
+                20, lambda: _call_public_api(url, transport=transport, markets="KRW-BTC"))
+            time.sleep(0.05)
+            gate.set()
+            for t in threads:
+                t.join()
+
+        assert mock.call_count == 1
+        assert all(r[0] == body for r in results)
+        assert all(r[1]["group"] == "ticker" for r in results)
+        # 결과 객체는 호출마다 따로 파싱
+        assert results[0][0] is not results[1][0]
+
+    def test_different_transports_not_merged(self):
+        url = "https://api.upbit.com/v1/ticker"
+        set_request_coalescer(RequestCoalescer(ttl=60))
+        try:
+            for _ in range(2):
+                transport = HTTPTransport(rate_limiter=None, retry=None)
+                with patch.object(transport.session, "request",
+                                  return_value=_response([])) as mock:
+                    _call_public_api(url, transport=transport, markets="KRW-BTC")
+                    _call_public_api(url, transport=transport, markets="KRW-BTC")
+                assert mock.call_count == 1
+        finally:
+            set_request_coalescer(None)
@@ -0,0 +1,166 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from fsfupbit.async_api import AsyncUpbit
+from fsfupbit.endpoints import (
+    CANDLE_PATHS, ENDPOINTS, UPBIT_API_URL, Endpoints, get_endpoints, set_base_url,
+)
+from fsfupbit.exchange_api import Upbit
+from fsfupbit.quotation_api import get_current_price, get_tickers, get_url_ohlcv
+from fsfupbit.transport import (
+    HTTPTransport, get_default_transport, set_default_transport,
+)
+
+PROXY = "http://cache.internal:8080"
+
+
+@pytest.fixture
+def restore_base_url():
+    yield
+    set_base_url(None)
+
+
+# =============================================================================
+# Endpoints Tests
+# =============================================================================
+
+class TestEndpoints:
+    """Endpoints URL 표 테스트"""
+
+    def test_default_base_url(self):
+        """기본 주소는 api.upbit.com"""
+        endpoints = Endpoints()
+        assert endpoints.base_url == UPBIT_API_URL
+        assert endpoints.url("ticker") == "https://api.upbit.com/v1/ticker"
+        assert endpoints.url("deposits") == "https://api.upbit.com/v1/deposits"
+
+    def test_custom_base_url(self):
+        """모든 경로에 지정한 주소를 붙이고 끝의 슬래시는 제거"""
+        endpoints = Endpoints(PROXY + "/")
+        for name, path in ENDPOINTS.items():
+            assert endpoints.url(name) == PROXY + path
+
+    def test_unknown_name(self):
+        """등록되지 않은 이름은 KeyError"""
+        with pytest.raises(KeyError):
+            Endpoints().url("no_such_endpoint")
+
+    @pytest.mark.parametrize("interval, path", [
+        ("day", "/v1/candles/days"),
+        ("days", "/v1/candles/days"),
+        ("minute1", "/v1/candles/minutes/1"),
+        ("minutes60", "/v1/candles/minutes/60"),
+        ("minute240", "/v1/candles/minutes/240"),
+        ("week", "/v1/candles/weeks"),
+        ("months", "/v1/candles/months"),
+        ("year", "/v1/candles/years"),
+        ("seconds/1", "/v1/candles/seconds/1"),
+        ("seconds/7", "/v1/candles/seconds/7"),
+        ("unknown", "/v1/candles/days"),
+    ])
+    def test_candle_url(self, interval, path):
+        """interval별 캔들 URL (알 수 없는 interval은 일 캔들)"""
+        assert Endpoints(PROXY).candle_url(interval) == PROXY + path
+
+    def test_candle_paths_cover_aliases(self):
+        """단수/복수 별칭이 같은 경로"""
+        assert CANDLE_PATHS["minute5"] == CANDLE_PATHS["minutes5"]
+        assert CANDLE_PATHS["week"] == CANDLE_PATHS["weeks"]
+
+
+# =============================================================================
+# Base URL Tests
+# =============================================================================
+
+class TestBaseUrl:
+    """프로세스/클라이언트 기본 주소 테스트"""
+
+    def test_set_base_url(self, restore_base_url):
+        """set_base_url은 시세 조회 URL을 바꾸고 None이면 복원"""
+        set_base_url(PROXY)
+        assert get_endpoints().base_url == PROXY
+        assert get_url_ohlcv("minute1") == PROXY + "/v1/candles/minutes/1"
+
+        set_base_url(None)
+        assert get_url_ohlcv("minute1") == "https://api.upbit.com/v1/candles/minutes/1"
+
+    @patch('fsfupbit.market_registry._call_public_api')
+    @patch('fsfupbit.quotation_api._call_public_api')
+    def test_quotation_uses_base_url(self, mock_api, mock_registry_api, restore_base_url):
+        """시세 조회 함수는 프로세스 기본 주소로 요청"""
+        mock_api.return_value = ([{"market": "KRW-BTC", "trade_price": 1.0}], {})
+        mock_registry_api.return_value = ([{"market": "KRW-BTC"}], {})
+        set_base_url(PROXY)
+
+        get_current_price("KRW-BTC")
+        assert mock_api.call_args[0][0] == PROXY + "/v1/ticker"
+
+        get_tickers()
+        assert mock_registry_api.call_args[0][0] == PROXY + "/v1/market/all"
+
+    @patch('fsfupbit.exchange_api._send_get_request')
+    def test_client_base_url(self, mock_request, restore_base_url):
+        """클라이언트 base_url은 프로세스 기본 주소보다 우선"""
+        mock_request.return_value = ([], {})
+        set_base_url("http://other:9000")
+        upbit = Upbit("test_access_key", "test_secret_key", base_url=PROXY)
+
+        upbit.get_balances()
+        assert mock_request.call_args[0][0] == PROXY + "/v1/accounts"
+
+        upbit.set_base_url(None)
+        upbit.get_balances()
+        assert mock_request.call_args[0][0] == "http://other:9000/v1/accounts"
+
+    def test_async_client_base_url(self):
+        """AsyncUpbit도 base_url로 요청"""
+        upbit = AsyncUpbit("test_access_key", "test_secret_key", base_url=PROXY)
+        with patch('fsfupbit.async_api._send_request') as mock_send:
+            async def send(method, url, **kwargs):
+                return [], {}
+            mock_send.side_effect = send
+            asyncio.run(upbit.get_balances())
+
+        assert mock_send.call_args[0][1] == PROXY + "/v1/accounts"
+
+    @patch('fsfupbit.exchange_api._send_get_request')
+    def test_base_url_precedence(self, mock_request, restore_base_url):
+        """클라이언트 base_url > transport base_url > set_base_url() 순서"""
+        mock_request.return_value = ([], {})
+        sim = "http://127.0.0.1:9999"
+        set_base_url(PROXY)
+        transport = HTTPTransport(base_url=sim, rate_limiter=None)
+
+        assert get_endpoints(transport).base_url == sim
+        assert get_endpoints(HTTPTransport(rate_limiter=None)).base_url == PROXY
+
+        upbit = Upbit("test_access_key", "test_secret_key", transport=transport)
+        upbit.get_balances()
+        assert mock_request.call_args[0][0] == sim + "/v1/accounts"
+
+        upbit.set_base_url("http://client:1")
+        upbit.get_balances()
+        assert mock_request.call_args[0][0] == "http://client:1/v1/accounts"
+
+    @patch('fsfupbit.quotation_api._call_public_api')
+    def test_default_transport_base_url(self, mock_api, restore_base_url):
+        """기본 transport의 base_url은 set_base_url()보다 우선"""
+        mock_api.return_value = ([{"market": "KRW-BTC", "trade_price": 1.0}], {})
+        previous = get_default_transport()
+        set_base_url(PROXY)
+        set_default_transport(HTTPTransport(base_url="http://127.0.0.1:9999/"))
+        try:
+            get_current_price("KRW-BTC")
+        finally:
+            set_default_transport(previous)
+        assert mock_api.call_args[0][0] == "http://127.0.0.1:9999/v1/ticker"
+
+    def test_transport_does_not_rewrite_urls(self):
+        """transport는 받은 URL을 그대로 전송"""
+        transport = HTTPTransport(base_url="http://127.0.0.1:9999",
+                                  rate_limiter=None, retry=None)
+        with patch.object(transport.session, "request") as mock:
+            transport.get(UPBIT_API_URL + "/v1/ticker")
+        assert mock.call_args[0][1] == UPBIT_API_URL + "/v1/ticker"
+        assert transport.base_url == "http://127.0.0.1:9999"
@@ -188,3 +188,112 @@ class TestUpbitOrderError:
         """Exception 상속 확인"""
         error = UpbitOrderError("Test")
         assert isinstance(error, Exception)
+
+
+# =============================================================================
+# Error Registry Tests
+# =============================================================================
+
+def _error_response(status_code, name=None, message="", text="", headers=None):
+    mock = Mock(spec=Response)
+    mock.status_code = status_code
+    mock.ok = False
+    mock.text = text
+    mock.headers = headers or {}
+    mock.json.return_value = {"error": {"name": name, "message": message}}
+    return mock
+
+
+class TestErrorRegistry:
+    """(상태 코드, 에러 이름) 예외 클래스 등록 테스트"""
+
+    def test_instance_carries_context(self):
+        """예외 인스턴스에 서버 메시지, 이름, Remaining-Req 정보 포함"""
+        resp = _error_response(
+            400, "insufficient_funds_bid", "주문가능한 금액(KRW)이 부족합니다.",
+            headers={"Remaining-Req": "group=order; min=479; sec=7"})
+
+        with pytest.raises(InsufficientFundsBid) as exc:
+            error_handler(lambda: resp)()
+
+        assert exc.value.name == "insufficient_funds_bid"
+        assert exc.value.message == "주문가능한 금액(KRW)이 부족합니다."
+        assert exc.value.remaining_req == {"group": "order", "min": 479, "sec": 7}
+        assert str(exc.value) == InsufficientFundsBid.msg
+
+    def test_too_many_requests_does_not_parse_json(self):
+        """429 응답은 본문을 JSON으로 파싱하지 않음"""
+        resp = _error_response(429, text="Too many API requests.",
+                               headers={"Remaining-Req": "group=default; min=1800; sec=0"})
+
+        with pytest.raises(TooManyRequests) as exc:
+            error_handler(lambda: resp)()
+
+        resp.json.assert_not_called()
+        assert exc.value.remaining_req["sec"] == 0
+
+    def test_unknown_too_many_requests_text(self):
+        """알 수 없는 429 본문도 TooManyRequests"""
+        resp = _error_response(429, text="rate limited")
+
+        with pytest.raises(TooManyRequests) as exc:
+            error_handler(lambda: resp)()
+        assert exc.value.message == "rate limited"
+        assert exc.value.remaining_req is None
+
+    def test_unknown_name_falls_back_to_upbit_error(self):
+        """등록되지 않은 에러 이름은 UpbitError"""
+        resp = _error_response(400, "new_upbit_error", "새 에러")
+
+        with pytest.raises(UpbitError) as exc:
+            error_handler(lambda: resp)()
+        assert exc.value.name == "new_upbit_error"
+        assert exc.value.code == 400
+        assert exc.value.message == "새 에러"
+        assert str(exc.value) == "새 에러"
+
+    def test_unknown_message_with_braces(self):
+        """서버 메시지의 중괄호를 형식 문자열로 해석하지 않음"""
+        resp = _error_response(400, "new_upbit_error", "bad param {market}")
+
+        with pytest.raises(UpbitError) as exc:
+            error_handler(lambda: resp)()
+        assert str(exc.value) == "bad param {market}"
+
+    def test_non_json_body(self):
+        """JSON이 아닌 에러 본문도 UpbitError"""
+        resp = _error_response(502)
+        resp.json.side_effect = ValueError("not json")
+
+        with pytest.raises(UpbitError) as exc:
+            error_handler(lambda: resp)()
+        assert exc.value.code == 502
+
+    def test_register_error(self):
+        """실행 중 새 에러 이름 등록"""
+        from fsfupbit.errors import UpbitBadRequestError, _ERROR_REGISTRY
+
+        @register_error
+        class MarketOffline(UpbitBadRequestError):
+            name = "market_offline"
+            code = 400
+            msg = "거래 가능한 마켓이 아닙니다."
+
+        try:
+            resp = _error_response(400, "market_offline", "offline")
+            with pytest.raises(MarketOffline) as exc:
+                error_handler(lambda: resp)()
+            assert exc.value.message == "offline"
+            from fsfupbit import errors
+            assert MarketOffline in errors.BAD_REQUESTS
+            assert MarketOffline not in errors.UNAUTHORIZED
+
+            register_error(MarketOffline, name="market_closed")
+            resp = _error_response(400, "market_closed")
+            with pytest.raises(MarketOffline):
+                error_handler(lambda: resp)()
+        finally:
+            _ERROR_REGISTRY.pop((400, "market_offline"), None)
+            _ERROR_REGISTRY.pop((400, "market_closed"), None)
+        from fsfupbit import errors
+        assert MarketOffline not in errors.BAD_REQUESTS
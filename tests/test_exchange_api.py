@@ -93,17 +93,19 @@ class TestWithdrawCoinNetType:
 class TestDepositURLFix:
     """입금 API URL 오타 수정 테스트"""
 
-    def test_deposit_list_url_is_correct(self):
+    @patch('fsfupbit.exchange_api._send_get_request')
+    def test_deposit_list_url_is_correct(self, mock_request):
         """get_deposit_list 함수가 올바른 URL을 사용하는지 확인"""
-        import inspect
-        source = inspect.getsource(Upbit.get_deposit_list)
+        mock_request.return_value = ([], {})
+        upbit = Upbit("test_access_key", "test_secret_key")
 
+        upbit.get_deposit_list("BTC")
+
+        url = mock_request.call_args[0][0]
         # URL에 //v1 (이중 슬래시)이 없는지 확인
-        assert "api.upbit.com//v1" not in source, \
+        assert "api.upbit.com//v1" not in url, \
             "입금 API URL에 이중 슬래시 오타가 있습니다: //v1 → /v1"
-
-        # 올바른 URL이 포함되어 있는지 확인
-        assert "api.upbit.com/v1/deposits" in source, \
+        assert url == "https://api.upbit.com/v1/deposits", \
             "입금 API URL이 올바르지 않습니다: https://api.upbit.com/v1/deposits"
 
 
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+import fsfupbit
+
+
+def _loaded_modules(code):
+    """새 인터프리터에서 code 실행 후 로드된 무거운 모듈 목록"""
+    script = (
+        code + "\nimport sys\n"
+        "print(','.join(m for m in ('pandas', 'numpy', 'websockets', 'jwt', "
+        "'asyncio', 'multiprocessing') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                            text=True, check=True)
+    return set(filter(None, result.stdout.strip().split(",")))
+
+
+class TestLazyImport:
+    """공개 이름 지연 import 테스트"""
+
+    def test_import_package_loads_nothing_heavy(self):
+        """import fsfupbit은 무거운 의존성을 로드하지 않음"""
+        assert _loaded_modules("import fsfupbit") == set()
+
+    def test_upbit_does_not_load_pandas(self):
+        """Upbit만 사용하면 pandas, websockets, jwt를 로드하지 않음"""
+        assert _loaded_modules(
+            "from fsfupbit import Upbit\nUpbit('a', 'b')._request_headers()") == set()
+
+    def test_quotation_loads_pandas_on_use(self):
+        """get_ohlcv는 접근만으로는 pandas를 로드하지 않고 변환 시 로드"""
+        assert "pandas" not in _loaded_modules("from fsfupbit import get_ohlcv")
+        assert "pandas" in _loaded_modules(
+            "from fsfupbit.quotation_api import _candles_to_frame\n"
+            "_candles_to_frame([])")
+
+    def test_all_names_resolve(self):
+        """__all__의 모든 이름이 해당 모듈의 객체로 연결"""
+        for name in fsfupbit.__all__:
+            assert getattr(fsfupbit, name) is not None
+        assert set(fsfupbit.__all__) <= set(dir(fsfupbit))
+
+    def test_unknown_attribute(self):
+        """없는 이름은 AttributeError"""
+        with pytest.raises(AttributeError):
+            fsfupbit.not_a_function
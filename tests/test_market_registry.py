@@ -0,0 +1,223 @@
+import copy
+import json
+import pytest
+from unittest.mock import patch
+
+from fsfupbit.endpoints import set_base_url
+from fsfupbit.market_registry import (
+    MarketRegistry, get_market_registry, set_market_registry,
+)
+from fsfupbit.quotation_api import get_tickers
+
+
+def _market(market, warning=False, **caution):
+    flags = {
+        "PRICE_FLUCTUATIONS": False,
+        "TRADING_VOLUME_SOARING": False,
+        "DEPOSIT_AMOUNT_SOARING": False,
+        "GLOBAL_PRICE_DIFFERENCES": False,
+        "CONCENTRATION_OF_SMALL_ACCOUNTS": False,
+    }
+    flags.update(caution)
+    return {
+        "market": market,
+        "korean_name": market + " 한글",
+        "english_name": market + " english",
+        "market_warning": "CAUTION" if warning else "NONE",
+        "market_event": {"warning": warning, "caution": flags},
+    }
+
+
+MARKETS = [
+    _market("KRW-BTC"),
+    _market("KRW-ETH", PRICE_FLUCTUATIONS=True),
+    _market("KRW-XRP", warning=True),
+    _market("BTC-ETH", TRADING_VOLUME_SOARING=True, PRICE_FLUCTUATIONS=True),
+    _market("USDT-BTC"),
+]
+LIMIT_INFO = {"group": "market", "min": 599, "sec": 9}
+
+
+@pytest.fixture
+def mock_api():
+    with patch('fsfupbit.market_registry._call_public_api',
+               return_value=(copy.deepcopy(MARKETS), LIMIT_INFO)) as mock:
+        yield mock
+
+
+@pytest.fixture
+def default_registry():
+    registry = MarketRegistry()
+    set_market_registry(registry)
+    yield registry
+    set_market_registry(None)
+
+
+# =============================================================================
+# MarketRegistry Tests
+# =============================================================================
+
+class TestMarketRegistry:
+    """MarketRegistry 색인과 TTL 테스트"""
+
+    def test_indexes(self, mock_api):
+        """마켓, 호가 통화, 유의/주의 종목별 조회"""
+        registry = MarketRegistry()
+
+        assert registry.tickers() == [m["market"] for m in MARKETS]
+        assert registry.tickers("KRW") == ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+        assert registry.tickers("KRW-E") == ["KRW-ETH"]
+        assert registry.tickers("EUR") == []
+        assert registry.get("BTC-ETH")["market_event"]["caution"]["TRADING_VOLUME_SOARING"]
+        assert registry.get("KRW-DOGE") is None
+        assert "USDT-BTC" in registry
+        assert len(registry) == 5
+        assert registry.quotes() == ["KRW", "BTC", "USDT"]
+        assert registry.warning_markets() == ["KRW-XRP"]
+        assert registry.caution_markets() == ["KRW-ETH", "BTC-ETH"]
+        assert registry.caution_markets("TRADING_VOLUME_SOARING") == ["BTC-ETH"]
+        assert registry.caution_markets("DEPOSIT_AMOUNT_SOARING") == []
+        assert mock_api.call_count == 1
+        assert mock_api.call_args[1] == {"isDetails": "true"}
+
+    def test_basic_and_details_views(self, mock_api):
+        """details=False면 마켓 코드와 이름만"""
+        registry = MarketRegistry()
+
+        basic = registry.markets("BTC")
+        assert basic == [{"market": "BTC-ETH", "korean_name": "BTC-ETH 한글",
+                          "english_name": "BTC-ETH english"}]
+        assert registry.markets("BTC", details=True) == [MARKETS[3]]
+
+    def test_results_are_copies(self, mock_api):
+        """반환한 리스트를 수정해도 색인은 그대로"""
+        registry = MarketRegistry()
+        registry.tickers("KRW").append("KRW-FAKE")
+
+        assert "KRW-FAKE" not in registry.tickers("KRW")
+
+    def test_market_dicts_are_copies(self, mock_api):
+        """반환한 마켓 정보 딕셔너리를 수정해도 저장소는 그대로"""
+        registry = MarketRegistry()
+        registry.get("KRW-BTC")["korean_name"] = "변경"
+        registry.markets("KRW", details=True)[0]["market"] = "KRW-FAKE"
+        registry.markets("KRW-B")[0]["english_name"] = "changed"
+
+        assert registry.get("KRW-BTC") == MARKETS[0]
+        assert registry.markets("KRW", details=True)[0]["market"] == "KRW-BTC"
+        assert registry.markets("KRW-B")[0]["english_name"] == "KRW-BTC english"
+        assert registry.get("KRW-NONE") is None
+
+    def test_ttl(self, mock_api):
+        """ttl 동안 재사용하고 지나면 다시 받음"""
+        registry = MarketRegistry(ttl=60)
+        with patch('fsfupbit.market_registry.time.time', return_value=1000.0):
+            registry.tickers()
+            registry.tickers("KRW")
+        assert mock_api.call_count == 1
+
+        with patch('fsfupbit.market_registry.time.time', return_value=1061.0):
+            registry.tickers()
+        assert mock_api.call_count == 2
+
+    def test_ttl_zero_and_invalidate(self, mock_api):
+        """ttl=0이면 매번, invalidate() 후에는 다음 조회 때 다시 받음"""
+        registry = MarketRegistry(ttl=0)
+        registry.tickers()
+        registry.tickers()
+        assert mock_api.call_count == 2
+
+        registry = MarketRegistry()
+        registry.tickers()
+        registry.invalidate()
+        registry.tickers()
+        assert mock_api.call_count == 4
+
+    def test_base_url_change_refetches(self, mock_api):
+        """요청 주소가 바뀌면 ttl과 관계없이 다시 받음"""
+        registry = MarketRegistry()
+        registry.tickers()
+        try:
+            set_base_url("http://cache.internal:8080")
+            registry.tickers()
+        finally:
+            set_base_url(None)
+
+        assert mock_api.call_count == 2
+        assert mock_api.call_args[0][0] == "http://cache.internal:8080/v1/market/all"
+
+
+# =============================================================================
+# Persistence Tests
+# =============================================================================
+
+class TestMarketRegistryPersistence:
+    """파일 저장과 재시작 시 읽기 테스트"""
+
+    def test_warm_start(self, mock_api, tmp_path):
+        """ttl 안에 저장된 목록은 요청 없이 읽음"""
+        path = str(tmp_path / "cache" / "markets.json")
+        MarketRegistry(path=path).tickers()
+        assert mock_api.call_count == 1
+
+        restarted = MarketRegistry(path=path)
+        assert restarted.tickers("KRW") == ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+        assert restarted.warning_markets() == ["KRW-XRP"]
+        assert mock_api.call_count == 1
+
+    def test_expired_file_refetched(self, mock_api, tmp_path):
+        """ttl이 지난 파일은 무시하고 다시 받아 저장"""
+        path = tmp_path / "markets.json"
+        MarketRegistry(path=str(path)).tickers()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["fetched_at"] -= 3600
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        MarketRegistry(path=str(path)).tickers()
+
+        assert mock_api.call_count == 2
+        assert json.loads(path.read_text(encoding="utf-8"))["fetched_at"] > data["fetched_at"]
+
+    def test_broken_file_ignored(self, mock_api, tmp_path):
+        """읽을 수 없는 파일은 무시"""
+        path = tmp_path / "markets.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert MarketRegistry(path=str(path)).tickers("USDT") == ["USDT-BTC"]
+        assert mock_api.call_count == 1
+
+
+# =============================================================================
+# get_tickers Tests
+# =============================================================================
+
+class TestGetTickersRegistry:
+    """get_tickers가 기본 저장소를 사용하는지 테스트"""
+
+    def test_served_from_registry(self, mock_api, default_registry):
+        """여러 번 호출해도 요청은 한 번"""
+        assert get_tickers("KRW") == ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+        assert get_tickers("BTC", verbose=True)[0] == {
+            "market": "BTC-ETH", "korean_name": "BTC-ETH 한글",
+            "english_name": "BTC-ETH english"}
+        assert get_tickers(is_details=True) == MARKETS
+        assert get_tickers(limit_info=True) == ([m["market"] for m in MARKETS], LIMIT_INFO)
+        assert mock_api.call_count == 1
+
+    def test_verbose_results_do_not_leak(self, mock_api, default_registry):
+        """get_tickers 결과를 수정해도 다음 호출에 영향 없음"""
+        get_tickers(is_details=True)[0]["market_warning"] = "CAUTION"
+        get_tickers("KRW", verbose=True)[0].clear()
+
+        assert get_tickers(is_details=True) == MARKETS
+        assert get_tickers("KRW", verbose=True)[0]["market"] == "KRW-BTC"
+
+    def test_set_market_registry(self, mock_api, default_registry):
+        """set_market_registry로 교체, None이면 기본 설정으로 다시 생성"""
+        registry = MarketRegistry(ttl=600)
+        set_market_registry(registry)
+        assert get_market_registry() is registry
+
+        set_market_registry(None)
+        assert get_market_registry() is not registry
+        assert get_market_registry().ttl == 60
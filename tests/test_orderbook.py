@@ -0,0 +1,99 @@
+import math
+import numpy as np
+import pytest
+
+from fsfupbit.errors import UpbitValidationError
+from fsfupbit.orderbook import OrderBook
+
+
+def _units(n, best_bid=100.0, best_ask=101.0):
+    return [{"ask_price": best_ask + i, "bid_price": best_bid - i,
+             "ask_size": 1.0 + i, "bid_size": 2.0 + i} for i in range(n)]
+
+
+def _message(n=3, timestamp=1, **kwargs):
+    return {"type": "orderbook", "code": "KRW-BTC", "timestamp": timestamp,
+            "orderbook_units": _units(n, **kwargs)}
+
+
+# =============================================================================
+# OrderBook Tests
+# =============================================================================
+
+class TestOrderBook:
+    """OrderBook 테스트"""
+
+    def test_best_prices_and_spread(self):
+        """최우선 호가, 스프레드, 중간값"""
+        book = OrderBook()
+        assert book.update(_message()) == "KRW-BTC"
+
+        assert book.best_bid("KRW-BTC") == 100.0
+        assert book.best_ask("KRW-BTC") == 101.0
+        assert book.spread("KRW-BTC") == 1.0
+        assert book.mid("KRW-BTC") == 100.5
+
+    def test_cumulative_depth(self):
+        """단계별 누적 잔량"""
+        book = OrderBook()
+        book.update(_message(3))
+
+        assert book.depth("KRW-BTC", "bid", levels=2) == 5.0
+        assert book.depth("KRW-BTC", "ask") == 6.0
+        assert book.cumulative("KRW-BTC", "ask").tolist() == [1.0, 3.0, 6.0]
+
+    def test_update_in_place(self):
+        """갱신해도 같은 배열을 사용하고, 줄어든 단계는 비움"""
+        book = OrderBook(["KRW-BTC"], levels=5)
+        array = book._books["KRW-BTC"]
+        book.update(_message(3, timestamp=1))
+        book.update(_message(2, timestamp=2, best_bid=90.0))
+
+        assert book._books["KRW-BTC"] is array
+        assert book.bids("KRW-BTC").tolist() == [[90.0, 89.0], [2.0, 3.0]]
+        assert math.isnan(array[0, 2])
+
+    def test_stale_message_ignored(self):
+        """저장된 것보다 오래된 메시지는 무시"""
+        book = OrderBook()
+        book.update(_message(timestamp=10))
+        assert book.update(_message(timestamp=5, best_bid=50.0)) is None
+        assert book.best_bid("KRW-BTC") == 100.0
+
+    def test_depth_limit(self):
+        """levels보다 많은 단계는 잘라서 저장"""
+        book = OrderBook(levels=2)
+        book.update(_message(5))
+        assert book.asks("KRW-BTC").shape == (2, 2)
+
+    def test_simple_format(self):
+        """SIMPLE 포맷 메시지 반영"""
+        book = OrderBook()
+        book.update({"ty": "orderbook", "cd": "KRW-ETH", "tms": 1,
+                     "obu": [{"ap": 11.0, "bp": 10.0, "as": 1.0, "bs": 2.0}]})
+        assert book.spread("KRW-ETH") == 1.0
+
+    def test_seed_from_snapshot(self):
+        """get_orderbook 응답(리스트)으로 초기화"""
+        book = OrderBook()
+        book.seed([
+            {"market": "KRW-BTC", "timestamp": 1, "orderbook_units": _units(2)},
+            {"market": "KRW-ETH", "timestamp": 1, "orderbook_units": _units(2, 10.0, 11.0)},
+        ])
+        assert book.markets == ["KRW-BTC", "KRW-ETH"]
+        assert book.best_ask("KRW-ETH") == 11.0
+
+    def test_unknown_market_and_side(self):
+        """호가가 없는 마켓과 잘못된 side 검증"""
+        book = OrderBook()
+        with pytest.raises(UpbitValidationError):
+            book.best_bid("KRW-BTC")
+        book.update(_message())
+        with pytest.raises(UpbitValidationError):
+            book.depth("KRW-BTC", "buy")
+
+    def test_empty_book(self):
+        """호가를 받기 전에는 NaN과 0"""
+        book = OrderBook(["KRW-BTC"])
+        assert np.isnan(book.best_bid("KRW-BTC"))
+        assert book.depth("KRW-BTC", "bid") == 0.0
@@ -1,4 +1,6 @@
 from fsfupbit.quotation_api import *
+from fsfupbit.quotation_api import _chunk_markets
+import pandas as pd
 import pytest
 from unittest.mock import Mock, patch
 
@@ -436,4 +438,506 @@ class TestPrivateWebSocketManager:
         token = pwm._generate_jwt_token()
         assert token.startswith("Bearer ")
         # JWT 토큰은 base64로 인코딩되므로 구조를 확인
-        assert len(token) > 20  # 최소한 토큰 길이 확인
\ No newline at end of file
+        assert len(token) > 20  # 최소한 토큰 길이 확인
+
+# =============================================================================
+# Concurrent Pagination Tests
+# =============================================================================
+
+def _fake_candle_api(start, n, width, missing=()):
+    """to 이전의 캔들을 최신순으로 count개 돌려주는 가짜 캔들 API
+
+    missing에 포함된 순번의 캔들은 거래가 없었던 것으로 간주하여 만들지 않는다.
+    """
+    import datetime as dt
+    times = [start + width * i for i in range(n) if i not in set(missing)]
+
+    def call(url, **params):
+        to = dt.datetime.strptime(params["to"], "%Y-%m-%d %H:%M:%S")
+        older = [t for t in times if t < to][-params["count"]:]
+        contents = []
+        for t in reversed(older):
+            kst = t + dt.timedelta(hours=9)
+            price = float((t - start) // width)
+            contents.append({
+                "market": params["market"],
+                "candle_date_time_utc": t.strftime("%Y-%m-%dT%H:%M:%S"),
+                "candle_date_time_kst": kst.strftime("%Y-%m-%dT%H:%M:%S"),
+                "opening_price": price,
+                "high_price": price + 2,
+                "low_price": price - 1,
+                "trade_price": price + 1,
+                "candle_acc_trade_volume": 1.0,
+                "candle_acc_trade_price": price,
+            })
+        return contents, {"group": "candle", "min": 600, "sec": 9}
+    return call
+
+
+class TestConcurrentOhlcv:
+    """get_ohlcv max_workers 동시 페이지 조회 테스트"""
+
+    START = datetime.datetime(2024, 1, 1)
+    WIDTH = datetime.timedelta(minutes=1)
+
+    def _run(self, count, max_workers, n=2000, missing=()):
+        call = _fake_candle_api(self.START, n, self.WIDTH, missing)
+        to = self.START + self.WIDTH * n
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=call) as mock_api:
+            df = get_ohlcv("KRW-BTC", interval="minute1", count=count, to=to,
+                           period=0, max_workers=max_workers)
+        return df, mock_api
+
+    def test_candle_width(self):
+        """고정 간격 캔들의 간격 계산"""
+        from fsfupbit.quotation_api import _candle_width
+        assert _candle_width(get_url_ohlcv("minute3")) == datetime.timedelta(minutes=3)
+        assert _candle_width(get_url_ohlcv("seconds/30")) == datetime.timedelta(seconds=30)
+        assert _candle_width(get_url_ohlcv("day")) == datetime.timedelta(days=1)
+        assert _candle_width(get_url_ohlcv("week")) == datetime.timedelta(weeks=1)
+        assert _candle_width(get_url_ohlcv("month")) is None
+        assert _candle_width(get_url_ohlcv("year")) is None
+
+    def test_matches_sequential(self):
+        """동시 조회 결과가 순차 조회 결과와 동일"""
+        sequential, _ = self._run(1000, None)
+        concurrent, mock_api = self._run(1000, 4)
+
+        assert mock_api.call_count == 5
+        pd.testing.assert_frame_equal(sequential, concurrent)
+
+    def test_gaps_filled_by_second_pass(self):
+        """빈 구간 때문에 부족한 캔들은 추가 요청으로 채움"""
+        missing = range(1500, 1550)
+        sequential, _ = self._run(1000, None, missing=missing)
+        concurrent, mock_api = self._run(1000, 4, missing=missing)
+
+        assert len(concurrent) == 1000
+        assert concurrent.index.is_unique
+        assert mock_api.call_count == 6
+        pd.testing.assert_frame_equal(sequential, concurrent)
+
+    def test_history_shorter_than_count(self):
+        """상장 이후 캔들 수보다 많이 요청하면 있는 만큼 반환"""
+        concurrent, _ = self._run(1000, 4, n=450)
+        assert len(concurrent) == 450
+        assert concurrent.index.is_monotonic_increasing
+
+    def test_month_interval_stays_sequential(self):
+        """월 캔들은 동시 조회하지 않음"""
+        with patch('fsfupbit.quotation_api._get_ohlcv_concurrent') as mock_concurrent, \
+                patch('fsfupbit.quotation_api._call_public_api', return_value=([], {})):
+            get_ohlcv("KRW-BTC", interval="month", count=400, max_workers=4)
+        mock_concurrent.assert_not_called()
+
+
+# =============================================================================
+# Candle Parsing Tests
+# =============================================================================
+
+class TestCandlesToFrame:
+    """캔들 응답 일괄 변환 테스트"""
+
+    def test_columns_index_and_dtypes(self):
+        """KST 시각 인덱스, 오름차순, float64 컬럼으로 변환"""
+        from fsfupbit.quotation_api import _candles_to_frame
+        call = _fake_candle_api(datetime.datetime(2024, 1, 1), 5,
+                                datetime.timedelta(minutes=1))
+        contents, _ = call("", market="KRW-BTC", count=5, to="2024-01-02 00:00:00")
+
+        df = _candles_to_frame(contents)
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "value"]
+        assert df.index.is_monotonic_increasing
+        assert df.index[0] == datetime.datetime(2024, 1, 1, 9, 0)
+        assert (df.dtypes == "float64").all()
+        assert df["close"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_sequential_parses_once(self):
+        """여러 페이지를 받아도 변환은 한 번만 수행"""
+        from fsfupbit.quotation_api import _candles_to_frame
+        call = _fake_candle_api(datetime.datetime(2024, 1, 1), 1000,
+                                datetime.timedelta(minutes=1))
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=call), \
+                patch('fsfupbit.quotation_api._candles_to_frame',
+                      wraps=_candles_to_frame) as mock_parse:
+            df = get_ohlcv("KRW-BTC", interval="minute1", count=600,
+                           to=datetime.datetime(2024, 1, 2), period=0)
+
+        assert mock_parse.call_count == 1
+        assert len(df) == 600
+        assert df.index.is_unique
+
+
+# =============================================================================
+# Multi-ticker OHLCV Tests
+# =============================================================================
+
+class TestGetOhlcvMany:
+    """get_ohlcv_many 여러 마켓 동시 조회 테스트"""
+
+    START = datetime.datetime(2024, 1, 1)
+    WIDTH = datetime.timedelta(minutes=1)
+    TO = datetime.datetime(2024, 1, 1, 1, 0)
+
+    def _api(self, failing=(), listed_late=()):
+        full = _fake_candle_api(self.START, 60, self.WIDTH)
+        late = _fake_candle_api(self.START + self.WIDTH * 30, 30, self.WIDTH)
+
+        def call(url, **params):
+            if params["market"] in failing:
+                raise UpbitAPIError("서버 오류", status_code=500)
+            if params["market"] in listed_late:
+                return late(url, **params)
+            return full(url, **params)
+        return call
+
+    def test_multiindex_panel(self):
+        """(ticker, field) MultiIndex 컬럼과 합쳐진 인덱스로 반환"""
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._api(listed_late={"KRW-XRP"})):
+            df = get_ohlcv_many(["KRW-BTC", "KRW-ETH", "KRW-XRP"],
+                                interval="minute1", count=60, to=self.TO)
+
+        assert list(df.columns.get_level_values(0).unique()) == \
+            ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+        assert len(df) == 60
+        assert df.index.is_monotonic_increasing
+        # 늦게 상장된 마켓의 앞부분은 NaN
+        assert df["KRW-XRP"]["close"].isna().sum() == 30
+        assert df["KRW-BTC"]["close"].iloc[-1] == 60.0
+
+    def test_as_dict_aligned(self):
+        """as_dict=True이면 같은 인덱스의 DataFrame 딕셔너리 반환"""
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._api(listed_late={"KRW-XRP"})):
+            data = get_ohlcv_many(["KRW-BTC", "KRW-XRP"], interval="minute1",
+                                  count=60, to=self.TO, as_dict=True)
+
+        assert set(data) == {"KRW-BTC", "KRW-XRP"}
+        assert data["KRW-BTC"].index.equals(data["KRW-XRP"].index)
+        assert list(data["KRW-BTC"].columns) == \
+            ["open", "high", "low", "close", "volume", "value"]
+
+    def test_failure_raises_with_tickers(self):
+        """일부 마켓 실패 시 실패한 마켓을 담은 UpbitAPIError 발생"""
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._api(failing={"KRW-ETH"})):
+            with pytest.raises(UpbitAPIError) as exc:
+                get_ohlcv_many(["KRW-BTC", "KRW-ETH"], interval="minute1",
+                               count=60, to=self.TO)
+
+        assert "KRW-ETH" in str(exc.value)
+        assert list(exc.value.response) == ["KRW-ETH"]
+
+    def test_failure_collected(self):
+        """errors="collect"이면 성공한 데이터와 마켓별 예외를 함께 반환"""
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._api(failing={"KRW-ETH"})):
+            df, failed = get_ohlcv_many(["KRW-BTC", "KRW-ETH"],
+                                        interval="minute1", count=60,
+                                        to=self.TO, errors="collect")
+
+        assert list(df.columns.get_level_values(0).unique()) == ["KRW-BTC"]
+        assert isinstance(failed["KRW-ETH"], UpbitAPIError)
+        assert failed["KRW-ETH"].status_code == 500
+
+    def test_invalid_errors_option(self):
+        """errors 값 검증"""
+        with pytest.raises(UpbitValidationError):
+            get_ohlcv_many(["KRW-BTC"], errors="ignore")
+
+
+# =============================================================================
+# Streaming OHLCV Tests
+# =============================================================================
+
+class TestIterOhlcvFrom:
+    """iter_ohlcv_from 시간순 조각 제너레이터 테스트"""
+
+    START = datetime.datetime(2024, 1, 1)
+    WIDTH = datetime.timedelta(minutes=1)
+    UTC = datetime.timezone.utc
+
+    def _utc(self, value):
+        return value.replace(tzinfo=self.UTC)
+
+    def _run(self, n=1000, missing=(), fromDatetime=None, to=None, **kwargs):
+        call = _fake_candle_api(self.START, n, self.WIDTH, missing)
+        fromDatetime = fromDatetime or self.START
+        to = to or self.START + self.WIDTH * n
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=call) as mock_api:
+            chunks = list(iter_ohlcv_from("KRW-BTC", "minute1", self._utc(fromDatetime),
+                                          self._utc(to), period=0, **kwargs))
+        return chunks, mock_api
+
+    def test_chunks_chronological(self):
+        """조각은 시간순으로 이어지고 합치면 구간 전체"""
+        chunks, _ = self._run(chunk_size=300)
+
+        assert all(len(c) >= 300 for c in chunks[:-1])
+        df = pd.concat(chunks)
+        assert len(df) == 1000
+        assert df.index.is_monotonic_increasing
+        assert df.index.is_unique
+        assert df["open"].tolist() == [float(i) for i in range(1000)]
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "value"]
+
+    def test_range_bounds(self):
+        """fromDatetime 이상, to 미만의 캔들만 반환"""
+        chunks, _ = self._run(fromDatetime=self.START + self.WIDTH * 100,
+                              to=self.START + self.WIDTH * 700)
+
+        df = pd.concat(chunks)
+        assert df["open"].iloc[0] == 100.0
+        assert df["open"].iloc[-1] == 699.0
+        assert len(df) == 600
+
+    def test_gaps(self):
+        """거래가 없어 빠진 캔들 외에는 모두 반환"""
+        missing = set(range(150, 450)) | {800}
+        chunks, _ = self._run(missing=missing)
+
+        assert len(pd.concat(chunks)) == 1000 - len(missing)
+
+    def test_skips_before_listing(self):
+        """상장 전 구간은 페이지마다 요청하지 않고 건너뜀"""
+        chunks, mock_api = self._run(fromDatetime=self.START - datetime.timedelta(days=365))
+
+        assert len(pd.concat(chunks)) == 1000
+        # 1년치 분 캔들 페이지(약 2600개) 대신 이분 탐색 + 구간 페이지
+        assert mock_api.call_count < 30
+
+    def test_no_candles(self):
+        """구간 이전에 캔들이 전혀 없으면 아무것도 반환하지 않음"""
+        chunks, mock_api = self._run(fromDatetime=self.START - datetime.timedelta(days=2),
+                                     to=self.START - datetime.timedelta(days=1))
+
+        assert chunks == []
+        assert mock_api.call_count == 2
+
+    def test_lazy(self):
+        """필요한 조각까지만 요청"""
+        call = _fake_candle_api(self.START, 5000, self.WIDTH)
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=call) as mock_api:
+            chunks = iter_ohlcv_from("KRW-BTC", "minute1", self._utc(self.START),
+                                     self._utc(self.START + self.WIDTH * 5000), period=0)
+            first = next(chunks)
+
+        assert first["open"].iloc[0] == 0.0
+        assert mock_api.call_count == 1
+
+    def test_month_interval(self):
+        """월 캔들은 전체를 받은 뒤 시간순 조각으로 반환"""
+        call = _fake_candle_api(self.START, 50, datetime.timedelta(days=31))
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=call):
+            chunks = list(iter_ohlcv_from(
+                "KRW-BTC", "month", self._utc(self.START + datetime.timedelta(days=31 * 10)),
+                self._utc(self.START + datetime.timedelta(days=31 * 50)),
+                period=0, chunk_size=16))
+
+        assert [len(c) for c in chunks] == [16, 16, 8]
+        assert pd.concat(chunks)["open"].tolist() == [float(i) for i in range(10, 50)]
+
+
+# =============================================================================
+# Trades Tests
+# =============================================================================
+
+def _fake_trades_api(per_day):
+    """days_ago마다 per_day개 체결을 최신순 cursor 페이지로 돌려주는 _call_public_api"""
+    calls = []
+
+    def call(url, **params):
+        calls.append(params)
+        day = params.get("days_ago", 0)
+        end = (10 - day) * 100000
+        ids = range(end, end - per_day, -1)
+        if "cursor" in params:
+            ids = [i for i in ids if i < params["cursor"]]
+        trades = [{
+            "market": params["market"],
+            "timestamp": i * 1000,
+            "trade_price": float(i),
+            "trade_volume": 0.5,
+            "prev_closing_price": 1.0,
+            "change_price": float(i) - 1.0,
+            "ask_bid": "BID" if i % 2 else "ASK",
+            "sequential_id": i,
+        } for i in list(ids)[:params["count"]]]
+        return trades, {}
+    call.calls = calls
+    return call
+
+
+class TestGetTrades:
+    """get_trades / iter_trades / get_trades_history 테스트"""
+
+    @patch('fsfupbit.quotation_api._call_public_api')
+    def test_get_trades_params(self, mock_api):
+        """지정한 파라미터만 전달"""
+        mock_api.return_value = ([], {"group": "trade"})
+
+        assert get_trades("KRW-ETH", count=10, days_ago=2, cursor=123) == []
+        assert mock_api.call_args[0][0] == "https://api.upbit.com/v1/trades/ticks"
+        assert mock_api.call_args[1] == {"market": "KRW-ETH", "count": 10,
+                                         "days_ago": 2, "cursor": 123}
+
+        assert get_trades("KRW-ETH", limit_info=True) == ([], {"group": "trade"})
+        assert mock_api.call_args[1] == {"market": "KRW-ETH", "count": 500}
+
+    @pytest.mark.parametrize("kwargs", [
+        {"count": 0}, {"count": 501}, {"days_ago": 0}, {"days_ago": 8},
+    ])
+    def test_get_trades_validation(self, kwargs):
+        """count, days_ago 범위 검증"""
+        with pytest.raises(UpbitValidationError):
+            get_trades("KRW-BTC", **kwargs)
+
+    def test_iter_trades_walks_cursor(self):
+        """sequential_id 커서로 하루치를 끝까지 받고 다음 날짜로 이동"""
+        api = _fake_trades_api(1200)
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=api):
+            pages = list(iter_trades("KRW-BTC", days=2))
+
+        assert [len(p) for p in pages] == [500, 500, 200, 500, 500, 200]
+        assert api.calls[1]["cursor"] == pages[0][-1]["sequential_id"]
+        assert [c.get("days_ago") for c in api.calls] == [None] * 3 + [1] * 3
+
+    def test_iter_trades_stops_early(self):
+        """반복을 멈추면 이후 페이지는 요청하지 않음"""
+        api = _fake_trades_api(1200)
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=api):
+            next(iter_trades("KRW-BTC", days=8))
+
+        assert len(api.calls) == 1
+
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_history_frame(self, max_workers):
+        """날짜별 결과를 시간순 DataFrame으로 합침"""
+        api = _fake_trades_api(600)
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=api):
+            df = get_trades_history("KRW-BTC", days=4, max_workers=max_workers)
+
+        assert len(df) == 2400
+        assert df.index.is_monotonic_increasing
+        assert df.index.name == "timestamp_kst"
+        assert df.index[0] == pd.Timestamp(699401, unit="s") + pd.Timedelta(hours=9)
+        assert list(df.columns) == [name for name, _ in TRADE_COLUMNS] + ["ask_bid"]
+        assert df["sequential_id"].dtype == "int64"
+        assert set(df["ask_bid"]) == {"ASK", "BID"}
+
+    def test_history_numpy_dedup(self):
+        """numpy 출력은 sequential_id로 중복을 제거한 컬럼별 배열"""
+        api = _fake_trades_api(700)
+
+        def overlapping(url, **params):
+            trades, info = api(url, **params)
+            # 다음 페이지가 이전 페이지의 마지막 체결을 다시 포함하는 경우
+            if "cursor" in params:
+                trades.insert(0, {**trades[0], "sequential_id": params["cursor"],
+                                  "timestamp": params["cursor"] * 1000})
+            return trades, info
+
+        with patch('fsfupbit.quotation_api._call_public_api', side_effect=overlapping):
+            cols = get_trades_history("KRW-BTC", output="numpy")
+
+        assert len(cols["sequential_id"]) == 700
+        assert (cols["sequential_id"][1:] > cols["sequential_id"][:-1]).all()
+        assert cols["trade_price"].dtype == "float64"
+
+    def test_history_validation(self):
+        """days, output 검증"""
+        with pytest.raises(UpbitValidationError):
+            get_trades_history("KRW-BTC", days=9)
+        with pytest.raises(UpbitValidationError):
+            get_trades_history("KRW-BTC", output="records")
+
+
+# =============================================================================
+# Current Price Tests
+# =============================================================================
+
+class TestCurrentPriceChunks:
+    """get_current_price 묶음 동시 조회와 /v1/ticker/all 테스트"""
+
+    LIMIT = {"group": "ticker", "min": 1800, "sec": 29}
+
+    @staticmethod
+    def _ticker_api(calls):
+        def call(url, **params):
+            calls.append(params)
+            markets = params["markets"]
+            if isinstance(markets, str):
+                markets = [markets]
+            return [{"market": m, "trade_price": float(i)}
+                    for i, m in enumerate(markets)], TestCurrentPriceChunks.LIMIT
+        return call
+
+    def test_chunk_markets_url_length(self):
+        """URL 길이와 최대 마켓 수 안에서 묶음으로 나눔"""
+        url = "https://api.upbit.com/v1/ticker"
+        tickers = [f"KRW-C{i:03d}" for i in range(450)]
+
+        chunks = _chunk_markets(url, tickers)
+        assert [len(c) for c in chunks] == [200, 200, 50]
+        assert sum(chunks, []) == tickers
+
+        chunks = _chunk_markets(url, tickers, max_url_length=1000)
+        assert sum(chunks, []) == tickers
+        for chunk in chunks:
+            query = "&".join("markets=" + t for t in chunk)
+            assert len(url) + 1 + len(query) <= 1000
+
+    def test_chunks_requested_concurrently(self):
+        """묶음은 스레드 풀에서 동시에 요청하고 결과는 티커 순서대로 합침"""
+        calls = []
+        tickers = [f"KRW-C{i:03d}" for i in range(450)]
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._ticker_api(calls)), \
+                patch('fsfupbit.quotation_api.ThreadPoolExecutor',
+                      wraps=ThreadPoolExecutor) as executor:
+            prices, limit = get_current_price(tickers, limit_info=True)
+
+        assert executor.call_args[1] == {"max_workers": 3}
+        assert len(calls) == 3
+        assert list(prices) == tickers
+        assert limit == self.LIMIT
+
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._ticker_api([])), \
+                patch('fsfupbit.quotation_api.ThreadPoolExecutor') as executor:
+            data = get_current_price(tickers, verbose=True, max_workers=None)
+        executor.assert_not_called()
+        assert [x["market"] for x in data] == tickers
+
+    def test_frame_output(self):
+        """output="frame"이면 마켓 코드 인덱스의 DataFrame"""
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   side_effect=self._ticker_api([])):
+            df = get_current_price(["KRW-BTC", "KRW-ETH"], output="frame")
+            single = get_current_price("KRW-BTC", output="frame")
+
+        assert list(df.index) == ["KRW-BTC", "KRW-ETH"]
+        assert df.loc["KRW-ETH", "trade_price"] == 1.0
+        assert list(single.index) == ["KRW-BTC"]
+
+    def test_quote_currencies(self):
+        """quote_currencies는 /v1/ticker/all 1회 요청"""
+        body = [{"market": "KRW-BTC", "trade_price": 1.0},
+                {"market": "BTC-ETH", "trade_price": 0.05}]
+        with patch('fsfupbit.quotation_api._call_public_api',
+                   return_value=(body, self.LIMIT)) as mock:
+            prices = get_current_price(quote_currencies=["KRW", "BTC"])
+
+        assert mock.call_count == 1
+        assert mock.call_args[0][0].endswith("/v1/ticker/all")
+        assert mock.call_args[1] == {"quote_currencies": "KRW,BTC"}
+        assert prices == {"KRW-BTC": 1.0, "BTC-ETH": 0.05}
+
+    def test_invalid_output(self):
+        with pytest.raises(UpbitValidationError):
+            get_current_price(["KRW-BTC", "KRW-ETH"], output="numpy")
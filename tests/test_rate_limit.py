@@ -0,0 +1,163 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from fsfupbit.rate_limit import RateLimiter, TokenBucket
+from fsfupbit.transport import HTTPTransport
+
+
+# =============================================================================
+# TokenBucket Tests
+# =============================================================================
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_within_capacity(self):
+        """용량 이내의 요청은 대기 없이 통과"""
+        bucket = TokenBucket(rate=10)
+        now = bucket.updated
+        waits = [bucket.reserve(now) for _ in range(10)]
+        assert waits == [0.0] * 10
+
+    def test_reservations_are_queued(self):
+        """용량을 넘는 요청은 순서대로 대기 시간이 늘어남"""
+        bucket = TokenBucket(rate=10)
+        now = bucket.updated
+        for _ in range(10):
+            bucket.reserve(now)
+
+        assert bucket.reserve(now) == pytest.approx(0.1)
+        assert bucket.reserve(now) == pytest.approx(0.2)
+
+    def test_refill(self):
+        """시간이 지나면 토큰이 충전됨"""
+        bucket = TokenBucket(rate=10)
+        now = bucket.updated
+        for _ in range(10):
+            bucket.reserve(now)
+
+        assert bucket.reserve(now + 0.5) == 0.0
+
+    def test_observe_clamps_tokens(self):
+        """서버의 남은 요청 수가 더 적으면 토큰을 줄임"""
+        bucket = TokenBucket(rate=10)
+        now = bucket.updated
+        bucket.observe(0, now)
+
+        assert bucket.reserve(now) == pytest.approx(0.1)
+
+    def test_observe_learns_capacity(self):
+        """서버가 더 큰 한도를 알려주면 용량과 속도를 올림"""
+        bucket = TokenBucket(rate=10)
+        bucket.observe(29, bucket.updated)
+
+        assert bucket.capacity == 30
+        assert bucket.rate == 30
+
+
+# =============================================================================
+# RateLimiter Tests
+# =============================================================================
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.parametrize("method,url,group", [
+        ("GET", "https://api.upbit.com/v1/market/all", "market"),
+        ("GET", "https://api.upbit.com/v1/candles/minutes/1", "candle"),
+        ("GET", "https://api.upbit.com/v1/ticker", "ticker"),
+        ("GET", "https://api.upbit.com/v1/orderbook", "orderbook"),
+        ("POST", "https://api.upbit.com/v1/orders", "order"),
+        ("POST", "https://api.upbit.com/v1/orders/test", "order-test"),
+        ("GET", "https://api.upbit.com/v1/orders/open", "default"),
+        ("GET", "https://api.upbit.com/v1/accounts", "default"),
+    ])
+    def test_group_for_defaults(self, method, url, group):
+        """경로로 기본 그룹을 추정"""
+        assert RateLimiter().group_for(method, url) == group
+
+    def test_observe_learns_route_group(self):
+        """Remaining-Req 헤더의 그룹으로 경로 매핑을 학습"""
+        limiter = RateLimiter()
+        url = "https://api.upbit.com/v1/orders/chance"
+
+        limiter.observe("GET", url, "group=order-chance; min=1800; sec=7")
+
+        assert limiter.group_for("GET", url) == "order-chance"
+
+    def test_observe_ignores_missing_header(self):
+        """헤더가 없거나 형식이 다르면 무시"""
+        limiter = RateLimiter()
+        limiter.observe("GET", "https://api.upbit.com/v1/ticker", None)
+        limiter.observe("GET", "https://api.upbit.com/v1/ticker", "invalid")
+
+    def test_exhausted_group_delays(self):
+        """sec=0을 받은 그룹의 다음 요청은 대기"""
+        limiter = RateLimiter()
+        url = "https://api.upbit.com/v1/candles/days"
+        limiter.observe("GET", url, "group=candle; min=600; sec=0")
+
+        assert limiter.reserve("GET", url) > 0
+        # 다른 그룹은 영향 없음
+        assert limiter.reserve("GET", "https://api.upbit.com/v1/ticker") == 0.0
+
+    def test_too_many_requests_drains_group(self):
+        """429 응답은 해당 그룹의 토큰을 비움"""
+        limiter = RateLimiter()
+        url = "https://api.upbit.com/v1/ticker"
+        limiter.observe("GET", url, None, status_code=429)
+
+        assert limiter.reserve("GET", url) > 0
+
+    def test_acquire_sleeps(self):
+        """acquire는 예약된 대기 시간만큼 잠듦"""
+        limiter = RateLimiter(rates={"default": 1})
+        url = "https://api.upbit.com/v1/accounts"
+        with patch("fsfupbit.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire("GET", url)
+            limiter.acquire("GET", url)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
+
+    def test_acquire_async(self):
+        """비동기 acquire는 이벤트 루프에서 대기"""
+        limiter = RateLimiter(rates={"default": 100})
+        url = "https://api.upbit.com/v1/accounts"
+
+        async def main():
+            for _ in range(101):
+                await limiter.acquire_async("GET", url)
+
+        asyncio.run(main())
+
+
+class TestTransportRateLimiter:
+    """transport와 RateLimiter 연동 테스트"""
+
+    def test_transport_acquires_and_observes(self):
+        """transport가 전송 전 acquire, 전송 후 observe를 호출"""
+        limiter = Mock(spec=RateLimiter)
+        transport = HTTPTransport(rate_limiter=limiter)
+        transport.session = Mock()
+        resp = transport.session.request.return_value
+        resp.headers = {"Remaining-Req": "group=ticker; min=600; sec=9"}
+        resp.status_code = 200
+
+        transport.get("https://api.upbit.com/v1/ticker")
+
+        limiter.acquire.assert_called_once_with(
+            "GET", "https://api.upbit.com/v1/ticker")
+        limiter.observe.assert_called_once_with(
+            "GET", "https://api.upbit.com/v1/ticker",
+            "group=ticker; min=600; sec=9", 200)
+
+    def test_transport_without_rate_limiter(self):
+        """rate_limiter=None이면 스케줄러를 사용하지 않음"""
+        transport = HTTPTransport(rate_limiter=None)
+        assert transport.rate_limiter is None
+
+    def test_default_rate_limiter_shared(self):
+        """기본 설정의 transport들은 같은 스케줄러를 공유"""
+        assert HTTPTransport().rate_limiter is HTTPTransport().rate_limiter
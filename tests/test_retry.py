@@ -0,0 +1,241 @@
+import asyncio
+import json
+import jwt
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from requests.models import Response
+
+from fsfupbit.exchange_api import Upbit
+from fsfupbit.request_api import _send_post_request
+from fsfupbit.retry import RetryBudget, RetryPolicy, _retry_after
+from fsfupbit.transport import AsyncHTTPTransport, HTTPTransport
+
+SECRET = "test_secret_key_that_is_long_enough_"
+REMAINING_REQ = {"Remaining-Req": "group=order; min=479; sec=7"}
+
+
+def _response(status_code, headers=None, payload=None):
+    resp = Mock(spec=Response)
+    resp.ok = status_code < 400
+    resp.status_code = status_code
+    resp.headers = headers or {}
+    resp.json.return_value = payload if payload is not None else {}
+    return resp
+
+
+def _transport(responses, **policy):
+    transport = HTTPTransport(rate_limiter=None, retry=RetryPolicy(**policy))
+    transport.session = Mock()
+    transport.session.request.side_effect = responses
+    return transport
+
+
+# =============================================================================
+# RetryPolicy Tests
+# =============================================================================
+
+class TestRetryPolicy:
+    """RetryPolicy 테스트"""
+
+    def test_allows_get_only_by_default(self):
+        """기본적으로 GET만 재시도"""
+        policy = RetryPolicy()
+        assert policy.allows("GET")
+        assert not policy.allows("POST")
+        assert not policy.allows("DELETE")
+        assert not policy.allows("GET", idempotent=False)
+
+    def test_orders_are_opt_in(self):
+        """identifier 주문(POST, idempotent=True)은 retry_orders=True일 때만 재시도"""
+        assert not RetryPolicy().allows("POST", idempotent=True)
+        assert RetryPolicy(retry_orders=True).allows("POST", idempotent=True)
+        assert not RetryPolicy(retry_orders=True).allows("POST")
+
+    @patch("fsfupbit.retry.random.uniform", side_effect=lambda a, b: b)
+    def test_exponential_backoff_cap(self, _):
+        """대기 시간 상한이 지수적으로 늘어나고 backoff_max에서 멈춤"""
+        policy = RetryPolicy(max_retries=10, backoff_base=0.1, backoff_max=0.5,
+                             budget=RetryBudget(burst=100))
+        delays = [policy.delay(attempt, 503) for attempt in range(5)]
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_max_retries_and_status(self):
+        """최대 횟수를 넘거나 재시도 대상이 아닌 상태 코드면 None"""
+        policy = RetryPolicy(max_retries=2)
+        assert policy.delay(2, 503) is None
+        assert policy.delay(0, 400) is None
+        assert policy.delay(0, None) is not None
+
+    def test_retry_after(self):
+        """Retry-After 헤더보다 먼저 재시도하지 않음"""
+        policy = RetryPolicy()
+        assert policy.delay(0, 429, {"Retry-After": "2"}) == 2.0
+        assert policy.delay(0, 503, {"Retry-After": "120"}) is None
+        assert _retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _retry_after("soon") is None
+
+    def test_remaining_req_exhausted(self):
+        """Remaining-Req의 sec가 0이면 다음 1초 구간까지 대기"""
+        policy = RetryPolicy()
+        headers = {"Remaining-Req": "group=default; min=1799; sec=0"}
+        assert policy.delay(0, 429, headers) == 1.0
+        headers = {"Remaining-Req": "group=default; min=1799; sec=5"}
+        assert policy.delay(0, 429, headers) <= policy.backoff_base
+
+    def test_budget(self):
+        """예산이 없으면 재시도하지 않고, 요청이 쌓이면 다시 허용"""
+        budget = RetryBudget(ratio=0.5, min_per_sec=0, burst=1)
+        policy = RetryPolicy(budget=budget)
+        assert policy.delay(0, 503) is not None
+        assert policy.delay(0, 503) is None
+        budget.deposit()
+        budget.deposit()
+        assert policy.delay(0, 503) is not None
+
+
+# =============================================================================
+# HTTPTransport Retry Tests
+# =============================================================================
+
+@patch("fsfupbit.transport.time.sleep")
+class TestTransportRetry:
+    """HTTPTransport 재시도 테스트"""
+
+    def test_retries_get_until_success(self, mock_sleep):
+        """GET 요청의 429/5xx는 재시도 후 성공 응답 반환"""
+        transport = _transport([_response(503), _response(429), _response(200)])
+
+        resp = transport.get("https://api.upbit.com/v1/ticker")
+
+        assert resp.status_code == 200
+        assert transport.session.request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_returns_last_response_when_exhausted(self, mock_sleep):
+        """재시도 횟수를 다 쓰면 마지막 실패 응답 반환"""
+        transport = _transport([_response(502)] * 3, max_retries=2)
+
+        resp = transport.get("https://api.upbit.com/v1/ticker")
+
+        assert resp.status_code == 502
+        assert transport.session.request.call_count == 3
+
+    def test_client_error_not_retried(self, mock_sleep):
+        """400 응답은 재시도하지 않음"""
+        transport = _transport([_response(400)])
+
+        assert transport.get("https://api.upbit.com/v1/ticker").status_code == 400
+        mock_sleep.assert_not_called()
+
+    def test_post_not_retried_by_default(self, mock_sleep):
+        """주문 POST는 기본적으로 재시도하지 않음"""
+        transport = _transport([_response(503)], retry_orders=True)
+
+        assert transport.post("https://api.upbit.com/v1/orders").status_code == 503
+        assert transport.session.request.call_count == 1
+
+    def test_network_error_retried(self, mock_sleep):
+        """GET 요청의 연결 오류는 재시도, 재시도를 다 쓰면 예외 전달"""
+        transport = _transport([requests.ConnectionError(), _response(200)])
+        assert transport.get("https://api.upbit.com/v1/ticker").status_code == 200
+
+        transport = _transport([requests.Timeout()] * 2, max_retries=1)
+        with pytest.raises(requests.Timeout):
+            transport.get("https://api.upbit.com/v1/ticker")
+
+    def test_disabled(self, mock_sleep):
+        """retry=None이면 재시도하지 않음"""
+        transport = HTTPTransport(rate_limiter=None, retry=None)
+        transport.session = Mock()
+        transport.session.request.return_value = _response(503)
+
+        assert transport.get("https://api.upbit.com/v1/ticker").status_code == 503
+        assert transport.retry is None
+
+    def test_identified_order_retried_with_new_nonce(self, mock_sleep):
+        """identifier 주문은 opt-in 시 재시도하며, 매번 새 nonce로 서명"""
+        transport = _transport(
+            [_response(500), _response(201, REMAINING_REQ, {"uuid": "abc"})],
+            retry_orders=True)
+        upbit = Upbit("test_access_key", SECRET, transport=transport)
+
+        order = upbit.buy_limit_order("KRW-BTC", 50000000, 0.001,
+                                      identifier="my-order-1")
+
+        assert order == {"uuid": "abc"}
+        calls = transport.session.request.call_args_list
+        assert len(calls) == 2
+        tokens = [kw["headers"]["Authorization"].split(" ", 1)[1] for _, kw in calls]
+        nonces = {jwt.decode(t, SECRET, algorithms=["HS256"])["nonce"] for t in tokens}
+        assert len(nonces) == 2
+        for _, kw in calls:
+            assert json.loads(kw["data"])["identifier"] == "my-order-1"
+            assert kw["headers"]["Content-Type"] == "application/json"
+
+    def test_order_without_identifier_not_retried(self, mock_sleep):
+        """identifier가 없는 주문은 retry_orders=True여도 재시도하지 않음"""
+        transport = _transport([_response(500)], retry_orders=True)
+        upbit = Upbit("test_access_key", SECRET, transport=transport)
+
+        assert upbit.buy_limit_order("KRW-BTC", 50000000, 0.001) is None
+        assert transport.session.request.call_count == 1
+
+
+class TestRequestApiIdempotent:
+    """request_api의 멱등 여부 전달 테스트"""
+
+    def test_identifier_marks_post_idempotent(self):
+        """identifier가 있는 POST는 idempotent=True로 전송"""
+        transport = Mock()
+        transport.post.return_value = _response(201, REMAINING_REQ, {"uuid": "abc"})
+
+        _send_post_request("https://api.upbit.com/v1/orders", headers={},
+                           data={"market": "KRW-BTC", "identifier": "id-1"},
+                           transport=transport)
+        assert transport.post.call_args[1]["idempotent"] is True
+
+        _send_post_request("https://api.upbit.com/v1/orders", headers={},
+                           data={"market": "KRW-BTC"}, transport=transport)
+        assert transport.post.call_args[1]["idempotent"] is None
+
+
+# =============================================================================
+# AsyncHTTPTransport Retry Tests
+# =============================================================================
+
+class TestAsyncTransportRetry:
+    """AsyncHTTPTransport 재시도 테스트"""
+
+    def test_retries_get_until_success(self):
+        """GET 요청의 503은 재시도 후 성공 응답 반환"""
+        web = pytest.importorskip("aiohttp.web")
+        statuses = [503, 429, 200]
+        seen = []
+
+        async def handler(request):
+            status = statuses[len(seen)]
+            seen.append(status)
+            return web.json_response({"status": status}, status=status)
+
+        async def main():
+            app = web.Application()
+            app.router.add_get("/v1/ticker", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            transport = AsyncHTTPTransport(
+                rate_limiter=None, retry=RetryPolicy(backoff_base=0.01))
+            try:
+                return await transport.get(f"http://127.0.0.1:{port}/v1/ticker")
+            finally:
+                await transport.close()
+                await runner.cleanup()
+
+        resp = asyncio.run(main())
+
+        assert resp.status_code == 200
+        assert seen == [503, 429, 200]
@@ -0,0 +1,163 @@
+import json
+import multiprocessing as mp
+import pytest
+
+from fsfupbit.ring_buffer import SharedRingBuffer
+
+
+@pytest.fixture
+def ring():
+    buffer = SharedRingBuffer(slots=4, slot_size=64)
+    yield buffer
+    buffer.close()
+    buffer.unlink()
+
+
+def _produce(name, n):
+    writer = SharedRingBuffer(name, create=False)
+    for i in range(n):
+        writer.write(json.dumps({"i": i}).encode())
+    writer.close()
+
+
+# =============================================================================
+# SharedRingBuffer Tests
+# =============================================================================
+
+class TestSharedRingBuffer:
+    """SharedRingBuffer 테스트"""
+
+    def test_write_and_read(self, ring):
+        """쓴 순서대로 읽음"""
+        ring.write(b"first")
+        ring.write(b"second")
+
+        assert bytes(ring.read(block=False)) == b"first"
+        assert bytes(ring.read(block=False)) == b"second"
+        assert ring.read(block=False) is None
+
+    def test_read_is_zero_copy(self, ring):
+        """read는 공유 메모리를 가리키는 memoryview를 반환"""
+        ring.write(b'{"a": 1}')
+        view = ring.read(block=False)
+
+        assert isinstance(view, memoryview)
+        assert json.loads(bytes(view)) == {"a": 1}
+        view.release()
+
+    def test_overrun_reported(self, ring):
+        """소비자가 슬롯 수보다 뒤처지면 건너뛴 메시지 수를 기록"""
+        for i in range(10):
+            ring.write(str(i).encode())
+
+        assert bytes(ring.read(block=False)) == b"6"
+        assert ring.overruns == 6
+        assert [bytes(ring.read(block=False)) for _ in range(3)] == [b"7", b"8", b"9"]
+
+    def test_overwrite_while_reading_detected(self, ring):
+        """읽은 뒤 슬롯이 덮어쓰이면 still_valid가 False이고 overruns에 한 번 기록"""
+        ring.write(b"old")
+        view = ring.read(block=False)
+        assert ring.still_valid()
+
+        for i in range(ring.slots):
+            ring.write(b"new%d" % i)
+
+        assert bytes(view) != b"old"
+        assert ring.still_valid() is False
+        assert ring.overruns == 1
+        assert ring.still_valid()
+        assert ring.overruns == 1
+        view.release()
+
+    def test_oversized_message_skipped(self, ring):
+        """slot_size보다 큰 메시지는 기록하지 않음"""
+        assert ring.write(b"x" * 65) is False
+        assert ring.oversized == 1
+        assert ring.read(block=False) is None
+
+    def test_read_timeout(self, ring):
+        """timeout 동안 메시지가 없으면 None"""
+        assert ring.read(timeout=0.01) is None
+
+    def test_attach_requires_ring(self):
+        """링 버퍼가 아닌 공유 메모리에는 연결하지 않음"""
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(create=True, size=128)
+        try:
+            with pytest.raises(ValueError):
+                SharedRingBuffer(shm.name, create=False)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_cross_process(self):
+        """다른 프로세스가 쓴 메시지를 복사 없이 읽음"""
+        ring = SharedRingBuffer(slots=256, slot_size=64)
+        try:
+            process = mp.Process(target=_produce, args=(ring.name, 100))
+            process.start()
+            process.join(10)
+
+            received = [json.loads(bytes(ring.read(timeout=1)))["i"] for _ in range(100)]
+            assert received == list(range(100))
+            assert ring.overruns == 0
+        finally:
+            ring.close()
+            ring.unlink()
+
+
+class TestWebSocketManagerShm:
+    """WebSocketManager output="shm" 옵션 테스트"""
+
+    def test_invalid_output(self):
+        """지원하지 않는 output 값 검증"""
+        from fsfupbit.errors import UpbitValidationError
+        from fsfupbit.websocket_api import WebSocketManager
+        with pytest.raises(UpbitValidationError):
+            WebSocketManager("ticker", ["KRW-BTC"], output="pipe")
+
+    def test_get_decodes_ring_messages(self):
+        """링 버퍼의 원본 바이트를 get()에서 dict로 변환"""
+        from fsfupbit.websocket_api import WebSocketManager
+        wm = WebSocketManager("ticker", ["KRW-BTC"], output="shm")
+        wm.alive = True   # 자식 프로세스 없이 링 버퍼만 확인
+        ring = wm._WebSocketManager__ring
+        try:
+            ring.write(b'{"type": "ticker", "code": "KRW-BTC"}')
+            assert wm.get() == {"type": "ticker", "code": "KRW-BTC"}
+            ring.write(b'{"type": "ticker"}')
+            assert bytes(wm.get_raw(timeout=1)) == b'{"type": "ticker"}'
+            assert wm.still_valid()
+            assert wm.overruns == 0
+            assert wm.oversized == 0
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_get_discards_message_overwritten_while_decoding(self):
+        """디코딩 중 덮어쓰인 메시지는 버리고 overruns에 기록"""
+        from fsfupbit.websocket_api import WebSocketManager
+
+        def decode(raw):
+            message = json.loads(bytes(raw))
+            if message["i"] == 0:
+                # 디코딩하는 사이 생산자가 버퍼를 한 바퀴 돎
+                for i in range(1, 5):
+                    ring.write(b'{"i": %d}' % i)
+            return message
+
+        wm = WebSocketManager("ticker", ["KRW-BTC"], output="shm",
+                              slots=4, slot_size=64, decoder=decode)
+        wm.alive = True
+        ring = wm._WebSocketManager__ring
+        try:
+            ring.write(b'{"i": 0}')
+            assert wm.get() == {"i": 1}
+            assert wm.overruns == 1
+
+            assert ring.write(b"x" * 65) is False
+            assert wm.oversized == 1
+        finally:
+            ring.close()
+            ring.unlink()
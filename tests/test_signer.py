@@ -0,0 +1,99 @@
+import hashlib
+from urllib.parse import urlencode
+
+import jwt
+import pytest
+
+from fsfupbit.exchange_api import Upbit
+from fsfupbit.signer import JWTSigner, canonical_query, query_hash
+
+SECRET = "test_secret_key_that_is_long_enough_"
+
+
+def _reference_hash(query):
+    """기존 _request_headers의 query_hash 계산"""
+    m = hashlib.sha512()
+    m.update(urlencode(query, doseq=True).replace("%5B%5D=", "[]=").encode())
+    return m.hexdigest()
+
+
+# =============================================================================
+# canonical_query Tests
+# =============================================================================
+
+class TestCanonicalQuery:
+    """query_hash용 쿼리 문자열 테스트"""
+
+    @pytest.mark.parametrize("query", [
+        {},
+        {"market": "KRW-BTC"},
+        {"market": "KRW-BTC", "side": "bid", "volume": "0.01", "price": 50000000,
+         "ord_type": "limit"},
+        {"market": "KRW-BTC", "states[]": ["done", "cancel"], "page": 1},
+        {"uuids[]": ("a-b", "c d"), "limit": 100.5},
+        {"note": "한글 & 특수문자 =?[]", "flag": True, "empty": None},
+        {"currency": "BTC", "net_type": "BTC", "secondary_address": b"tag"},
+        [("market", "KRW-BTC"), ("market", "KRW-ETH")],
+    ])
+    def test_matches_urlencode(self, query):
+        """urlencode(doseq=True) + "[]" 치환 결과와 동일"""
+        expected = urlencode(query, doseq=True).replace("%5B%5D=", "[]=")
+        assert canonical_query(query) == expected
+        assert query_hash(query) == _reference_hash(query)
+
+
+# =============================================================================
+# JWTSigner Tests
+# =============================================================================
+
+class TestJWTSigner:
+    """JWTSigner 테스트"""
+
+    def test_token_verifies_with_pyjwt(self):
+        """PyJWT로 검증 가능한 HS256 토큰"""
+        signer = JWTSigner("access", SECRET)
+        token = signer.token()
+
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+        payload = jwt.decode(token, SECRET, algorithms=["HS256"])
+        assert payload["access_key"] == "access"
+        assert len(payload["nonce"]) == 36
+        assert "query_hash" not in payload
+
+    def test_query_hash_claim(self):
+        """쿼리가 있으면 query_hash와 query_hash_alg 포함"""
+        signer = JWTSigner("access", SECRET)
+        query = {"market": "KRW-BTC", "states[]": ["done", "cancel"]}
+        payload = jwt.decode(signer.token(query), SECRET, algorithms=["HS256"])
+
+        assert payload["query_hash"] == _reference_hash(query)
+        assert payload["query_hash_alg"] == "SHA512"
+
+    def test_nonce_is_unique(self):
+        """요청마다 다른 nonce 사용"""
+        signer = JWTSigner("access", SECRET)
+        nonces = {jwt.decode(signer.token(), SECRET, algorithms=["HS256"])["nonce"]
+                  for _ in range(10)}
+        assert len(nonces) == 10
+
+    def test_access_key_escaped(self):
+        """access_key에 JSON 특수문자가 있어도 올바른 페이로드"""
+        signer = JWTSigner('ac"ce\\ss', SECRET)
+        payload = jwt.decode(signer.token(), SECRET, algorithms=["HS256"])
+        assert payload["access_key"] == 'ac"ce\\ss'
+
+    def test_upbit_request_headers(self):
+        """Upbit._request_headers가 서명기를 재사용하고, 키가 바뀌면 새로 만듦"""
+        upbit = Upbit("access", SECRET)
+        headers = upbit._request_headers({"market": "KRW-BTC"})
+        signer = upbit._signer
+
+        token = headers["Authorization"].split(" ", 1)[1]
+        assert headers["Authorization"].startswith("Bearer ")
+        assert jwt.decode(token, SECRET, algorithms=["HS256"])["access_key"] == "access"
+
+        upbit._request_headers()
+        assert upbit._signer is signer
+        upbit.secret = SECRET + "new"
+        upbit._request_headers()
+        assert upbit._signer is not signer
@@ -0,0 +1,383 @@
+import asyncio
+import queue
+import threading
+import time
+import pytest
+import requests
+
+from fsfupbit import quotation_api, simulator
+from fsfupbit.errors import InsufficientFundsBid, TooManyRequests, UnderMinTotalBid
+from fsfupbit.exchange_api import Upbit
+from fsfupbit.request_api import _send_get_request, _send_post_request
+from fsfupbit.retry import RetryPolicy
+from fsfupbit.simulator import UpbitSimulator
+from fsfupbit.transport import get_default_transport, set_default_transport
+from fsfupbit.websocket_api import WebSocketHub, stream
+
+ACCESS = "sim_access_key"
+SECRET = "sim_secret_key_that_is_long_enough"
+
+
+@pytest.fixture
+def sim():
+    simulator = UpbitSimulator(keys={ACCESS: SECRET}, ws_interval=0.05).start()
+    previous = get_default_transport()
+    set_default_transport(simulator.transport())
+    try:
+        yield simulator
+    finally:
+        set_default_transport(previous)
+        simulator.stop()
+
+
+@pytest.fixture
+def upbit(sim):
+    return Upbit(ACCESS, SECRET, transport=sim.transport())
+
+
+# =============================================================================
+# Quotation API Tests
+# =============================================================================
+
+class TestSimulatorQuotation:
+    """시세 API 시뮬레이션 테스트"""
+
+    def test_get_ohlcv(self, sim):
+        """분 캔들을 200개 이상 요청하면 여러 번 나누어 받은 연속 캔들"""
+        df = quotation_api.get_ohlcv("KRW-BTC", interval="minute1", count=450)
+
+        assert len(df) == 450
+        assert df.index.is_monotonic_increasing
+        assert df.index.is_unique
+        assert (df.index[1:] - df.index[:-1]).unique().tolist() == [pd_minute()]
+        assert (df["high"] >= df["low"]).all()
+
+    def test_candles_deterministic(self, sim):
+        """같은 to로 요청하면 같은 캔들"""
+        first = quotation_api.get_ohlcv("KRW-ETH", interval="minute60", count=5,
+                                        to="2024-01-01 00:00:00")
+        second = quotation_api.get_ohlcv("KRW-ETH", interval="minute60", count=5,
+                                         to="2024-01-01 00:00:00")
+
+        assert first.equals(second)
+        assert str(first.index[-1]) == "2024-01-01 08:00:00"  # KST
+
+    def test_week_candles_start_on_monday(self, sim):
+        """주 캔들은 월요일에 시작"""
+        df = quotation_api.get_ohlcv("KRW-BTC", interval="week", count=3)
+
+        assert all(ts.weekday() == 0 for ts in df.index)
+
+    def test_current_price_and_tickers(self, sim):
+        """현재가와 마켓 목록"""
+        sim.set_price("KRW-BTC", 50000000)
+
+        assert quotation_api.get_current_price("KRW-BTC") == 50000000
+        prices = quotation_api.get_current_price(["KRW-BTC", "KRW-ETH"])
+        assert set(prices) == {"KRW-BTC", "KRW-ETH"}
+        krw = quotation_api.get_current_price(quote_currencies="KRW", output="frame")
+        assert set(krw.index) == set(quotation_api.get_tickers("KRW"))
+        assert krw.loc["KRW-BTC", "trade_price"] == 50000000
+        assert "KRW-BTC" in quotation_api.get_tickers("KRW")
+        assert all(t.startswith("BTC-") for t in quotation_api.get_tickers("BTC"))
+
+    def test_orderbook(self, sim):
+        """호가는 매도가가 매수가보다 높음"""
+        orderbook = quotation_api.get_orderbook("KRW-BTC")
+        units = orderbook["orderbook_units"]
+
+        assert len(units) == 30
+        assert units[0]["ask_price"] > units[0]["bid_price"]
+
+    def test_trades_history(self):
+        """체결 내역을 cursor로 끝까지 받아 날짜별로 합침"""
+        previous = get_default_transport()
+        with UpbitSimulator(websocket=False, trade_interval=300) as sim:
+            set_default_transport(sim.transport())
+            try:
+                latest = quotation_api.get_trades("KRW-BTC", count=3)
+                older = quotation_api.get_trades(
+                    "KRW-BTC", count=3, cursor=latest[-1]["sequential_id"])
+                df = quotation_api.get_trades_history("KRW-BTC", days=3, max_workers=3)
+            finally:
+                set_default_transport(previous)
+
+        assert latest[0]["sequential_id"] > latest[-1]["sequential_id"] > \
+            older[0]["sequential_id"]
+        assert older[0]["timestamp"] == latest[-1]["timestamp"] - 300000
+        assert df.index.is_monotonic_increasing
+        assert df["sequential_id"].is_unique
+        # 이전 두 날짜는 하루 전체 (300초 간격 288건)
+        assert len(df) >= 2 * 288
+
+    def test_remaining_req_and_429(self):
+        """그룹별 초당 요청 수를 넘으면 429와 Remaining-Req 헤더"""
+        with UpbitSimulator(websocket=False, rates={"ticker": 2}) as sim:
+            url = sim.base_url + "/v1/ticker?markets=KRW-BTC"
+            responses = [requests.get(url) for _ in range(3)]
+
+        assert responses[0].headers["Remaining-Req"].startswith("group=ticker;")
+        assert responses[1].headers["Remaining-Req"].endswith("sec=0")
+        statuses = [r.status_code for r in responses]
+        assert statuses[:2] == [200, 200]
+        # 요청 사이에 1초 구간이 바뀌면 세 번째도 허용될 수 있음
+        assert statuses[2] in (200, 429)
+        if statuses[2] == 429:
+            assert responses[2].text == "Too many API requests."
+
+    def test_injected_error_retried(self, sim):
+        """주입한 503은 transport 재시도로 복구"""
+        transport = sim.transport(retry=RetryPolicy(backoff_base=0.01))
+        sim.inject_error(503, "/v1/ticker", times=2)
+
+        resp = transport.get(sim.base_url + "/v1/ticker",
+                             params={"markets": "KRW-BTC"})
+
+        assert resp.status_code == 200
+        assert resp.json()[0]["market"] == "KRW-BTC"
+
+
+def pd_minute():
+    import pandas as pd
+    return pd.Timedelta(minutes=1)
+
+
+# =============================================================================
+# Exchange API Tests
+# =============================================================================
+
+class TestSimulatorExchange:
+    """계좌/주문 API 시뮬레이션 테스트"""
+
+    def test_limit_order_flow(self, sim, upbit):
+        """대기 주문은 가격이 닿으면 체결되고 잔고에 반영"""
+        sim.set_price("KRW-BTC", 50000000)
+
+        order = upbit.buy_limit_order("KRW-BTC", 49000000, 0.001)
+        assert order["state"] == "wait"
+        assert upbit.get_balance("KRW") == pytest.approx(10000000 - 49000 * 1.0005)
+        assert [o["uuid"] for o in upbit.get_order("KRW-BTC")] == [order["uuid"]]
+
+        sim.set_price("KRW-BTC", 48000000)
+
+        assert upbit.get_order(order["uuid"])[0]["state"] == "done"
+        assert upbit.get_balance("KRW-BTC") == pytest.approx(0.001)
+        assert upbit.get_order("KRW-BTC") == []
+
+    def test_market_orders(self, sim, upbit):
+        """시장가 매수/매도는 즉시 체결"""
+        sim.set_price("KRW-XRP", 1000)
+
+        upbit.buy_market_order("KRW-XRP", 10000)
+        assert upbit.get_balance("KRW-XRP") == pytest.approx(10)
+
+        upbit.sell_market_order("KRW-XRP", 10)
+        assert upbit.get_balance("KRW-XRP") == 0
+        assert upbit.get_balance("KRW") == pytest.approx(10000000 - 10 - 5)
+
+    def test_cancel_order(self, sim, upbit):
+        """취소하면 주문 중인 금액이 잔고로 돌아옴"""
+        sim.set_price("KRW-BTC", 50000000)
+        order = upbit.buy_limit_order("KRW-BTC", 40000000, 0.001)
+
+        cancelled = upbit.cancel_order(order["uuid"])
+
+        assert cancelled["state"] == "cancel"
+        assert upbit.get_balance("KRW") == pytest.approx(10000000)
+
+    def test_identifier(self, sim, upbit):
+        """identifier로 주문 조회, 같은 identifier는 거부"""
+        sim.set_price("KRW-BTC", 50000000)
+        order = upbit.buy_limit_order("KRW-BTC", 40000000, 0.001, identifier="id-1")
+
+        data = {"identifier": "id-1"}
+        found, _ = _send_get_request(sim.base_url + "/v1/order",
+                                     headers=upbit._request_headers(data), data=data,
+                                     transport=upbit.transport)
+        assert found["uuid"] == order["uuid"]
+        assert upbit.buy_limit_order("KRW-BTC", 40000000, 0.001,
+                                     identifier="id-1") is None
+
+    def test_order_errors(self, sim, upbit):
+        """최소 주문 금액과 잔고 부족은 Upbit와 같은 에러"""
+        sim.set_price("KRW-BTC", 50000000)
+
+        for volume, error in ((0.00001, UnderMinTotalBid), (1, InsufficientFundsBid)):
+            data = {"market": "KRW-BTC", "side": "bid", "ord_type": "limit",
+                    "price": "50000000", "volume": str(volume)}
+            with pytest.raises(error):
+                _send_post_request(sim.base_url + "/v1/orders",
+                                   headers=upbit._request_headers(data), data=data,
+                                   transport=upbit.transport)
+
+    def test_rejects_bad_signature(self, sim):
+        """잘못된 비밀 키로 서명한 요청은 401"""
+        upbit = Upbit(ACCESS, "wrong_secret_key_that_is_long_enough",
+                      transport=sim.transport())
+
+        resp = requests.get(sim.base_url + "/v1/accounts",
+                            headers=upbit._request_headers())
+
+        assert resp.status_code == 401
+        assert resp.json()["error"]["name"] == "jwt_verification"
+
+    def test_lowercase_headers(self, sim, upbit):
+        """헤더 이름은 대소문자를 구분하지 않음"""
+        data = {"market": "KRW-BTC"}
+        headers = {k.lower(): v for k, v in upbit._request_headers(data).items()}
+
+        resp = requests.get(sim.base_url + "/v1/orders/chance", params=data,
+                            headers=headers)
+
+        assert resp.status_code == 200
+        assert resp.json()["market"]["id"] == "KRW-BTC"
+
+    def test_nonce_history_bounded(self, sim, upbit, monkeypatch):
+        """기억하는 nonce 수는 NONCE_HISTORY로 제한"""
+        monkeypatch.setattr(simulator, "NONCE_HISTORY", 2)
+        url = sim.base_url + "/v1/accounts"
+        signed = [upbit._request_headers() for _ in range(3)]
+        for headers in signed:
+            assert requests.get(url, headers=headers).status_code == 200
+
+        assert len(sim._nonces) == 2
+        replay = requests.get(url, headers=signed[-1])
+        assert replay.json()["error"]["name"] == "nonce_used"
+        # 가장 오래된 nonce는 잊었으므로 다시 허용
+        assert requests.get(url, headers=signed[0]).status_code == 200
+
+    def test_request_count_thread_safe(self):
+        """여러 스레드에서 동시에 처리해도 요청 수가 빠지지 않음"""
+        sim = UpbitSimulator(websocket=False, rate_limit=False)
+
+        def worker():
+            for _ in range(500):
+                sim.handle("GET", "/v1/market/all", {}, b"")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sim.request_count == 4000
+
+    def test_rate_limited_order(self):
+        """주문 그룹의 초당 요청 수를 넘으면 TooManyRequests"""
+        with UpbitSimulator(websocket=False, keys={ACCESS: SECRET},
+                            rates={"order": 1, "default": 30}) as sim:
+            upbit = Upbit(ACCESS, SECRET, transport=sim.transport(retry=None))
+            sim.set_price("KRW-BTC", 50000000)
+            data = {"market": "KRW-BTC", "side": "bid", "ord_type": "limit",
+                    "price": "40000000", "volume": "0.001"}
+            with pytest.raises(TooManyRequests):
+                for _ in range(3):
+                    _send_post_request(sim.base_url + "/v1/orders",
+                                       headers=upbit._request_headers(data), data=data,
+                                       transport=upbit.transport)
+
+
+# =============================================================================
+# WebSocket Tests
+# =============================================================================
+
+class TestSimulatorWebSocket:
+    """WebSocket 시뮬레이션 테스트"""
+
+    def test_stream(self, sim):
+        """공개 스트림은 구독한 코드의 시세를 전송"""
+        async def collect():
+            messages = []
+            async for msg in stream("ticker", ["KRW-BTC", "KRW-ETH"],
+                                    uri=sim.websocket_uri, reconnect_delay=None):
+                messages.append(msg)
+                if len(messages) == 4:
+                    return messages
+
+        messages = asyncio.run(asyncio.wait_for(collect(), 10))
+
+        assert {m["code"] for m in messages} == {"KRW-BTC", "KRW-ETH"}
+        assert all(m["type"] == "ticker" for m in messages)
+
+    def test_simple_format(self, sim):
+        """SIMPLE 포맷은 축약 필드명으로 전송"""
+        async def first():
+            async for msg in stream("trade", ["KRW-BTC"], uri=sim.websocket_uri,
+                                    format="SIMPLE", reconnect_delay=None):
+                return msg
+
+        msg = asyncio.run(asyncio.wait_for(first(), 10))
+
+        assert msg["ty"] == "trade"
+        assert msg["cd"] == "KRW-BTC"
+        assert "tp" in msg
+
+    def test_private_my_order(self, sim, upbit):
+        """개인 스트림은 주문 이벤트를 전송"""
+        sim.set_price("KRW-BTC", 50000000)
+        with WebSocketHub(ACCESS, SECRET, uri=sim.websocket_uri,
+                          private_uri=sim.private_websocket_uri) as hub:
+            orders = hub.subscribe("myOrder")
+            # 구독이 서버에 반영될 때까지 잠시 대기
+            asyncio.run(asyncio.sleep(0.5))
+            order = upbit.buy_limit_order("KRW-BTC", 40000000, 0.001)
+
+            msg = orders.get(timeout=5)
+
+        assert msg["type"] == "myOrder"
+        assert msg["uuid"] == order["uuid"]
+        assert msg["state"] == "wait"
+
+    def test_private_hub_wrong_keys(self, sim, caplog):
+        """잘못된 키의 개인 구독은 에러 메시지를 받고 허브에 기록"""
+        with caplog.at_level("WARNING", logger="fsfupbit.websocket_api"):
+            with WebSocketHub(ACCESS, "wrong_secret_key_that_is_long_enough",
+                              uri=sim.websocket_uri,
+                              private_uri=sim.private_websocket_uri) as hub:
+                orders = hub.subscribe("myOrder")
+                msg = orders.get(timeout=5)
+                last_error = hub.last_error
+
+        assert msg == {"error": {"name": "jwt_verification",
+                                 "message": "JWT 서명 검증에 실패했습니다"}}
+        assert last_error == msg
+        assert "jwt_verification" in caplog.text
+
+    def test_private_hub_wrong_keys_backs_off(self, sim):
+        """인증 거부 에러만 받는 연결은 재연결 대기 시간을 늘림"""
+        with WebSocketHub(ACCESS, "wrong_secret_key_that_is_long_enough",
+                          uri=sim.websocket_uri, private_uri=sim.private_websocket_uri,
+                          reconnect_delay=0.1) as hub:
+            orders = hub.subscribe("myOrder")
+            time.sleep(0.5)
+            errors = []
+            while True:
+                try:
+                    errors.append(orders.get(block=False))
+                except queue.Empty:
+                    break
+
+        # 0.1 + 0.2 + 0.4초 대기이므로 0.5초 동안 최대 3번 연결
+        assert 1 <= len(errors) <= 3
+
+    def test_private_stream_wrong_keys_backs_off(self, sim):
+        """인증 거부 에러만 받고 끊기는 개인 스트림은 대기 시간을 늘리며 재연결"""
+        messages = []
+
+        async def main():
+            async for msg in stream("myOrder", access_key=ACCESS,
+                                    secret_key="wrong_secret_key_that_is_long_enough",
+                                    uri=sim.private_websocket_uri, reconnect_delay=0.1):
+                messages.append(msg)
+
+        async def run():
+            try:
+                await asyncio.wait_for(main(), 0.5)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(run())
+
+        # 0.1 + 0.2 + 0.4초 대기이므로 0.5초 동안 최대 3번 연결
+        assert 1 <= len(messages) <= 3
+        assert all(m["error"]["name"] == "jwt_verification" for m in messages)
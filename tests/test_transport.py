@@ -0,0 +1,135 @@
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from urllib3.util.retry import Retry
+
+from fsfupbit.transport import (
+    HTTPTransport,
+    get_default_transport,
+    set_default_transport,
+)
+from fsfupbit.request_api import _call_public_api, _send_get_request
+from fsfupbit.exchange_api import Upbit
+
+
+def _ok_response(payload, remaining_req="group=market; min=573; sec=9"):
+    resp = Mock(spec=Response)
+    resp.ok = True
+    resp.status_code = 200
+    resp.json.return_value = payload
+    resp.headers = {"Remaining-Req": remaining_req}
+    return resp
+
+
+# =============================================================================
+# HTTPTransport Tests
+# =============================================================================
+
+class TestHTTPTransport:
+    """HTTPTransport 테스트"""
+
+    def test_pool_settings(self):
+        """커넥션 풀 설정이 어댑터에 반영되는지 확인"""
+        transport = HTTPTransport(pool_connections=4, pool_maxsize=16)
+        adapter = transport.session.get_adapter("https://api.upbit.com")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+
+    def test_injected_session_adapters_kept(self):
+        """주입한 세션의 어댑터는 교체하지 않고, 풀 크기를 지정하면 교체"""
+        session = requests.Session()
+        custom = HTTPAdapter(max_retries=Retry(total=3))
+        session.mount("https://", custom)
+
+        transport = HTTPTransport(session=session)
+        assert transport.session.get_adapter("https://api.upbit.com") is custom
+
+        transport = HTTPTransport(session=session, pool_maxsize=8)
+        adapter = transport.session.get_adapter("https://api.upbit.com")
+        assert adapter is not custom
+        assert adapter._pool_maxsize == 8
+
+    def test_default_timeout_applied(self):
+        """요청에 기본 타임아웃이 적용되는지 확인"""
+        transport = HTTPTransport(timeout=(1, 2))
+        transport.session = Mock()
+
+        transport.get("https://api.upbit.com/v1/market/all")
+
+        _, kwargs = transport.session.request.call_args
+        assert kwargs["timeout"] == (1, 2)
+
+    def test_explicit_timeout_overrides_default(self):
+        """호출 시 전달한 타임아웃이 우선하는지 확인"""
+        transport = HTTPTransport(timeout=(1, 2))
+        transport.session = Mock()
+
+        transport.post("https://api.upbit.com/v1/orders", timeout=5)
+
+        args, kwargs = transport.session.request.call_args
+        assert args[0] == "POST"
+        assert kwargs["timeout"] == 5
+
+    def test_keep_alive_disabled(self):
+        """keep_alive=False이면 Connection: close 헤더 설정"""
+        transport = HTTPTransport(keep_alive=False)
+        assert transport.session.headers["Connection"] == "close"
+
+    def test_default_transport_is_shared(self):
+        """기본 transport는 한 번만 생성되어 재사용"""
+        set_default_transport(None)
+        first = get_default_transport()
+        assert get_default_transport() is first
+
+    def test_set_default_transport(self):
+        """set_default_transport로 교체한 transport가 시세 조회에 사용됨"""
+        transport = HTTPTransport()
+        transport.session = Mock()
+        transport.session.request.return_value = _ok_response([])
+
+        set_default_transport(transport)
+        try:
+            data, limit = _call_public_api(
+                "https://api.upbit.com/v1/market/all", isDetails="false")
+        finally:
+            set_default_transport(None)
+
+        assert data == []
+        assert limit["group"] == "market"
+        transport.session.request.assert_called_once()
+
+
+class TestTransportInjection:
+    """Upbit 인스턴스별 transport 주입 테스트"""
+
+    def test_send_get_request_uses_given_transport(self):
+        """명시한 transport로 요청이 전송되는지 확인"""
+        transport = Mock()
+        transport.get.return_value = _ok_response([{"currency": "KRW"}])
+
+        data, _ = _send_get_request(
+            "https://api.upbit.com/v1/accounts", headers={},
+            transport=transport)
+
+        assert data == [{"currency": "KRW"}]
+        transport.get.assert_called_once()
+
+    @patch('fsfupbit.exchange_api._send_get_request')
+    def test_upbit_passes_transport(self, mock_request):
+        """Upbit 메서드가 자신의 transport를 전달하는지 확인"""
+        transport = HTTPTransport()
+        upbit = Upbit("test_access_key", "test_secret_key", transport=transport)
+        mock_request.return_value = ([], {})
+
+        upbit.get_balances()
+
+        _, kwargs = mock_request.call_args
+        assert kwargs["transport"] is transport
+
+    def test_upbit_default_transport_is_none(self):
+        """transport 미지정 시 모듈 기본 transport 사용"""
+        upbit = Upbit("test_access_key", "test_secret_key")
+        assert upbit.transport is None
@@ -0,0 +1,382 @@
+import asyncio
+import json
+import queue
+import socket
+import threading
+import time
+import pytest
+
+import websockets
+
+from fsfupbit.errors import UpbitValidationError
+from fsfupbit.websocket_api import WebSocketHub, stream
+
+
+class FakeUpbitServer:
+    """구독 메시지를 기록하고, 요청받은 타입/코드의 메시지를 보내는 로컬 WebSocket 서버"""
+
+    def __init__(self):
+        self.requests = queue.Queue()
+        self.connections = 0
+        self.reject = False
+        self.deny = False
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    async def _handler(self, websocket, *args):
+        self.connections += 1
+        if self.reject:
+            # 인증 실패처럼 구독 메시지를 받기 전에 정상 종료
+            return
+        self.websocket = websocket
+        async for raw in websocket:
+            self.requests.put(json.loads(raw))
+
+    def _process_request(self, *args):
+        if not self.deny:
+            return None
+        # 폐기된 키처럼 핸드셰이크 단계에서 401로 거부
+        self.connections += 1
+        if hasattr(args[0], "respond"):
+            return args[0].respond(401, "denied\n")
+        return 401, [], b"denied\n"
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+
+        async def main():
+            self._server = await websockets.serve(
+                self._handler, "127.0.0.1", 0, process_request=self._process_request)
+            self.port = list(self._server.sockets)[0].getsockname()[1]
+            self._started.set()
+            await self._server.wait_closed()
+
+        try:
+            self._loop.run_until_complete(main())
+        finally:
+            self._loop.close()
+
+    @property
+    def uri(self):
+        return f"ws://127.0.0.1:{self.port}"
+
+    def push(self, message):
+        asyncio.run_coroutine_threadsafe(
+            self.websocket.send(json.dumps(message).encode()), self._loop).result(5)
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._thread.join(5)
+
+
+@pytest.fixture
+def server():
+    srv = FakeUpbitServer()
+    yield srv
+    srv.close()
+
+
+def _types(request):
+    """구독 메시지에서 ticket, format을 제외한 {type: codes}"""
+    return {item["type"]: item.get("codes") for item in request[1:]
+            if "type" in item}
+
+
+# =============================================================================
+# WebSocketHub Tests
+# =============================================================================
+
+class TestWebSocketHubRouting:
+    """WebSocketHub 구독 메시지 생성과 분배 테스트 (연결 없음)"""
+
+    def test_combined_request(self):
+        """같은 연결의 구독을 하나의 구독 메시지로 합침"""
+        hub = WebSocketHub()
+        hub._start = lambda: None
+        hub.subscribe("ticker", ["KRW-BTC"])
+        hub.subscribe("ticker", ["KRW-ETH", "KRW-BTC"])
+        hub.subscribe("trade", ["KRW-BTC"])
+
+        request = json.loads(hub._public.message)
+        assert _types(request) == {
+            "ticker": ["KRW-BTC", "KRW-ETH"],
+            "trade": ["KRW-BTC"],
+        }
+        assert hub._private.message is None
+
+    def test_dispatch_by_type_and_code(self):
+        """타입과 코드가 일치하는 구독에만 전달"""
+        hub = WebSocketHub()
+        hub._start = lambda: None
+        btc = hub.subscribe("ticker", ["KRW-BTC"])
+        eth = hub.subscribe("ticker", ["KRW-ETH"])
+        trade = hub.subscribe("trade", ["KRW-BTC"])
+
+        hub._dispatch(b'{"type": "ticker", "code": "KRW-BTC", "trade_price": 1}')
+
+        assert btc.get(block=False)["trade_price"] == 1
+        with pytest.raises(queue.Empty):
+            eth.get(block=False)
+        with pytest.raises(queue.Empty):
+            trade.get(block=False)
+
+    def test_private_types_without_codes(self):
+        """myAsset은 코드 없이 모든 구독에 전달, myOrder 코드 생략 시 전체"""
+        hub = WebSocketHub("access", "secret")
+        hub._start = lambda: None
+        asset = hub.subscribe("MyAsset")
+        orders = hub.subscribe("MyOrder")
+
+        assert _types(json.loads(hub._private.message)) == {
+            "myOrder": None, "myAsset": None}
+        assert hub._public.message is None
+
+        hub._dispatch('{"type": "myAsset", "assets": []}')
+        hub._dispatch('{"type": "myOrder", "code": "KRW-BTC"}')
+        assert asset.get(block=False)["type"] == "myAsset"
+        assert orders.get(block=False)["code"] == "KRW-BTC"
+
+    def test_unsubscribe_updates_request(self):
+        """구독 해지 시 남은 구독으로 메시지를 갱신, 모두 해지하면 연결 불필요"""
+        hub = WebSocketHub()
+        hub._start = lambda: None
+        btc = hub.subscribe("ticker", ["KRW-BTC"])
+        trade = hub.subscribe("trade", ["KRW-BTC"])
+
+        btc.close()
+        assert _types(json.loads(hub._public.message)) == {"trade": ["KRW-BTC"]}
+        trade.close()
+        assert hub._public.message is None
+
+    def test_overflow_drops_oldest(self):
+        """큐가 가득 차면 가장 오래된 메시지를 버리고 개수를 기록"""
+        hub = WebSocketHub()
+        hub._start = lambda: None
+        sub = hub.subscribe("trade", ["KRW-BTC"], qsize=2)
+        for i in range(3):
+            hub._dispatch(json.dumps({"type": "trade", "code": "KRW-BTC", "i": i}))
+
+        assert sub.dropped == 1
+        assert sub.get(block=False)["i"] == 1
+
+    def test_my_asset_delivered_once(self):
+        """여러 경로에 등록된 구독에도 메시지를 한 번만 전달"""
+        hub = WebSocketHub("access", "secret")
+        hub._start = lambda: None
+        asset = hub.subscribe("myAsset", ["KRW-BTC", "KRW-ETH"])
+        trade = hub.subscribe("orderbook", ["KRW-BTC", "KRW-BTC.5"])
+
+        hub._dispatch('{"type": "myAsset", "assets": []}')
+        hub._dispatch('{"type": "orderbook", "code": "KRW-BTC"}')
+        assert asset._q.qsize() == 1
+        assert trade._q.qsize() == 1
+
+    def test_close_wakes_iterating_consumer(self):
+        """허브를 닫으면 메시지를 기다리며 반복 중인 소비자가 종료"""
+        hub = WebSocketHub()
+        hub._start = lambda: None
+        sub = hub.subscribe("trade", ["KRW-BTC"])
+        other = hub.subscribe("ticker", ["KRW-BTC"])
+        hub._dispatch('{"type": "trade", "code": "KRW-BTC", "i": 1}')
+        received = []
+        consumer = threading.Thread(target=lambda: received.extend(sub))
+        consumer.start()
+
+        hub.close()
+        consumer.join(5)
+        assert not consumer.is_alive()
+        assert [m["i"] for m in received] == [1]
+        with pytest.raises(queue.Empty):
+            other.get(timeout=5)
+        assert list(other) == []
+
+    def test_validation(self):
+        """지원하지 않는 타입, 코드 누락, 인증 키 누락 검증"""
+        hub = WebSocketHub()
+        with pytest.raises(UpbitValidationError):
+            hub.subscribe("candle", ["KRW-BTC"])
+        with pytest.raises(UpbitValidationError):
+            hub.subscribe("ticker")
+        with pytest.raises(UpbitValidationError):
+            hub.subscribe("myOrder")
+
+
+class TestWebSocketHubConnection:
+    """로컬 WebSocket 서버를 사용한 WebSocketHub 연동 테스트"""
+
+    def test_runtime_subscription_changes(self, server):
+        """실행 중 구독을 변경하면 같은 연결로 구독 메시지를 다시 보냄"""
+        with WebSocketHub(uri=server.uri) as hub:
+            btc = hub.subscribe("ticker", ["KRW-BTC"])
+            assert _types(server.requests.get(timeout=5)) == {"ticker": ["KRW-BTC"]}
+
+            server.push({"type": "ticker", "code": "KRW-BTC", "trade_price": 100})
+            assert btc.get(timeout=5)["trade_price"] == 100
+
+            btc.add_codes(["KRW-ETH"])
+            assert _types(server.requests.get(timeout=5)) == {
+                "ticker": ["KRW-BTC", "KRW-ETH"]}
+
+            trades = hub.subscribe("trade", ["KRW-ETH"])
+            assert _types(server.requests.get(timeout=5)) == {
+                "ticker": ["KRW-BTC", "KRW-ETH"], "trade": ["KRW-ETH"]}
+
+            server.push({"type": "trade", "code": "KRW-ETH", "trade_price": 5})
+            assert trades.get(timeout=5)["trade_price"] == 5
+            assert server.connections == 1
+
+    def test_reconnect_waits_after_normal_close(self, server):
+        """서버가 정상 종료해도 재연결 전에 대기하고, 반복되면 대기 시간을 늘림"""
+        server.reject = True
+        with WebSocketHub(uri=server.uri, reconnect_delay=0.1) as hub:
+            hub.subscribe("ticker", ["KRW-BTC"])
+            time.sleep(0.5)
+        # 0.1 + 0.2 + 0.4초 대기이므로 0.5초 동안 최대 3번 연결
+        assert 1 <= server.connections <= 3
+
+    def test_connection_failure_reported(self):
+        """연결 실패는 구독 큐에 에러 메시지로 전달되고 last_error에 기록"""
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        with WebSocketHub(uri=f"ws://127.0.0.1:{port}", reconnect_delay=10) as hub:
+            sub = hub.subscribe("ticker", ["KRW-BTC"])
+            msg = sub.get(timeout=5)
+            assert hub.last_error == msg
+
+        assert set(msg["error"]) == {"name", "message"}
+        assert msg["error"]["name"]
+
+
+# =============================================================================
+# stream() Tests
+# =============================================================================
+
+class TestStream:
+    """asyncio stream() 테스트"""
+
+    def test_stream_yields_messages(self, server):
+        """현재 이벤트 루프에서 구독 후 메시지를 dict로 반환"""
+        async def main():
+            messages = []
+            async for msg in stream("ticker", ["KRW-BTC"], uri=server.uri):
+                messages.append(msg)
+                if len(messages) == 2:
+                    break
+            return messages
+
+        async def feed():
+            request = await asyncio.get_running_loop().run_in_executor(
+                None, server.requests.get, True, 5)
+            assert _types(request) == {"ticker": ["KRW-BTC"]}
+            assert request[1]["isOnlyRealtime"] is True
+            server.push({"type": "ticker", "code": "KRW-BTC", "trade_price": 1})
+            server.push({"type": "ticker", "code": "KRW-BTC", "trade_price": 2})
+
+        async def run():
+            consumer = asyncio.ensure_future(main())
+            await feed()
+            return await asyncio.wait_for(consumer, 5)
+
+        messages = asyncio.run(run())
+        assert [m["trade_price"] for m in messages] == [1, 2]
+
+    def test_stream_without_reconnect(self):
+        """reconnect_delay=None이면 연결 실패를 그대로 전달"""
+        async def main():
+            async for _ in stream("trade", ["KRW-BTC"], uri="ws://127.0.0.1:9",
+                                  reconnect_delay=None):
+                pass
+
+        with pytest.raises(OSError):
+            asyncio.run(main())
+
+    def _connect_for(self, server, seconds, **kwargs):
+        """seconds 동안 stream을 돌리며 받은 메시지 목록"""
+        messages = []
+
+        async def main():
+            async for msg in stream("ticker", ["KRW-BTC"], uri=server.uri, **kwargs):
+                messages.append(msg)
+
+        async def run():
+            try:
+                await asyncio.wait_for(main(), seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(run())
+        return messages
+
+    def test_stream_backs_off_after_failed_connects(self, server):
+        """메시지 없이 반복해서 끊기면 재연결 대기 시간을 두 배씩 늘림"""
+        server.reject = True
+        self._connect_for(server, 0.5, reconnect_delay=0.1)
+        # 0.1 + 0.2 + 0.4초 대기이므로 0.5초 동안 최대 3번 연결
+        assert 1 <= server.connections <= 3
+
+    def test_stream_retries_rejected_handshake(self, server):
+        """핸드셰이크 거부(InvalidStatus)도 예외 없이 대기 후 재연결"""
+        server.deny = True
+        self._connect_for(server, 0.5, reconnect_delay=0.1, reconnect_max_delay=0.1)
+        # 상한 0.1초이므로 여러 번 재시도하되 예외로 중단되지 않음
+        assert server.connections >= 3
+
+        with pytest.raises(websockets.InvalidHandshake):
+            self._connect_for(server, 5, reconnect_delay=None)
+
+    def test_stream_validation(self):
+        """코드 누락, 인증 키 누락 검증"""
+        async def first(**kwargs):
+            async for msg in stream(**kwargs):
+                return msg
+
+        with pytest.raises(UpbitValidationError):
+            asyncio.run(first(type="ticker"))
+        with pytest.raises(UpbitValidationError):
+            asyncio.run(first(type="myAsset"))
+
+
+class TestSimpleFormat:
+    """SIMPLE 포맷 구독 테스트"""
+
+    def test_hub_routes_simple_messages(self):
+        """SIMPLE 포맷 메시지를 축약 필드(ty, cd)로 분배"""
+        hub = WebSocketHub(format="SIMPLE")
+        hub._start = lambda: None
+        sub = hub.subscribe("trade", ["KRW-BTC"])
+
+        assert json.loads(hub._public.message)[-1] == {"format": "SIMPLE"}
+        hub._dispatch(b'{"ty": "trade", "cd": "KRW-BTC", "tp": 1.0}')
+        assert sub.get(block=False) == {"ty": "trade", "cd": "KRW-BTC", "tp": 1.0}
+
+    def test_hub_expands_simple_messages(self):
+        """expand=True이면 DEFAULT 필드명으로 변환하여 전달"""
+        hub = WebSocketHub(format="SIMPLE", expand=True)
+        hub._start = lambda: None
+        sub = hub.subscribe("trade", ["KRW-BTC"])
+
+        hub._dispatch(b'{"ty": "trade", "cd": "KRW-BTC", "tp": 1.0}')
+        assert sub.get(block=False) == {
+            "type": "trade", "code": "KRW-BTC", "trade_price": 1.0}
+
+    def test_stream_simple(self, server):
+        """stream()은 format을 요청하고 필드명을 변환"""
+        async def main():
+            async for msg in stream("ticker", ["KRW-BTC"], uri=server.uri,
+                                    format="SIMPLE", expand=True):
+                return msg
+
+        async def run():
+            consumer = asyncio.ensure_future(main())
+            request = await asyncio.get_running_loop().run_in_executor(
+                None, server.requests.get, True, 5)
+            assert request[-1] == {"format": "SIMPLE"}
+            server.push({"ty": "ticker", "cd": "KRW-BTC", "tp": 3.0})
+            return await asyncio.wait_for(consumer, 5)
+
+        assert asyncio.run(run()) == {
+            "type": "ticker", "code": "KRW-BTC", "trade_price": 3.0}
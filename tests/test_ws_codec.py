@@ -0,0 +1,79 @@
+import json
+import pytest
+
+from fsfupbit.errors import UpbitValidationError
+from fsfupbit.ws_codec import check_format, expand_simple, get_decoder
+
+
+# =============================================================================
+# Decoder Tests
+# =============================================================================
+
+class TestGetDecoder:
+    """get_decoder 테스트"""
+
+    def test_json_decoder_accepts_bytes_and_memoryview(self):
+        """표준 json 디코더는 bytes, memoryview, str 모두 처리"""
+        decode = get_decoder("json")
+        assert decode(b'{"a": 1}') == {"a": 1}
+        assert decode(memoryview(b'{"a": 1}')) == {"a": 1}
+        assert decode('{"a": 1}') == {"a": 1}
+
+    def test_auto_decoder(self):
+        """auto는 설치된 디코더 중 하나를 선택"""
+        assert get_decoder()(b'{"type": "trade"}') == {"type": "trade"}
+
+    def test_orjson_decoder(self):
+        """orjson 디코더 선택"""
+        orjson = pytest.importorskip("orjson")
+        assert get_decoder("orjson") is orjson.loads
+
+    def test_callable_decoder(self):
+        """함수를 넘기면 그대로 사용"""
+        assert get_decoder(json.loads) is json.loads
+
+    def test_unknown_decoder(self):
+        """지원하지 않는 디코더 이름 검증"""
+        with pytest.raises(UpbitValidationError):
+            get_decoder("ujson")
+
+
+# =============================================================================
+# SIMPLE Format Tests
+# =============================================================================
+
+class TestExpandSimple:
+    """SIMPLE 포맷 필드명 변환 테스트"""
+
+    def test_trade(self):
+        """trade 메시지 필드명 변환"""
+        message = {"ty": "trade", "cd": "KRW-BTC", "tp": 100.0, "tv": 0.5,
+                   "ab": "BID", "sid": 1, "ttms": 1700000000000, "st": "REALTIME"}
+        assert expand_simple(message) == {
+            "type": "trade", "code": "KRW-BTC", "trade_price": 100.0,
+            "trade_volume": 0.5, "ask_bid": "BID", "sequential_id": 1,
+            "trade_timestamp": 1700000000000, "stream_type": "REALTIME"}
+
+    def test_orderbook_units(self):
+        """orderbook_units 내부 필드도 변환"""
+        message = {"ty": "orderbook", "cd": "KRW-BTC", "tas": 1.0, "tbs": 2.0,
+                   "obu": [{"ap": 101.0, "bp": 100.0, "as": 0.1, "bs": 0.2}]}
+        expanded = expand_simple(message)
+        assert expanded["total_ask_size"] == 1.0
+        assert expanded["orderbook_units"] == [
+            {"ask_price": 101.0, "bid_price": 100.0, "ask_size": 0.1, "bid_size": 0.2}]
+
+    def test_same_abbreviation_by_type(self):
+        """같은 약어도 타입에 따라 다른 필드로 변환 (ap)"""
+        assert "avg_price" in expand_simple({"ty": "myOrder", "ap": 1.0})
+        assert "ask_price" in expand_simple({"ty": "orderbook", "ap": 1.0})
+
+    def test_unknown_fields_kept(self):
+        """표에 없는 필드는 그대로 유지"""
+        assert expand_simple({"ty": "ticker", "new": 1}) == {"type": "ticker", "new": 1}
+
+    def test_check_format(self):
+        """format 값 검증"""
+        assert check_format("simple") == "SIMPLE"
+        with pytest.raises(UpbitValidationError):
+            check_format("COMPACT")